@@ -1,6 +1,15 @@
+import io
+
 import numpy as np
+from dash import Dash, html
+from PIL import Image
 
-from webviz_subsurface._datainput.image_processing import array_to_png
+from webviz_subsurface._datainput.image_processing import (
+    array2d_to_png,
+    array2d_to_png_bytes,
+    array_to_png,
+)
+from webviz_subsurface._utils.png_image_server import PngImageServer
 
 with open("tests/data/surface_png.txt", "r") as file:
     BASE64_SURFACE = file.read()
@@ -9,3 +18,45 @@ with open("tests/data/surface_png.txt", "r") as file:
 def test_array_to_png() -> None:
     data = np.loadtxt("tests/data/surface_zarr.np.gz")
     assert array_to_png(data) == BASE64_SURFACE
+
+
+def test_array2d_to_png_bytes() -> None:
+    rng = np.random.default_rng(seed=1234)
+    tensor = rng.uniform(0, 256**3 - 1, size=(40, 30))
+    tensor[3, 4] = np.nan
+    tensor[0, 0] = 0.0
+    tensor[1, 1] = 256**3 - 1
+
+    image = Image.open(io.BytesIO(array2d_to_png_bytes(tensor)))
+    assert image.mode == "RGBA"
+    assert image.size == (30, 40)
+
+    rgba = np.asarray(image).astype(np.int64)
+    decoded = rgba[:, :, 0] * 256 * 256 + rgba[:, :, 1] * 256 + rgba[:, :, 2]
+    defined = ~np.isnan(tensor)
+    assert np.array_equal(rgba[:, :, 3] == 0, ~defined)
+    assert np.array_equal(decoded[defined], np.floor(tensor[defined]))
+
+    assert array2d_to_png(tensor).startswith("data:image/png;base64,")
+
+
+def test_png_image_server() -> None:
+    app = Dash(__name__)
+    app.layout = html.Div()
+    server = PngImageServer(app)
+    client = app.server.test_client()
+
+    png_bytes = array2d_to_png_bytes(np.zeros((10, 10)))
+    url = server.publish_png(png_bytes)
+    assert url == server.publish_png(png_bytes)
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert response.data == png_bytes
+    assert "immutable" in response.headers["Cache-Control"]
+
+    response = client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+    assert response.status_code == 304
+
+    assert client.get(url.replace(url[-8:], "0000.png")).status_code == 404
@@ -55,6 +55,7 @@ class EnsembleSummaryProviderDummy(EnsembleSummaryProvider):
         vector_names: Sequence[str],
         resampling_frequency: Optional[Frequency],
         realizations: Optional[Sequence[int]] = None,
+        date_as_datetime64: bool = False,
     ) -> pd.DataFrame:
         raise NotImplementedError("Method not implemented for mock!")
 
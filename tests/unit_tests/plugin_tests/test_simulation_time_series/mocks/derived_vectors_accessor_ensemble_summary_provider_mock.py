@@ -3,6 +3,7 @@ from typing import List, Optional, Sequence
 import pandas as pd
 
 from webviz_subsurface._providers import Frequency
+from webviz_subsurface._utils.dataframe_utils import make_date_column_datetime64
 
 from ....mocks.ensemble_summary_provider_dummy import EnsembleSummaryProviderDummy
 
@@ -41,6 +42,7 @@ class EnsembleSummaryProviderMock(EnsembleSummaryProviderDummy):
         vector_names: Sequence[str],
         __resampling_frequency: Optional[Frequency],
         realizations: Optional[Sequence[int]] = None,
+        date_as_datetime64: bool = False,
     ) -> pd.DataFrame:
         for elm in vector_names:
             if elm not in self._vectors:
@@ -56,5 +58,9 @@ class EnsembleSummaryProviderMock(EnsembleSummaryProviderDummy):
                 .reset_index()
             )
             output.drop("index", inplace=True, axis=1)
-            return output
-        return self._df[["DATE", "REAL"] + list(vector_names)]
+        else:
+            output = self._df[["DATE", "REAL"] + list(vector_names)]
+        if date_as_datetime64:
+            output = output.copy()
+            make_date_column_datetime64(output)
+        return output
@@ -1,10 +1,13 @@
 import datetime
 
+import numpy as np
+import pandas as pd
 import pytest
 
 # pylint: disable=line-too-long
 from webviz_subsurface.plugins._simulation_time_series._views._subplot_view._utils.datetime_utils import (
     from_str,
+    to_datetime_object_array,
     to_str,
 )
 
@@ -49,3 +52,16 @@ def test_to_str_assert() -> None:
             == f"Invalid date resolution, expected no data for hour, minute, second"
             f" or microsecond for {str(_date)}"
         )
+
+
+def test_to_datetime_object_array() -> None:
+    expected_dates = [datetime.datetime(2021, 6, 13), datetime.datetime(2263, 1, 1)]
+
+    datetime64_dates = pd.Series(np.array(expected_dates, dtype="datetime64[ms]"))
+    object_dates = pd.Series(expected_dates, dtype=object)
+
+    for dates in [datetime64_dates, object_dates]:
+        result = to_datetime_object_array(dates)
+        assert result.tolist() == expected_dates
+        # pylint: disable = unidiomatic-typecheck
+        assert all(type(elm) == datetime.datetime for elm in result)
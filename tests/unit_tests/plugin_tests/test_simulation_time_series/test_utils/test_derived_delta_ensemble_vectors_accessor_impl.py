@@ -1,4 +1,5 @@
 import datetime
+from typing import Tuple
 
 import pandas as pd
 import pytest
@@ -8,7 +9,10 @@ from webviz_subsurface_components.VectorCalculatorWrapper import (
     VariableVectorMapInfo,
 )
 
-from webviz_subsurface._utils.dataframe_utils import make_date_column_datetime_object
+from webviz_subsurface._utils.dataframe_utils import (
+    make_date_column_datetime64,
+    make_date_column_datetime_object,
+)
 
 # pylint: disable = line-too-long
 from webviz_subsurface.plugins._simulation_time_series._views._subplot_view._utils.derived_vectors_accessor.derived_delta_ensemble_vectors_accessor_impl import (
@@ -317,3 +321,49 @@ def test_create_calculated_vectors_df_filter_realizations(
 
     assert_frame_equal(expected_reals_df, test_df)
     assert list(set(test_df["REAL"].values)) == [1, 2]
+
+
+TEST_DATETIME64_CASES = [
+    pytest.param(
+        (INPUT_A_DF, INPUT_B_DF),
+        (EXPECTED_DELTA_DF, EXPECTED_DELTA_INVTL_DF, EXPECTED_SUM_A_AND_B_DF),
+    ),
+    pytest.param(
+        (INPUT_A_AFTER_2262_DF, INPUT_B_AFTER_2262_DF),
+        (
+            EXPECTED_DELTA_AFTER_2262_DF,
+            EXPECTED_DELTA_INVTL_AFTER_2262_DF,
+            EXPECTED_SUM_A_AND_B_AFTER_2262_DF,
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize("input_dfs, expected_dfs", TEST_DATETIME64_CASES)
+def test_accessor_with_date_as_datetime64(
+    input_dfs: Tuple[pd.DataFrame, pd.DataFrame],
+    expected_dfs: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame],
+) -> None:
+    test_accessor = DerivedDeltaEnsembleVectorsAccessorImpl(
+        name="Test datetime64 accessor",
+        provider_pair=(
+            EnsembleSummaryProviderMock(input_dfs[0]),
+            EnsembleSummaryProviderMock(input_dfs[1]),
+        ),
+        vectors=["A", "B", "PER_INTVL_B", "Sum A and B"],
+        expressions=[TEST_EXPRESSION],
+        resampling_frequency=None,
+        date_as_datetime64=True,
+    )
+
+    test_dfs = [
+        test_accessor.get_provider_vectors_df(),
+        test_accessor.create_per_interval_and_per_day_vectors_df(),
+        test_accessor.create_calculated_vectors_df(),
+    ]
+    for test_df, expected_df in zip(test_dfs, expected_dfs):
+        expected_datetime64_df = expected_df.copy()
+        make_date_column_datetime64(expected_datetime64_df)
+
+        assert test_df["DATE"].dtype == "datetime64[ms]"
+        assert_frame_equal(expected_datetime64_df, test_df)
@@ -5,7 +5,10 @@ import pytest
 from pandas._testing import assert_frame_equal
 
 from webviz_subsurface._providers import Frequency
-from webviz_subsurface._utils.dataframe_utils import make_date_column_datetime_object
+from webviz_subsurface._utils.dataframe_utils import (
+    make_date_column_datetime64,
+    make_date_column_datetime_object,
+)
 
 # pylint: disable=line-too-long
 from webviz_subsurface.plugins._simulation_time_series._views._subplot_view._utils.from_timeseries_cumulatives import (
@@ -244,6 +247,32 @@ def test_calculate_from_resampled_cumulative_vectors_df(
     assert_frame_equal(expected_per_day_df, calculated_per_day_df)
 
 
+@pytest.mark.parametrize(
+    "input_df, expected_per_intvl_df, expected_per_day_df", TEST_CASES
+)
+def test_calculate_from_resampled_cumulative_vectors_df_datetime64(
+    input_df: pd.DataFrame,
+    expected_per_intvl_df: pd.DataFrame,
+    expected_per_day_df: pd.DataFrame,
+) -> None:
+    input_datetime64_df = input_df.copy()
+    make_date_column_datetime64(input_datetime64_df)
+
+    for as_per_day, expected_df in [
+        (False, expected_per_intvl_df),
+        (True, expected_per_day_df),
+    ]:
+        expected_datetime64_df = expected_df.copy()
+        make_date_column_datetime64(expected_datetime64_df)
+
+        calculated_df = calculate_from_resampled_cumulative_vectors_df(
+            input_datetime64_df, as_per_day
+        )
+
+        assert calculated_df["DATE"].dtype == "datetime64[ms]"
+        assert_frame_equal(expected_datetime64_df, calculated_df)
+
+
 def test_calculate_from_resampled_cumulative_vectors_df_invalid_input() -> None:
     """Test assert check assert_date_column_is_datetime_object() in
     webviz_subsurface._utils.dataframe_utils.py
@@ -284,6 +313,10 @@ def test_get_cumulative_vector_name() -> None:
     assert get_cumulative_vector_name("PER_DAY_FOPR") == "FOPR"
     assert get_cumulative_vector_name("PER_INTVL_FOPR") == "FOPR"
 
+    # Only the prefix is removed, also when the vector starts with prefix characters
+    assert get_cumulative_vector_name("PER_DAY_DOPT") == "DOPT"
+    assert get_cumulative_vector_name("PER_INTVL_INJT") == "INJT"
+
     # Expect ValueError when verifying vector not starting with "PER_DAY_" or "PER_INTVL_"
     try:
         get_cumulative_vector_name("Test_vector")
@@ -55,6 +55,7 @@ class EnsembleSummaryProviderMock(EnsembleSummaryProviderDummy):
         vector_names: Sequence[str],
         __resampling_frequency: Optional[Frequency],
         realizations: Optional[Sequence[int]] = None,
+        __date_as_datetime64: bool = False,
     ) -> pd.DataFrame:
         if realizations:
             if not set(realizations).issubset(set(self._realizations)):
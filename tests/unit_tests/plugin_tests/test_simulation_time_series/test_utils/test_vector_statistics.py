@@ -4,7 +4,10 @@ import pandas as pd
 import pytest
 from pandas._testing import assert_frame_equal
 
-from webviz_subsurface._utils.dataframe_utils import make_date_column_datetime_object
+from webviz_subsurface._utils.dataframe_utils import (
+    make_date_column_datetime64,
+    make_date_column_datetime_object,
+)
 from webviz_subsurface.plugins._simulation_time_series._views._subplot_view._types import (
     StatisticsOptions,
 )
@@ -146,6 +149,21 @@ def test_create_vectors_statistics_df(
     assert_frame_equal(statistics_df, expected_statistics_df)
 
 
+@pytest.mark.parametrize("input_df, expected_statistics_df", TEST_VALID_CASES)
+def test_create_vectors_statistics_df_datetime64(
+    input_df: pd.DataFrame, expected_statistics_df: pd.DataFrame
+) -> None:
+    input_datetime64_df = input_df.copy()
+    make_date_column_datetime64(input_datetime64_df)
+    expected_datetime64_df = expected_statistics_df.copy()
+    make_date_column_datetime64(expected_datetime64_df)
+
+    statistics_df = create_vectors_statistics_df(input_datetime64_df)
+
+    assert statistics_df["DATE"].dtype == "datetime64[ms]"
+    assert_frame_equal(statistics_df, expected_datetime64_df)
+
+
 def test_create_vectors_statstics_df_invalid_input() -> None:
     """Test assert check assert_date_column_is_datetime_object() in
     webviz_subsurface._utils.dataframe_utils.py
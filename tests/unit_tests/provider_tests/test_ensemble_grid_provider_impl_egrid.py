@@ -0,0 +1,138 @@
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+import resfo
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_grid_provider._egrid_file_discovery import (
+    EclipseCaseFileInfo,
+)
+from webviz_subsurface._providers.ensemble_grid_provider.provider_impl_egrid import (
+    KEYWORD_INDEX_FILE_NAME,
+    ProviderImplEgrid,
+)
+
+# Large enough for the properties to span several data blocks in the files
+GRID_DIMENSIONS = (20, 10, 6)
+RESTART_DATES = [(2000, 1, 1), (2001, 7, 15), (2003, 1, 1)]
+
+
+def _make_intehead(year: int, month: int, day: int) -> np.ndarray:
+    intehead = np.zeros(411, dtype=np.int32)
+    intehead[8:11] = GRID_DIMENSIONS
+    intehead[64:67] = [day, month, year]
+    return intehead
+
+
+def _write_eclipse_case(case_dir: Path, seed: int) -> EclipseCaseFileInfo:
+    rng = np.random.default_rng(seed)
+
+    grid = xtgeo.create_box_grid(GRID_DIMENSIONS)
+    actnum = grid.get_actnum()
+    actnum.values = (rng.random(GRID_DIMENSIONS) > 0.1).astype(np.int32)
+    grid.set_actnum(actnum)
+    grid.to_file(case_dir / "CASE.EGRID", fformat="egrid")
+
+    num_cells = grid.ncol * grid.nrow * grid.nlay
+    num_active = grid.nactive
+    header_records: List[Tuple[str, np.ndarray]] = [
+        ("LOGIHEAD", np.zeros(121, dtype=bool)),
+        ("DOUBHEAD", np.zeros(229)),
+    ]
+
+    resfo.write(
+        case_dir / "CASE.INIT",
+        [("INTEHEAD", _make_intehead(*RESTART_DATES[0]))]
+        + header_records
+        + [
+            ("PORV    ", rng.random(num_cells).astype(np.float32)),
+            ("PORO    ", rng.random(num_active).astype(np.float32)),
+            ("SATNUM  ", rng.integers(1, 4, num_active).astype(np.int32)),
+        ],
+    )
+
+    restart_records: List[Tuple[str, np.ndarray]] = []
+    for step, date in enumerate(RESTART_DATES):
+        restart_records.append(("SEQNUM  ", np.array([step], dtype=np.int32)))
+        restart_records.append(("INTEHEAD", _make_intehead(*date)))
+        restart_records.extend(header_records)
+        restart_records.append(
+            ("PRESSURE", (100 * rng.random(num_active)).astype(np.float32))
+        )
+        restart_records.append(("SWAT    ", rng.random(num_active).astype(np.float32)))
+    resfo.write(case_dir / "CASE.UNRST", restart_records)
+
+    return EclipseCaseFileInfo(
+        realization=seed,
+        egrid_path=str(case_dir / "CASE.EGRID"),
+        init_path=str(case_dir / "CASE.INIT"),
+        unrst_path=str(case_dir / "CASE.UNRST"),
+    )
+
+
+def _create_providers(tmp_path: Path) -> Tuple[ProviderImplEgrid, ProviderImplEgrid]:
+    """Returns a provider using the keyword index and one reading through xtgeo"""
+    ecl_cases = []
+    for real in [0, 1]:
+        case_dir = tmp_path / f"real-{real}"
+        case_dir.mkdir()
+        ecl_cases.append(_write_eclipse_case(case_dir, seed=real))
+
+    storage_dir = tmp_path / "storage"
+    for storage_key in ["indexed", "xtgeo"]:
+        ProviderImplEgrid.write_backing_store(
+            storage_dir, storage_key, ecl_cases, avoid_copying_grid_data=False
+        )
+    (storage_dir / "xtgeo" / KEYWORD_INDEX_FILE_NAME).unlink()
+
+    props = (["PORV", "PORO", "SATNUM"], ["PRESSURE", "SWAT"])
+    indexed_provider = ProviderImplEgrid.from_backing_store(
+        storage_dir, "indexed", *props
+    )
+    xtgeo_provider = ProviderImplEgrid.from_backing_store(storage_dir, "xtgeo", *props)
+    assert indexed_provider is not None and xtgeo_provider is not None
+
+    return indexed_provider, xtgeo_provider
+
+
+def test_indexed_property_reads_match_xtgeo(tmp_path: Path) -> None:
+    indexed_provider, xtgeo_provider = _create_providers(tmp_path)
+
+    expected_dates = [f"{y:04d}{m:02d}{d:02d}" for y, m, d in RESTART_DATES]
+    assert indexed_provider.dates_for_dynamic_property("PRESSURE") == expected_dates
+    assert xtgeo_provider.dates_for_dynamic_property("PRESSURE") == expected_dates
+
+    for real in [0, 1]:
+        for prop_name in ["PORV", "PORO", "SATNUM"]:
+            indexed_values = indexed_provider.get_static_property_values(
+                prop_name, real
+            )
+            xtgeo_values = xtgeo_provider.get_static_property_values(prop_name, real)
+            assert indexed_values is not None
+            np.testing.assert_allclose(indexed_values, xtgeo_values, rtol=1e-6)
+
+        for prop_name in ["PRESSURE", "SWAT"]:
+            for date in expected_dates:
+                indexed_values = indexed_provider.get_dynamic_property_values(
+                    prop_name, date, real
+                )
+                xtgeo_values = xtgeo_provider.get_dynamic_property_values(
+                    prop_name, date, real
+                )
+                assert indexed_values is not None
+                assert indexed_values.dtype == np.float32
+                np.testing.assert_allclose(indexed_values, xtgeo_values, rtol=1e-6)
+
+    satnum_values = indexed_provider.get_static_property_values("SATNUM", 0)
+    assert satnum_values is not None
+    assert satnum_values.dtype == np.int32
+    assert -1 in satnum_values
+
+
+def test_grid_geometry_is_cached(tmp_path: Path) -> None:
+    indexed_provider, _xtgeo_provider = _create_providers(tmp_path)
+
+    grid = indexed_provider.get_3dgrid(0)
+    assert indexed_provider.get_3dgrid(0) is grid
+    assert indexed_provider.get_3dgrid(1) is not grid
@@ -0,0 +1,122 @@
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pytest
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_grid_provider import EnsembleGridProvider
+from webviz_subsurface._providers.ensemble_grid_provider._grid_property_store import (
+    GridPropertyStore,
+    GridPropertyStoreProvider,
+)
+
+NUM_CELLS = 2500
+DATES = ["20000101", "20010101"]
+
+
+class _DummyGridProvider(EnsembleGridProvider):
+    def __init__(self) -> None:
+        self.num_property_reads = 0
+
+    def provider_id(self) -> str:
+        return "dummy_grid_provider"
+
+    def static_property_names(self) -> List[str]:
+        return ["PORO", "FIPNUM"]
+
+    def dynamic_property_names(self) -> List[str]:
+        return ["PRESSURE"]
+
+    def dates_for_dynamic_property(self, property_name: str) -> Optional[List[str]]:
+        return DATES
+
+    def realizations(self) -> List[int]:
+        return [0, 3]
+
+    def get_3dgrid(self, realization: int) -> xtgeo.Grid:
+        return xtgeo.create_box_grid((25, 10, 10))
+
+    def get_static_property_values(
+        self, property_name: str, realization: int
+    ) -> Optional[np.ndarray]:
+        self.num_property_reads += 1
+        if property_name == "FIPNUM":
+            return np.arange(NUM_CELLS) % 7 + realization
+        if property_name == "PORO":
+            values = np.linspace(0, 1, NUM_CELLS) + realization
+            values[::10] = np.nan
+            return values
+        return None
+
+    def get_dynamic_property_values(
+        self, property_name: str, property_date: str, realization: int
+    ) -> Optional[np.ndarray]:
+        self.num_property_reads += 1
+        if property_name == "PRESSURE" and property_date in DATES:
+            return np.full(NUM_CELLS, 100 * realization + DATES.index(property_date))
+        return None
+
+
+def test_property_store_roundtrip(tmp_path: Path) -> None:
+    provider = _DummyGridProvider()
+    GridPropertyStore.write(tmp_path, provider)
+    store = GridPropertyStore.open(tmp_path)
+    assert store is not None
+
+    store_provider = GridPropertyStoreProvider(provider, store)
+    assert store_provider.provider_id() == provider.provider_id()
+    provider.num_property_reads = 0
+
+    for real in provider.realizations():
+        poro = store_provider.get_static_property_values("PORO", real)
+        assert poro is not None
+        assert poro.dtype == np.float32
+        np.testing.assert_allclose(
+            poro, provider.get_static_property_values("PORO", real), rtol=1e-6
+        )
+
+        fipnum = store_provider.get_static_property_values("FIPNUM", real)
+        assert fipnum is not None
+        assert fipnum.dtype == np.int32
+        np.testing.assert_array_equal(
+            fipnum, provider.get_static_property_values("FIPNUM", real)
+        )
+
+        for date in DATES:
+            pressure = store_provider.get_dynamic_property_values(
+                "PRESSURE", date, real
+            )
+            assert pressure is not None
+            np.testing.assert_array_equal(
+                pressure, provider.get_dynamic_property_values("PRESSURE", date, real)
+            )
+
+    # Only the reference reads above should have reached the wrapped provider
+    assert provider.num_property_reads == 2 * (2 + len(DATES))
+
+    # Properties missing from the store fall back to the wrapped provider
+    assert store_provider.get_static_property_values("NTG", 0) is None
+    assert provider.num_property_reads == 2 * (2 + len(DATES)) + 1
+
+
+def test_open_incomplete_property_store(tmp_path: Path) -> None:
+    assert GridPropertyStore.open(tmp_path) is None
+
+
+def test_failed_write_leaves_no_index_or_temporary_files(tmp_path: Path) -> None:
+    class _FailingGridProvider(_DummyGridProvider):
+        def get_dynamic_property_values(
+            self, property_name: str, property_date: str, realization: int
+        ) -> Optional[np.ndarray]:
+            if realization == 3:
+                raise OSError("Failed to read property")
+            return super().get_dynamic_property_values(
+                property_name, property_date, realization
+            )
+
+    with pytest.raises(OSError):
+        GridPropertyStore.write(tmp_path, _FailingGridProvider())
+
+    assert GridPropertyStore.open(tmp_path) is None
+    assert not list(tmp_path.glob("tmp-*"))
@@ -3,7 +3,9 @@ import os
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 # The fmu.ensemble dependency resdata is only available for Linux,
 # hence, ignore any import exception here to make
@@ -106,6 +108,113 @@ def test_create_from_arrow_unsmry_lazy(testdata_folder: Path, tmp_path: Path) ->
     assert vecdf["REAL"][0] == 5
 
 
+def _write_synthetic_unsmry_arrow_file(ens_dir: Path, real: int, values: list) -> None:
+    unsmry_dir = ens_dir / f"realization-{real}/iter-0/share/results/unsmry"
+    os.makedirs(unsmry_dir, exist_ok=True)
+    dates = np.datetime64("2020-01-01", "ms") + np.arange(len(values)).astype("m8[D]")
+    table = pa.table({"DATE": dates, "FOPT": pa.array(values, pa.float32())})
+    with pa.OSFile(str(unsmry_dir / "unsmry.arrow"), "wb") as sink:
+        with pa.RecordBatchFileWriter(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def test_create_from_arrow_unsmry_lazy_incremental(tmp_path: Path) -> None:
+    ens_dir = tmp_path / "ens"
+    ensemble_path = str(ens_dir / "realization-*/iter-0")
+    storage_dir = tmp_path / "storage"
+    _write_synthetic_unsmry_arrow_file(ens_dir, 0, [1.0, 2.0])
+    _write_synthetic_unsmry_arrow_file(ens_dir, 1, [10.0, 20.0])
+
+    factory = EnsembleSummaryProviderFactory(storage_dir, allow_storage_writes=True)
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, "share/results/unsmry/*.arrow", incremental=True
+    )
+    assert provider.realizations() == [0, 1]
+
+    # Non-incremental mode keeps using the existing backing store
+    _write_synthetic_unsmry_arrow_file(ens_dir, 2, [100.0, 200.0, 300.0])
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, "share/results/unsmry/*.arrow"
+    )
+    assert provider.realizations() == [0, 1]
+
+    # Add realization 2, change realization 1 and remove realization 0
+    _write_synthetic_unsmry_arrow_file(ens_dir, 1, [11.0, 21.0, 31.0, 41.0])
+    os.remove(ens_dir / "realization-0/iter-0/share/results/unsmry/unsmry.arrow")
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, "share/results/unsmry/*.arrow", incremental=True
+    )
+    assert provider.realizations() == [1, 2]
+
+    vecdf = provider.get_vectors_df(["FOPT"], None)
+    assert vecdf["REAL"].tolist() == [1, 1, 1, 1, 2, 2, 2]
+    assert vecdf["FOPT"].tolist() == [11.0, 21.0, 31.0, 41.0, 100.0, 200.0, 300.0]
+
+    # Unchanged files should not trigger rewrite of the backing store
+    arrow_files = list(storage_dir.rglob("arrow_unsmry_lazy__*.arrow"))
+    assert len(arrow_files) == 1
+    mtime_before = arrow_files[0].stat().st_mtime_ns
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, "share/results/unsmry/*.arrow", incremental=True
+    )
+    assert arrow_files[0].stat().st_mtime_ns == mtime_before
+    assert provider.realizations() == [1, 2]
+
+
+def test_create_from_arrow_unsmry_lazy_with_incremental_factory(
+    tmp_path: Path,
+) -> None:
+    ens_dir = tmp_path / "ens"
+    ensemble_path = str(ens_dir / "realization-*/iter-0")
+    _write_synthetic_unsmry_arrow_file(ens_dir, 0, [1.0, 2.0])
+
+    factory = EnsembleSummaryProviderFactory(
+        tmp_path / "storage", allow_storage_writes=True, incremental_lazy_updates=True
+    )
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, "share/results/unsmry/*.arrow"
+    )
+    assert provider.realizations() == [0]
+
+    # The factory setting is used when incremental is not specified
+    _write_synthetic_unsmry_arrow_file(ens_dir, 1, [10.0, 20.0])
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, "share/results/unsmry/*.arrow"
+    )
+    assert provider.realizations() == [0, 1]
+
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, "share/results/unsmry/*.arrow", incremental=False
+    )
+    assert provider.realizations() == [0, 1]
+
+
+def test_create_from_arrow_unsmry_lazy_incremental_without_files(
+    tmp_path: Path,
+) -> None:
+    ens_dir = tmp_path / "ens"
+    ensemble_path = str(ens_dir / "realization-*/iter-0")
+    _write_synthetic_unsmry_arrow_file(ens_dir, 0, [1.0, 2.0])
+    _write_synthetic_unsmry_arrow_file(ens_dir, 1, [10.0, 20.0])
+
+    factory = EnsembleSummaryProviderFactory(
+        tmp_path / "storage", allow_storage_writes=True, incremental_lazy_updates=True
+    )
+    factory.create_from_arrow_unsmry_lazy(ensemble_path, "share/results/unsmry/*.arrow")
+
+    # The existing backing store is used when the source files are gone
+    for real in [0, 1]:
+        os.remove(
+            ens_dir / f"realization-{real}/iter-0/share/results/unsmry/unsmry.arrow"
+        )
+    provider = factory.create_from_arrow_unsmry_lazy(
+        ensemble_path, "share/results/unsmry/*.arrow"
+    )
+    assert provider.realizations() == [0, 1]
+    vecdf = provider.get_vectors_df(["FOPT"], None)
+    assert vecdf["FOPT"].tolist() == [1.0, 2.0, 10.0, 20.0]
+
+
 def test_arrow_unsmry_lazy_vector_metadata(
     testdata_folder: Path, tmp_path: Path
 ) -> None:
@@ -0,0 +1,118 @@
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas._testing import assert_frame_equal
+
+from webviz_subsurface._providers.ensemble_summary_provider._provider_impl_arrow_presampled import (
+    ProviderImplArrowPresampled,
+)
+from webviz_subsurface._providers.ensemble_summary_provider.ensemble_summary_provider import (
+    EnsembleSummaryProvider,
+)
+from webviz_subsurface._providers.ensemble_summary_provider.ensemble_summary_provider_delta import (
+    EnsembleSummaryProviderDelta,
+)
+from webviz_subsurface._utils.ensemble_statistics import StatisticFunction
+
+# fmt: off
+INPUT_DATA_A = [
+    ["DATE",                "REAL",  "A",     "B",  "C" ],
+    [datetime(2020, 1, 1),  0,       10.0,    1.0,  5.0 ],
+    [datetime(2020, 2, 1),  0,       20.0,    1.0,  5.0 ],
+    [datetime(2020, 1, 1),  1,       30.0,    1.0,  5.0 ],
+    [datetime(2020, 2, 1),  1,       40.0,    1.0,  5.0 ],
+    [datetime(2020, 1, 1),  2,       50.0,    1.0,  5.0 ],
+    [datetime(2020, 2, 1),  2,       np.nan,  1.0,  5.0 ],
+]
+
+INPUT_DATA_B = [
+    ["DATE",                "REAL",  "A",  "B",  "D" ],
+    [datetime(2020, 1, 1),  1,       1.0,  3.0,  7.0 ],
+    [datetime(2020, 2, 1),  1,       2.0,  3.0,  7.0 ],
+    [datetime(2020, 3, 1),  1,       3.0,  3.0,  7.0 ],
+    [datetime(2020, 1, 1),  2,       4.0,  3.0,  7.0 ],
+    [datetime(2020, 2, 1),  2,       5.0,  3.0,  7.0 ],
+    [datetime(2020, 3, 1),  2,       6.0,  3.0,  7.0 ],
+    [datetime(2020, 1, 1),  3,       7.0,  3.0,  7.0 ],
+    [datetime(2020, 2, 1),  3,       8.0,  3.0,  7.0 ],
+    [datetime(2020, 3, 1),  3,       9.0,  3.0,  7.0 ],
+]
+# fmt: on
+
+
+def _create_provider(
+    input_py: list, storage_dir: Path, storage_key: str
+) -> EnsembleSummaryProvider:
+    input_df = pd.DataFrame(input_py[1:], columns=input_py[0])
+    ProviderImplArrowPresampled.write_backing_store_from_ensemble_dataframe(
+        storage_dir, storage_key, input_df
+    )
+    new_provider = ProviderImplArrowPresampled.from_backing_store(
+        storage_dir, storage_key
+    )
+    if not new_provider:
+        raise ValueError("Failed to create EnsembleSummaryProvider")
+    return new_provider
+
+
+@pytest.fixture(name="provider")
+def fixture_provider(tmp_path: Path) -> EnsembleSummaryProvider:
+    return EnsembleSummaryProviderDelta(
+        _create_provider(INPUT_DATA_A, tmp_path, "ens_a"),
+        _create_provider(INPUT_DATA_B, tmp_path, "ens_b"),
+    )
+
+
+def test_get_vector_names_and_realizations(provider: EnsembleSummaryProvider) -> None:
+    assert provider.vector_names() == ["A", "B"]
+    assert provider.vector_names_filtered_by_value(exclude_constant_values=True) == [
+        "A"
+    ]
+    assert provider.realizations() == [1, 2]
+    assert provider.vector_metadata("C") is None
+
+
+def test_get_dates(provider: EnsembleSummaryProvider) -> None:
+    assert provider.dates(None) == [datetime(2020, 1, 1), datetime(2020, 2, 1)]
+
+
+def test_get_vectors(provider: EnsembleSummaryProvider) -> None:
+    vecdf = provider.get_vectors_df(["A", "B"], None)
+
+    expected_df = pd.DataFrame(
+        {
+            "DATE": [datetime(2020, 1, 1), datetime(2020, 2, 1), datetime(2020, 1, 1)],
+            "REAL": [1, 1, 2],
+            "A": [29.0, 38.0, 46.0],
+            "B": [-2.0, -2.0, -2.0],
+        }
+    )
+    assert_frame_equal(vecdf, expected_df, check_dtype=False)
+    assert isinstance(vecdf["DATE"][0], datetime)
+
+    vecdf = provider.get_vectors_df(["B"], None, [2], date_as_datetime64=True)
+    assert vecdf["DATE"].dtype == "datetime64[ms]"
+    assert vecdf.shape == (2, 3)
+    assert list(vecdf["REAL"]) == [2, 2]
+
+
+def test_get_vectors_for_date(provider: EnsembleSummaryProvider) -> None:
+    vecdf = provider.get_vectors_for_date_df(datetime(2020, 2, 1), ["A"])
+
+    assert list(vecdf.columns) == ["REAL", "A"]
+    assert list(vecdf["REAL"]) == [1]
+    assert list(vecdf["A"]) == [38.0]
+
+
+def test_get_vectors_statistics(provider: EnsembleSummaryProvider) -> None:
+    statdf = provider.get_vectors_statistics_df(
+        ["A"], None, {"MEAN": StatisticFunction.MEAN, "MAX": StatisticFunction.MAX}
+    )
+
+    assert list(statdf.columns) == [("DATE", ""), ("A", "MEAN"), ("A", "MAX")]
+    assert list(statdf[("DATE", "")]) == [datetime(2020, 1, 1), datetime(2020, 2, 1)]
+    assert list(statdf[("A", "MEAN")]) == [37.5, 38.0]
+    assert list(statdf[("A", "MAX")]) == [46.0, 38.0]
@@ -13,9 +13,17 @@ from webviz_subsurface._providers.ensemble_summary_provider._provider_impl_arrow
     _find_first_non_increasing_date_pair,
     _is_date_column_monotonically_increasing,
 )
+from webviz_subsurface._providers.ensemble_summary_provider._resampled_vector_cache import (
+    ResampledVectorCache,
+)
 from webviz_subsurface._providers.ensemble_summary_provider.ensemble_summary_provider import (
     EnsembleSummaryProvider,
 )
+from webviz_subsurface._utils.cumulative_vectors import calc_from_cumulative_values
+from webviz_subsurface._utils.ensemble_statistics import (
+    StatisticFunction,
+    create_grouped_statistics_df,
+)
 
 
 def _add_mock_smry_meta_to_table(table: pa.Table) -> pa.Table:
@@ -76,7 +84,7 @@ def _create_provider_obj_with_data(
     per_real_tables = _split_into_per_realization_tables(input_table)
 
     ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
-        storage_dir, "dummy_key", per_real_tables
+        storage_dir, "dummy_key", sorted(per_real_tables.items())
     )
     new_provider = ProviderImplArrowLazy.from_backing_store(storage_dir, "dummy_key")
 
@@ -244,6 +252,13 @@ def test_get_vectors_without_resampling(tmp_path: Path) -> None:
     assert vecdf.shape == (1, 4)
     assert vecdf.columns.tolist() == ["DATE", "REAL", "B", "A"]
 
+    vecdf = provider.get_vectors_df(
+        ["A"], resampling_frequency=None, date_as_datetime64=True
+    )
+    assert vecdf.shape == (3, 3)
+    assert vecdf["DATE"].dtype == np.dtype("datetime64[ms]")
+    assert vecdf["DATE"].to_numpy()[2] == np.datetime64("2023-12-21", "ms")
+
 
 def test_get_vectors_with_daily_resampling(tmp_path: Path) -> None:
     # fmt:off
@@ -386,3 +401,280 @@ def test_create_with_repeated_dates(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError):
         _create_provider_obj_with_data(input_data, tmp_path)
+
+
+def test_backing_store_has_one_batch_range_per_realization(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "A"],
+        [np.datetime64("2023-12-20", "ms"),  2,      20.0],
+        [np.datetime64("2023-12-21", "ms"),  2,      21.0],
+        [np.datetime64("2023-12-20", "ms"),  0,      0.0],
+        [np.datetime64("2023-12-20", "ms"),  1,      10.0],
+        [np.datetime64("2023-12-21", "ms"),  1,      11.0],
+    ]
+    # fmt:on
+    provider = _create_provider_obj_with_data(input_data, tmp_path)
+    assert provider.realizations() == [0, 1, 2]
+
+    source = pa.memory_map(str(tmp_path / "dummy_key.arrow"), "r")
+    reader = pa.ipc.RecordBatchFileReader(source)
+    assert reader.num_record_batches == 3
+    for batch_idx in range(reader.num_record_batches):
+        batch_reals = reader.get_batch(batch_idx).column(0).unique().to_pylist()
+        assert batch_reals == [batch_idx]
+
+    vecdf = provider.get_vectors_df(
+        ["A"], resampling_frequency=None, realizations=[2, 0]
+    )
+    assert vecdf["REAL"].tolist() == [0, 2, 2]
+    assert vecdf["A"].tolist() == [0.0, 20.0, 21.0]
+
+    vecdf = provider.get_vectors_df(["A"], resampling_frequency=None, realizations=[])
+    assert vecdf.shape == (0, 3)
+
+    vecdf = provider.get_vectors_df(["A"], resampling_frequency=None, realizations=[99])
+    assert vecdf.shape == (0, 3)
+
+
+def test_get_vectors_with_resampled_vector_cache(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "TOT_t",  "RATE_r"],
+        [np.datetime64("2020-01-01", "ms"),  0,      10.0,     1.0],
+        [np.datetime64("2020-03-15", "ms"),  0,      40.0,     4.0],
+        [np.datetime64("2020-01-01", "ms"),  1,      20.0,     2.0],
+        [np.datetime64("2020-02-20", "ms"),  1,      60.0,     6.0],
+    ]
+    # fmt:on
+    provider_without_cache = _create_provider_obj_with_data(input_data, tmp_path)
+
+    cache = ResampledVectorCache(max_mem_bytes=1024 * 1024, spill_dir=None)
+    provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "dummy_key", cache)
+    assert provider is not None
+
+    expected_df = provider_without_cache.get_vectors_df(
+        ["TOT_t", "RATE_r"], Frequency.MONTHLY, [1]
+    )
+
+    vecdf = provider.get_vectors_df(["TOT_t"], Frequency.MONTHLY, [1])
+    assert vecdf.equals(expected_df[["DATE", "REAL", "TOT_t"]])
+    assert cache.stats().misses == 1
+
+    vecdf = provider.get_vectors_df(["TOT_t", "RATE_r"], Frequency.MONTHLY, [1])
+    assert vecdf.equals(expected_df)
+    assert cache.stats().mem_hits == 1
+    assert cache.stats().misses == 2
+
+    vecdf = provider.get_vectors_df(["RATE_r", "TOT_t"], Frequency.MONTHLY, [1])
+    assert vecdf.equals(expected_df[["DATE", "REAL", "RATE_r", "TOT_t"]])
+    assert cache.stats().mem_hits == 3
+
+    # Different realizations and no resampling should bypass cached entries
+    vecdf = provider.get_vectors_df(["TOT_t"], Frequency.MONTHLY)
+    assert vecdf.shape == (7, 3)
+    vecdf = provider.get_vectors_df(["TOT_t"], None)
+    assert vecdf.shape == (4, 3)
+    assert cache.stats().misses == 3
+
+
+def test_get_vectors_calculated_from_cumulatives(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "TOT_t",  "RATE_r"],
+        [np.datetime64("2020-01-01", "ms"),  0,      10.0,     1.0],
+        [np.datetime64("2020-03-15", "ms"),  0,      40.0,     4.0],
+        [np.datetime64("2020-01-01", "ms"),  1,      20.0,     2.0],
+        [np.datetime64("2020-02-20", "ms"),  1,      60.0,     6.0],
+    ]
+    # fmt:on
+    provider_without_cache = _create_provider_obj_with_data(input_data, tmp_path)
+    assert provider_without_cache.supports_vectors_calculated_from_cumulatives()
+    assert "PER_DAY_TOT_t" not in provider_without_cache.vector_names()
+
+    cache = ResampledVectorCache(max_mem_bytes=1024 * 1024, spill_dir=None)
+    provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "dummy_key", cache)
+    assert provider is not None
+
+    for prov in [provider_without_cache, provider]:
+        vecdf = prov.get_vectors_df(
+            ["PER_INTVL_TOT_t", "RATE_r", "PER_DAY_TOT_t"], Frequency.MONTHLY
+        )
+        assert vecdf.columns.tolist() == [
+            "DATE",
+            "REAL",
+            "PER_INTVL_TOT_t",
+            "RATE_r",
+            "PER_DAY_TOT_t",
+        ]
+
+        cumulative_df = prov.get_vectors_df(
+            ["TOT_t"], Frequency.MONTHLY, date_as_datetime64=True
+        )
+        for as_per_day, vec_name in [
+            (False, "PER_INTVL_TOT_t"),
+            (True, "PER_DAY_TOT_t"),
+        ]:
+            expected_values = calc_from_cumulative_values(
+                cumulative_df["DATE"].to_numpy(),
+                cumulative_df["REAL"].to_numpy(),
+                {"TOT_t": cumulative_df["TOT_t"].to_numpy()},
+                as_per_day,
+            )
+            assert vecdf[vec_name].tolist() == expected_values["TOT_t"].tolist()
+
+    # The calculated vectors are cached like the stored vectors
+    assert cache.stats().misses == 4
+    provider.get_vectors_df(["PER_DAY_TOT_t"], Frequency.MONTHLY)
+    assert cache.stats().misses == 4
+
+    # Per interval and per day vectors are only calculated for stored vectors
+    with pytest.raises(KeyError):
+        provider_without_cache.get_vectors_df(["PER_DAY_UNKNOWN"], Frequency.MONTHLY)
+
+
+def test_get_vectors_statistics(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "TOT_t",  "RATE_r"],
+        [np.datetime64("2020-01-01", "ms"),  0,      10.0,     1.0],
+        [np.datetime64("2020-03-15", "ms"),  0,      40.0,     4.0],
+        [np.datetime64("2020-01-01", "ms"),  1,      20.0,     2.0],
+        [np.datetime64("2020-02-20", "ms"),  1,      60.0,     6.0],
+        [np.datetime64("2020-01-01", "ms"),  2,      30.0,     3.0],
+        [np.datetime64("2020-03-01", "ms"),  2,      90.0,     9.0],
+    ]
+    # fmt:on
+    provider = _create_provider_obj_with_data(input_data, tmp_path)
+    statistics = {
+        "MEAN": StatisticFunction.MEAN,
+        "MAX": StatisticFunction.MAX,
+        "P10": 0.9,
+    }
+
+    for frequency, realizations in [
+        (Frequency.MONTHLY, None),
+        (Frequency.MONTHLY, [2, 0]),
+        (None, None),
+    ]:
+        expected_df = create_grouped_statistics_df(
+            provider.get_vectors_df(["TOT_t", "RATE_r"], frequency, realizations),
+            "DATE",
+            ["TOT_t", "RATE_r"],
+            statistics,
+        )
+
+        statdf = provider.get_vectors_statistics_df(
+            ["TOT_t", "RATE_r"], frequency, statistics, realizations
+        )
+        assert statdf.columns.equals(expected_df.columns)
+        assert statdf[("DATE", "")].tolist() == expected_df[("DATE", "")].tolist()
+        assert isinstance(statdf[("DATE", "")].iloc[0], datetime)
+        np.testing.assert_allclose(
+            statdf.iloc[:, 1:].to_numpy(), expected_df.iloc[:, 1:].to_numpy()
+        )
+
+    statdf = provider.get_vectors_statistics_df(
+        ["TOT_t"], Frequency.MONTHLY, statistics
+    )
+    statdf_datetime64 = provider.get_vectors_statistics_df(
+        ["TOT_t"], Frequency.MONTHLY, statistics, date_as_datetime64=True
+    )
+    assert statdf_datetime64[("DATE", "")].dtype == np.dtype("datetime64[ms]")
+    assert statdf_datetime64[("DATE", "")].tolist() == statdf[("DATE", "")].tolist()
+
+
+def test_get_vectors_statistics_with_resampled_vector_cache(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "TOT_t",  "RATE_r"],
+        [np.datetime64("2020-01-01", "ms"),  0,      10.0,     1.0],
+        [np.datetime64("2020-03-15", "ms"),  0,      40.0,     4.0],
+        [np.datetime64("2020-01-01", "ms"),  1,      20.0,     2.0],
+        [np.datetime64("2020-02-20", "ms"),  1,      60.0,     6.0],
+    ]
+    # fmt:on
+    provider_without_cache = _create_provider_obj_with_data(input_data, tmp_path)
+
+    cache = ResampledVectorCache(max_mem_bytes=1024 * 1024, spill_dir=None)
+    provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "dummy_key", cache)
+    assert provider is not None
+
+    statistics = {"MEAN": StatisticFunction.MEAN, "P50": 0.5}
+    expected_df = provider_without_cache.get_vectors_statistics_df(
+        ["TOT_t", "RATE_r"], Frequency.MONTHLY, statistics
+    )
+
+    # Misses for both the statistics and the resampled vector
+    statdf = provider.get_vectors_statistics_df(
+        ["TOT_t"], Frequency.MONTHLY, statistics
+    )
+    assert statdf.equals(expected_df[["DATE", "TOT_t"]])
+    assert cache.stats().misses == 2
+
+    # The statistics for TOT_t are served from the cache
+    statdf = provider.get_vectors_statistics_df(
+        ["TOT_t", "RATE_r"], Frequency.MONTHLY, statistics
+    )
+    assert statdf.equals(expected_df)
+    assert cache.stats().mem_hits == 1
+    assert cache.stats().misses == 4
+
+    # Other statistics are cached separately, but reuse the resampled vectors
+    provider.get_vectors_statistics_df(
+        ["TOT_t"], Frequency.MONTHLY, {"MIN": StatisticFunction.MIN}
+    )
+    assert cache.stats().mem_hits == 2
+    assert cache.stats().misses == 5
+
+
+def test_write_backing_store_with_differing_columns(tmp_path: Path) -> None:
+    per_real_tables = {
+        5: pa.table(
+            {
+                "DATE": pa.array(
+                    [
+                        np.datetime64("2020-01-01", "ms"),
+                        np.datetime64("2020-01-02", "ms"),
+                    ]
+                ),
+                "A": [50.0, 51.0],
+            }
+        ),
+        2: pa.table(
+            {
+                "DATE": pa.array([np.datetime64("2020-01-01", "ms")]),
+                "B": [-20.0],
+                "A": [20.0],
+            }
+        ),
+    }
+    ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
+        tmp_path, "dummy_key", sorted(per_real_tables.items())
+    )
+    provider = ProviderImplArrowLazy.from_backing_store(tmp_path, "dummy_key")
+    assert provider is not None
+
+    assert provider.realizations() == [2, 5]
+    assert sorted(provider.vector_names()) == ["A", "B"]
+    assert provider.vector_names_filtered_by_value(exclude_constant_values=True) == [
+        "A"
+    ]
+
+    vecdf = provider.get_vectors_df(["A", "B"], resampling_frequency=None)
+    assert vecdf["REAL"].tolist() == [2, 5, 5]
+    assert vecdf["A"].tolist() == [20.0, 50.0, 51.0]
+    assert vecdf["B"].tolist()[0] == -20.0
+    assert vecdf["B"].isna().tolist() == [False, True, True]
+
+
+def test_write_backing_store_requires_increasing_realizations(tmp_path: Path) -> None:
+    table = pa.table(
+        {"DATE": pa.array([np.datetime64("2020-01-01", "ms")]), "A": [1.0]}
+    )
+    with pytest.raises(ValueError):
+        ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
+            tmp_path, "dummy_key", [(3, table), (1, table)]
+        )
+
+    assert not list(tmp_path.iterdir())
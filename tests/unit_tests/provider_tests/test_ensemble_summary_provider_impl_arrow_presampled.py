@@ -11,6 +11,7 @@ from webviz_subsurface._providers.ensemble_summary_provider._provider_impl_arrow
 from webviz_subsurface._providers.ensemble_summary_provider.ensemble_summary_provider import (
     EnsembleSummaryProvider,
 )
+from webviz_subsurface._utils.ensemble_statistics import StatisticFunction
 
 # fmt: off
 INPUT_DATA_DATETIME = [
@@ -127,6 +128,29 @@ def test_get_vectors(provider: EnsembleSummaryProvider) -> None:
     assert vecdf.columns.tolist() == ["DATE", "REAL", "C", "A"]
 
 
+def test_get_vectors_statistics(provider: EnsembleSummaryProvider) -> None:
+    statistics = {"MEAN": StatisticFunction.MEAN, "P10": 0.9}
+
+    statdf = provider.get_vectors_statistics_df(["A", "C"], None, statistics)
+    assert statdf.shape == (2, 5)
+    assert statdf.columns.tolist() == [
+        ("DATE", ""),
+        ("A", "MEAN"),
+        ("A", "P10"),
+        ("C", "MEAN"),
+        ("C", "P10"),
+    ]
+    assert isinstance(statdf[("DATE", "")][0], datetime)
+    assert statdf[("A", "MEAN")].tolist() == [11.0, 13.0]
+    assert statdf[("A", "P10")].tolist() == [pytest.approx(11.8), 13.0]
+
+    statdf = provider.get_vectors_statistics_df(
+        ["A"], None, statistics, realizations=[0]
+    )
+    assert statdf.shape == (1, 3)
+    assert statdf[("A", "MEAN")].tolist() == [10.0]
+
+
 def test_get_vectors_for_date(provider: EnsembleSummaryProvider) -> None:
     intersection_of_dates = provider.dates(resampling_frequency=None)
     assert len(intersection_of_dates) == 1
@@ -0,0 +1,139 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+from webviz_subsurface._providers.ensemble_summary_provider._resampled_vector_cache import (
+    ResampledVectorCache,
+)
+from webviz_subsurface._providers.ensemble_summary_provider.ensemble_summary_provider import (
+    Frequency,
+)
+
+
+def _create_vector_table(vector_name: str, num_rows: int) -> pa.Table:
+    return pa.table(
+        {
+            "DATE": pa.array(
+                np.arange(num_rows).astype("M8[D]").astype("M8[ms]"),
+                type=pa.timestamp("ms"),
+            ),
+            "REAL": pa.array(np.zeros(num_rows, dtype=np.int64)),
+            vector_name: pa.array(np.arange(num_rows, dtype=np.float64)),
+        }
+    )
+
+
+def test_fetch_and_store_in_memory() -> None:
+    cache = ResampledVectorCache(max_mem_bytes=1024 * 1024, spill_dir=None)
+
+    assert cache.fetch("prov", "A", Frequency.MONTHLY, None) is None
+
+    table_a = _create_vector_table("A", 10)
+    cache.store("prov", "A", Frequency.MONTHLY, None, table_a)
+
+    assert cache.fetch("prov", "A", Frequency.MONTHLY, None) is table_a
+    assert cache.fetch("prov", "A", Frequency.YEARLY, None) is None
+    assert cache.fetch("prov", "A", Frequency.MONTHLY, [0]) is None
+    assert cache.fetch("other_prov", "A", Frequency.MONTHLY, None) is None
+
+    stats = cache.stats()
+    assert stats.mem_hits == 1
+    assert stats.misses == 4
+
+
+def test_realization_order_and_duplicates_give_same_key() -> None:
+    cache = ResampledVectorCache(max_mem_bytes=1024 * 1024, spill_dir=None)
+
+    table_a = _create_vector_table("A", 10)
+    cache.store("prov", "A", Frequency.MONTHLY, [3, 1, 2], table_a)
+
+    assert cache.fetch("prov", "A", Frequency.MONTHLY, [1, 2, 3, 3]) is table_a
+
+
+def test_lru_eviction_without_spill() -> None:
+    table_a = _create_vector_table("A", 100)
+    table_b = _create_vector_table("B", 100)
+    table_c = _create_vector_table("C", 100)
+    cache = ResampledVectorCache(max_mem_bytes=2 * table_a.nbytes, spill_dir=None)
+
+    cache.store("prov", "A", Frequency.MONTHLY, None, table_a)
+    cache.store("prov", "B", Frequency.MONTHLY, None, table_b)
+
+    # Touch A so that B becomes the least recently used entry
+    assert cache.fetch("prov", "A", Frequency.MONTHLY, None) is not None
+    cache.store("prov", "C", Frequency.MONTHLY, None, table_c)
+
+    assert cache.fetch("prov", "B", Frequency.MONTHLY, None) is None
+    assert cache.fetch("prov", "A", Frequency.MONTHLY, None) is not None
+    assert cache.fetch("prov", "C", Frequency.MONTHLY, None) is not None
+    assert cache.stats().evictions == 1
+
+
+def test_evicted_entries_are_spilled_to_disk(tmp_path: Path) -> None:
+    table_a = _create_vector_table("A", 100)
+    table_b = _create_vector_table("B", 100)
+    cache = ResampledVectorCache(max_mem_bytes=table_a.nbytes, spill_dir=tmp_path)
+
+    cache.store("prov", "A", Frequency.MONTHLY, None, table_a)
+    cache.store("prov", "B", Frequency.MONTHLY, None, table_b)
+    assert len(list(tmp_path.glob("*.arrow"))) == 1
+
+    spilled_table = cache.fetch("prov", "A", Frequency.MONTHLY, None)
+    assert spilled_table is not None
+    assert spilled_table.equals(table_a)
+    assert cache.stats().disk_hits == 1
+
+    # A new cache instance should pick up the spilled entries
+    new_cache = ResampledVectorCache(max_mem_bytes=table_a.nbytes, spill_dir=tmp_path)
+    assert new_cache.fetch("prov", "A", Frequency.MONTHLY, None) is not None
+    assert new_cache.fetch("prov", "B", Frequency.MONTHLY, None) is not None
+
+
+def test_spill_files_are_limited_by_disk_size(tmp_path: Path) -> None:
+    tables = [_create_vector_table(vec_name, 100) for vec_name in "ABCD"]
+
+    # Find the size of a spill file, which is equal for all the tables
+    probe_dir = tmp_path / "probe"
+    probe_cache = ResampledVectorCache(max_mem_bytes=0, spill_dir=probe_dir)
+    probe_cache.store("prov", "A", Frequency.MONTHLY, None, tables[0])
+    probe_cache.store("prov", "B", Frequency.MONTHLY, None, tables[1])
+    file_size = next(probe_dir.glob("*.arrow")).stat().st_size
+
+    cache = ResampledVectorCache(
+        max_mem_bytes=tables[0].nbytes,
+        spill_dir=tmp_path,
+        max_disk_bytes=2 * file_size,
+    )
+    for table in tables:
+        cache.store("prov", table.column_names[2], Frequency.MONTHLY, None, table)
+
+    # A, B and C have been spilled, and A as the least recently used is evicted
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
+    assert cache.stats().disk_evictions == 1
+    assert cache.fetch("prov", "A", Frequency.MONTHLY, None) is None
+    assert cache.fetch("prov", "B", Frequency.MONTHLY, None) is not None
+
+
+def test_setup_removes_orphaned_tmp_files_and_evicts(tmp_path: Path) -> None:
+    orphaned_tmp_file = tmp_path / "orphaned.arrow__123.tmp"
+    orphaned_tmp_file.write_bytes(b"")
+    os.utime(orphaned_tmp_file, (0, 0))
+    recent_tmp_file = tmp_path / "recent.arrow__456.tmp"
+    recent_tmp_file.write_bytes(b"")
+
+    table_a = _create_vector_table("A", 100)
+    table_b = _create_vector_table("B", 100)
+    cache = ResampledVectorCache(max_mem_bytes=table_a.nbytes, spill_dir=tmp_path)
+    cache.store("prov", "A", Frequency.MONTHLY, None, table_a)
+    cache.store("prov", "B", Frequency.MONTHLY, None, table_b)
+    assert len(list(tmp_path.glob("*.arrow"))) == 1
+
+    new_cache = ResampledVectorCache(
+        max_mem_bytes=table_a.nbytes, spill_dir=tmp_path, max_disk_bytes=0
+    )
+    assert not orphaned_tmp_file.exists()
+    assert recent_tmp_file.exists()
+    assert not list(tmp_path.glob("*.arrow"))
+    assert new_cache.stats().disk_evictions == 1
@@ -5,6 +5,7 @@ from webviz_subsurface._providers.ensemble_summary_provider._resampling import (
     Frequency,
     generate_normalized_sample_dates,
     interpolate_backfill,
+    resample_segmented_multi_real_table,
     sample_segmented_multi_real_table_at_date,
 )
 
@@ -318,3 +319,168 @@ def test_sample_segmented_multi_real_table_at_date() -> None:
     assert res["T"][1].as_py() == 3000
     assert res["R"][0].as_py() == 4
     assert res["R"][1].as_py() == 500
+
+
+def test_resample_segmented_multi_real_table() -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                             "REAL",  "T",    "R"],
+        [np.datetime64("2020-01-01", "ms"),  0,       10.0,   1],
+        [np.datetime64("2020-01-04", "ms"),  0,       40.0,   4],
+        [np.datetime64("2020-01-06", "ms"),  0,       60.0,   6],
+        [np.datetime64("2020-01-02", "ms"),  1,       2000.0,  200],
+        [np.datetime64("2020-01-05", "ms"),  1,       5000.0,  500],
+        [np.datetime64("2020-01-07T12:00", "ms"),  1, 7500.0,  750],
+        [np.datetime64("2020-01-03", "ms"),  2,       300.0,  30],
+    ]
+    # fmt:on
+
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int64()),
+            pa.field("T", pa.float32(), metadata={b"is_rate": b"False"}),
+            pa.field("R", pa.float32(), metadata={b"is_rate": b"True"}),
+        ]
+    )
+
+    table = _create_table_from_row_data(per_row_input_data=input_data, schema=schema)
+
+    res = resample_segmented_multi_real_table(table, Frequency.DAILY)
+    assert res.schema == schema
+
+    # fmt:off
+    expected_dates = (
+        [np.datetime64(f"2020-01-0{day}", "ms") for day in [1, 2, 3, 4, 5, 6]]
+        + [np.datetime64(f"2020-01-0{day}", "ms") for day in [2, 3, 4, 5, 6, 7, 8]]
+        + [np.datetime64("2020-01-03", "ms")]
+    )
+    # fmt:on
+    assert res["DATE"].to_numpy().tolist() == expected_dates
+    assert res["REAL"].to_pylist() == 6 * [0] + 7 * [1] + [2]
+
+    assert res["T"].to_pylist() == [
+        10, 20, 30, 40, 50, 60,
+        2000, 3000, 4000, 5000, 6000, 7000, 7500,
+        300,
+    ]  # fmt: skip
+    assert res["R"].to_pylist() == [
+        1, 4, 4, 4, 6, 6,
+        200, 500, 500, 500, 750, 750, 0,
+        30,
+    ]  # fmt: skip
+
+
+def test_resample_segmented_multi_real_table_matches_np_interp() -> None:
+    rng = np.random.default_rng(seed=0)
+
+    per_real_tables = []
+    for real in [3, 5, 8]:
+        dates = np.datetime64("2020-01-15", "ms") + np.cumsum(
+            rng.integers(1, 40, size=20)
+        ).astype("m8[D]")
+        per_real_tables.append(
+            pa.table(
+                {
+                    "DATE": dates,
+                    "REAL": np.full(len(dates), real),
+                    "T": rng.random(len(dates)),
+                }
+            )
+        )
+    table = pa.concat_tables(per_real_tables)
+
+    res = resample_segmented_multi_real_table(table, Frequency.MONTHLY)
+
+    for real_table in per_real_tables:
+        real = real_table["REAL"][0].as_py()
+        res_mask = res["REAL"].to_numpy() == real
+        sample_dates = res["DATE"].to_numpy()[res_mask]
+        expected_values = np.interp(
+            sample_dates.astype(np.int64),
+            real_table["DATE"].to_numpy().astype(np.int64),
+            real_table["T"].to_numpy(),
+        )
+        assert np.array_equal(res["T"].to_numpy()[res_mask], expected_values)
+
+
+def _create_unsorted_segmented_tables() -> list:
+    """Per realization tables, to be concatenated into a table that is segmented
+    on REAL but not sorted on REAL"""
+    rng = np.random.default_rng(seed=1)
+
+    schema = pa.schema(
+        [
+            pa.field("DATE", pa.timestamp("ms")),
+            pa.field("REAL", pa.int64()),
+            pa.field("T", pa.float64(), metadata={b"is_rate": b"False"}),
+            pa.field("R", pa.float64(), metadata={b"is_rate": b"True"}),
+        ]
+    )
+
+    per_real_tables = []
+    for real, first_date, num_dates in [
+        (3, "2000-03-01", 12),
+        (0, "2001-07-01", 4),
+        (7, "2000-01-01", 20),
+        (5, "2000-11-01", 3),
+    ]:
+        dates = np.datetime64(first_date, "ms") + np.cumsum(
+            rng.integers(20, 60, size=num_dates)
+        ).astype("m8[D]")
+        per_real_tables.append(
+            pa.table(
+                {
+                    "DATE": dates,
+                    "REAL": np.full(num_dates, real),
+                    "T": rng.random(num_dates) * 10,
+                    "R": rng.random(num_dates) * 10,
+                },
+                schema=schema,
+            )
+        )
+
+    return per_real_tables
+
+
+def test_sample_segmented_multi_real_table_at_date_with_unsorted_reals() -> None:
+    per_real_tables = _create_unsorted_segmented_tables()
+    table = pa.concat_tables(per_real_tables)
+    sorted_per_real_tables = sorted(
+        per_real_tables, key=lambda real_table: real_table["REAL"][0].as_py()
+    )
+
+    for sampledate in [
+        np.datetime64("2000-01-01", "ms"),
+        np.datetime64("2001-06-15", "ms"),
+        np.datetime64("2003-01-01", "ms"),
+        per_real_tables[1]["DATE"].to_numpy()[2],
+    ]:
+        res = sample_segmented_multi_real_table_at_date(table, sampledate)
+
+        expected = pa.concat_tables(
+            [
+                sample_segmented_multi_real_table_at_date(real_table, sampledate)
+                for real_table in sorted_per_real_tables
+            ]
+        )
+        assert res["REAL"].to_pylist() == [0, 3, 5, 7]
+        assert res.equals(expected)
+
+
+def test_resample_segmented_multi_real_table_with_unsorted_reals() -> None:
+    per_real_tables = _create_unsorted_segmented_tables()
+    table = pa.concat_tables(per_real_tables)
+    sorted_per_real_tables = sorted(
+        per_real_tables, key=lambda real_table: real_table["REAL"][0].as_py()
+    )
+
+    res = resample_segmented_multi_real_table(table, Frequency.MONTHLY)
+
+    expected = pa.concat_tables(
+        [
+            resample_segmented_multi_real_table(real_table, Frequency.MONTHLY)
+            for real_table in sorted_per_real_tables
+        ]
+    )
+    assert res.equals(expected)
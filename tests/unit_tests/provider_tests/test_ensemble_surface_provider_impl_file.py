@@ -0,0 +1,245 @@
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_surface_provider._io_concurrency import (
+    IO_EXECUTOR_TYPE_ENV_VAR,
+    IO_MAX_WORKERS_ENV_VAR,
+    IoConcurrencyConfig,
+    IoExecutorType,
+    io_concurrency_config_from_env,
+)
+from webviz_subsurface._providers.ensemble_surface_provider._provider_impl_file import (
+    ProviderImplFile,
+    SurfaceStoreFormat,
+)
+from webviz_subsurface._providers.ensemble_surface_provider._stat_surf_cache import (
+    StatSurfCache,
+)
+from webviz_subsurface._providers.ensemble_surface_provider._surface_discovery import (
+    SurfaceFileInfo,
+)
+from webviz_subsurface._providers.ensemble_surface_provider.ensemble_surface_provider import (
+    SimulatedSurfaceAddress,
+    StatisticalSurfaceAddress,
+    SurfaceStatistic,
+)
+
+
+def _write_realization_surfaces(surf_dir: Path, num_reals: int) -> List[str]:
+    rng = np.random.default_rng(seed=1234)
+    surf_fns = []
+    for real in range(num_reals):
+        values = np.ma.masked_array(rng.random((12, 9)), mask=False)
+        # Make one node undefined in one of the realizations
+        if real == 1:
+            values.mask[3, 4] = True
+        surf = xtgeo.RegularSurface(ncol=12, nrow=9, xinc=1.0, yinc=1.0, values=values)
+        surf_fn = str(surf_dir / f"real-{real}--topvolon--depth.gri")
+        surf.to_file(surf_fn)
+        surf_fns.append(surf_fn)
+
+    return surf_fns
+
+
+def _create_provider(
+    tmp_path: Path,
+    num_reals: int,
+    io_concurrency: IoConcurrencyConfig = IoConcurrencyConfig(),
+    store_format: SurfaceStoreFormat = SurfaceStoreFormat.STACKED,
+) -> ProviderImplFile:
+    surf_dir = tmp_path / "surfaces"
+    surf_dir.mkdir()
+    surf_fns = _write_realization_surfaces(surf_dir, num_reals)
+    sim_surfaces = [
+        SurfaceFileInfo(
+            path=surf_fn, real=real, name="topvolon", attribute="depth", datestr=None
+        )
+        for real, surf_fn in enumerate(surf_fns)
+    ]
+
+    storage_dir = tmp_path / "storage"
+    ProviderImplFile.write_backing_store(
+        storage_dir,
+        "dummy_key",
+        sim_surfaces=sim_surfaces,
+        obs_surfaces=[],
+        avoid_copying_surfaces=False,
+        io_concurrency=io_concurrency,
+        store_format=store_format,
+    )
+    provider = ProviderImplFile.from_backing_store(
+        storage_dir,
+        "dummy_key",
+        StatSurfCache(
+            tmp_path / "stat_surf_cache", max_mem_bytes=10**8, max_disk_bytes=10**8
+        ),
+        io_concurrency,
+    )
+    assert provider is not None
+    return provider
+
+
+def _make_address(
+    statistic: SurfaceStatistic, realizations: List[int]
+) -> StatisticalSurfaceAddress:
+    return StatisticalSurfaceAddress(
+        attribute="depth",
+        name="topvolon",
+        datestr=None,
+        statistic=statistic,
+        realizations=realizations,
+    )
+
+
+def test_get_statistical_surfaces_matches_xtgeo_apply(tmp_path: Path) -> None:
+    provider = _create_provider(tmp_path, num_reals=5)
+    reals = provider.realizations()
+    assert reals == [0, 1, 2, 3, 4]
+
+    statistics = list(SurfaceStatistic)
+    stat_surfs = provider.get_statistical_surfaces(
+        [_make_address(statistic, reals) for statistic in statistics]
+    )
+
+    input_surfs = xtgeo.Surfaces(
+        [
+            xtgeo.surface_from_file(fn)
+            for fn in sorted((tmp_path / "surfaces").glob("*.gri"))
+        ]
+    )
+    expected_funcs = {
+        SurfaceStatistic.MEAN: (np.mean, []),
+        SurfaceStatistic.STDDEV: (np.std, []),
+        SurfaceStatistic.MINIMUM: (np.min, []),
+        SurfaceStatistic.MAXIMUM: (np.max, []),
+        SurfaceStatistic.P10: (np.percentile, [10]),
+        SurfaceStatistic.P90: (np.percentile, [90]),
+    }
+    for statistic, stat_surf in zip(statistics, stat_surfs):
+        func, args = expected_funcs[statistic]
+        expected_surf = input_surfs.apply(func, *args, axis=0)
+        assert stat_surf is not None
+        assert np.array_equal(stat_surf.values.mask, expected_surf.values.mask)
+        assert stat_surf.values.mask[3, 4]
+        assert np.allclose(
+            stat_surf.values.compressed(), expected_surf.values.compressed(), atol=1e-6
+        )
+
+    # Single statistics should now be served from the cache
+    single_surf = provider.get_surface(_make_address(SurfaceStatistic.P90, reals))
+    assert single_surf is not None
+    assert np.ma.allequal(single_surf.values, stat_surfs[-1].values)
+    assert len(list((tmp_path / "stat_surf_cache").glob("*.gri"))) == len(statistics)
+
+
+def test_get_statistical_surfaces_for_different_realizations(tmp_path: Path) -> None:
+    provider = _create_provider(tmp_path, num_reals=4)
+
+    surfs = provider.get_statistical_surfaces(
+        [
+            _make_address(SurfaceStatistic.MAXIMUM, [0, 2]),
+            _make_address(SurfaceStatistic.MAXIMUM, [0, 1, 2, 3]),
+            _make_address(SurfaceStatistic.MAXIMUM, [2, 0]),
+            _make_address(SurfaceStatistic.MEAN, [9]),
+        ]
+    )
+
+    assert surfs[0] is not None and surfs[1] is not None and surfs[2] is not None
+    assert not surfs[0].values.mask[3, 4]
+    assert surfs[1].values.mask[3, 4]
+    assert np.array_equal(surfs[0].values, surfs[2].values)
+    assert surfs[0] is not surfs[2]
+    assert surfs[3] is None
+
+
+@pytest.mark.parametrize(
+    "io_concurrency",
+    [
+        IoConcurrencyConfig(max_workers=1),
+        IoConcurrencyConfig(IoExecutorType.THREAD, max_workers=3),
+        IoConcurrencyConfig(IoExecutorType.PROCESS, max_workers=2),
+    ],
+)
+def test_parallel_copy_and_load(
+    tmp_path: Path, io_concurrency: IoConcurrencyConfig
+) -> None:
+    provider = _create_provider(
+        tmp_path,
+        num_reals=6,
+        io_concurrency=io_concurrency,
+        store_format=SurfaceStoreFormat.FILE_COPIES,
+    )
+    assert len(list((tmp_path / "storage" / "dummy_key" / "sim").glob("*.gri"))) == 6
+
+    mean_surf = provider.get_surface(
+        _make_address(SurfaceStatistic.MEAN, provider.realizations())
+    )
+    input_surfs = xtgeo.Surfaces(
+        [
+            xtgeo.surface_from_file(fn)
+            for fn in sorted((tmp_path / "surfaces").glob("*.gri"))
+        ]
+    )
+    expected_surf = input_surfs.apply(np.mean, axis=0)
+    assert mean_surf is not None
+    assert np.ma.allclose(mean_surf.values, expected_surf.values, atol=1e-6)
+
+
+def test_io_concurrency_config_from_env() -> None:
+    assert io_concurrency_config_from_env({}) == IoConcurrencyConfig()
+    assert io_concurrency_config_from_env(
+        {IO_EXECUTOR_TYPE_ENV_VAR: "Process", IO_MAX_WORKERS_ENV_VAR: "3"}
+    ) == IoConcurrencyConfig(IoExecutorType.PROCESS, max_workers=3)
+    assert (
+        io_concurrency_config_from_env(
+            {IO_EXECUTOR_TYPE_ENV_VAR: "fibers", IO_MAX_WORKERS_ENV_VAR: "0"}
+        )
+        == IoConcurrencyConfig()
+    )
+
+
+@pytest.mark.parametrize(
+    "store_format", [SurfaceStoreFormat.STACKED, SurfaceStoreFormat.FILE_COPIES]
+)
+def test_get_simulated_surface(
+    tmp_path: Path, store_format: SurfaceStoreFormat
+) -> None:
+    provider = _create_provider(tmp_path, num_reals=3, store_format=store_format)
+
+    sim_dir = tmp_path / "storage" / "dummy_key" / "sim"
+    if store_format == SurfaceStoreFormat.STACKED:
+        assert len(list(sim_dir.glob("*.surfstack"))) == 1
+        assert len(list(sim_dir.glob("*.gri"))) == 0
+    else:
+        assert len(list(sim_dir.glob("*.gri"))) == 3
+
+    for real in range(3):
+        surf = provider.get_surface(
+            SimulatedSurfaceAddress(
+                attribute="depth", name="topvolon", datestr=None, realization=real
+            )
+        )
+        expected_surf = xtgeo.surface_from_file(
+            tmp_path / "surfaces" / f"real-{real}--topvolon--depth.gri"
+        )
+        assert surf is not None
+        assert surf.compare_topology(expected_surf)
+        assert np.ma.allclose(surf.values, expected_surf.values, atol=1e-6)
+
+
+def test_inventory_queries(tmp_path: Path) -> None:
+    provider = _create_provider(tmp_path, num_reals=3)
+
+    assert provider.attributes() == ["depth"]
+    assert provider.surface_names_for_attribute("depth") == ["topvolon"]
+    assert not provider.surface_names_for_attribute("unknown")
+    assert provider.surface_dates_for_attribute("depth") is None
+    assert provider.realizations() == [0, 1, 2]
+
+    # Modifying the returned lists must not affect the provider
+    provider.realizations().append(99)
+    assert provider.realizations() == [0, 1, 2]
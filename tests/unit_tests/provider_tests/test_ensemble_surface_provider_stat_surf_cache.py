@@ -0,0 +1,99 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_surface_provider._stat_surf_cache import (
+    StatSurfCache,
+    compose_input_fingerprint,
+)
+from webviz_subsurface._providers.ensemble_surface_provider.ensemble_surface_provider import (
+    StatisticalSurfaceAddress,
+    SurfaceStatistic,
+)
+
+
+def _make_surface(value: float) -> xtgeo.RegularSurface:
+    return xtgeo.RegularSurface(
+        ncol=10, nrow=8, xinc=1.0, yinc=1.0, values=np.full((10, 8), value)
+    )
+
+
+def _make_address(statistic: SurfaceStatistic) -> StatisticalSurfaceAddress:
+    return StatisticalSurfaceAddress(
+        attribute="ds_extract_geogrid",
+        name="topvolon",
+        datestr=None,
+        statistic=statistic,
+        realizations=[2, 0, 1],
+    )
+
+
+def test_fetch_from_memory_and_disk(tmp_path: Path) -> None:
+    address = _make_address(SurfaceStatistic.MEAN)
+    cache = StatSurfCache(tmp_path, max_mem_bytes=10**8, max_disk_bytes=10**8)
+
+    assert cache.fetch(address, "fingerprint") is None
+
+    cache.store(address, "fingerprint", _make_surface(42.0))
+    mem_surf = cache.fetch(address, "fingerprint")
+    assert mem_surf is not None
+    assert np.allclose(mem_surf.values, 42.0)
+
+    # Modifying the fetched surface must not affect the cached entry
+    mem_surf.values = 0.0
+    assert np.allclose(cache.fetch(address, "fingerprint").values, 42.0)
+
+    # A fresh cache instance, as in another process, should find the disk entry
+    other_cache = StatSurfCache(tmp_path, max_mem_bytes=10**8, max_disk_bytes=10**8)
+    disk_surf = other_cache.fetch(address, "fingerprint")
+    assert disk_surf is not None
+    assert np.allclose(disk_surf.values, 42.0)
+    assert other_cache.fetch(address, "other_fingerprint") is None
+
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_memory_only_cache() -> None:
+    address = _make_address(SurfaceStatistic.P10)
+    cache = StatSurfCache(None, max_mem_bytes=1, max_disk_bytes=0)
+
+    cache.store(address, "fingerprint", _make_surface(1.0))
+    assert cache.fetch(address, "fingerprint") is not None
+
+    # Storing a second entry exceeds the memory limit and evicts the first
+    cache.store(address, "other_fingerprint", _make_surface(2.0))
+    assert cache.fetch(address, "fingerprint") is None
+    assert cache.fetch(address, "other_fingerprint") is not None
+
+
+def test_disk_eviction(tmp_path: Path) -> None:
+    cache = StatSurfCache(tmp_path, max_mem_bytes=10**8, max_disk_bytes=10**8)
+    cache.store(_make_address(SurfaceStatistic.MEAN), "fp", _make_surface(1.0))
+    file_size = sum(path.stat().st_size for path in tmp_path.glob("*.gri"))
+
+    # Room for two files on disk
+    cache = StatSurfCache(tmp_path, max_mem_bytes=10**8, max_disk_bytes=2 * file_size)
+    for statistic in [SurfaceStatistic.P10, SurfaceStatistic.P90]:
+        cache.store(_make_address(statistic), "fp", _make_surface(1.0))
+
+    gri_files = list(tmp_path.glob("*.gri"))
+    assert len(gri_files) == 2
+    assert not any(path.name.startswith("Mean") for path in gri_files)
+
+
+def test_input_fingerprint(tmp_path: Path) -> None:
+    surf_fns = []
+    for real in range(3):
+        surf_fn = str(tmp_path / f"surf_{real}.gri")
+        _make_surface(float(real)).to_file(surf_fn)
+        surf_fns.append(surf_fn)
+
+    fingerprint = compose_input_fingerprint([0, 1, 2], surf_fns)
+    assert fingerprint == compose_input_fingerprint([2, 1, 0, 1], surf_fns[::-1])
+    assert fingerprint != compose_input_fingerprint([0, 1], surf_fns)
+
+    stat_res = os.stat(surf_fns[1])
+    os.utime(surf_fns[1], ns=(stat_res.st_atime_ns, stat_res.st_mtime_ns + 10**9))
+    assert fingerprint != compose_input_fingerprint([0, 1, 2], surf_fns)
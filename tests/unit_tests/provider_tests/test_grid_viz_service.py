@@ -0,0 +1,244 @@
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_grid_provider import (
+    CellFilter,
+    EnsembleGridProvider,
+    GridVizService,
+    PropertySpec,
+    Ray,
+)
+from webviz_subsurface._providers.ensemble_grid_provider._esg_geometry_cache import (
+    EsgGeometryCache,
+)
+
+
+class _DummyGridProvider(EnsembleGridProvider):
+    def __init__(self) -> None:
+        self.num_get_3dgrid_calls = 0
+
+    def provider_id(self) -> str:
+        return "dummy_grid_provider"
+
+    def static_property_names(self) -> List[str]:
+        return []
+
+    def dynamic_property_names(self) -> List[str]:
+        return []
+
+    def dates_for_dynamic_property(self, property_name: str) -> Optional[List[str]]:
+        return None
+
+    def realizations(self) -> List[int]:
+        return [0, 1, 2]
+
+    def get_3dgrid(self, realization: int) -> xtgeo.Grid:
+        self.num_get_3dgrid_calls += 1
+        return xtgeo.create_box_grid((20, 15, 10 + realization))
+
+    def get_static_property_values(
+        self, property_name: str, realization: int
+    ) -> Optional[np.ndarray]:
+        if property_name == "CELL_INDEX":
+            grid = self.get_3dgrid(realization)
+            return np.arange(grid.ncol * grid.nrow * grid.nlay)
+        return None
+
+    def get_dynamic_property_values(
+        self, property_name: str, property_date: str, realization: int
+    ) -> Optional[np.ndarray]:
+        return None
+
+
+def _get_grid_point_array(
+    service: GridVizService, provider_id: str, realization: int
+) -> np.ndarray:
+    surface_polys, _ = service.get_surface(provider_id, realization, None, None)
+    return surface_polys.point_arr.copy()
+
+
+def test_grid_workers_lru_eviction(tmp_path: Path) -> None:
+    provider = _DummyGridProvider()
+
+    # Find the memory used by one worker, including its cached surface, to set up a
+    # budget of two workers
+    probe_service = GridVizService()
+    probe_service.register_provider(provider)
+    _get_grid_point_array(probe_service, provider.provider_id(), 2)
+    # pylint: disable=protected-access
+    worker = probe_service._get_or_create_grid_worker(provider.provider_id(), 2)
+    assert worker is not None
+    worker_bytes = worker.estimated_memory_bytes()
+    assert worker_bytes > 0
+
+    esg_geometry_cache = EsgGeometryCache(tmp_path, max_disk_bytes=10**9)
+    service = GridVizService(
+        max_grid_workers_bytes=int(2.5 * worker_bytes),
+        esg_geometry_cache=esg_geometry_cache,
+    )
+    service.register_provider(provider)
+    provider.num_get_3dgrid_calls = 0
+
+    expected_points = {
+        real: _get_grid_point_array(service, provider.provider_id(), real)
+        for real in [0, 1, 2]
+    }
+    assert provider.num_get_3dgrid_calls == 3
+    assert len(list(tmp_path.glob("*.npz"))) == 3
+
+    # Realization 0 was evicted, but is re-created from the geometry cache
+    assert list(service._key_to_worker_dict) == [
+        "Pdummy_grid_provider__R1",
+        "Pdummy_grid_provider__R2",
+    ]
+    points = _get_grid_point_array(service, provider.provider_id(), 0)
+    assert provider.num_get_3dgrid_calls == 3
+    assert np.array_equal(points, expected_points[0])
+    assert list(service._key_to_worker_dict) == [
+        "Pdummy_grid_provider__R2",
+        "Pdummy_grid_provider__R0",
+    ]
+
+
+def test_grid_workers_evicted_on_cache_growth() -> None:
+    provider = _DummyGridProvider()
+    provider_id = provider.provider_id()
+
+    # Budget that just fits two workers without any cached data
+    probe_service = GridVizService()
+    probe_service.register_provider(provider)
+    # pylint: disable=protected-access
+    workers_bytes = 0
+    for real in [0, 1]:
+        worker = probe_service._get_or_create_grid_worker(provider_id, real)
+        assert worker is not None
+        workers_bytes += worker.estimated_memory_bytes()
+
+    service = GridVizService(max_grid_workers_bytes=workers_bytes + 1000)
+    service.register_provider(provider)
+    for real in [0, 1]:
+        service._get_or_create_grid_worker(provider_id, real)
+    assert list(service._key_to_worker_dict) == [
+        "Pdummy_grid_provider__R0",
+        "Pdummy_grid_provider__R1",
+    ]
+
+    # Growing the caches of realization 1 exceeds the budget without creating any
+    # new worker, so realization 0 is evicted
+    service.ray_pick_many(
+        provider_id, 1, np.array([[[1.5, 1.5, 100.0], [1.5, 1.5, -100.0]]]), None, None
+    )
+    assert list(service._key_to_worker_dict) == ["Pdummy_grid_provider__R1"]
+
+
+def test_cut_along_polyline_only_hits_crossed_columns() -> None:
+    provider = _DummyGridProvider()
+    service = GridVizService()
+    service.register_provider(provider)
+
+    # The grid is 20x15 columns of 1x1, cross row J=7 and then column I=3
+    polyline_xy = [-5.0, 7.5, 3.5, 7.5, 3.5, 20.0]
+    surface_polys, property_scalars = service.cut_along_polyline(
+        provider.provider_id(), 0, polyline_xy, PropertySpec("CELL_INDEX", None)
+    )
+    assert len(surface_polys.poly_arr) > 0
+    assert property_scalars is not None
+
+    cell_indices = np.unique(property_scalars.value_arr)
+    cell_i = cell_indices % 20
+    cell_j = (cell_indices // 20) % 15
+    assert set(cell_indices // (20 * 15)) == set(range(10))
+    assert set(zip(cell_i, cell_j)) == {(i, 7) for i in range(4)} | {
+        (3, j) for j in range(7, 15)
+    }
+
+    # A polyline outside the grid gives an empty result
+    surface_polys, property_scalars = service.cut_along_polyline(
+        provider.provider_id(), 0, [100.0, 100.0, 200.0, 200.0], None
+    )
+    assert len(surface_polys.point_arr) == 0
+    assert property_scalars is None
+
+
+def test_surfaces_cached_per_cell_filter() -> None:
+    provider = _DummyGridProvider()
+    service = GridVizService()
+    service.register_provider(provider)
+    provider_id = provider.provider_id()
+
+    cell_filters = [None] + [CellFilter(0, 9, 0, 9, 0, k) for k in range(1, 5)]
+    surfaces = {}
+    for cell_filter in cell_filters[:3]:
+        surface_polys, _ = service.get_surface(provider_id, 0, None, cell_filter)
+        surfaces[str(cell_filter)] = surface_polys
+
+    # Toggling between the filters re-uses the cached surfaces
+    for cell_filter in cell_filters[:3]:
+        surface_polys, property_scalars = service.get_surface(
+            provider_id, 0, PropertySpec("CELL_INDEX", None), cell_filter
+        )
+        assert surface_polys is surfaces[str(cell_filter)]
+        assert property_scalars is not None
+
+        mapped_scalars = service.get_mapped_property_values(
+            provider_id, 0, PropertySpec("CELL_INDEX", None), cell_filter
+        )
+        assert mapped_scalars is not None
+        assert np.array_equal(mapped_scalars.value_arr, property_scalars.value_arr)
+
+    # Only the most recently used surfaces are kept
+    for cell_filter in cell_filters[3:]:
+        service.get_surface(provider_id, 0, None, cell_filter)
+    surface_polys, _ = service.get_surface(provider_id, 0, None, cell_filters[0])
+    assert surface_polys is not surfaces[str(cell_filters[0])]
+    assert np.array_equal(
+        surface_polys.point_arr, surfaces[str(cell_filters[0])].point_arr
+    )
+
+
+def test_ray_pick_many_matches_ray_pick() -> None:
+    provider = _DummyGridProvider()
+    service = GridVizService()
+    service.register_provider(provider)
+    provider_id = provider.provider_id()
+
+    # Vertical rays from above the grid, the last one misses the grid
+    rays = np.array(
+        [[[x, y, 100.0], [x, y, -100.0]] for x, y in [(0.5, 0.5), (7.2, 3.9), (50, 50)]]
+    )
+    for cell_filter in [None, CellFilter(5, 12, 2, 9, 3, 8)]:
+        results = service.ray_pick_many(
+            provider_id, 0, rays, PropertySpec("CELL_INDEX", None), cell_filter
+        )
+        assert len(results) == len(rays)
+
+        for ray_arr, result in zip(rays, results):
+            pick_result = service.ray_pick(
+                provider_id,
+                0,
+                Ray(origin=ray_arr[0].tolist(), end=ray_arr[1].tolist()),
+                PropertySpec("CELL_INDEX", None),
+                cell_filter,
+            )
+            if pick_result is None:
+                assert result["cell_index"] == -1
+                assert np.isnan(result["cell_property_value"])
+                continue
+
+            assert result["cell_index"] == pick_result.cell_index
+            assert result["cell_property_value"] == pick_result.cell_index
+            assert (result["cell_i"], result["cell_j"], result["cell_k"]) == (
+                pick_result.cell_i,
+                pick_result.cell_j,
+                pick_result.cell_k,
+            )
+            assert np.allclose(
+                result["intersection_point"], pick_result.intersection_point
+            )
+
+    # Picking against the cropped grid starts at the filter's top layer
+    assert results["cell_k"][1] == 3
+    assert results["cell_index"][0] == -1
@@ -0,0 +1,100 @@
+import gzip
+
+import numpy as np
+import xtgeo
+from dash import Dash, html
+
+from webviz_subsurface._providers.ensemble_surface_provider import (
+    QualifiedSurfaceAddress,
+    SimulatedSurfaceAddress,
+    SurfaceArrayEncoding,
+    SurfaceArrayServer,
+)
+
+
+def _make_surface() -> xtgeo.RegularSurface:
+    values = np.ma.masked_array(
+        np.linspace(1000.0, 2000.0, 40 * 30).reshape(40, 30), mask=False
+    )
+    values.mask[5, 7] = True
+    return xtgeo.RegularSurface(ncol=40, nrow=30, xinc=1.0, yinc=1.0, values=values)
+
+
+def _make_qualified_address() -> QualifiedSurfaceAddress:
+    return QualifiedSurfaceAddress(
+        provider_id="dummy_provider",
+        address=SimulatedSurfaceAddress(
+            attribute="depth", name="topvolon", datestr=None, realization=0
+        ),
+    )
+
+
+def test_encodings_and_http_caching() -> None:
+    app = Dash(__name__)
+    app.layout = html.Div()
+    server = SurfaceArrayServer(app)
+    client = app.server.test_client()
+
+    surface = _make_surface()
+    qualified_address = _make_qualified_address()
+    expected_values = np.rot90(np.ma.filled(surface.values, fill_value=np.nan))
+
+    for encoding in SurfaceArrayEncoding:
+        server.publish_surface(qualified_address, surface, encoding)
+    meta = server.get_surface_metadata(qualified_address)
+    assert meta is not None
+    assert meta.val_min == 1000.0 and meta.val_max == 2000.0
+
+    # Uncompressed float32 is unchanged from before
+    url = SurfaceArrayServer.encode_partial_url(qualified_address)
+    response = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert np.array_equal(
+        np.frombuffer(response.data, np.float32).reshape(expected_values.shape),
+        expected_values.astype(np.float32),
+        equal_nan=True,
+    )
+
+    url = SurfaceArrayServer.encode_partial_url(
+        qualified_address, SurfaceArrayEncoding.UINT16
+    )
+    response = client.get(url, headers={"Accept-Encoding": "gzip, deflate"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    quantized = np.frombuffer(gzip.decompress(response.data), np.uint16).reshape(
+        expected_values.shape
+    )
+    assert np.array_equal(quantized == 65535, np.isnan(expected_values))
+    decoded = meta.val_min + quantized * (meta.val_max - meta.val_min) / 65534
+    defined = ~np.isnan(expected_values)
+    assert np.allclose(decoded[defined], expected_values[defined], atol=0.01)
+
+    # Conditional request with the received ETag gives 304 without a body
+    etag = response.headers["ETag"]
+    response = client.get(
+        url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert not response.data
+
+    # Same ETag for a different content coding must not match, and clients not
+    # accepting gzip get the stored uncompressed bytes
+    response = client.get(
+        url, headers={"Accept-Encoding": "deflate", "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert response.data == quantized.tobytes()
+
+    url = SurfaceArrayServer.encode_partial_url(
+        qualified_address, SurfaceArrayEncoding.FLOAT16
+    )
+    response = client.get(url, headers={"Accept-Encoding": "identity"})
+    float16_values = np.frombuffer(response.data, np.float16).reshape(
+        expected_values.shape
+    )
+    assert np.allclose(float16_values, expected_values, rtol=1e-3, equal_nan=True)
+
+    assert client.get(url.replace("float16", "float64")).status_code == 400
+    assert client.get(url.replace("dummy_provider", "other")).status_code == 404
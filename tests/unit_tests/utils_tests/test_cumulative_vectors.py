@@ -0,0 +1,49 @@
+import numpy as np
+
+from webviz_subsurface._utils.cumulative_vectors import (
+    calc_from_cumulative_values,
+    split_per_interval_or_per_day_vector_name,
+)
+
+
+def test_split_per_interval_or_per_day_vector_name() -> None:
+    assert split_per_interval_or_per_day_vector_name("PER_DAY_FOPT") == ("FOPT", True)
+    assert split_per_interval_or_per_day_vector_name("PER_INTVL_DOPT") == (
+        "DOPT",
+        False,
+    )
+    assert split_per_interval_or_per_day_vector_name("FOPT") is None
+
+
+def test_calc_from_cumulative_values() -> None:
+    dates = np.array(
+        ["2020-01-01", "2020-01-11", "2020-01-31", "2020-01-01", "2020-01-11"],
+        dtype="datetime64[ms]",
+    )
+    reals = np.array([0, 0, 0, 3, 3])
+    cumulative_values = {
+        "A": np.array([0.0, 10.0, 50.0, 100.0, 150.0]),
+        "B": np.array([0.0, np.nan, 20.0, 1.0, 2.0]),
+    }
+
+    per_interval_values = calc_from_cumulative_values(
+        dates, reals, cumulative_values, as_per_day=False
+    )
+    np.testing.assert_array_equal(per_interval_values["A"], [10, 40, 0, 50, 0])
+    np.testing.assert_array_equal(per_interval_values["B"], [0, 0, 0, 1, 0])
+
+    per_day_values = calc_from_cumulative_values(
+        dates, reals, cumulative_values, as_per_day=True
+    )
+    np.testing.assert_array_equal(per_day_values["A"], [1, 2, 0, 5, 0])
+    np.testing.assert_array_equal(per_day_values["B"], [0, 0, 0, 0.1, 0])
+
+
+def test_calc_from_cumulative_values_no_rows() -> None:
+    calculated_values = calc_from_cumulative_values(
+        np.array([], dtype="datetime64[ms]"),
+        np.array([], dtype=int),
+        {"A": np.array([])},
+        as_per_day=True,
+    )
+    assert calculated_values["A"].shape == (0,)
@@ -1,11 +1,15 @@
 import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandas._testing import assert_frame_equal
 
 from webviz_subsurface._utils.dataframe_utils import (
     assert_date_column_is_datetime_object,
+    assert_date_column_is_datetime_object_or_datetime64,
+    is_date_column_datetime64,
+    make_date_column_datetime64,
     make_date_column_datetime_object,
 )
 
@@ -279,3 +283,66 @@ def test_make_date_column_datetime_object_input_date_year_2020_df() -> None:
     with pytest.raises(ValueError) as err:
         make_date_column_datetime_object(input_date_year_2020_df)
     assert str(err.value) == f'Column "DATE" of type {datetime.date} is not handled!'
+
+
+# *******************************************************
+#########################################################
+#
+# TESTING OF: make_date_column_datetime64()
+#
+########################################################
+# *******************************************************
+
+
+@pytest.mark.parametrize(
+    "input_df",
+    [
+        INPUT_DATETIME_YEAR_2020_DF,
+        INPUT_TIMESTAMP_YEAR_2020_DF,
+        INPUT_DATETIME_YEAR_2263_DF,
+        INPUT_NO_ROWS_DF,
+    ],
+)
+def test_make_date_column_datetime64(input_df: pd.DataFrame) -> None:
+    # Copy to prevent modification if input_df
+    test_df = input_df.copy()
+
+    make_date_column_datetime64(test_df)
+
+    assert test_df["DATE"].dtype == np.dtype("datetime64[ms]")
+    assert is_date_column_datetime64(test_df)
+    assert_date_column_is_datetime_object_or_datetime64(test_df)
+    assert test_df["DATE"].to_numpy().astype(object).tolist() == [
+        pd.Timestamp(elm).to_pydatetime() for elm in input_df["DATE"]
+    ]
+
+
+@pytest.mark.parametrize(
+    "input_df", [INPUT_DATETIME_YEAR_2020_DF, INPUT_DATETIME_YEAR_2263_DF]
+)
+def test_make_date_column_datetime64_round_trip(input_df: pd.DataFrame) -> None:
+    # Copy to prevent modification if input_df
+    test_df = input_df.copy()
+
+    make_date_column_datetime64(test_df)
+    make_date_column_datetime_object(test_df)
+
+    assert not is_date_column_datetime64(test_df)
+    assert_frame_equal(test_df, input_df)
+
+
+def test_assert_date_column_is_datetime_object_or_datetime64_error() -> None:
+    # Timestamp elements give datetime64[ns] dtype, which is not accepted
+    assert not is_date_column_datetime64(INPUT_TIMESTAMP_YEAR_2020_DF)
+    with pytest.raises(ValueError) as err:
+        assert_date_column_is_datetime_object_or_datetime64(
+            INPUT_TIMESTAMP_YEAR_2020_DF
+        )
+    assert (
+        str(err.value)
+        == '"DATE"-column in dataframe is not on datetime.datetime format!'
+    )
+
+    with pytest.raises(ValueError) as err:
+        is_date_column_datetime64(INPUT_EMPTY_DF)
+    assert str(err.value) == 'df does not contain column "DATE"'
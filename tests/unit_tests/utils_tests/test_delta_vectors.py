@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+from pandas._testing import assert_frame_equal
+
+from webviz_subsurface._utils.delta_vectors import (
+    create_delta_vectors_df,
+    find_matching_rows,
+)
+
+
+def test_find_matching_rows() -> None:
+    rows_a, rows_b = find_matching_rows(
+        [np.array([1, 1, 2, 2, 4]), np.array([10, 20, 10, 20, 10])],
+        [np.array([4, 2, 1, 3]), np.array([10, 20, 20, 10])],
+    )
+
+    np.testing.assert_array_equal(rows_a, [1, 3, 4])
+    np.testing.assert_array_equal(rows_b, [2, 1, 0])
+
+
+def test_find_matching_rows_no_rows() -> None:
+    rows_a, rows_b = find_matching_rows([np.array([1, 2])], [np.array([], dtype=int)])
+
+    assert len(rows_a) == 0
+    assert len(rows_b) == 0
+
+
+def test_create_delta_vectors_df() -> None:
+    """Compare with subtracting dataframes with ["DATE", "REAL"] MultiIndex, for
+    dataframes with different dates and realizations, NaN values and rows in random
+    order"""
+    rng = np.random.default_rng(seed=42)
+    dates = np.arange(
+        np.datetime64("2020-01", "M"), np.datetime64("2020-07", "M")
+    ).astype("datetime64[ms]")
+
+    def _create_input_df(num_reals: int, num_dates: int) -> pd.DataFrame:
+        df = pd.DataFrame(
+            {
+                "DATE": np.tile(dates[:num_dates], num_reals),
+                "REAL": np.repeat(np.arange(num_reals), num_dates),
+                "A": rng.random(num_reals * num_dates),
+                "B": rng.random(num_reals * num_dates),
+            }
+        )
+        df.loc[rng.random(df.shape[0]) < 0.1, "B"] = np.nan
+        return df
+
+    vectors_a_df = _create_input_df(num_reals=8, num_dates=6)
+    vectors_b_df = (
+        _create_input_df(num_reals=10, num_dates=5)
+        .drop(index=[3, 17])
+        .sample(frac=1, random_state=1)
+    )
+
+    delta_df = create_delta_vectors_df(vectors_a_df, vectors_b_df, ["A", "B"])
+
+    expected_df = (
+        vectors_a_df.set_index(["DATE", "REAL"])
+        .sub(vectors_b_df.set_index(["DATE", "REAL"]))
+        .dropna(axis=0, how="any")
+        .reset_index()
+        .sort_values(["REAL", "DATE"], ignore_index=True)
+    )
+    assert_frame_equal(delta_df, expected_df)
@@ -0,0 +1,106 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas._testing import assert_frame_equal
+
+from webviz_subsurface._utils.ensemble_statistics import (
+    StatisticFunction,
+    create_dense_group_arrays,
+    create_grouped_statistics_df,
+    nanquantile_rows,
+)
+
+
+def _create_input_df() -> pd.DataFrame:
+    """Dataframe with uneven number of realizations per date, NaN values, a date
+    with only NaN values and rows in random order"""
+    rng = np.random.default_rng(seed=42)
+    df = pd.DataFrame(
+        {
+            "DATE": np.repeat(np.arange(6), 7),
+            "REAL": np.tile(np.arange(7), 6),
+            "A": rng.random(42),
+            "B": rng.normal(size=42),
+        }
+    )
+    df.loc[rng.random(42) < 0.2, "A"] = np.nan
+    df.loc[df["DATE"] == 4, "B"] = np.nan
+    df = df.drop(index=[3, 10, 11, 12, 30])
+    return df.sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+def test_create_dense_group_arrays() -> None:
+    group_values, value_arrays = create_dense_group_arrays(
+        np.array([2, 1, 2, 1, 3]), {"A": np.array([20.0, 10.0, 21.0, 11.0, 30.0])}
+    )
+
+    np.testing.assert_array_equal(group_values, [1, 2, 3])
+    np.testing.assert_array_equal(
+        value_arrays["A"], [[10.0, 11.0], [20.0, 21.0], [30.0, np.nan]]
+    )
+
+
+@pytest.mark.parametrize("quantiles", [[0.5], [0.1, 0.9], [0.0, 0.25, 1.0]])
+def test_nanquantile_rows(quantiles: list) -> None:
+    rng = np.random.default_rng(seed=1234)
+    values = rng.random((40, 13))
+    values[rng.random(values.shape) < 0.3] = np.nan
+    values[5] = np.nan
+    values[6, 1:] = np.nan
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        expected = np.nanquantile(values, quantiles, axis=1)
+
+    np.testing.assert_array_equal(nanquantile_rows(values, quantiles), expected)
+
+
+def test_create_grouped_statistics_df() -> None:
+    df = _create_input_df()
+
+    statistics_df = create_grouped_statistics_df(
+        df,
+        group_column="DATE",
+        value_columns=["A", "B"],
+        statistics={
+            "mean": StatisticFunction.MEAN,
+            "std": StatisticFunction.STD,
+            "min": StatisticFunction.MIN,
+            "max": StatisticFunction.MAX,
+            "p10": 0.9,
+            "p90": 0.1,
+        },
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        expected_df = (
+            df[["DATE", "A", "B"]]
+            .groupby("DATE")
+            .agg(
+                [
+                    ("mean", "mean"),
+                    ("std", "std"),
+                    ("min", "min"),
+                    ("max", "max"),
+                    ("p10", lambda x: np.nanpercentile(x, q=90)),
+                    ("p90", lambda x: np.nanpercentile(x, q=10)),
+                ]
+            )
+            .reset_index()
+        )
+
+    assert_frame_equal(statistics_df, expected_df, check_exact=False)
+
+
+def test_create_grouped_statistics_df_no_rows() -> None:
+    df = pd.DataFrame(columns=["DATE", "A"])
+
+    statistics_df = create_grouped_statistics_df(
+        df, "DATE", ["A"], {"mean": StatisticFunction.MEAN, "p50": 0.5}
+    )
+
+    assert statistics_df.shape[0] == 0
+    assert list(statistics_df.columns) == [("DATE", ""), ("A", "mean"), ("A", "p50")]
@@ -0,0 +1,122 @@
+import os
+import pickle
+import stat
+from pathlib import Path
+
+from webviz_subsurface._utils import publish_store
+from webviz_subsurface._utils.publish_store import (
+    InMemoryPublishStore,
+    SharedDirPublishStore,
+)
+
+
+def test_in_memory_publish_store_lru_eviction_and_stats() -> None:
+    store = InMemoryPublishStore("test", max_bytes=3500)
+
+    for key in ["a", "b", "c"]:
+        store.put(key, bytes(1000))
+    assert store.get("a") is not None
+
+    # Exceeds the limit, so the least recently used entry "b" is evicted
+    store.put("d", bytes(1000))
+    assert store.get("b") is None
+    assert store.get("a") == bytes(1000)
+    assert store.get("c") is not None and store.get("d") is not None
+
+    stats = store.get_stats()
+    assert stats.num_puts == 4
+    assert stats.num_evictions == 1
+    assert stats.num_hits == 4 and stats.num_misses == 1
+    assert stats.hit_ratio == 0.8
+    assert stats.used_bytes <= stats.max_bytes
+
+
+def test_shared_dir_publish_store_is_shared_and_evicts_lru(tmp_path: Path) -> None:
+    # Two stores on the same directory, as in two different worker processes
+    store_a = SharedDirPublishStore("test", max_bytes=3500, store_dir=tmp_path)
+    store_b = SharedDirPublishStore("test", max_bytes=3500, store_dir=tmp_path)
+
+    store_a.put("meta", {"val_min": 1.0, "val_max": 2.0})
+    assert store_b.get("meta") == {"val_min": 1.0, "val_max": 2.0}
+    assert store_b.get("unknown") is None
+
+    store_a.put("meta", {"val_min": 3.0, "val_max": 4.0})
+    assert store_b.get("meta") == {"val_min": 3.0, "val_max": 4.0}
+
+    # Make the entries "x", "y" and "z" the least recently used, in that order
+    for idx, key in enumerate(["x", "y", "z"]):
+        store_b.put(key, bytes(1000))
+        # pylint: disable=protected-access
+        entry_path = store_b._make_entry_path(key)
+        os.utime(entry_path, ns=(idx + 1, idx + 1))
+
+    # Exceeds the limit, so "x" is evicted even though it was written by the other store
+    store_a.put("w", bytes(1000))
+    assert store_a.get("x") is None
+    assert store_b.get("y") is not None
+    assert store_b.get("w") is not None
+    assert store_b.get("meta") is not None
+    assert store_a.get_stats().num_evictions == 1
+
+
+def test_in_memory_publish_stores_share_size_limit_and_clear() -> None:
+    # pylint: disable=protected-access
+    shared_entries = publish_store._InMemoryEntries()
+    store_a = InMemoryPublishStore("a", max_bytes=3500, shared_entries=shared_entries)
+    store_b = InMemoryPublishStore("b", max_bytes=3500, shared_entries=shared_entries)
+
+    store_a.put("key", bytes(1000))
+    store_b.put("key", bytes(1000))
+    store_b.put("other", bytes(1000))
+    assert store_a.get("key") is not None
+
+    # The least recently used entry of both stores is evicted
+    store_a.put("new", bytes(1000))
+    assert store_b.get("key") is None
+    assert store_a.get_stats().used_bytes == store_b.get_stats().used_bytes
+
+    store_a.clear()
+    assert store_a.get("key") is None and store_a.get("new") is None
+    assert store_b.get("other") is not None
+
+
+def test_shared_dir_publish_stores_share_size_limit_and_clear(tmp_path: Path) -> None:
+    store_a = SharedDirPublishStore("a", max_bytes=3500, store_dir=tmp_path)
+    store_b = SharedDirPublishStore("b", max_bytes=3500, store_dir=tmp_path)
+
+    store_a.put("key", bytes(1000))
+    store_b.put("key", bytes(1000))
+
+    for idx, (store, key) in enumerate([(store_b, "key"), (store_a, "key")]):
+        # pylint: disable=protected-access
+        os.utime(store._make_entry_path(key), ns=(idx + 1, idx + 1))
+    store_b.put("other", bytes(1000))
+
+    # Exceeds the limit, so the least recently used entry of the other store is evicted
+    store_a.put("new", bytes(1000))
+    assert store_b.get("key") is None
+    assert store_a.get("key") is not None
+
+    store_b.clear()
+    assert store_b.get("other") is None
+    assert store_a.get("key") is not None and store_a.get("new") is not None
+    assert store_b.get_stats().used_bytes == 2 * len(pickle.dumps(bytes(1000)))
+
+
+def test_worker_session_dir_must_be_private(tmp_path: Path) -> None:
+    # pylint: disable=protected-access
+    session_dir = publish_store._get_worker_session_dir(tmp_path, "prefix_", 1234)
+    assert session_dir is not None
+    assert stat.S_IMODE(session_dir.stat().st_mode) == 0o700
+    assert publish_store._get_worker_session_dir(tmp_path, "prefix_", 1234) == (
+        session_dir
+    )
+
+    # Directories accessible by others, or symlinks, are not used
+    session_dir.chmod(0o777)
+    assert publish_store._get_worker_session_dir(tmp_path, "prefix_", 1234) is None
+    session_dir.chmod(0o700)
+    assert not publish_store._is_private_dir(tmp_path / "missing")
+    (tmp_path / "link").symlink_to(session_dir)
+    assert not publish_store._is_private_dir(tmp_path / "link")
+    assert publish_store._is_private_dir(session_dir)
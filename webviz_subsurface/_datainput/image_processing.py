@@ -4,6 +4,10 @@ import io
 import numpy as np
 from PIL import Image
 
+from webviz_subsurface._providers.ensemble_surface_provider._surface_to_image import (
+    scaled_values_to_png_bytes,
+)
+
 
 def array_to_png(tensor: np.ndarray, shift: bool = True, colormap: bool = False) -> str:
     # pylint: disable=too-many-branches
@@ -81,31 +85,20 @@ def array2d_to_png(tensor: np.ndarray) -> str:
     to create pictures on-the-fly from numpy arrays, they have to be converted
     to base64. This is an example function of how that can be done.
 
-    This function encodes the numpy array to a RGBA png.
-    The array is encoded as a heightmap, in Mapbox Terrain RGB format
-    (https://docs.mapbox.com/help/troubleshooting/access-elevation-data/).
-    The undefined values are set as having alpha = 0. The height values are
-    shifted to start from 0.
+    See array2d_to_png_bytes() for the encoding. Prefer publishing the PNG bytes
+    through PngImageServer, which avoids inlining the image in callback payloads.
     """
+    return png_bytes_to_data_url(array2d_to_png_bytes(tensor))
 
-    shape = tensor.shape
-    tensor = np.repeat(tensor, 4)  # This will flatten the array
-
-    tensor[0::4][np.isnan(tensor[0::4])] = 0  # Red
-    tensor[1::4][np.isnan(tensor[1::4])] = 0  # Green
-    tensor[2::4][np.isnan(tensor[2::4])] = 0  # Blue
 
-    tensor[0::4] = np.floor((tensor[0::4] / (256 * 256)) % 256)  # Red
-    tensor[1::4] = np.floor((tensor[1::4] / 256) % 256)  # Green
-    tensor[2::4] = np.floor(tensor[2::4] % 256)  # Blue
-    tensor[3::4] = np.where(np.isnan(tensor[3::4]), 0, 255)  # Alpha
+def array2d_to_png_bytes(tensor: np.ndarray) -> bytes:
+    """Encodes the numpy array to a RGBA png heightmap, using the same encoder as
+    the surface images of SurfaceImageServer. The values are expected to be scaled
+    to the range [0, 256**3 - 1], see scaled_values_to_png_bytes().
+    """
+    return scaled_values_to_png_bytes(tensor)
 
-    # Back to 2d shape + 1 dimension for the rgba values.
-    tensor = tensor.reshape((shape[0], shape[1], 4))
-    image = Image.fromarray(np.uint8(tensor), "RGBA")
 
-    byte_io = io.BytesIO()
-    image.save(byte_io, format="png")
-    byte_io.seek(0)
-    base64_data = base64.b64encode(byte_io.read()).decode("ascii")
+def png_bytes_to_data_url(png_bytes: bytes) -> str:
+    base64_data = base64.b64encode(png_bytes).decode("ascii")
     return f"data:image/png;base64,{base64_data}"
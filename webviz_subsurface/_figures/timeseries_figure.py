@@ -1,10 +1,13 @@
 import datetime
 from typing import Dict, List, Optional
 
-import numpy as np
 import pandas as pd
 
 from webviz_subsurface._utils.colors import find_intermediate_color, rgba_to_str
+from webviz_subsurface._utils.ensemble_statistics import (
+    StatisticFunction,
+    create_grouped_statistics_df,
+)
 from webviz_subsurface._utils.enum_shim import StrEnum
 from webviz_subsurface._utils.simulation_timeseries import (
     get_simulation_line_shape,
@@ -206,17 +209,11 @@ class TimeSeriesFigure:
         )
 
     def create_vectors_statistics_df(self) -> pd.DataFrame:
-        return (
-            self.dframe[["DATE", self.vector]]
-            .groupby(["DATE"])
-            .agg(
-                [
-                    ("Mean", "mean"),
-                    ("P10", lambda x: np.nanpercentile(x, q=90)),
-                    ("P90", lambda x: np.nanpercentile(x, q=10)),
-                ]
-            )
-            .reset_index()
+        return create_grouped_statistics_df(
+            self.dframe,
+            group_column="DATE",
+            value_columns=[self.vector],
+            statistics={"Mean": StatisticFunction.MEAN, "P10": 0.9, "P90": 0.1},
         )
 
     def create_vector_observation_traces(self) -> None:
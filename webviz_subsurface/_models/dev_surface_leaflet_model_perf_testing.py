@@ -0,0 +1,109 @@
+import base64
+import io
+import json
+import time
+from typing import Any, Callable
+
+import numpy as np
+import xtgeo
+from dash import Dash, html
+from PIL import Image
+
+from webviz_subsurface._datainput.image_processing import array2d_to_png_bytes
+from webviz_subsurface._utils.png_image_server import PngImageServer
+
+from .surface_leaflet_model import SurfaceLeafletModel
+
+
+def _legacy_array2d_to_png(tensor: np.ndarray) -> str:
+    """The array2d_to_png() encoding used before the switch to array2d_to_png_bytes()"""
+    shape = tensor.shape
+    tensor = np.repeat(tensor, 4)
+
+    tensor[0::4][np.isnan(tensor[0::4])] = 0
+    tensor[1::4][np.isnan(tensor[1::4])] = 0
+    tensor[2::4][np.isnan(tensor[2::4])] = 0
+
+    tensor[0::4] = np.floor((tensor[0::4] / (256 * 256)) % 256)
+    tensor[1::4] = np.floor((tensor[1::4] / 256) % 256)
+    tensor[2::4] = np.floor(tensor[2::4] % 256)
+    tensor[3::4] = np.where(np.isnan(tensor[3::4]), 0, 255)
+
+    tensor = tensor.reshape((shape[0], shape[1], 4))
+    image = Image.fromarray(tensor.astype(np.uint8), "RGBA")
+
+    byte_io = io.BytesIO()
+    image.save(byte_io, format="png")
+    byte_io.seek(0)
+    base64_data = base64.b64encode(byte_io.read()).decode("ascii")
+    return f"data:image/png;base64,{base64_data}"
+
+
+def _create_synthetic_surface(ncol: int, nrow: int) -> xtgeo.RegularSurface:
+    rng = np.random.default_rng(seed=1234)
+    x_arr, y_arr = np.meshgrid(
+        np.linspace(0, 4 * np.pi, nrow), np.linspace(0, 3 * np.pi, ncol)
+    )
+    values = 1700 + 50 * np.sin(x_arr) * np.cos(y_arr) + rng.normal(0, 0.5, x_arr.shape)
+    mask = np.zeros(values.shape, dtype=bool)
+    mask[: ncol // 5, : nrow // 4] = True
+    masked_values = np.ma.masked_array(values, mask=mask)
+
+    return xtgeo.RegularSurface(
+        ncol=ncol, nrow=nrow, xinc=25.0, yinc=25.0, values=masked_values
+    )
+
+
+def _best_of_ms(num_runs: int, func: Callable[..., Any], *args: Any) -> float:
+    best_ms = float("inf")
+    for _ in range(num_runs):
+        start_tim = time.perf_counter()
+        func(*args)
+        best_ms = min(best_ms, 1000 * (time.perf_counter() - start_tim))
+    return best_ms
+
+
+def main() -> None:
+    print()
+    print("## Running SurfaceLeafletModel benchmark")
+    print("## ======================================")
+
+    app = Dash(__name__)
+    app.layout = html.Div()
+    image_server = PngImageServer.instance(app)
+
+    num_runs = 3
+    for size in [500, 1000, 2000, 4000]:
+        model = SurfaceLeafletModel(_create_synthetic_surface(size, size))
+        scaled_zvalues = model.scaled_zvalues
+
+        legacy_ms = _best_of_ms(
+            num_runs,
+            lambda values: _legacy_array2d_to_png(values.copy()),
+            scaled_zvalues,
+        )
+        legacy_payload_bytes = len(_legacy_array2d_to_png(scaled_zvalues.copy()))
+
+        encode_ms = _best_of_ms(num_runs, array2d_to_png_bytes, scaled_zvalues)
+        png_bytes = array2d_to_png_bytes(scaled_zvalues)
+        publish_ms = _best_of_ms(num_runs, image_server.publish_png, png_bytes)
+
+        layer_ms = _best_of_ms(num_runs, lambda model: model.layer, model)
+        layer_payload_bytes = len(json.dumps(model.layer))
+
+        print(
+            f"## {size:4d}x{size:<4d}  "
+            f"legacy: encode={legacy_ms:7.1f}ms payload={legacy_payload_bytes / 1024**2:6.2f}MB  "
+            f"new: encode={encode_ms:6.1f}ms publish={publish_ms:5.1f}ms "
+            f"png={len(png_bytes) / 1024**2:6.2f}MB "
+            f"layer={layer_ms:6.1f}ms payload={layer_payload_bytes / 1024:4.1f}KB"
+        )
+
+    print("## done")
+
+
+# Running:
+#   python -m webviz_subsurface._models.dev_surface_leaflet_model_perf_testing
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,13 @@
-import base64
-import io
 from typing import Optional
 
 import numpy as np
 import xtgeo
-from PIL import Image
 
-from webviz_subsurface._datainput.image_processing import array2d_to_png
+from webviz_subsurface._datainput.image_processing import (
+    array2d_to_png_bytes,
+    png_bytes_to_data_url,
+)
+from webviz_subsurface._utils.png_image_server import PngImageServer
 
 
 class SurfaceLeafletModel:
@@ -35,7 +36,13 @@ class SurfaceLeafletModel:
 
     @property
     def img_url(self) -> str:
-        return array2d_to_png(self.scaled_zvalues.copy())
+        """URL of the heightmap image. If the plugin has set up a PngImageServer
+        the image is published there, otherwise it is returned as a data URL"""
+        png_bytes = array2d_to_png_bytes(self.scaled_zvalues)
+        image_server = PngImageServer.initialized_instance()
+        if image_server is None:
+            return png_bytes_to_data_url(png_bytes)
+        return image_server.publish_png(png_bytes)
 
     @property
     def min_val(self) -> float:
@@ -53,12 +60,8 @@ class SurfaceLeafletModel:
 
     @property
     def map_scale(self) -> float:
-        img = Image.open(
-            io.BytesIO(
-                base64.b64decode(array2d_to_png(self.scaled_zvalues.copy())[22:])
-            )
-        )
-        width, height = img.size
+        # The image has the same dimensions as the z values array
+        height, width = self.zvalues.shape
         if width * height >= 300 * 300:
             return 1.0
         ratio = (1000**2) / (width * height)
@@ -10,6 +10,9 @@ from .ensemble_summary_provider.ensemble_summary_provider import (
     Frequency,
     VectorMetadata,
 )
+from .ensemble_summary_provider.ensemble_summary_provider_delta import (
+    EnsembleSummaryProviderDelta,
+)
 from .ensemble_summary_provider.ensemble_summary_provider_factory import (
     EnsembleSummaryProviderFactory,
 )
@@ -23,6 +26,7 @@ from .ensemble_surface_provider import (
     SimulatedSurfaceAddress,
     StatisticalSurfaceAddress,
     SurfaceAddress,
+    SurfaceArrayEncoding,
     SurfaceArrayMeta,
     SurfaceArrayServer,
     SurfaceImageMeta,
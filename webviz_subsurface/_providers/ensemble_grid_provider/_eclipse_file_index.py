@@ -0,0 +1,195 @@
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Size of the keyword header record, including its leading and trailing record markers
+_HEADER_RECORD_SIZE = 24
+_RECORD_MARKER_SIZE = 4
+
+# Per value type: numpy dtype of the (big endian) items, item size in bytes and
+# max number of items per data block
+_NUMERIC_TYPE_INFO: Dict[str, Tuple[str, int, int]] = {
+    "INTE": (">i4", 4, 1000),
+    "REAL": (">f4", 4, 1000),
+    "DOUB": (">f8", 8, 1000),
+    "LOGI": (">i4", 4, 1000),
+}
+_CHAR_BLOCK_ITEMS = 105
+
+# Zero based indices of the date items in INTEHEAD
+_INTEHEAD_DAY_IDX = 64
+_INTEHEAD_MONTH_IDX = 65
+_INTEHEAD_YEAR_IDX = 66
+
+
+@dataclass(frozen=True)
+class EclipseKeywordRecord:
+    """Location of the data for a keyword in an unformatted Eclipse file. The
+    data_offset is the byte offset of the first data block's record marker."""
+
+    keyword: str
+    value_type: str
+    count: int
+    data_offset: int
+    date: str = ""
+
+
+def index_egrid_file(file_path: Path) -> List[EclipseKeywordRecord]:
+    """Returns the records for the GRIDHEAD and ACTNUM keywords of the global grid"""
+    wanted_keywords = ["GRIDHEAD", "ACTNUM"]
+    records: List[EclipseKeywordRecord] = []
+    with open(file_path, "rb") as file:
+        for record in _iterate_keyword_records(file):
+            if record.keyword == "ENDGRID":
+                break
+            if record.keyword in wanted_keywords:
+                wanted_keywords.remove(record.keyword)
+                records.append(record)
+
+    return records
+
+
+def index_init_file(file_path: Path, min_count: int) -> List[EclipseKeywordRecord]:
+    """Returns the records for the numeric keywords of the global grid that have at
+    least min_count values, i.e. the cell properties"""
+    records: Dict[str, EclipseKeywordRecord] = {}
+    with open(file_path, "rb") as file:
+        for record in _iterate_global_grid_records(file):
+            if _is_property_record(record, min_count) and record.keyword not in records:
+                records[record.keyword] = record
+
+    return list(records.values())
+
+
+def index_unrst_file(file_path: Path, min_count: int) -> List[EclipseKeywordRecord]:
+    """Returns the records for the numeric keywords of the global grid that have at
+    least min_count values, i.e. the cell properties, for each report step.
+    The date of each record is given as a YYYYMMDD string."""
+    records: Dict[Tuple[str, str], EclipseKeywordRecord] = {}
+    curr_date: Optional[str] = None
+    with open(file_path, "rb") as file:
+        for record in _iterate_global_grid_records(file):
+            if record.keyword == "SEQNUM":
+                curr_date = None
+            elif record.keyword == "INTEHEAD" and curr_date is None:
+                intehead = read_keyword_values(file_path, record)
+                curr_date = (
+                    f"{intehead[_INTEHEAD_YEAR_IDX]:04d}"
+                    f"{intehead[_INTEHEAD_MONTH_IDX]:02d}"
+                    f"{intehead[_INTEHEAD_DAY_IDX]:02d}"
+                )
+            elif curr_date is not None and _is_property_record(record, min_count):
+                key = (curr_date, record.keyword)
+                if key not in records:
+                    records[key] = EclipseKeywordRecord(
+                        keyword=record.keyword,
+                        value_type=record.value_type,
+                        count=record.count,
+                        data_offset=record.data_offset,
+                        date=curr_date,
+                    )
+
+    return list(records.values())
+
+
+# pylint: disable=too-many-locals
+def read_keyword_values(file_path: Path, record: EclipseKeywordRecord) -> np.ndarray:
+    """Read the values of a numeric keyword by seeking directly to its data.
+    Values are returned as float32 for REAL and DOUB keywords, as int32 otherwise."""
+    if record.value_type not in _NUMERIC_TYPE_INFO:
+        raise ValueError(f"Unsupported value type: {record.value_type}")
+
+    item_dtype, item_size, block_items = _NUMERIC_TYPE_INFO[record.value_type]
+    num_full_blocks, num_remaining_items = divmod(record.count, block_items)
+    num_blocks = num_full_blocks + (1 if num_remaining_items > 0 else 0)
+    num_bytes = record.count * item_size + num_blocks * 2 * _RECORD_MARKER_SIZE
+
+    with open(file_path, "rb") as file:
+        file.seek(record.data_offset)
+        buffer = file.read(num_bytes)
+    if len(buffer) != num_bytes:
+        raise ValueError(f"Unexpected end of file for keyword: {record.keyword}")
+
+    # Full blocks are read through a structured dtype which skips the record markers
+    block_dtype = np.dtype(
+        [("head", ">i4"), ("data", item_dtype, (block_items,)), ("tail", ">i4")]
+    )
+    full_blocks = np.frombuffer(buffer, dtype=block_dtype, count=num_full_blocks)
+    remaining_items = np.frombuffer(
+        buffer,
+        dtype=item_dtype,
+        count=num_remaining_items,
+        offset=num_full_blocks * block_dtype.itemsize + _RECORD_MARKER_SIZE,
+    )
+
+    out_dtype = np.float32 if record.value_type in ["REAL", "DOUB"] else np.int32
+    values = np.empty(record.count, dtype=out_dtype)
+    values[: num_full_blocks * block_items] = full_blocks["data"].ravel()
+    values[num_full_blocks * block_items :] = remaining_items
+
+    return values
+
+
+def _is_property_record(record: EclipseKeywordRecord, min_count: int) -> bool:
+    return record.value_type in _NUMERIC_TYPE_INFO and record.count >= min_count
+
+
+def _iterate_global_grid_records(file: BinaryIO) -> Iterator[EclipseKeywordRecord]:
+    """Iterate over the records, skipping any local grid (LGR) sections"""
+    inside_lgr = False
+    for record in _iterate_keyword_records(file):
+        if record.keyword == "LGR":
+            inside_lgr = True
+        elif record.keyword == "ENDLGR":
+            inside_lgr = False
+        elif not inside_lgr:
+            yield record
+
+
+def _iterate_keyword_records(file: BinaryIO) -> Iterator[EclipseKeywordRecord]:
+    """Iterate over the keyword records in an unformatted (big endian) Eclipse file,
+    without reading the data"""
+    file.seek(0)
+    offset = 0
+    while True:
+        header = file.read(_HEADER_RECORD_SIZE)
+        if not header:
+            return
+        if len(header) != _HEADER_RECORD_SIZE:
+            raise ValueError("Unexpected end of file while reading keyword header")
+
+        head_marker, raw_keyword, count, raw_type, tail_marker = struct.unpack(
+            ">i8si4si", header
+        )
+        if head_marker != 16 or tail_marker != 16 or count < 0:
+            raise ValueError("Not an unformatted Eclipse file, or file is corrupt")
+
+        record = EclipseKeywordRecord(
+            keyword=raw_keyword.decode("ascii", errors="replace").strip(),
+            value_type=raw_type.decode("ascii", errors="replace"),
+            count=count,
+            data_offset=offset + _HEADER_RECORD_SIZE,
+        )
+        yield record
+
+        offset = record.data_offset + _data_size_in_bytes(record)
+        file.seek(offset)
+
+
+def _data_size_in_bytes(record: EclipseKeywordRecord) -> int:
+    if record.value_type in _NUMERIC_TYPE_INFO:
+        _dtype, item_size, block_items = _NUMERIC_TYPE_INFO[record.value_type]
+    elif record.value_type == "CHAR":
+        item_size, block_items = 8, _CHAR_BLOCK_ITEMS
+    elif record.value_type.startswith("C0"):
+        item_size, block_items = int(record.value_type[1:]), _CHAR_BLOCK_ITEMS
+    elif record.value_type == "MESS":
+        return 0
+    else:
+        raise ValueError(f"Unknown value type: {record.value_type}")
+
+    num_blocks = -(-record.count // block_items)
+    return record.count * item_size + num_blocks * 2 * _RECORD_MARKER_SIZE
@@ -0,0 +1,143 @@
+import logging
+
+import numpy as np
+from vtkmodules.util.numpy_support import numpy_to_vtkIdTypeArray, vtk_to_numpy
+
+# pylint: disable=no-name-in-module,
+from vtkmodules.vtkCommonDataModel import (
+    VTK_HEXAHEDRON,
+    vtkCellArray,
+    vtkDataSetAttributes,
+    vtkExplicitStructuredGrid,
+    vtkUnstructuredGrid,
+)
+
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+
+# -----------------------------------------------------------------------------
+class EsgColumnIndex:
+    """Spatial index over the (I,J) columns of an explicit structured grid, holding
+    the XY bounding box of the active cells in each column. Used to quickly find the
+    cells that may be intersected by a vertical fence along a polyline segment, and to
+    build an unstructured grid with only those cells."""
+
+    # -----------------------------------------------------------------------------
+    def __init__(self, esgrid: vtkExplicitStructuredGrid) -> None:
+        timer = PerfTimer()
+
+        self._esgrid = esgrid
+
+        cell_dims = [0, 0, 0]
+        esgrid.GetCellDims(cell_dims)
+        self._num_i, self._num_j, self._num_k = cell_dims
+        num_columns = self._num_i * self._num_j
+
+        # Numpy views on the native VTK arrays, no copying is done here
+        points_np = vtk_to_numpy(esgrid.GetPoints().GetData())
+        self._conn_np = vtk_to_numpy(esgrid.GetCells().GetConnectivityArray()).reshape(
+            -1, 8
+        )
+
+        ghost_arr_vtk = esgrid.GetCellGhostArray()
+        if ghost_arr_vtk is not None:
+            self._active_np = (
+                vtk_to_numpy(ghost_arr_vtk) & vtkDataSetAttributes.HIDDENCELL
+            ) == 0
+        else:
+            self._active_np = np.ones(self._conn_np.shape[0], dtype=bool)
+
+        self._min_x = np.full(num_columns, np.inf)
+        self._max_x = np.full(num_columns, -np.inf)
+        self._min_y = np.full(num_columns, np.inf)
+        self._max_y = np.full(num_columns, -np.inf)
+
+        # Process one layer at a time to limit the size of the temporary arrays
+        for k in range(self._num_k):
+            layer_slice = slice(k * num_columns, (k + 1) * num_columns)
+            layer_conn = self._conn_np[layer_slice]
+            layer_active = self._active_np[layer_slice]
+            for min_arr, max_arr, axis in [
+                (self._min_x, self._max_x, 0),
+                (self._min_y, self._max_y, 1),
+            ]:
+                corner_coords = points_np[layer_conn, axis]
+                np.minimum(
+                    min_arr,
+                    np.where(layer_active, corner_coords.min(axis=1), np.inf),
+                    out=min_arr,
+                )
+                np.maximum(
+                    max_arr,
+                    np.where(layer_active, corner_coords.max(axis=1), -np.inf),
+                    out=max_arr,
+                )
+
+        LOGGER.debug(
+            f"Built column index for {num_columns} columns in {timer.elapsed_s():.2f}s"
+        )
+
+    # -----------------------------------------------------------------------------
+    def memory_bytes(self) -> int:
+        return (
+            self._min_x.nbytes
+            + self._max_x.nbytes
+            + self._min_y.nbytes
+            + self._max_y.nbytes
+            + self._active_np.nbytes
+        )
+
+    # -----------------------------------------------------------------------------
+    # pylint: disable=too-many-locals
+    def find_cells_intersecting_segment(
+        self, x_0: float, y_0: float, x_1: float, y_1: float
+    ) -> np.ndarray:
+        """Returns the indices of the active cells in the columns whose XY bounding
+        box is intersected by the segment. The cell indices are ESG cell ids."""
+        candidate_columns = np.nonzero(
+            (self._max_x >= min(x_0, x_1))
+            & (self._min_x <= max(x_0, x_1))
+            & (self._max_y >= min(y_0, y_1))
+            & (self._min_y <= max(y_0, y_1))
+        )[0]
+
+        # The boxes overlap the segment's bounding box, so the only remaining
+        # separating axis to test is the normal of the segment
+        normal_x = y_1 - y_0
+        normal_y = x_0 - x_1
+        half_ext_x = 0.5 * (
+            self._max_x[candidate_columns] - self._min_x[candidate_columns]
+        )
+        half_ext_y = 0.5 * (
+            self._max_y[candidate_columns] - self._min_y[candidate_columns]
+        )
+        center_x = self._min_x[candidate_columns] + half_ext_x
+        center_y = self._min_y[candidate_columns] + half_ext_y
+        center_dist = np.abs(normal_x * (center_x - x_0) + normal_y * (center_y - y_0))
+        projected_radius = abs(normal_x) * half_ext_x + abs(normal_y) * half_ext_y
+        columns = candidate_columns[center_dist <= projected_radius]
+
+        layer_offsets = np.arange(self._num_k) * (self._num_i * self._num_j)
+        cell_ids = (layer_offsets[:, np.newaxis] + columns[np.newaxis, :]).ravel()
+
+        return cell_ids[self._active_np[cell_ids]]
+
+    # -----------------------------------------------------------------------------
+    def create_ugrid_for_cells(self, cell_ids: np.ndarray) -> vtkUnstructuredGrid:
+        """Create an unstructured grid with the specified cells, sharing points with
+        the explicit structured grid. As with vtkExplicitStructuredGridToUnstructuredGrid
+        the ESG cell ids are stored in the vtkOriginalCellIds cell data array."""
+        cell_array = vtkCellArray()
+        cell_array.SetData(8, numpy_to_vtkIdTypeArray(self._conn_np[cell_ids].ravel()))
+
+        ugrid = vtkUnstructuredGrid()
+        ugrid.SetPoints(self._esgrid.GetPoints())
+        ugrid.SetCells(VTK_HEXAHEDRON, cell_array)
+
+        original_cell_ids_vtk = numpy_to_vtkIdTypeArray(cell_ids, deep=1)
+        original_cell_ids_vtk.SetName("vtkOriginalCellIds")
+        ugrid.GetCellData().AddArray(original_cell_ids_vtk)
+
+        return ugrid
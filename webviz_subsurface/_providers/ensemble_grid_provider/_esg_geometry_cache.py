@@ -0,0 +1,142 @@
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+from ._xtgeo_to_vtk_explicit_structured_grid import EsgGeometryData
+
+LOGGER = logging.getLogger(__name__)
+
+FILE_EXTENSION = ".npz"
+
+
+class EsgGeometryCache:
+    """On-disk cache of the geometry data used to create the VTK explicit structured
+    grids, so that re-creating a grid that has been evicted from memory does not
+    require loading the xtgeo grid and converting it again.
+
+    The cache may be shared between processes. It is capped in size, and the least
+    recently used entries will be evicted first.
+    """
+
+    def __init__(self, cache_dir: Path, max_disk_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self._max_disk_bytes = max_disk_bytes
+        self._evict_lock = threading.Lock()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def fetch(self, provider_id: str, realization: int) -> Optional[EsgGeometryData]:
+        timer = PerfTimer()
+
+        full_path = self.cache_dir / _compose_file_name(provider_id, realization)
+        if not full_path.is_file():
+            return None
+
+        try:
+            with np.load(full_path) as npz_file:
+                geometry_data = EsgGeometryData(
+                    point_dims=npz_file["point_dims"],
+                    vertex_arr=npz_file["vertex_arr"],
+                    conn_arr=npz_file["conn_arr"],
+                    inactive_arr=npz_file["inactive_arr"],
+                )
+            # Touch the file so that eviction is done in LRU order
+            os.utime(full_path)
+        # pylint: disable=broad-except
+        except Exception as exc:
+            LOGGER.warning(f"Failed to read ESG geometry from cache: {exc}")
+            return None
+
+        LOGGER.debug(
+            f"Read ESG geometry from cache in {timer.elapsed_s():.2f}s "
+            f"(provider_id={provider_id}, real={realization})"
+        )
+
+        return geometry_data
+
+    def store(
+        self, provider_id: str, realization: int, geometry_data: EsgGeometryData
+    ) -> None:
+        timer = PerfTimer()
+
+        file_name = _compose_file_name(provider_id, realization)
+        full_path = self.cache_dir / file_name
+
+        # Go via a temporary file which we don't rename until writing is finished
+        # to make the cache writing concurrency-friendly.
+        tmp_path = self.cache_dir / (file_name + f"__{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as file:
+                np.savez(
+                    file,
+                    point_dims=geometry_data.point_dims,
+                    vertex_arr=geometry_data.vertex_arr,
+                    conn_arr=geometry_data.conn_arr,
+                    inactive_arr=geometry_data.inactive_arr,
+                )
+            os.replace(tmp_path, full_path)
+        except OSError as exc:
+            LOGGER.warning(f"Failed to write ESG geometry to cache: {exc}")
+            if tmp_path.exists():
+                os.remove(tmp_path)
+            return
+
+        self._evict_if_needed()
+
+        LOGGER.debug(
+            f"Wrote ESG geometry to cache in {timer.elapsed_s():.2f}s "
+            f"(provider_id={provider_id}, real={realization})"
+        )
+
+    def _evict_if_needed(self) -> None:
+        """Delete the least recently used files until the cache is within its size
+        limit. Other processes may be doing the same, so tolerate files that disappear
+        underway."""
+        with self._evict_lock:
+            entries: List[os.DirEntry] = []
+            total_bytes = 0
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(FILE_EXTENSION):
+                        continue
+                    try:
+                        total_bytes += entry.stat().st_size
+                        entries.append(entry)
+                    except FileNotFoundError:
+                        continue
+
+            if total_bytes <= self._max_disk_bytes:
+                return
+
+            num_evicted = 0
+            # Never evict the most recently used entry
+            for entry in sorted(entries, key=_entry_mtime_or_zero)[:-1]:
+                if total_bytes <= self._max_disk_bytes:
+                    break
+                try:
+                    entry_bytes = entry.stat().st_size
+                    os.remove(entry.path)
+                    total_bytes -= entry_bytes
+                    num_evicted += 1
+                except FileNotFoundError:
+                    continue
+
+        LOGGER.debug(f"Evicted {num_evicted} entries from ESG geometry cache")
+
+
+def _compose_file_name(provider_id: str, realization: int) -> str:
+    return f"{provider_id}--R{realization}{FILE_EXTENSION}"
+
+
+def _entry_mtime_or_zero(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
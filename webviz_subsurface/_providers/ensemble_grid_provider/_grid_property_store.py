@@ -0,0 +1,270 @@
+import logging
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import xtgeo
+
+from webviz_subsurface._utils.enum_shim import StrEnum
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+from .ensemble_grid_provider import EnsembleGridProvider
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "property_store_index.parquet"
+
+# The property values are stored as float32, or int32 for discrete properties
+_STORE_DTYPES = [np.dtype(np.float32), np.dtype(np.int32)]
+
+
+class Col(StrEnum):
+    REAL = "realization"
+    NAME = "name"
+    DATE = "date"
+    DTYPE = "dtype"
+    ROW = "row"
+    NUM_CELLS = "num_cells"
+
+
+class GridPropertyStore:
+    """Store with the values of all the grid properties of a provider, pre-extracted
+    into one memory-mapped file per realization and value type. Each file holds one
+    row per property, with the values for all cells in the Fortran order layout
+    returned by EnsembleGridProvider.get_static_property_values() and
+    get_dynamic_property_values(). Reading a property is a zero-copy slice."""
+
+    def __init__(self, store_dir: Path, index_df: pd.DataFrame) -> None:
+        self._store_dir = store_dir
+        self._lock = threading.Lock()
+        self._memmaps: Dict[Tuple[int, str], np.memmap] = {}
+
+        self._index: Dict[Tuple[int, str, str], Tuple[str, int, int]] = {
+            (int(real), name, date): (dtype, int(row), int(num_cells))
+            for real, name, date, dtype, row, num_cells in zip(
+                index_df[Col.REAL],
+                index_df[Col.NAME],
+                index_df[Col.DATE],
+                index_df[Col.DTYPE],
+                index_df[Col.ROW],
+                index_df[Col.NUM_CELLS],
+            )
+        }
+        self._num_rows: Dict[Tuple[int, str], int] = {}
+        for (real, _name, _date), (dtype, row, _num_cells) in self._index.items():
+            key = (real, dtype)
+            self._num_rows[key] = max(self._num_rows.get(key, 0), row + 1)
+
+    @staticmethod
+    def write(store_dir: Path, provider: EnsembleGridProvider) -> None:
+        """Extract all static and dynamic properties of the provider into a store.
+        All files are written to temporary files that are renamed into place, and the
+        index is written last, so a store without an index is incomplete."""
+        timer = PerfTimer()
+
+        LOGGER.info(f"Writing grid property store to: {store_dir}")
+        store_dir.mkdir(parents=True, exist_ok=True)
+
+        property_specs: List[Tuple[str, str]] = [
+            (name, "") for name in provider.static_property_names()
+        ]
+        for name in provider.dynamic_property_names():
+            dates = provider.dates_for_dynamic_property(name)
+            property_specs.extend((name, date) for date in dates or [])
+
+        index_rows: List[Tuple[int, str, str, str, int, int]] = []
+        tmp_paths: Dict[str, Path] = {}
+        try:
+            for real in provider.realizations():
+                tmp_paths = {
+                    dtype.name: store_dir / f"tmp-{uuid.uuid4().hex}"
+                    for dtype in _STORE_DTYPES
+                }
+                index_rows.extend(
+                    _write_realization_files(provider, real, property_specs, tmp_paths)
+                )
+                for dtype_name, tmp_path in tmp_paths.items():
+                    os.replace(
+                        tmp_path, store_dir / _compose_file_name(real, dtype_name)
+                    )
+
+            index_df = pd.DataFrame(
+                index_rows,
+                columns=[
+                    Col.REAL,
+                    Col.NAME,
+                    Col.DATE,
+                    Col.DTYPE,
+                    Col.ROW,
+                    Col.NUM_CELLS,
+                ],
+            )
+            tmp_paths = {INDEX_FILE_NAME: store_dir / f"tmp-{uuid.uuid4().hex}"}
+            index_df.to_parquet(path=tmp_paths[INDEX_FILE_NAME])
+            os.replace(tmp_paths[INDEX_FILE_NAME], store_dir / INDEX_FILE_NAME)
+        finally:
+            # Remove the temporary files left behind if writing failed
+            for tmp_path in tmp_paths.values():
+                tmp_path.unlink(missing_ok=True)
+
+        LOGGER.info(
+            f"Wrote grid property store in: {timer.elapsed_s():.2f}s "
+            f"(#properties={len(property_specs)}, #stored_arrays={len(index_df)})"
+        )
+
+    @staticmethod
+    def open(store_dir: Path) -> Optional["GridPropertyStore"]:
+        try:
+            index_df = pd.read_parquet(path=store_dir / INDEX_FILE_NAME)
+        except FileNotFoundError:
+            return None
+
+        return GridPropertyStore(store_dir, index_df)
+
+    def get_values(
+        self, property_name: str, property_date: str, realization: int
+    ) -> Optional[np.ndarray]:
+        """Returns read-only view of the property values for all cells, or None if
+        the property is not in the store"""
+        entry = self._index.get((realization, property_name, property_date))
+        if entry is None:
+            return None
+
+        dtype_name, row, num_cells = entry
+        memmap = self._get_memmap(realization, dtype_name, num_cells)
+        return memmap[row]
+
+    def _get_memmap(
+        self, realization: int, dtype_name: str, num_cells: int
+    ) -> np.memmap:
+        key = (realization, dtype_name)
+        with self._lock:
+            memmap = self._memmaps.get(key)
+            if memmap is None:
+                memmap = np.memmap(
+                    self._store_dir / _compose_file_name(realization, dtype_name),
+                    dtype=dtype_name,
+                    mode="r",
+                    shape=(self._num_rows[key], num_cells),
+                )
+                self._memmaps[key] = memmap
+
+        return memmap
+
+
+class GridPropertyStoreProvider(EnsembleGridProvider):
+    """Grid provider that serves the property values from a GridPropertyStore, and
+    delegates everything else to the wrapped provider. Properties that are missing
+    from the store are read from the wrapped provider."""
+
+    def __init__(
+        self, wrapped_provider: EnsembleGridProvider, store: GridPropertyStore
+    ) -> None:
+        self._wrapped_provider = wrapped_provider
+        self._store = store
+
+    def provider_id(self) -> str:
+        return self._wrapped_provider.provider_id()
+
+    def static_property_names(self) -> List[str]:
+        return self._wrapped_provider.static_property_names()
+
+    def dynamic_property_names(self) -> List[str]:
+        return self._wrapped_provider.dynamic_property_names()
+
+    def dates_for_dynamic_property(self, property_name: str) -> Optional[List[str]]:
+        return self._wrapped_provider.dates_for_dynamic_property(property_name)
+
+    def realizations(self) -> List[int]:
+        return self._wrapped_provider.realizations()
+
+    def get_3dgrid(self, realization: int) -> xtgeo.Grid:
+        return self._wrapped_provider.get_3dgrid(realization)
+
+    def get_static_property_values(
+        self, property_name: str, realization: int
+    ) -> Optional[np.ndarray]:
+        values = self._store.get_values(property_name, "", realization)
+        if values is not None:
+            return values
+
+        return self._wrapped_provider.get_static_property_values(
+            property_name, realization
+        )
+
+    def get_dynamic_property_values(
+        self, property_name: str, property_date: str, realization: int
+    ) -> Optional[np.ndarray]:
+        values = self._store.get_values(property_name, property_date, realization)
+        if values is not None:
+            return values
+
+        return self._wrapped_provider.get_dynamic_property_values(
+            property_name, property_date, realization
+        )
+
+
+def _write_realization_files(
+    provider: EnsembleGridProvider,
+    realization: int,
+    property_specs: List[Tuple[str, str]],
+    file_paths: Dict[str, Path],
+) -> List[Tuple[int, str, str, str, int, int]]:
+    """Write the property values of the realization to one file per value type, and
+    return the index rows of the written properties"""
+    index_rows: List[Tuple[int, str, str, str, int, int]] = []
+    files: Dict[str, BinaryIO] = {
+        dtype_name: open(file_path, "wb")  # pylint: disable=consider-using-with
+        for dtype_name, file_path in file_paths.items()
+    }
+    try:
+        num_rows = {dtype_name: 0 for dtype_name in files}
+        num_cells: Optional[int] = None
+        for name, date in property_specs:
+            values = _load_property_values(provider, name, date, realization)
+            if values is None:
+                continue
+            if num_cells is None:
+                num_cells = values.size
+            if values.size != num_cells:
+                LOGGER.warning(
+                    f"Skipping property {name} {date} for realization {realization}, "
+                    f"got {values.size} values, expected {num_cells}"
+                )
+                continue
+
+            dtype_name = values.dtype.name
+            files[dtype_name].write(values.tobytes())
+            index_rows.append(
+                (realization, name, date, dtype_name, num_rows[dtype_name], num_cells)
+            )
+            num_rows[dtype_name] += 1
+    finally:
+        for file in files.values():
+            file.close()
+
+    return index_rows
+
+
+def _load_property_values(
+    provider: EnsembleGridProvider, name: str, date: str, realization: int
+) -> Optional[np.ndarray]:
+    if date:
+        values = provider.get_dynamic_property_values(name, date, realization)
+    else:
+        values = provider.get_static_property_values(name, realization)
+    if values is None:
+        return None
+
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int32, copy=False)
+
+    return values.astype(np.float32, copy=False)
+
+
+def _compose_file_name(realization: int, dtype_name: str) -> str:
+    return f"R{realization}.{dtype_name}.bin"
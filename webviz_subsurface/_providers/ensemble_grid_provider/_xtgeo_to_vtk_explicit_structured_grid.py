@@ -1,4 +1,5 @@
 import logging
+from dataclasses import dataclass
 
 import numpy as np
 import xtgeo
@@ -23,39 +24,68 @@ from webviz_subsurface._utils.perf_timer import PerfTimer
 LOGGER = logging.getLogger(__name__)
 
 
+# -----------------------------------------------------------------------------
+@dataclass
+class EsgGeometryData:
+    """Geometry data needed to create a VTK explicit structured grid"""
+
+    point_dims: np.ndarray
+    # Vertices with the z axis already pointing upwards, as used in VTK
+    vertex_arr: np.ndarray
+    conn_arr: np.ndarray
+    inactive_arr: np.ndarray
+
+
 # -----------------------------------------------------------------------------
 def xtgeo_grid_to_vtk_explicit_structured_grid(
     xtg_grid: xtgeo.Grid,
 ) -> vtkExplicitStructuredGrid:
     timer = PerfTimer()
 
+    geometry_data = xtgeo_grid_to_esg_geometry_data(xtg_grid)
+    et_get_esg_geo_data_ms = timer.lap_ms()
+
+    vtk_esgrid = create_vtk_esgrid_from_geometry_data(geometry_data)
+    et_create_vtk_esg_ms = timer.lap_ms()
+
+    LOGGER.debug(
+        f"xtgeo_grid_to_vtk_explicit_structured_grid() took {timer.elapsed_s():.2f}s "
+        f"(get_esg_geo_data={et_get_esg_geo_data_ms}ms, "
+        f"create_vtk_esg={et_create_vtk_esg_ms}ms)"
+    )
+
+    return vtk_esgrid
+
+
+# -----------------------------------------------------------------------------
+def xtgeo_grid_to_esg_geometry_data(xtg_grid: xtgeo.Grid) -> EsgGeometryData:
     # Create geometry data suitable for use with VTK's explicit structured grid
     # based on the specified xtgeo 3d grid
     pt_dims, vertex_arr, conn_arr, inactive_arr = xtg_grid.get_vtk_esg_geometry_data()
     vertex_arr[:, 2] *= -1
-    et_get_esg_geo_data_ms = timer.lap_ms()
 
-    # LOGGER.debug(f"pt_dims={pt_dims}")
-    # LOGGER.debug(f"vertex_arr.shape={vertex_arr.shape}")
-    # LOGGER.debug(f"vertex_arr.dtype={vertex_arr.dtype}")
-    # LOGGER.debug(f"conn_arr.shape={conn_arr.shape}")
-    # LOGGER.debug(f"conn_arr.dtype={conn_arr.dtype}")
+    return EsgGeometryData(
+        point_dims=pt_dims,
+        vertex_arr=vertex_arr,
+        conn_arr=conn_arr,
+        inactive_arr=inactive_arr,
+    )
 
-    vtk_esgrid = _create_vtk_esgrid_from_verts_and_conn(pt_dims, vertex_arr, conn_arr)
-    et_create_vtk_esg_ms = timer.lap_ms()
+
+# -----------------------------------------------------------------------------
+def create_vtk_esgrid_from_geometry_data(
+    geometry_data: EsgGeometryData,
+) -> vtkExplicitStructuredGrid:
+    vtk_esgrid = _create_vtk_esgrid_from_verts_and_conn(
+        geometry_data.point_dims, geometry_data.vertex_arr, geometry_data.conn_arr
+    )
 
     # Make sure we hide the inactive cells.
     # First we let VTK allocate cell ghost array, then we obtain a numpy view
     # on the array and write to that (we're actually modifying the native VTK array)
     ghost_arr_vtk = vtk_esgrid.AllocateCellGhostArray()
     ghost_arr_np = vtk_to_numpy(ghost_arr_vtk)
-    ghost_arr_np[inactive_arr] = vtkDataSetAttributes.HIDDENCELL
-
-    LOGGER.debug(
-        f"xtgeo_grid_to_vtk_explicit_structured_grid() took {timer.elapsed_s():.2f}s "
-        f"(get_esg_geo_data={et_get_esg_geo_data_ms}ms, "
-        f"create_vtk_esg={et_create_vtk_esg_ms}ms)"
-    )
+    ghost_arr_np[geometry_data.inactive_arr] = vtkDataSetAttributes.HIDDENCELL
 
     return vtk_esgrid
 
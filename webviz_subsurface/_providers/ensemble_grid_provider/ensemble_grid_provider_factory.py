@@ -2,7 +2,7 @@ import hashlib
 import logging
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from webviz_config.webviz_factory import WebvizFactory
 from webviz_config.webviz_factory_registry import WEBVIZ_FACTORY_REGISTRY
@@ -11,6 +11,8 @@ from webviz_config.webviz_instance_info import WebvizRunMode
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._egrid_file_discovery import discover_per_realization_eclipse_files
+from ._esg_geometry_cache import EsgGeometryCache
+from ._grid_property_store import GridPropertyStore, GridPropertyStoreProvider
 from ._roff_file_discovery import discover_per_realization_roff_files
 from .ensemble_grid_provider import EnsembleGridProvider
 from .provider_impl_egrid import ProviderImplEgrid
@@ -18,6 +20,8 @@ from .provider_impl_roff import ProviderImplRoff
 
 LOGGER = logging.getLogger(__name__)
 
+_ESG_GEOMETRY_CACHE_MAX_DISK_BYTES = 20 * 1024 * 1024 * 1024
+
 
 class EnsembleGridProviderFactory(WebvizFactory):
     def __init__(
@@ -34,8 +38,13 @@ class EnsembleGridProviderFactory(WebvizFactory):
             f"EnsembleGridProviderFactory init: storage_dir={self._storage_dir}"
         )
 
+        self._esg_geometry_cache: Optional[EsgGeometryCache] = None
         if self._allow_storage_writes:
             os.makedirs(self._storage_dir, exist_ok=True)
+            self._esg_geometry_cache = EsgGeometryCache(
+                self._storage_dir / "esg_geometry_cache",
+                _ESG_GEOMETRY_CACHE_MAX_DISK_BYTES,
+            )
 
     @staticmethod
     def instance() -> "EnsembleGridProviderFactory":
@@ -61,9 +70,22 @@ class EnsembleGridProviderFactory(WebvizFactory):
 
         return factory
 
+    def esg_geometry_cache(self) -> Optional[EsgGeometryCache]:
+        """Returns the on-disk cache for grid geometry, intended for use with the
+        GridVizService. Returns None if storage writes are not allowed."""
+        return self._esg_geometry_cache
+
     def create_from_roff_files(
-        self, ens_path: str, grid_name: str, attribute_filter: List[str] = None
+        self,
+        ens_path: str,
+        grid_name: str,
+        attribute_filter: List[str] = None,
+        preextract_properties: bool = False,
     ) -> EnsembleGridProvider:
+        """If preextract_properties is True, all the grid properties are extracted into
+        a memory-mapped property store, see GridPropertyStore. This makes the property
+        reads much faster at the expense of a slower first time import and more disk
+        usage."""
         timer = PerfTimer()
         string_to_hash = (
             f"{ens_path}_{grid_name}"
@@ -77,6 +99,8 @@ class EnsembleGridProviderFactory(WebvizFactory):
                 f"Loaded grid provider from backing store in {timer.elapsed_s():.2f}s ("
                 f"ens_path={ens_path})"
             )
+            if preextract_properties:
+                return self._wrap_with_property_store(provider, storage_key)
             return provider
 
         # We can only import data from data source if storage writes are allowed
@@ -110,6 +134,8 @@ class EnsembleGridProviderFactory(WebvizFactory):
             f" write={et_write_s:.2f}s, ens_path={ens_path})"
         )
 
+        if preextract_properties:
+            return self._wrap_with_property_store(provider, storage_key)
         return provider
 
     def create_from_eclipse_files(
@@ -118,7 +144,9 @@ class EnsembleGridProviderFactory(WebvizFactory):
         grid_name: str,
         init_properties: List[str],
         restart_properties: List[str],
+        preextract_properties: bool = False,
     ) -> EnsembleGridProvider:
+        """See create_from_roff_files() regarding preextract_properties"""
         timer = PerfTimer()
 
         string_to_hash = f"{ens_path}_{grid_name}_egrid"
@@ -131,6 +159,8 @@ class EnsembleGridProviderFactory(WebvizFactory):
                 f"Loaded grid provider from backing store in {timer.elapsed_s():.2f}s ("
                 f"ens_path={ens_path})"
             )
+            if preextract_properties:
+                return self._wrap_with_property_store(provider, storage_key)
             return provider
 
         # We can only import data from data source if storage writes are allowed
@@ -162,8 +192,42 @@ class EnsembleGridProviderFactory(WebvizFactory):
             f" write={et_write_s:.2f}s, ens_path={ens_path})"
         )
 
+        if preextract_properties:
+            return self._wrap_with_property_store(provider, storage_key)
         return provider
 
+    def _wrap_with_property_store(
+        self, provider: EnsembleGridProvider, storage_key: str
+    ) -> EnsembleGridProvider:
+        """Wrap the provider so that it reads properties from a property store,
+        creating the store if needed. The store is keyed by the available properties,
+        since these depend on the arguments used when creating the provider."""
+        timer = PerfTimer()
+
+        property_names = provider.static_property_names() + sorted(
+            provider.dynamic_property_names()
+        )
+        store_dir = (
+            self._storage_dir
+            / storage_key
+            / f"property_store__{_make_hash_string('_'.join(property_names))}"
+        )
+        store = GridPropertyStore.open(store_dir)
+        if store is None and self._allow_storage_writes:
+            GridPropertyStore.write(store_dir, provider)
+            store = GridPropertyStore.open(store_dir)
+
+        if store is None:
+            LOGGER.warning(
+                f"No grid property store available for {storage_key}, "
+                f"reading properties from the grid files"
+            )
+            return provider
+
+        LOGGER.info(f"Opened grid property store in {timer.elapsed_s():.2f}s")
+
+        return GridPropertyStoreProvider(provider, store)
+
 
 def _make_hash_string(string_to_hash: str) -> str:
     # There is no security risk here and chances of collision should be very slim
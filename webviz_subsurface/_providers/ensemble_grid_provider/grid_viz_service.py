@@ -1,7 +1,9 @@
 import dataclasses
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 from vtkmodules.util.numpy_support import vtk_to_numpy
@@ -11,10 +13,9 @@ from vtkmodules.vtkCommonCore import reference, vtkIdList, vtkPoints
 
 # pylint: disable=no-name-in-module,
 from vtkmodules.vtkCommonDataModel import (
-    vtkCellArray,
     vtkCellLocator,
     vtkExplicitStructuredGrid,
-    vtkLine,
+    vtkGenericCell,
     vtkPlane,
     vtkPolyData,
     vtkUnstructuredGrid,
@@ -25,8 +26,6 @@ from vtkmodules.vtkFiltersCore import (
     vtkAppendPolyData,
     vtkClipPolyData,
     vtkExplicitStructuredGridCrop,
-    vtkExplicitStructuredGridToUnstructuredGrid,
-    vtkExtractCellsAlongPolyLine,
     vtkPlaneCutter,
     vtkUnstructuredGridToExplicitStructuredGrid,
 )
@@ -34,9 +33,13 @@ from vtkmodules.vtkFiltersGeometry import vtkExplicitStructuredGridSurfaceFilter
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ._esg_column_index import EsgColumnIndex
+from ._esg_geometry_cache import EsgGeometryCache
+
 # Requires updated xtgeo
 from ._xtgeo_to_vtk_explicit_structured_grid import (
-    xtgeo_grid_to_vtk_explicit_structured_grid,
+    create_vtk_esgrid_from_geometry_data,
+    xtgeo_grid_to_esg_geometry_data,
 )
 from .ensemble_grid_provider import EnsembleGridProvider
 
@@ -44,6 +47,31 @@ LOGGER = logging.getLogger(__name__)
 
 _GRID_VIZ_SERVICE_INSTANCE: Optional["GridVizService"] = None
 
+# Budget for the estimated memory used by all the grid workers, the least recently
+# used workers are evicted when the budget is exceeded
+_DEFAULT_MAX_GRID_WORKERS_BYTES = 4 * 1024 * 1024 * 1024
+
+# Number of grid surfaces, one per cell filter, that each grid worker keeps cached
+_MAX_CACHED_SURFACES_PER_WORKER = 4
+
+# Number of cell locators, one per cell filter, that each grid worker keeps cached.
+# The memory used by a locator is not reported by VTK, so it is estimated.
+_MAX_CACHED_LOCATORS_PER_WORKER = 2
+_ESTIMATED_LOCATOR_BYTES_PER_CELL = 16
+
+# Result of GridVizService.ray_pick_many(), with one element per ray. For rays that
+# don't hit the grid, cell_index and the IJK are -1 and the floats are NaN.
+PICK_RESULTS_DTYPE = np.dtype(
+    [
+        ("cell_index", np.int64),
+        ("cell_i", np.int32),
+        ("cell_j", np.int32),
+        ("cell_k", np.int32),
+        ("intersection_point", np.float64, (3,)),
+        ("cell_property_value", np.float64),
+    ]
+)
+
 
 @dataclass
 class PropertySpec:
@@ -81,6 +109,20 @@ class Ray:
     # direction: List[float]
 
 
+@dataclass
+class _CachedSurface:
+    surface_polys: SurfacePolys
+    original_cell_indices: np.ndarray
+
+
+@dataclass
+class _CachedLocator:
+    # The grid the locator was built for, which is the cropped grid if a cell filter
+    # is in use. Holds a reference to keep the grid alive with the locator.
+    grid: vtkExplicitStructuredGrid
+    locator: vtkCellLocator
+
+
 @dataclass
 class PickResult:
     cell_index: int
@@ -94,45 +136,162 @@ class PickResult:
 # =============================================================================
 class GridWorker:
     # -----------------------------------------------------------------------------
-    def __init__(self, full_esgrid: vtkExplicitStructuredGrid) -> None:
+    def __init__(
+        self,
+        full_esgrid: vtkExplicitStructuredGrid,
+        on_cache_grown: Optional[Callable[[], None]] = None,
+    ) -> None:
         self._full_esgrid = full_esgrid
 
-        self._cached_cell_filter: Optional[CellFilter] = None
-        self._cached_original_cell_indices: Optional[np.ndarray] = None
+        # Called, without any of the worker's locks held, after data has been added
+        # to the worker's caches, since they count towards estimated_memory_bytes()
+        self._on_cache_grown = on_cache_grown
+
+        self._surface_cache_lock = threading.Lock()
+        self._surface_cache: "OrderedDict[Optional[Tuple[int, ...]], _CachedSurface]" = (
+            OrderedDict()
+        )
+
+        self._column_index_lock = threading.Lock()
+        self._column_index: Optional[EsgColumnIndex] = None
+
+        self._locator_cache_lock = threading.Lock()
+        self._locator_cache: "OrderedDict[Optional[Tuple[int, ...]], _CachedLocator]" = (
+            OrderedDict()
+        )
 
     # -----------------------------------------------------------------------------
     def get_full_esgrid(self) -> vtkExplicitStructuredGrid:
         return self._full_esgrid
 
     # -----------------------------------------------------------------------------
-    def get_cached_original_cell_indices(
+    def estimated_memory_bytes(self) -> int:
+        # GetActualMemorySize() returns kibibytes
+        num_bytes = self._full_esgrid.GetActualMemorySize() * 1024
+        with self._surface_cache_lock:
+            for cached_surface in self._surface_cache.values():
+                num_bytes += (
+                    cached_surface.surface_polys.point_arr.nbytes
+                    + cached_surface.surface_polys.poly_arr.nbytes
+                    + cached_surface.original_cell_indices.nbytes
+                )
+        if self._column_index is not None:
+            num_bytes += self._column_index.memory_bytes()
+        with self._locator_cache_lock:
+            for cached_locator in self._locator_cache.values():
+                if cached_locator.grid is not self._full_esgrid:
+                    num_bytes += cached_locator.grid.GetActualMemorySize() * 1024
+                num_bytes += (
+                    cached_locator.grid.GetNumberOfCells()
+                    * _ESTIMATED_LOCATOR_BYTES_PER_CELL
+                )
+        return num_bytes
+
+    # -----------------------------------------------------------------------------
+    def get_cell_locator(
         self, cell_filter: Optional[CellFilter]
-    ) -> Optional[np.ndarray]:
-        if self._cached_original_cell_indices is None:
-            return None
+    ) -> Tuple[vtkExplicitStructuredGrid, vtkCellLocator]:
+        """Returns the grid for the cell filter (the full grid or a cropped grid)
+        and a cell locator for it, building and caching them on first use"""
+        cache_key = _make_cell_filter_cache_key(cell_filter)
+        did_build_locator = False
+        with self._locator_cache_lock:
+            cached_locator = self._locator_cache.get(cache_key)
+            if cached_locator is None:
+                did_build_locator = True
+                timer = PerfTimer()
+                grid = self._full_esgrid
+                if cell_filter:
+                    grid = _calc_cropped_grid(grid, cell_filter)
+
+                # Note that vtkStaticCellLocator would be faster to build, but as of
+                # VTK 9.7 it sometimes misses the nearest hit in IntersectWithLine()
+                locator = vtkCellLocator()
+                locator.SetDataSet(grid)
+                locator.BuildLocator()
+                cached_locator = _CachedLocator(grid, locator)
+                self._locator_cache[cache_key] = cached_locator
+                LOGGER.debug(
+                    f"Built cell locator in {timer.elapsed_s():.2f}s "
+                    f"({_cell_filter_dbg_str(cell_filter)})"
+                )
 
-        if cell_filter == self._cached_cell_filter:
-            return self._cached_original_cell_indices
+            self._locator_cache.move_to_end(cache_key)
+            while len(self._locator_cache) > _MAX_CACHED_LOCATORS_PER_WORKER:
+                self._locator_cache.popitem(last=False)
 
-        return None
+        if did_build_locator:
+            self._notify_cache_grown()
+
+        return cached_locator.grid, cached_locator.locator
+
+    # -----------------------------------------------------------------------------
+    def get_column_index(self) -> EsgColumnIndex:
+        """Returns the column index of the full grid, building it on first use"""
+        did_build_index = False
+        with self._column_index_lock:
+            if self._column_index is None:
+                self._column_index = EsgColumnIndex(self._full_esgrid)
+                did_build_index = True
+            column_index = self._column_index
+
+        if did_build_index:
+            self._notify_cache_grown()
+
+        return column_index
+
+    # -----------------------------------------------------------------------------
+    def get_cached_surface(
+        self, cell_filter: Optional[CellFilter]
+    ) -> Optional[Tuple[SurfacePolys, np.ndarray]]:
+        """Returns the surface polys and the original cell indices of the surface's
+        cells for the cell filter, or None if they are not in the cache"""
+        cache_key = _make_cell_filter_cache_key(cell_filter)
+        with self._surface_cache_lock:
+            cached_surface = self._surface_cache.get(cache_key)
+            if cached_surface is None:
+                return None
+            self._surface_cache.move_to_end(cache_key)
+
+        return cached_surface.surface_polys, cached_surface.original_cell_indices
 
     # -----------------------------------------------------------------------------
-    def set_cached_original_cell_indices(
-        self, cell_filter: Optional[CellFilter], original_cell_indices: np.ndarray
+    def set_cached_surface(
+        self,
+        cell_filter: Optional[CellFilter],
+        surface_polys: SurfacePolys,
+        original_cell_indices: np.ndarray,
     ) -> None:
-        # Make copy of the cell filter
-        self._cached_cell_filter = (
-            dataclasses.replace(cell_filter) if cell_filter is not None else None
-        )
-        self._cached_original_cell_indices = original_cell_indices
+        cache_key = _make_cell_filter_cache_key(cell_filter)
+        with self._surface_cache_lock:
+            self._surface_cache[cache_key] = _CachedSurface(
+                surface_polys, original_cell_indices
+            )
+            self._surface_cache.move_to_end(cache_key)
+            while len(self._surface_cache) > _MAX_CACHED_SURFACES_PER_WORKER:
+                self._surface_cache.popitem(last=False)
+
+        self._notify_cache_grown()
+
+    # -----------------------------------------------------------------------------
+    def _notify_cache_grown(self) -> None:
+        if self._on_cache_grown:
+            self._on_cache_grown()
 
 
 # =============================================================================
 class GridVizService:
     # -----------------------------------------------------------------------------
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_grid_workers_bytes: int = _DEFAULT_MAX_GRID_WORKERS_BYTES,
+        esg_geometry_cache: Optional[EsgGeometryCache] = None,
+    ) -> None:
         self._id_to_provider_dict: Dict[str, EnsembleGridProvider] = {}
-        self._key_to_worker_dict: Dict[str, GridWorker] = {}
+        self._max_grid_workers_bytes = max_grid_workers_bytes
+        self._esg_geometry_cache = esg_geometry_cache
+        self._workers_lock = threading.Lock()
+        self._key_to_worker_dict: "OrderedDict[str, GridWorker]" = OrderedDict()
 
     # -----------------------------------------------------------------------------
     @staticmethod
@@ -163,6 +322,12 @@ class GridVizService:
 
         self._id_to_provider_dict[provider_id] = provider
 
+    # -----------------------------------------------------------------------------
+    def set_esg_geometry_cache(self, esg_geometry_cache: EsgGeometryCache) -> None:
+        """Enable on-disk caching of the grid geometry, which speeds up re-creation
+        of grid workers that have been evicted"""
+        self._esg_geometry_cache = esg_geometry_cache
+
     # -----------------------------------------------------------------------------
     # pylint: disable=too-many-locals,
     def get_surface(
@@ -189,23 +354,15 @@ class GridVizService:
             raise ValueError("Could not get grid worker")
         et_get_grid_worker_ms = timer.lap_ms()
 
-        grid = worker.get_full_esgrid()
-
-        if cell_filter:
-            grid = _calc_cropped_grid(grid, cell_filter)
-        et_crop_grid_ms = timer.lap_ms()
-
-        polydata = _calc_grid_surface(grid)
-
-        # !!!!!!
-        # Need to watch out here, think these may go out of scope!
-        points_np = vtk_to_numpy(polydata.GetPoints().GetData()).ravel()
-        polys_np = vtk_to_numpy(polydata.GetPolys().GetData())
-        original_cell_indices_np = vtk_to_numpy(
-            polydata.GetCellData().GetAbstractArray("vtkOriginalCellIds")
-        )
-
-        surface_polys = SurfacePolys(point_arr=points_np, poly_arr=polys_np)
+        got_cached_surface = True
+        cached_surface = worker.get_cached_surface(cell_filter)
+        if cached_surface is None:
+            got_cached_surface = False
+            cached_surface = _calc_surface_and_original_cell_indices(
+                worker.get_full_esgrid(), cell_filter
+            )
+            worker.set_cached_surface(cell_filter, *cached_surface)
+        surface_polys, original_cell_indices_np = cached_surface
         et_calc_surf_ms = timer.lap_ms()
 
         property_scalars: Optional[PropertyScalars] = None
@@ -216,13 +373,10 @@ class GridVizService:
                 property_scalars = PropertyScalars(value_arr=mapped_cell_vals)
         et_read_and_map_scalars_ms = timer.lap_ms()
 
-        worker.set_cached_original_cell_indices(cell_filter, original_cell_indices_np)
-
         LOGGER.debug(
             f"Got grid surface in {timer.elapsed_s():.2f}s "
             f"(get_grid_worker={et_get_grid_worker_ms}ms, "
-            f"crop_grid={et_crop_grid_ms}ms, "
-            f"calc_surf={et_calc_surf_ms}ms, "
+            f"calc_surf={et_calc_surf_ms}ms (cached={got_cached_surface}), "
             f"read_and_map_scalars={et_read_and_map_scalars_ms}ms, "
             f"provider_id={provider_id}, real={realization}, "
             f"{_property_spec_dbg_str(property_spec)}, "
@@ -256,20 +410,14 @@ class GridVizService:
             raise ValueError("Could not get grid worker")
         et_get_grid_worker_ms = timer.lap_ms()
 
-        original_cell_indices_np = worker.get_cached_original_cell_indices(cell_filter)
-        if original_cell_indices_np is None:
-            # Must first generate the grid to get the original cell indices
-            grid = worker.get_full_esgrid()
-            if cell_filter:
-                grid = _calc_cropped_grid(grid, cell_filter)
-
-            polydata = _calc_grid_surface(grid)
-            original_cell_indices_np = vtk_to_numpy(
-                polydata.GetCellData().GetAbstractArray("vtkOriginalCellIds")
-            )
-            worker.set_cached_original_cell_indices(
-                cell_filter, original_cell_indices_np
+        cached_surface = worker.get_cached_surface(cell_filter)
+        if cached_surface is None:
+            # Must first generate the surface to get the original cell indices
+            cached_surface = _calc_surface_and_original_cell_indices(
+                worker.get_full_esgrid(), cell_filter
             )
+            worker.set_cached_surface(cell_filter, *cached_surface)
+        original_cell_indices_np = cached_surface[1]
         et_get_mapping_indices_ms = timer.lap_ms()
 
         raw_cell_vals = _load_property_values(provider, realization, property_spec)
@@ -318,29 +466,16 @@ class GridVizService:
         if not worker:
             raise ValueError("Could not get grid worker")
 
-        esgrid = worker.get_full_esgrid()
+        column_index = worker.get_column_index()
+        et_get_index_s = timer.lap_s()
 
         num_points_in_polyline = int(len(polyline_xy) / 2)
 
-        ugrid = _vtk_esg_to_ug(esgrid)
-
-        # !!!!!!!!!!!!!!
-        # Requires VTK 9.2-ish
-        # ugrid = _extract_intersected_ugrid(ugrid, polyline_xy, 10.0)
-
         cutter_alg = vtkPlaneCutter()
-        cutter_alg.SetInputDataObject(ugrid)
-
-        # cell_locator = vtkStaticCellLocator()
-        # cell_locator.SetDataSet(esgrid)
-        # cell_locator.BuildLocator()
-
-        # box_clip_alg = vtkBoxClipDataSet()
-        # box_clip_alg.SetInputDataObject(ugrid)
-
         append_alg = vtkAppendPolyData()
-        et_setup_s = timer.lap_s()
+        num_cut_cells = 0
 
+        et_extract_s = 0.0
         et_cut_s = 0.0
         et_clip_s = 0.0
 
@@ -350,18 +485,19 @@ class GridVizService:
             x_1 = polyline_xy[2 * (i + 1)]
             y_1 = polyline_xy[2 * (i + 1) + 1]
             fwd_vec = np.array([x_1 - x_0, y_1 - y_0, 0.0])
-            fwd_vec /= np.linalg.norm(fwd_vec)
+            segment_length = np.linalg.norm(fwd_vec)
+            if segment_length == 0:
+                continue
+            fwd_vec /= segment_length
             right_vec = np.array([fwd_vec[1], -fwd_vec[0], 0])
 
-            # box_clip_alg.SetBoxClip(x_0, x_1, y_0, y_1, min_z, max_z)
-            # box_clip_alg.Update()
-            # clipped_ugrid = box_clip_alg.GetOutputDataObject(0)
-
-            # polyline_bounds = _calc_polyline_bounds([x_0, y_0, x_1, y_1])
-            # polyline_bounds.extend([min_z, max_z])
-            # cell_ids = vtkIdList()
-            # cell_locator.FindCellsWithinBounds(polyline_bounds, cell_ids)
-            # print(f"{cell_ids.GetNumberOfIds()}  {polyline_bounds=}")
+            # Only cut the cells in the columns that are intersected by the segment
+            cell_ids = column_index.find_cells_intersecting_segment(x_0, y_0, x_1, y_1)
+            if len(cell_ids) == 0:
+                continue
+            num_cut_cells += len(cell_ids)
+            segment_ugrid = column_index.create_ugrid_for_cells(cell_ids)
+            et_extract_s += timer.lap_s()
 
             plane = vtkPlane()
             plane.SetOrigin([x_0, y_0, 0])
@@ -375,11 +511,11 @@ class GridVizService:
             plane_1.SetOrigin([x_1, y_1, 0])
             plane_1.SetNormal((-fwd_vec).tolist())  # type: ignore
 
+            cutter_alg.SetInputDataObject(segment_ugrid)
             cutter_alg.SetPlane(plane)
             cutter_alg.Update()
 
             cut_surface_polydata = cutter_alg.GetOutput()
-            # print(f"{type(cut_surface_polydata)=}")
             et_cut_s += timer.lap_s()
 
             # Used vtkPolyDataPlaneClipper earlier, but it seems that it doesn't
@@ -401,6 +537,14 @@ class GridVizService:
 
             et_clip_s += timer.lap_s()
 
+        if append_alg.GetNumberOfInputConnections(0) == 0:
+            LOGGER.debug("Cutting along polyline done, polyline does not hit the grid")
+            empty_surface_polys = SurfacePolys(
+                point_arr=np.empty(0, dtype=np.float32),
+                poly_arr=np.empty(0, dtype=np.int64),
+            )
+            return empty_surface_polys, None
+
         append_alg.Update()
         comb_polydata = append_alg.GetOutput()
         et_combine_s = timer.lap_s()
@@ -422,8 +566,9 @@ class GridVizService:
 
         LOGGER.debug(
             f"Cutting along polyline done in {timer.elapsed_s():.2f}s "
-            f"setup={et_setup_s:.2f}s, cut={et_cut_s:.2f}s, clip={et_clip_s:.2f}s "
-            f"combine={et_combine_s:.2f}s, "
+            f"get_index={et_get_index_s:.2f}s, extract={et_extract_s:.2f}s, "
+            f"cut={et_cut_s:.2f}s, clip={et_clip_s:.2f}s, "
+            f"combine={et_combine_s:.2f}s, #cut_cells={num_cut_cells} "
             f"(provider_id={provider_id}, real={realization})"
         )
 
@@ -456,15 +601,14 @@ class GridVizService:
         if not worker:
             raise ValueError("Could not get grid worker")
 
-        grid = worker.get_full_esgrid()
-        if cell_filter:
-            grid = _calc_cropped_grid(grid, cell_filter)
+        grid, locator = worker.get_cell_locator(cell_filter)
         et_crop_s = timer.lap_s()
 
-        cell_id, isect_pt = _raypick_in_grid(grid, ray)  # type:ignore
+        pick_hit = _raypick_with_locator(locator, ray.origin, ray.end)
         et_pick_s = timer.lap_s()
-        if cell_id is None:
+        if pick_hit is None:
             return None
+        cell_id, isect_pt = pick_hit
 
         original_cell_id = cell_id
         if cell_filter:
@@ -506,6 +650,100 @@ class GridVizService:
             cell_property_value=cell_property_val,
         )
 
+    # -----------------------------------------------------------------------------
+    # pylint: disable=too-many-locals,
+    def ray_pick_many(
+        self,
+        provider_id: str,
+        realization: int,
+        rays: np.ndarray,
+        property_spec: Optional[PropertySpec],
+        cell_filter: Optional[CellFilter],
+    ) -> np.ndarray:
+        """Do ray picks for many rays in one go. The rays are given as an array with
+        shape (N, 2, 3) holding the origin and end point of each ray. Returns structured
+        array with PICK_RESULTS_DTYPE, with one element per ray."""
+        LOGGER.debug(
+            f"Doing {len(rays)} ray picks... "
+            f"(provider_id={provider_id}, real={realization}, "
+            f"{_property_spec_dbg_str(property_spec)}, "
+            f"{_cell_filter_dbg_str(cell_filter)})"
+        )
+        timer = PerfTimer()
+
+        provider = self._id_to_provider_dict.get(provider_id)
+        if not provider:
+            raise ValueError("Could not find provider")
+
+        worker = self._get_or_create_grid_worker(provider_id, realization)
+        if not worker:
+            raise ValueError("Could not get grid worker")
+
+        grid, locator = worker.get_cell_locator(cell_filter)
+        et_get_locator_s = timer.lap_s()
+
+        rays = np.asarray(rays, dtype=np.float64).reshape(-1, 2, 3)
+        results = np.empty(len(rays), dtype=PICK_RESULTS_DTYPE)
+        results["cell_index"] = -1
+        results["intersection_point"] = np.nan
+        results["cell_property_value"] = np.nan
+
+        hit_indices: List[int] = []
+        hit_cell_ids: List[int] = []
+        for ray_idx, (ray_origin, ray_end) in enumerate(rays):
+            pick_hit = _raypick_with_locator(
+                locator, ray_origin.tolist(), ray_end.tolist()
+            )
+            if pick_hit is not None:
+                hit_indices.append(ray_idx)
+                hit_cell_ids.append(pick_hit[0])
+                results["intersection_point"][ray_idx] = pick_hit[1]
+        et_pick_s = timer.lap_s()
+
+        hit_cell_ids_np = np.array(hit_cell_ids, dtype=np.int64)
+        if cell_filter:
+            # Picking was done against the cropped grid, map to the full grid
+            original_cell_ids_np = vtk_to_numpy(
+                grid.GetCellData().GetAbstractArray("vtkOriginalCellIds")
+            )
+            hit_cell_ids_np = original_cell_ids_np[hit_cell_ids_np]
+        results["cell_index"][hit_indices] = hit_cell_ids_np
+
+        cell_dims = [0, 0, 0]
+        worker.get_full_esgrid().GetCellDims(cell_dims)
+        results["cell_i"] = np.where(
+            results["cell_index"] >= 0, results["cell_index"] % cell_dims[0], -1
+        )
+        results["cell_j"] = np.where(
+            results["cell_index"] >= 0,
+            (results["cell_index"] // cell_dims[0]) % cell_dims[1],
+            -1,
+        )
+        results["cell_k"] = np.where(
+            results["cell_index"] >= 0,
+            results["cell_index"] // (cell_dims[0] * cell_dims[1]),
+            -1,
+        )
+
+        if property_spec and hit_indices:
+            raw_cell_vals = _load_property_values(provider, realization, property_spec)
+            if raw_cell_vals is not None:
+                results["cell_property_value"][hit_indices] = raw_cell_vals[
+                    hit_cell_ids_np
+                ]
+        et_props_s = timer.lap_s()
+
+        LOGGER.debug(
+            f"Did {len(rays)} ray picks in {timer.elapsed_s():.2f}s ("
+            f"get_locator={et_get_locator_s:.2f}s, pick={et_pick_s:.2f}s, "
+            f"props={et_props_s:.2f}s, #hits={len(hit_indices)}, "
+            f"provider_id={provider_id}, real={realization}, "
+            f"{_property_spec_dbg_str(property_spec)}, "
+            f"{_cell_filter_dbg_str(cell_filter)})"
+        )
+
+        return results
+
     # -----------------------------------------------------------------------------
     def _get_or_create_grid_worker(
         self, provider_id: str, realization: int
@@ -513,10 +751,12 @@ class GridVizService:
         timer = PerfTimer()
 
         worker_key = f"P{provider_id}__R{realization}"
-        worker = self._key_to_worker_dict.get(worker_key)
-        if worker:
-            LOGGER.debug("_get_or_create_grid_worker() returning cached data")
-            return worker
+        with self._workers_lock:
+            worker = self._key_to_worker_dict.get(worker_key)
+            if worker:
+                self._key_to_worker_dict.move_to_end(worker_key)
+                LOGGER.debug("_get_or_create_grid_worker() returning cached data")
+                return worker
 
         provider = self._id_to_provider_dict.get(provider_id)
         if not provider:
@@ -524,26 +764,75 @@ class GridVizService:
 
         LOGGER.debug("_get_or_create_grid_worker() data not in cache, loading...")
 
-        xtg_grid = provider.get_3dgrid(realization=realization)
-        et_xtgeo_grid_from_provider_grid_ms = timer.lap_ms()
+        geometry_data = None
+        if self._esg_geometry_cache:
+            geometry_data = self._esg_geometry_cache.fetch(provider_id, realization)
+        et_read_geometry_cache_ms = timer.lap_ms()
 
-        cell_count = xtg_grid.ncol * xtg_grid.nrow * xtg_grid.nlay
-        LOGGER.debug(f"_get_or_create_grid_worker() grid cell count: {cell_count}")
+        et_xtgeo_grid_from_provider_grid_ms = 0
+        et_get_esg_geo_data_ms = 0
+        if geometry_data is None:
+            xtg_grid = provider.get_3dgrid(realization=realization)
+            et_xtgeo_grid_from_provider_grid_ms = timer.lap_ms()
 
-        vtk_esg = xtgeo_grid_to_vtk_explicit_structured_grid(xtg_grid)
+            cell_count = xtg_grid.ncol * xtg_grid.nrow * xtg_grid.nlay
+            LOGGER.debug(f"_get_or_create_grid_worker() grid cell count: {cell_count}")
+
+            geometry_data = xtgeo_grid_to_esg_geometry_data(xtg_grid)
+            et_get_esg_geo_data_ms = timer.lap_ms()
+
+            if self._esg_geometry_cache:
+                self._esg_geometry_cache.store(provider_id, realization, geometry_data)
+
+        vtk_esg = create_vtk_esgrid_from_geometry_data(geometry_data)
         et_create_vtk_esg_ms = timer.lap_ms()
 
-        worker = GridWorker(vtk_esg)
-        self._key_to_worker_dict[worker_key] = worker
+        worker = GridWorker(vtk_esg, on_cache_grown=self._on_grid_worker_cache_grown)
+        with self._workers_lock:
+            self._key_to_worker_dict[worker_key] = worker
+            self._evict_grid_workers_if_needed()
 
         LOGGER.debug(
             f"_get_or_create_grid_worker() loaded data in {timer.elapsed_s():.2f}s "
-            f"(xtgeo_grid_from_provider_grid={et_xtgeo_grid_from_provider_grid_ms}ms, "
+            f"(read_geometry_cache={et_read_geometry_cache_ms}ms, "
+            f"xtgeo_grid_from_provider_grid={et_xtgeo_grid_from_provider_grid_ms}ms, "
+            f"get_esg_geo_data={et_get_esg_geo_data_ms}ms, "
             f"create_vtk_esg={et_create_vtk_esg_ms}ms)"
         )
 
         return worker
 
+    # -----------------------------------------------------------------------------
+    def _on_grid_worker_cache_grown(self) -> None:
+        """The caches of a grid worker grow after the worker has been inserted, so
+        check the budget again when data has been added to them"""
+        with self._workers_lock:
+            self._evict_grid_workers_if_needed()
+
+    # -----------------------------------------------------------------------------
+    def _evict_grid_workers_if_needed(self) -> None:
+        """Evict the least recently used grid workers until the estimated memory use
+        is within budget. Always keeps the most recently used worker.
+        Must be called with the workers lock held."""
+        key_to_bytes = {
+            key: worker.estimated_memory_bytes()
+            for key, worker in self._key_to_worker_dict.items()
+        }
+        total_bytes = sum(key_to_bytes.values())
+
+        while (
+            total_bytes > self._max_grid_workers_bytes
+            and len(self._key_to_worker_dict) > 1
+        ):
+            evicted_key, _evicted_worker = self._key_to_worker_dict.popitem(last=False)
+            total_bytes -= key_to_bytes[evicted_key]
+            LOGGER.info(
+                f"Evicted grid worker {evicted_key} "
+                f"({key_to_bytes[evicted_key] / (1024 * 1024):.1f}MB), "
+                f"grid workers now use {total_bytes / (1024 * 1024):.1f}MB of "
+                f"{self._max_grid_workers_bytes / (1024 * 1024):.0f}MB"
+            )
+
 
 # -----------------------------------------------------------------------------
 def _calc_cropped_grid(
@@ -567,18 +856,14 @@ def _calc_cropped_grid(
 
 
 # -----------------------------------------------------------------------------
-def _raypick_in_grid(
-    esgrid: vtkExplicitStructuredGrid, ray: Ray
+def _raypick_with_locator(
+    locator: vtkCellLocator, ray_origin: List[float], ray_end: List[float]
 ) -> Optional[Tuple[int, List[float]]]:
-    """Do a ray pick against the specified grid.
+    """Do a ray pick using the cell locator of a grid.
     Returns None if nothing was hit, otherwise returns the cellId (cell index) of the cell
     that was hit and the intersection point
     """
 
-    locator = vtkCellLocator()
-    locator.SetDataSet(esgrid)
-    locator.BuildLocator()
-
     tolerance = 0.0
     vtk_isect_points = vtkPoints()
     vtk_cell_ids_list = vtkIdList()
@@ -588,8 +873,14 @@ def _raypick_in_grid(
     # broken since it seemingly doesn't return the closest hit.
     # For now we try and use another overload that returns all hits, sorted by distance.
     # There is also an overload without the tol argument, but it doesn't seem to work.
+    # Passing in a cell of our own makes the query thread safe
     any_hits = locator.IntersectWithLine(
-        ray.origin, ray.end, tolerance, vtk_isect_points, vtk_cell_ids_list
+        ray_origin,
+        ray_end,
+        tolerance,
+        vtk_isect_points,
+        vtk_cell_ids_list,
+        vtkGenericCell(),
     )
     # print(f"{any_hits=}")
     # print(f"{vtk_isect_points.GetPoint(0)}")
@@ -620,6 +911,39 @@ def _calc_grid_surface(esgrid: vtkExplicitStructuredGrid) -> vtkPolyData:
     return polydata
 
 
+# -----------------------------------------------------------------------------
+def _calc_surface_and_original_cell_indices(
+    esgrid: vtkExplicitStructuredGrid, cell_filter: Optional[CellFilter]
+) -> Tuple[SurfacePolys, np.ndarray]:
+    grid = esgrid
+    if cell_filter:
+        grid = _calc_cropped_grid(grid, cell_filter)
+
+    polydata = _calc_grid_surface(grid)
+
+    # The numpy arrays keep references to the underlying VTK arrays, so these stay
+    # valid after the polydata goes out of scope
+    points_np = vtk_to_numpy(polydata.GetPoints().GetData()).ravel()
+    polys_np = vtk_to_numpy(polydata.GetPolys().GetData())
+    original_cell_indices_np = vtk_to_numpy(
+        polydata.GetCellData().GetAbstractArray("vtkOriginalCellIds")
+    )
+
+    return (
+        SurfacePolys(point_arr=points_np, poly_arr=polys_np),
+        original_cell_indices_np,
+    )
+
+
+# -----------------------------------------------------------------------------
+def _make_cell_filter_cache_key(
+    cell_filter: Optional[CellFilter],
+) -> Optional[Tuple[int, ...]]:
+    if cell_filter is None:
+        return None
+    return dataclasses.astuple(cell_filter)
+
+
 # -----------------------------------------------------------------------------
 def _load_property_values(
     provider: EnsembleGridProvider, realization: int, property_spec: PropertySpec
@@ -643,16 +967,6 @@ def _load_property_values(
     return prop_values
 
 
-# -----------------------------------------------------------------------------
-def _vtk_esg_to_ug(vtk_esgrid: vtkExplicitStructuredGrid) -> vtkUnstructuredGrid:
-    convert_filter = vtkExplicitStructuredGridToUnstructuredGrid()
-    convert_filter.SetInputData(vtk_esgrid)
-    convert_filter.Update()
-    vtk_ugrid = convert_filter.GetOutput()
-
-    return vtk_ugrid
-
-
 # -----------------------------------------------------------------------------
 def _vtk_ug_to_esg(vtk_ugrid: vtkUnstructuredGrid) -> vtkExplicitStructuredGrid:
     convert_filter = vtkUnstructuredGridToExplicitStructuredGrid()
@@ -666,111 +980,6 @@ def _vtk_ug_to_esg(vtk_ugrid: vtkUnstructuredGrid) -> vtkExplicitStructuredGrid:
     return vtk_esgrid
 
 
-# -----------------------------------------------------------------------------
-def _calc_polyline_bounds(polyline_xy: List[float]) -> Optional[List[float]]:
-    num_points = int(len(polyline_xy) / 2)
-    if num_points < 1:
-        return None
-
-    min_x = min(polyline_xy[0::2])
-    max_x = max(polyline_xy[0::2])
-    min_y = min(polyline_xy[1::2])
-    max_y = max(polyline_xy[1::2])
-
-    return [min_x, max_x, min_y, max_y]
-
-
-# -----------------------------------------------------------------------------
-# pylint: disable=too-many-locals,
-def _extract_intersected_ugrid(
-    ugrid: vtkUnstructuredGrid, polyline_xy_in: List[float], max_point_dist: float
-) -> vtkUnstructuredGrid:
-    timer = PerfTimer()
-
-    polyline_xy = _resample_polyline(polyline_xy_in, max_point_dist)
-    et_resample_s = timer.lap_s()
-
-    num_points_in_polyline = int(len(polyline_xy) / 2)
-    if num_points_in_polyline < 1:
-        return ugrid
-
-    bounds = ugrid.GetBounds()
-    min_z = bounds[4]
-    max_z = bounds[5]
-
-    points = vtkPoints()
-    lines = vtkCellArray()
-
-    for i in range(0, num_points_in_polyline):
-        x = polyline_xy[2 * i]
-        y = polyline_xy[2 * i + 1]
-
-        points.InsertNextPoint([x, y, min_z])
-        points.InsertNextPoint([x, y, max_z])
-
-        line = vtkLine()
-        line.GetPointIds().SetId(0, 2 * i)
-        line.GetPointIds().SetId(1, 2 * i + 1)
-
-        lines.InsertNextCell(line)
-
-    poly_data = vtkPolyData()
-    poly_data.SetPoints(points)
-    poly_data.SetLines(lines)
-
-    et_build_s = timer.lap_s()
-
-    extractor = vtkExtractCellsAlongPolyLine()
-    extractor.SetInputData(0, ugrid)
-    extractor.SetInputData(1, poly_data)
-    extractor.Update()
-
-    ret_grid = extractor.GetOutput(0)
-
-    et_extract_s = timer.lap_s()
-
-    LOGGER.debug(
-        f"extraction with {num_points_in_polyline} points took {timer.elapsed_s():.2f}s "
-        f"(resample={et_resample_s:.2f}s, build={et_build_s:.2f}s, extract={et_extract_s:.2f}s)"
-    )
-
-    return ret_grid
-
-
-# -----------------------------------------------------------------------------
-# pylint: disable=too-many-locals,
-def _resample_polyline(polyline_xy: List[float], max_point_dist: float) -> List[float]:
-    num_points = int(len(polyline_xy) / 2)
-    if num_points < 2:
-        return polyline_xy
-
-    ret_polyline = []
-
-    prev_x = polyline_xy[0]
-    prev_y = polyline_xy[1]
-    ret_polyline.extend([prev_x, prev_y])
-
-    for i in range(1, num_points):
-        x = polyline_xy[2 * i]
-        y = polyline_xy[2 * i + 1]
-
-        fwd = [x - prev_x, y - prev_y]
-        length = np.linalg.norm(fwd)
-        if length > max_point_dist:
-            n_length = int(length / max_point_dist)
-            delta_t = 1.0 / (n_length + 1)
-            for j in range(0, n_length):
-                pt_x = prev_x + fwd[0] * (j + 1) * delta_t
-                pt_y = prev_y + fwd[1] * (j + 1) * delta_t
-                ret_polyline.extend([pt_x, pt_y])
-
-        ret_polyline.extend([x, y])
-        prev_x = x
-        prev_y = y
-
-    return ret_polyline
-
-
 # -----------------------------------------------------------------------------
 def _property_spec_dbg_str(property_spec: Optional[PropertySpec]) -> str:
     if not property_spec:
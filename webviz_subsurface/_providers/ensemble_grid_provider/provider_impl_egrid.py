@@ -1,7 +1,9 @@
 import logging
 import shutil
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -10,11 +12,25 @@ import xtgeo
 from webviz_subsurface._utils.enum_shim import StrEnum
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ._eclipse_file_index import (
+    EclipseKeywordRecord,
+    index_egrid_file,
+    index_init_file,
+    index_unrst_file,
+    read_keyword_values,
+)
 from ._egrid_file_discovery import EclipseCaseFileInfo
 from .ensemble_grid_provider import EnsembleGridProvider
 
 LOGGER = logging.getLogger(__name__)
 
+KEYWORD_INDEX_FILE_NAME = "eclipse_keyword_index.parquet"
+
+# Max number of realizations for which the xtgeo grid and the active cells are kept
+# in memory. The grids are large, the active cell arrays much smaller.
+_MAX_CACHED_GRIDS = 4
+_MAX_CACHED_ACTNUMS = 32
+
 
 class Col(StrEnum):
     REAL = "realization"
@@ -23,6 +39,16 @@ class Col(StrEnum):
     UNRST = "unrst_path"
 
 
+class IndexCol(StrEnum):
+    REAL = "realization"
+    FILE = "file"
+    KEYWORD = "keyword"
+    DATE = "date"
+    VALUE_TYPE = "value_type"
+    COUNT = "count"
+    DATA_OFFSET = "data_offset"
+
+
 class GridType(StrEnum):
     GEOMETRY = "geometry"
     STATIC_PROPERTY = "static_property"
@@ -37,21 +63,43 @@ class ProviderImplEgrid(EnsembleGridProvider):
         grid_inventory_df: pd.DataFrame,
         init_properties: List[str],
         restart_properties: List[str],
+        keyword_index_df: Optional[pd.DataFrame] = None,
     ) -> None:
         self._provider_id = provider_id
         self._provider_dir = provider_dir
         self._inventory_df = grid_inventory_df
         self._init_properties = init_properties
         self._restart_properties = restart_properties
-        first_unrst = self._inventory_df[Col.UNRST][0]
-        self._restart_dates = [
-            str(dateint)
-            for dateint in xtgeo.GridProperties.scan_dates(
-                str(provider_dir / first_unrst), datesonly=True
-            )
-        ]
+
+        self._keyword_records: Dict[
+            Tuple[int, str, str, str], EclipseKeywordRecord
+        ] = {}
+        if keyword_index_df is not None:
+            self._keyword_records = _keyword_index_df_to_dict(keyword_index_df)
+
+        self._cache_lock = threading.Lock()
+        self._grid_cache: "OrderedDict[int, xtgeo.Grid]" = OrderedDict()
+        self._actnum_cache: "OrderedDict[int, np.ndarray]" = OrderedDict()
+
+        first_real = self._inventory_df[Col.REAL][0]
+        self._restart_dates = sorted(
+            {
+                date
+                for (real, file, _keyword, date) in self._keyword_records
+                if real == first_real and file == Col.UNRST.value
+            }
+        )
+        if not self._restart_dates:
+            first_unrst = self._inventory_df[Col.UNRST][0]
+            self._restart_dates = [
+                str(dateint)
+                for dateint in xtgeo.GridProperties.scan_dates(
+                    str(provider_dir / first_unrst), datesonly=True
+                )
+            ]
 
     @staticmethod
+    # pylint: disable=too-many-locals
     def write_backing_store(
         storage_dir: Path,
         storage_key: str,
@@ -102,7 +150,7 @@ class ProviderImplEgrid(EnsembleGridProvider):
             else:
                 ecl_stored_cases.append(ecl_case)
 
-        timer.lap_s()
+        et_copy_s = timer.lap_s()
 
         grid_inventory_df = pd.DataFrame(ecl_stored_cases)
 
@@ -110,6 +158,18 @@ class ProviderImplEgrid(EnsembleGridProvider):
 
         grid_inventory_df.to_parquet(path=parquet_file_name)
 
+        # Index the byte offsets of the properties in the INIT and UNRST files so
+        # that single properties can be read without parsing the files
+        keyword_index_df = _create_keyword_index_df(provider_dir, ecl_stored_cases)
+        keyword_index_df.to_parquet(path=provider_dir / KEYWORD_INDEX_FILE_NAME)
+        et_index_s = timer.lap_s()
+
+        LOGGER.debug(
+            f"Wrote grid backing store in: {timer.elapsed_s():.2f}s ("
+            f"copy={et_copy_s:.2f}s, index={et_index_s:.2f}s, "
+            f"#indexed_keywords={len(keyword_index_df)})"
+        )
+
     @staticmethod
     def from_backing_store(
         storage_dir: Path,
@@ -122,17 +182,27 @@ class ProviderImplEgrid(EnsembleGridProvider):
 
         try:
             grid_inventory_df = pd.read_parquet(path=parquet_file_name)
+        except FileNotFoundError:
+            return None
 
-            return ProviderImplEgrid(
-                storage_key,
-                provider_dir,
-                grid_inventory_df,
-                init_properties,
-                restart_properties,
+        # Backing stores written by older versions have no keyword index, in which
+        # case all the reading is done through xtgeo
+        keyword_index_df: Optional[pd.DataFrame] = None
+        try:
+            keyword_index_df = pd.read_parquet(
+                path=provider_dir / KEYWORD_INDEX_FILE_NAME
             )
-
         except FileNotFoundError:
-            return None
+            LOGGER.debug(f"No keyword index found in backing store: {provider_dir}")
+
+        return ProviderImplEgrid(
+            storage_key,
+            provider_dir,
+            grid_inventory_df,
+            init_properties,
+            restart_properties,
+            keyword_index_df,
+        )
 
     def provider_id(self) -> str:
         return self._provider_id
@@ -153,15 +223,38 @@ class ProviderImplEgrid(EnsembleGridProvider):
         return sorted([r for r in unique_reals if r >= 0])
 
     def get_3dgrid(self, realization: int) -> xtgeo.Grid:
+        with self._cache_lock:
+            grid = self._grid_cache.get(realization)
+            if grid is not None:
+                self._grid_cache.move_to_end(realization)
+                return grid
+
+        timer = PerfTimer()
+
         df = self._inventory_df.loc[self._inventory_df[Col.REAL] == realization]
         df = df[Col.EGRID]
         grid = xtgeo.grid_from_file(self._provider_dir / df.iloc[0], fformat="egrid")
 
+        with self._cache_lock:
+            self._grid_cache[realization] = grid
+            while len(self._grid_cache) > _MAX_CACHED_GRIDS:
+                self._grid_cache.popitem(last=False)
+
+        LOGGER.debug(
+            f"Loaded grid geometry in: {timer.elapsed_s():.2f}s (real={realization})"
+        )
+
         return grid
 
     def get_static_property_values(
         self, property_name: str, realization: int
     ) -> Optional[np.ndarray]:
+        prop_values = self._read_indexed_property_values(
+            Col.INIT, property_name, "", realization
+        )
+        if prop_values is not None:
+            return prop_values
+
         grid = self.get_3dgrid(realization)
         df = self._inventory_df.loc[self._inventory_df[Col.REAL] == realization]
         df = df[Col.INIT]
@@ -178,6 +271,12 @@ class ProviderImplEgrid(EnsembleGridProvider):
     def get_dynamic_property_values(
         self, property_name: str, property_date: str, realization: int
     ) -> Optional[np.ndarray]:
+        prop_values = self._read_indexed_property_values(
+            Col.UNRST, property_name, property_date, realization
+        )
+        if prop_values is not None:
+            return prop_values
+
         grid = self.get_3dgrid(realization)
         df = self._inventory_df.loc[self._inventory_df[Col.REAL] == realization]
         df = df[Col.UNRST]
@@ -189,3 +288,182 @@ class ProviderImplEgrid(EnsembleGridProvider):
             grid=grid,
         )
         return grid_property.get_npvalues1d(order="F").ravel()
+
+    def _read_indexed_property_values(
+        self, file_col: Col, property_name: str, date: str, realization: int
+    ) -> Optional[np.ndarray]:
+        """Read the property values for all cells, in Fortran order, by seeking
+        directly to the property's data. Returns None if the property is not indexed,
+        in which case the caller should fall back to reading through xtgeo."""
+        record = self._keyword_records.get(
+            (realization, file_col.value, property_name, date)
+        )
+        if record is None:
+            return None
+
+        timer = PerfTimer()
+
+        actnum = self._get_actnum(realization)
+        if actnum is None:
+            return None
+        et_actnum_ms = timer.lap_ms()
+
+        df = self._inventory_df.loc[self._inventory_df[Col.REAL] == realization]
+        file_values = read_keyword_values(
+            self._provider_dir / df[file_col].iloc[0], record
+        )
+        et_read_ms = timer.lap_ms()
+
+        # Inactive cells get the same fill values as when reading through xtgeo
+        is_discrete = np.issubdtype(file_values.dtype, np.integer)
+        fill_value = -1 if is_discrete else np.nan
+        prop_values = np.full(actnum.size, fill_value, dtype=file_values.dtype)
+        if file_values.size == actnum.size:
+            prop_values[actnum] = file_values[actnum]
+        elif file_values.size == np.count_nonzero(actnum):
+            prop_values[actnum] = file_values
+        else:
+            # E.g. dual porosity models, leave these to xtgeo
+            return None
+
+        LOGGER.debug(
+            f"Read indexed property in: {timer.elapsed_s():.2f}s ("
+            f"actnum={et_actnum_ms}ms, read={et_read_ms}ms, "
+            f"name={property_name}, date={date}, real={realization})"
+        )
+
+        return prop_values
+
+    def _get_actnum(self, realization: int) -> Optional[np.ndarray]:
+        """Returns boolean array of active cells in Fortran order"""
+        with self._cache_lock:
+            actnum = self._actnum_cache.get(realization)
+            if actnum is not None:
+                self._actnum_cache.move_to_end(realization)
+                return actnum
+
+        gridhead_record = self._keyword_records.get(
+            (realization, Col.EGRID.value, "GRIDHEAD", "")
+        )
+        if gridhead_record is None:
+            return None
+
+        df = self._inventory_df.loc[self._inventory_df[Col.REAL] == realization]
+        egrid_path = self._provider_dir / df[Col.EGRID].iloc[0]
+        gridhead = read_keyword_values(egrid_path, gridhead_record)
+        num_cells = int(gridhead[1]) * int(gridhead[2]) * int(gridhead[3])
+
+        actnum_record = self._keyword_records.get(
+            (realization, Col.EGRID.value, "ACTNUM", "")
+        )
+        if actnum_record is not None:
+            actnum = read_keyword_values(egrid_path, actnum_record) > 0
+        else:
+            actnum = np.ones(num_cells, dtype=bool)
+
+        if actnum.size != num_cells:
+            return None
+
+        with self._cache_lock:
+            self._actnum_cache[realization] = actnum
+            while len(self._actnum_cache) > _MAX_CACHED_ACTNUMS:
+                self._actnum_cache.popitem(last=False)
+
+        return actnum
+
+
+def _create_keyword_index_df(
+    provider_dir: Path, ecl_cases: List[EclipseCaseFileInfo]
+) -> pd.DataFrame:
+    """Index the GRIDHEAD and ACTNUM keywords of the EGRID files, and the cell
+    properties in the INIT and UNRST files. Files that cannot be indexed are left
+    out, and will be read through xtgeo instead."""
+    real_arr: List[int] = []
+    records: List[Tuple[Col, EclipseKeywordRecord]] = []
+    for ecl_case in ecl_cases:
+        try:
+            egrid_records = index_egrid_file(provider_dir / ecl_case.egrid_path)
+            gridhead_record = next(
+                rec for rec in egrid_records if rec.keyword == "GRIDHEAD"
+            )
+            gridhead = read_keyword_values(
+                provider_dir / ecl_case.egrid_path, gridhead_record
+            )
+            actnum_record = next(
+                (rec for rec in egrid_records if rec.keyword == "ACTNUM"), None
+            )
+            if actnum_record is not None:
+                actnum = read_keyword_values(
+                    provider_dir / ecl_case.egrid_path, actnum_record
+                )
+                num_active = int(np.count_nonzero(actnum))
+            else:
+                num_active = int(gridhead[1]) * int(gridhead[2]) * int(gridhead[3])
+
+            case_records = [(Col.EGRID, rec) for rec in egrid_records]
+            case_records.extend(
+                (Col.INIT, rec)
+                for rec in index_init_file(
+                    provider_dir / ecl_case.init_path, min_count=num_active
+                )
+            )
+            case_records.extend(
+                (Col.UNRST, rec)
+                for rec in index_unrst_file(
+                    provider_dir / ecl_case.unrst_path, min_count=num_active
+                )
+            )
+        except (OSError, ValueError, StopIteration) as exc:
+            LOGGER.warning(
+                f"Failed to index eclipse files for realization "
+                f"{ecl_case.realization}, will fall back to slower reads: {exc}"
+            )
+            continue
+
+        real_arr.extend([ecl_case.realization] * len(case_records))
+        records.extend(case_records)
+
+    return pd.DataFrame(
+        {
+            IndexCol.REAL: pd.Series(real_arr, dtype="int64"),
+            IndexCol.FILE: pd.Series(
+                [file.value for file, _rec in records], dtype="str"
+            ),
+            IndexCol.KEYWORD: pd.Series(
+                [rec.keyword for _file, rec in records], dtype="str"
+            ),
+            IndexCol.DATE: pd.Series([rec.date for _file, rec in records], dtype="str"),
+            IndexCol.VALUE_TYPE: pd.Series(
+                [rec.value_type for _file, rec in records], dtype="str"
+            ),
+            IndexCol.COUNT: pd.Series(
+                [rec.count for _file, rec in records], dtype="int64"
+            ),
+            IndexCol.DATA_OFFSET: pd.Series(
+                [rec.data_offset for _file, rec in records], dtype="int64"
+            ),
+        }
+    )
+
+
+def _keyword_index_df_to_dict(
+    keyword_index_df: pd.DataFrame,
+) -> Dict[Tuple[int, str, str, str], EclipseKeywordRecord]:
+    return {
+        (int(real), str(file), keyword, date): EclipseKeywordRecord(
+            keyword=keyword,
+            value_type=value_type,
+            count=int(count),
+            data_offset=int(data_offset),
+            date=date,
+        )
+        for real, file, keyword, date, value_type, count, data_offset in zip(
+            keyword_index_df[IndexCol.REAL],
+            keyword_index_df[IndexCol.FILE],
+            keyword_index_df[IndexCol.KEYWORD],
+            keyword_index_df[IndexCol.DATE],
+            keyword_index_df[IndexCol.VALUE_TYPE],
+            keyword_index_df[IndexCol.COUNT],
+            keyword_index_df[IndexCol.DATA_OFFSET],
+        )
+    }
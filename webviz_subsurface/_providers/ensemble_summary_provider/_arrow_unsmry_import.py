@@ -1,10 +1,13 @@
+import ctypes
 import glob
 import logging
 import os
 import re
-from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Set
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Deque, Dict, Iterator, List, Sequence, Set, Tuple
 
 import pyarrow as pa
 
@@ -13,10 +16,18 @@ from webviz_subsurface._utils.perf_timer import PerfTimer
 LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+# Transferring tables from the worker processes through shared memory relies on
+# POSIX semantics, where a shared memory block outlives its name being unlinked.
+# On other platforms the tables are pickled back to the parent process.
+_USE_SHARED_MEMORY_TRANSFER = os.name == "posix"
+
+
+@dataclass(frozen=True)
 class FileEntry:
     real: int
     filename: str
+    mtime_ns: int = 0
+    size: int = 0
 
 
 def _discover_arrow_unsmry_files(globpattern: str) -> List[FileEntry]:
@@ -43,7 +54,15 @@ def _discover_arrow_unsmry_files(globpattern: str) -> List[FileEntry]:
         if real is None:
             raise ValueError(f"Unable to determine realization number for file: {path}")
 
-        file_list.append(FileEntry(real=real, filename=path))
+        stat_result = os.stat(path)
+        file_list.append(
+            FileEntry(
+                real=real,
+                filename=path,
+                mtime_ns=stat_result.st_mtime_ns,
+                size=stat_result.st_size,
+            )
+        )
 
     # Sort the file entries on realization number
     file_list = sorted(file_list, key=lambda e: e.real)
@@ -57,38 +76,169 @@ def _load_table_from_arrow_file(entry: FileEntry) -> pa.Table:
     return reader.read_all()
 
 
-def load_per_realization_arrow_unsmry_files(
+def _write_table_to_new_shared_memory(table: pa.Table) -> Tuple[str, int]:
+    mock_sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(mock_sink, table.schema) as writer:
+        writer.write_table(table)
+    num_bytes = mock_sink.size()
+
+    shm = shared_memory.SharedMemory(create=True, size=max(num_bytes, 1))
+
+    # The parent process takes over the ownership and will unlink the block
+    # pylint: disable=protected-access
+    resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore
+
+    _write_table_to_buffer(table, shm.buf)
+    shm_name = shm.name
+    shm.close()
+
+    return (shm_name, num_bytes)
+
+
+def _write_table_to_buffer(table: pa.Table, buf: memoryview) -> None:
+    # Kept in a separate function so that all exports of buf are released on return
+    sink = pa.FixedSizeBufferWriter(pa.py_buffer(buf))
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _load_table_into_shared_memory(entry: FileEntry) -> Tuple[str, int]:
+    """Worker function that loads the table and places it in a new shared memory block
+    in IPC stream format. Returns name of the shared memory block and its size"""
+    table = _load_table_from_arrow_file(entry)
+    return _write_table_to_new_shared_memory(table)
+
+
+def _read_table_from_shared_memory(shm_name: str, num_bytes: int) -> pa.Table:
+    """Zero-copy read of table from a shared memory block.
+    The block's name is unlinked immediately, while the memory itself stays alive
+    for as long as the returned table (or any data derived from it) is referenced.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    shm.unlink()
+
+    # Use a foreign buffer that keeps the shared memory object alive, instead of a
+    # buffer that exports shm.buf, since the latter would prevent the shared memory
+    # object from ever being closed
+    c_char_obj = ctypes.c_char.from_buffer(shm.buf)
+    address = ctypes.addressof(c_char_obj)
+    del c_char_obj
+
+    arrow_buffer = pa.foreign_buffer(address, num_bytes, base=shm)
+    return pa.ipc.open_stream(arrow_buffer).read_all()
+
+
+def discover_per_realization_arrow_unsmry_files(
     ens_path: str, rel_file_pattern: str
-) -> Dict[int, pa.Table]:
-    """Load summary data stored in per-realization arrow files.
-    Returns dictionary containing a PyArrow table for each realization, indexed by
-    realization number.
+) -> List[FileEntry]:
+    """Find per-realization arrow files, sorted on realization number.
+    The returned entries contain the modification time and size of each file.
 
     `rel_file_pattern` denotes a file pattern relative to the realization's runpath,
     typical value is: "share/results/unsmry/*.arrow"
     """
 
-    LOGGER.debug(f"load_per_realization_arrow_unsmry_files() starting - {ens_path}")
     LOGGER.debug(f"looking for .arrow files using relative pattern: {rel_file_pattern}")
-    timer = PerfTimer()
 
-    per_real_tables: Dict[int, pa.Table] = {}
     globpattern = os.path.join(ens_path, rel_file_pattern)
     files_to_process = _discover_arrow_unsmry_files(globpattern)
     if len(files_to_process) == 0:
         LOGGER.warning(f"No arrow files were discovered in: {ens_path}")
         LOGGER.warning(f"Glob pattern used: {globpattern}")
-        return per_real_tables
+
+    return files_to_process
+
+
+def iterate_arrow_unsmry_files(
+    files_to_process: Sequence[FileEntry],
+) -> Iterator[Tuple[int, pa.Table]]:
+    """Load summary data from the specified per-realization arrow files in parallel,
+    yielding the realization number and PyArrow table for each file in the order of the
+    file entries.
+
+    Only a limited number of files are loaded ahead of the consumer, so memory usage is
+    bounded when the tables are processed one at a time, e.g. when streamed to a
+    backing store.
+    """
+
+    timer = PerfTimer()
+
+    if len(files_to_process) == 0:
+        return
+
+    max_num_pending = 2 * (os.cpu_count() or 1)
+    load_func = (
+        _load_table_into_shared_memory
+        if _USE_SHARED_MEMORY_TRANSFER
+        else _load_table_from_arrow_file
+    )
 
     with ProcessPoolExecutor() as executor:
-        futures = executor.map(_load_table_from_arrow_file, files_to_process)
-    for i, table in enumerate(futures):
-        real = files_to_process[i].real
-        per_real_tables[real] = table
-
-    # for entry in files_to_process:
-    #     table = _load_table_from_arrow_file(entry)
-    #     per_real_tables[entry.real] = table
+        entries_to_submit = iter(files_to_process)
+        pending: Deque[Tuple[FileEntry, Future]] = deque()
+        try:
+            for entry in entries_to_submit:
+                pending.append((entry, executor.submit(load_func, entry)))
+                if len(pending) >= max_num_pending:
+                    break
+
+            while pending:
+                entry, future = pending.popleft()
+                result = future.result()
+
+                next_entry = next(entries_to_submit, None)
+                if next_entry is not None:
+                    pending.append((next_entry, executor.submit(load_func, next_entry)))
+
+                yield entry.real, _table_from_load_result(result)
+        finally:
+            # Release the shared memory of tables that were loaded but not consumed,
+            # e.g. if the consumer stops early due to an error
+            for _entry, future in pending:
+                if _USE_SHARED_MEMORY_TRANSFER and future.exception() is None:
+                    _table_from_load_result(future.result())
+
+    LOGGER.debug(
+        f"iterate_arrow_unsmry_files() loaded {len(files_to_process)} files "
+        f"in: {timer.elapsed_s():.2f}s (shared_memory={_USE_SHARED_MEMORY_TRANSFER})"
+    )
+
+
+def _table_from_load_result(result: Any) -> pa.Table:
+    if _USE_SHARED_MEMORY_TRANSFER:
+        shm_name, num_bytes = result
+        return _read_table_from_shared_memory(shm_name, num_bytes)
+    return result
+
+
+def load_arrow_unsmry_files(
+    files_to_process: Sequence[FileEntry],
+) -> Dict[int, pa.Table]:
+    """Load summary data from the specified per-realization arrow files in parallel.
+    Returns dictionary containing a PyArrow table for each realization, indexed by
+    realization number.
+    """
+    return dict(iterate_arrow_unsmry_files(files_to_process))
+
+
+def load_per_realization_arrow_unsmry_files(
+    ens_path: str, rel_file_pattern: str
+) -> Dict[int, pa.Table]:
+    """Load summary data stored in per-realization arrow files.
+    Returns dictionary containing a PyArrow table for each realization, indexed by
+    realization number.
+
+    `rel_file_pattern` denotes a file pattern relative to the realization's runpath,
+    typical value is: "share/results/unsmry/*.arrow"
+    """
+
+    LOGGER.debug(f"load_per_realization_arrow_unsmry_files() starting - {ens_path}")
+    timer = PerfTimer()
+
+    files_to_process = discover_per_realization_arrow_unsmry_files(
+        ens_path, rel_file_pattern
+    )
+    per_real_tables = load_arrow_unsmry_files(files_to_process)
 
     LOGGER.debug(
         f"load_per_realization_arrow_unsmry_files() "
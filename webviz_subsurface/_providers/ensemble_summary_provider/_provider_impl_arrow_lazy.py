@@ -1,28 +1,44 @@
 import datetime
 import logging
+import os
+import shutil
+import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.compute as pc
 
+from webviz_subsurface._utils.cumulative_vectors import (
+    calc_from_cumulative_values,
+    split_per_interval_or_per_day_vector_name,
+)
+from webviz_subsurface._utils.ensemble_statistics import StatisticSpec
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._field_metadata import create_vector_metadata_from_field_meta
+from ._resampled_vector_cache import ResampledVectorCache
 from ._resampling import (
     generate_normalized_sample_dates,
     resample_segmented_multi_real_table,
     sample_segmented_multi_real_table_at_date,
 )
 from ._table_utils import (
+    add_per_real_batch_index_to_table_schema_metadata,
     add_per_vector_min_max_to_table_schema_metadata,
     find_intersected_dates_between_realizations,
     find_min_max_for_numeric_table_columns,
+    get_per_real_batch_index_from_schema_metadata,
     get_per_vector_min_max_from_schema_metadata,
 )
+from ._vector_statistics import (
+    create_per_vector_statistics_tables,
+    create_vectors_statistics_df,
+    make_statistics_key,
+)
 from .ensemble_summary_provider import (
     EnsembleSummaryProvider,
     Frequency,
@@ -35,14 +51,6 @@ from .ensemble_summary_provider import (
 LOGGER = logging.getLogger(__name__)
 
 
-def _sort_table_on_real_then_date(table: pa.Table) -> pa.Table:
-    indices = pc.sort_indices(
-        table, sort_keys=[("REAL", "ascending"), ("DATE", "ascending")]
-    )
-    sorted_table = table.take(indices)
-    return sorted_table
-
-
 def _is_date_column_monotonically_increasing(table: pa.Table) -> bool:
     dates_np = table.column("DATE").to_numpy()
     if not np.all(np.diff(dates_np) > np.timedelta64(0)):
@@ -62,13 +70,99 @@ def _find_first_non_increasing_date_pair(
     return (dates_np[offending_indices[0]], dates_np[offending_indices[0] + 1])
 
 
+def _validate_per_real_table(real_num: int, table: pa.Table) -> None:
+    if "REAL" in table.schema.names:
+        raise ValueError(f"Input tables should not have REAL column (real={real_num})")
+
+    if table.schema.field("DATE").type != pa.timestamp("ms"):
+        raise ValueError(
+            f"DATE column must have timestamp[ms] data type (real={real_num})"
+        )
+
+    if not _is_date_column_monotonically_increasing(table):
+        offending_pair = _find_first_non_increasing_date_pair(table)
+        raise ValueError(
+            f"DATE column must be monotonically increasing\n"
+            f"Error detected in realization: {real_num}\n"
+            f"First offending timestamps: {offending_pair}"
+        )
+
+
+def _update_running_min_max(
+    running_min_max: Dict[str, dict], table_min_max: Dict[str, dict]
+) -> None:
+    for colname, table_entry in table_min_max.items():
+        running_entry = running_min_max.setdefault(colname, {"min": None, "max": None})
+        for key, reduce_func in [("min", min), ("max", max)]:
+            table_val = table_entry[key]
+            if table_val is None:
+                continue
+            if running_entry[key] is None:
+                running_entry[key] = table_val
+            else:
+                running_entry[key] = reduce_func(running_entry[key], table_val)
+
+
+def _create_real_batch_conforming_to_schema(
+    real_num: int, table: pa.Table, schema: pa.Schema
+) -> pa.RecordBatch:
+    """Create a single record batch for the realization, with a REAL column and with
+    all the columns in the schema. Columns missing from the table are filled with nulls.
+    """
+    arrays: List[pa.Array] = []
+    for field in schema:
+        if field.name == "REAL":
+            arrays.append(pa.array(np.full(table.num_rows, real_num, np.int32)))
+        elif field.name in table.schema.names:
+            arrays.append(table.column(field.name).combine_chunks().cast(field.type))
+        else:
+            arrays.append(pa.nulls(table.num_rows, field.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _write_spill_table(file_name: Path, table: pa.Table) -> None:
+    with pa.OSFile(str(file_name), "wb") as sink:
+        with pa.RecordBatchFileWriter(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _read_spill_table(file_name: Path) -> pa.Table:
+    """Zero-copy read of a spilled table from its memory mapped file"""
+    source = pa.memory_map(str(file_name), "r")
+    return pa.ipc.RecordBatchFileReader(source).read_all()
+
+
+def _filter_table_on_realizations(
+    table: pa.Table, realizations: Optional[Sequence[int]]
+) -> pa.Table:
+    if realizations is None:
+        return table
+
+    mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
+    return table.filter(mask)
+
+
 class ProviderImplArrowLazy(EnsembleSummaryProvider):
     """This class implements an EnsembleSummaryProvider with lazy (on-demand)
     resampling/interpolation.
     """
 
-    def __init__(self, arrow_file_name: Path) -> None:
+    def __init__(
+        self,
+        arrow_file_name: Path,
+        resampled_vector_cache: Optional[ResampledVectorCache] = None,
+    ) -> None:
         self._arrow_file_name = str(arrow_file_name)
+        self._resampled_vector_cache = resampled_vector_cache
+
+        # Include the file's modification time in the key used for the resampled
+        # vector cache, so that cached data gets invalidated if the backing store
+        # is rewritten, e.g. by an incremental update
+        self._cache_provider_key = (
+            f"{Path(self._arrow_file_name).stem}__"
+            f"{os.stat(self._arrow_file_name).st_mtime_ns}"
+        )
 
         LOGGER.debug(f"init with arrow file: {self._arrow_file_name}")
         timer = PerfTimer()
@@ -88,8 +182,16 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         ]
         et_find_vec_names_ms = timer.lap_ms()
 
-        unique_realizations_on_file = reader.read_all().column("REAL").unique()
-        self._realizations: List[int] = unique_realizations_on_file.to_pylist()
+        # Backing stores written with per realization record batches carry an index
+        # in the schema metadata that lets us find realizations without reading data
+        self._per_real_batch_index = get_per_real_batch_index_from_schema_metadata(
+            reader.schema
+        )
+        if self._per_real_batch_index is not None:
+            self._realizations: List[int] = sorted(self._per_real_batch_index.keys())
+        else:
+            unique_realizations_on_file = reader.read_all().column("REAL").unique()
+            self._realizations = unique_realizations_on_file.to_pylist()
         et_find_real_ms = timer.lap_ms()
 
         # We'll try and keep the file open for the life-span of the provider.
@@ -116,15 +218,29 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
     @staticmethod
     def write_backing_store_from_per_realization_tables(
-        storage_dir: Path, storage_key: str, per_real_tables: Dict[int, pa.Table]
+        storage_dir: Path,
+        storage_key: str,
+        per_real_tables: Iterable[Tuple[int, pa.Table]],
     ) -> None:
+        """Write backing store from the per realization tables, given as an iterable
+        of (realization number, table) in order of increasing realization number.
+
+        The iterable is consumed one realization at a time, and the tables are streamed
+        to file with each realization stored in a separate record batch. The full
+        ensemble is never held in memory, so when the iterable produces its tables
+        lazily, peak memory usage is that of a single realization.
+
+        Since the schema, including its metadata with per-vector min/max values and
+        the per-realization batch index, must be known before writing the first batch,
+        each table is validated and spilled to a temporary file as it is consumed, while
+        collecting the schema and the running min/max values. Thereafter the spilled
+        tables are memory mapped and written to the backing store.
+        """
+
         # pylint: disable=too-many-locals
         @dataclass
         class Elapsed:
-            concat_tables_s: float = -1
-            build_add_real_col_s: float = -1
-            sorting_s: float = -1
-            find_and_store_min_max_s: float = -1
+            validate_and_spill_s: float = -1
             write_s: float = -1
 
         elapsed = Elapsed()
@@ -133,84 +249,130 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         LOGGER.debug(f"Writing backing store to arrow file: {arrow_file_name}")
         timer = PerfTimer()
 
-        unique_column_names = set()
-        for real_num, table in per_real_tables.items():
-            unique_column_names.update(table.schema.names)
-
-            if "REAL" in table.schema.names:
-                raise ValueError(
-                    f"Input tables should not have REAL column (real={real_num})"
-                )
-
-            if table.schema.field("DATE").type != pa.timestamp("ms"):
-                raise ValueError(
-                    f"DATE column must have timestamp[ms] data type (real={real_num})"
-                )
-
-            if not _is_date_column_monotonically_increasing(table):
-                offending_pair = _find_first_non_increasing_date_pair(table)
-                raise ValueError(
-                    f"DATE column must be monotonically increasing\n"
-                    f"Error detected in realization: {real_num}\n"
-                    f"First offending timestamps: {offending_pair}"
+        # Write to temporary files first and rename when done, so that an existing
+        # backing store gets replaced atomically
+        unique_suffix = uuid.uuid4().hex
+        spill_dir = storage_dir / (storage_key + f"__{unique_suffix}.spill.tmp")
+        tmp_arrow_file_name = storage_dir / (
+            storage_key + f"__{unique_suffix}.arrow.tmp"
+        )
+        try:
+            spill_dir.mkdir(parents=True)
+
+            # Realizations are stored in order since interpolations work per
+            # realization and we utilize slicing for speed
+            sorted_reals: List[int] = []
+            per_real_schemas: List[pa.Schema] = []
+            per_vector_min_max: Dict[str, dict] = {}
+            for real_num, table in per_real_tables:
+                if sorted_reals and real_num <= sorted_reals[-1]:
+                    raise ValueError(
+                        f"Realizations must be given in increasing order "
+                        f"(real={real_num} after real={sorted_reals[-1]})"
+                    )
+                _validate_per_real_table(real_num, table)
+                per_real_schemas.append(table.schema)
+                _update_running_min_max(
+                    per_vector_min_max, find_min_max_for_numeric_table_columns(table)
                 )
+                _write_spill_table(spill_dir / f"{real_num}.arrow", table)
+                sorted_reals.append(real_num)
 
-        LOGGER.debug(
-            f"Concatenating {len(per_real_tables)} tables with "
-            f"{len(unique_column_names)} unique column names"
-        )
+            unified_schema = pa.unify_schemas(per_real_schemas).remove_metadata()
+            schema = unified_schema.insert(0, pa.field("REAL", pa.int32()))
 
-        full_table = pa.concat_tables(
-            per_real_tables.values(), promote_options="default"
-        )
-        elapsed.concat_tables_s = timer.lap_s()
-
-        real_arr = np.empty(full_table.num_rows, np.int32)
-        table_start_idx = 0
-        for real_num, real_table in per_real_tables.items():
-            real_arr[table_start_idx : table_start_idx + real_table.num_rows] = real_num
-            table_start_idx += real_table.num_rows
-
-        full_table = full_table.add_column(0, "REAL", pa.array(real_arr))
-        elapsed.build_add_real_col_s = timer.lap_s()
-
-        # Must sort table on real since interpolations work per realization
-        # and we utilize slicing for speed
-        full_table = _sort_table_on_real_then_date(full_table)
-        elapsed.sorting_s = timer.lap_s()
-
-        # Find per column min/max values and store them as metadata on table's schema
-        per_vector_min_max = find_min_max_for_numeric_table_columns(full_table)
-        full_table = add_per_vector_min_max_to_table_schema_metadata(
-            full_table, per_vector_min_max
-        )
-        elapsed.find_and_store_min_max_s = timer.lap_s()
+            LOGGER.debug(
+                f"Streaming {len(sorted_reals)} tables with "
+                f"{len(unified_schema.names)} unique column names"
+            )
 
-        # feather.write_feather(full_table, dest=arrow_file_name)
-        with pa.OSFile(str(arrow_file_name), "wb") as sink:
-            with pa.RecordBatchFileWriter(sink, full_table.schema) as writer:
-                writer.write_table(full_table)
+            # Find per column min/max values and store them as metadata on table's
+            # schema, together with the index of the per realization record batches
+            per_real_batch_index = {
+                real: (idx, 1) for idx, real in enumerate(sorted_reals)
+            }
+            schema_carrier = add_per_vector_min_max_to_table_schema_metadata(
+                schema.empty_table(), per_vector_min_max
+            )
+            schema_carrier = add_per_real_batch_index_to_table_schema_metadata(
+                schema_carrier, per_real_batch_index
+            )
+            schema = schema_carrier.schema
+            elapsed.validate_and_spill_s = timer.lap_s()
+
+            with pa.OSFile(str(tmp_arrow_file_name), "wb") as sink:
+                with pa.RecordBatchFileWriter(sink, schema) as writer:
+                    for real_num in sorted_reals:
+                        batch = _create_real_batch_conforming_to_schema(
+                            real_num,
+                            _read_spill_table(spill_dir / f"{real_num}.arrow"),
+                            schema,
+                        )
+                        writer.write_batch(batch)
+            os.replace(tmp_arrow_file_name, arrow_file_name)
+        finally:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+            if tmp_arrow_file_name.exists():
+                os.remove(tmp_arrow_file_name)
         elapsed.write_s = timer.lap_s()
 
         LOGGER.debug(
             f"Wrote backing store to arrow file in: {timer.elapsed_s():.2f}s ("
-            f"concat_tables={elapsed.concat_tables_s:.2f}s, "
-            f"build_add_real_col={elapsed.build_add_real_col_s:.2f}s, "
-            f"sorting={elapsed.sorting_s:.2f}s, "
-            f"find_and_store_min_max={elapsed.find_and_store_min_max_s:.2f}s, "
+            f"validate_and_spill={elapsed.validate_and_spill_s:.2f}s, "
             f"write={elapsed.write_s:.2f}s)"
         )
 
     @staticmethod
     def from_backing_store(
-        storage_dir: Path, storage_key: str
+        storage_dir: Path,
+        storage_key: str,
+        resampled_vector_cache: Optional[ResampledVectorCache] = None,
     ) -> Optional["ProviderImplArrowLazy"]:
         arrow_file_name = storage_dir / (storage_key + ".arrow")
         if arrow_file_name.is_file():
-            return ProviderImplArrowLazy(arrow_file_name)
+            return ProviderImplArrowLazy(arrow_file_name, resampled_vector_cache)
 
         return None
 
+    @staticmethod
+    def read_per_realization_tables_from_backing_store(
+        storage_dir: Path, storage_key: str, realizations: Sequence[int]
+    ) -> Optional[Dict[int, pa.Table]]:
+        """Read back the tables of the specified realizations from an existing
+        backing store, as the tables passed to
+        `write_backing_store_from_per_realization_tables()`.
+        The returned tables are zero-copy views into the memory mapped backing store.
+        Returns None if the backing store does not exist or if it was written without
+        the per realization record batch index.
+        """
+        arrow_file_name = storage_dir / (storage_key + ".arrow")
+        if not arrow_file_name.is_file():
+            return None
+
+        source = pa.memory_map(str(arrow_file_name), "r")
+        reader = pa.ipc.RecordBatchFileReader(source)
+        per_real_batch_index = get_per_real_batch_index_from_schema_metadata(
+            reader.schema
+        )
+        if per_real_batch_index is None:
+            return None
+
+        per_real_tables: Dict[int, pa.Table] = {}
+        for real in realizations:
+            if real not in per_real_batch_index:
+                continue
+            first_batch, batch_count = per_real_batch_index[real]
+            batch_list = [
+                reader.get_batch(batch_idx)
+                for batch_idx in range(first_batch, first_batch + batch_count)
+            ]
+            # Strip away the webviz specific schema metadata, it will be recomputed
+            # when writing a new backing store
+            real_table = pa.Table.from_batches(batch_list).replace_schema_metadata()
+            per_real_tables[real] = real_table.drop(["REAL"])
+
+        return per_real_tables
+
     def _get_or_read_schema(self) -> pa.Schema:
         if self._cached_full_table:
             return self._cached_full_table.schema
@@ -220,15 +382,98 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         source = pa.memory_map(self._arrow_file_name, "r")
         return pa.ipc.RecordBatchFileReader(source).schema
 
-    def _get_or_read_table(self, columns: List[str]) -> pa.Table:
+    def _get_or_read_table(
+        self, columns: List[str], realizations: Optional[Sequence[int]] = None
+    ) -> pa.Table:
+        """Get table containing only the specified columns, and if `realizations` is
+        not None, only the rows belonging to the specified realizations.
+        The returned table will be sorted on REAL then DATE.
+        """
         if self._cached_full_table:
-            return self._cached_full_table.select(columns)
+            return _filter_table_on_realizations(
+                self._cached_full_table.select(columns), realizations
+            )
+
         if self._cached_reader:
-            return self._cached_reader.read_all().select(columns)
+            reader = self._cached_reader
+        else:
+            source = pa.memory_map(self._arrow_file_name, "r")
+            reader = pa.ipc.RecordBatchFileReader(source)
 
-        source = pa.memory_map(self._arrow_file_name, "r")
-        reader = pa.ipc.RecordBatchFileReader(source)
-        return reader.read_all().select(columns)
+        if self._per_real_batch_index is None:
+            return _filter_table_on_realizations(
+                reader.read_all().select(columns), realizations
+            )
+
+        # Only touch the record batches of the requested realizations. Since the
+        # file is memory mapped, only the pages of the selected columns get read.
+        if realizations is None:
+            reals_to_get = self._realizations
+        else:
+            requested_reals = set(realizations)
+            reals_to_get = [r for r in self._realizations if r in requested_reals]
+
+        batch_list: List[pa.RecordBatch] = []
+        for real in reals_to_get:
+            first_batch, batch_count = self._per_real_batch_index[real]
+            for batch_idx in range(first_batch, first_batch + batch_count):
+                batch_list.append(reader.get_batch(batch_idx))
+
+        return pa.Table.from_batches(batch_list, schema=reader.schema).select(columns)
+
+    def _find_stored_vectors_to_read(self, vector_names: Sequence[str]) -> List[str]:
+        """Names of the stored vectors to read for the specified vectors, where vectors
+        calculated from cumulatives are replaced by their cumulative vector."""
+        stored_vector_names: List[str] = []
+        for vec_name in vector_names:
+            split_vec_name = self._split_vector_calculated_from_cumulative(vec_name)
+            stored_vec_name = split_vec_name[0] if split_vec_name else vec_name
+            if stored_vec_name not in stored_vector_names:
+                stored_vector_names.append(stored_vec_name)
+        return stored_vector_names
+
+    def _split_vector_calculated_from_cumulative(
+        self, vector_name: str
+    ) -> Optional[Tuple[str, bool]]:
+        """Returns cumulative vector name and per day flag if the vector is a per
+        interval or per day vector of a stored vector, otherwise None."""
+        if vector_name in self._vector_names:
+            return None
+        split_vec_name = split_per_interval_or_per_day_vector_name(vector_name)
+        if split_vec_name is None or split_vec_name[0] not in self._vector_names:
+            return None
+        return split_vec_name
+
+    def _add_vectors_calculated_from_cumulatives(
+        self, table: pa.Table, vector_names: Sequence[str]
+    ) -> pa.Table:
+        """Add columns for the per interval and per day vectors among the specified
+        vectors, calculated from the cumulative vectors in the table, and return table
+        with DATE, REAL and the specified vectors.
+        The table must be sorted on REAL then DATE.
+        """
+        dates_np = None
+        reals_np = None
+        for vec_name in dict.fromkeys(vector_names):
+            split_vec_name = self._split_vector_calculated_from_cumulative(vec_name)
+            if split_vec_name is None:
+                continue
+            if dates_np is None or reals_np is None:
+                dates_np = table.column("DATE").to_numpy()
+                reals_np = table.column("REAL").to_numpy()
+
+            cumulative_vec_name, as_per_day = split_vec_name
+            calculated_values = calc_from_cumulative_values(
+                dates_np,
+                reals_np,
+                {cumulative_vec_name: table.column(cumulative_vec_name).to_numpy()},
+                as_per_day,
+            )
+            table = table.append_column(
+                vec_name, pa.array(calculated_values[cumulative_vec_name])
+            )
+
+        return table.select(["DATE", "REAL"] + list(vector_names))
 
     def vector_names(self) -> List[str]:
         return self._vector_names
@@ -281,6 +526,9 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
     def supports_resampling(self) -> bool:
         return True
 
+    def supports_vectors_calculated_from_cumulatives(self) -> bool:
+        return True
+
     def dates(
         self,
         resampling_frequency: Optional[Frequency],
@@ -288,14 +536,11 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
     ) -> List[datetime.datetime]:
         timer = PerfTimer()
 
-        table = self._get_or_read_table(["DATE", "REAL"])
+        table = self._get_or_read_table(
+            ["DATE", "REAL"], realizations if realizations else None
+        )
         et_read_ms = timer.lap_ms()
 
-        if realizations:
-            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(mask)
-        et_filter_ms = timer.lap_ms()
-
         if resampling_frequency is not None:
             unique_dates_np = table.column("DATE").unique().to_numpy()
             min_raw_date = np.min(unique_dates_np)
@@ -311,7 +556,6 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         LOGGER.debug(
             f"dates({resampling_frequency}) took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
-            f"filter={et_filter_ms}ms, "
             f"find_unique={et_find_unique_ms}ms)"
         )
 
@@ -322,33 +566,43 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         vector_names: Sequence[str],
         resampling_frequency: Optional[Frequency],
         realizations: Optional[Sequence[int]] = None,
+        date_as_datetime64: bool = False,
     ) -> pd.DataFrame:
         if not vector_names:
             raise ValueError("List of requested vector names is empty")
 
         timer = PerfTimer()
 
-        columns_to_get = ["DATE", "REAL"]
-        columns_to_get.extend(vector_names)
-        table = self._get_or_read_table(columns_to_get)
-        et_read_ms = timer.lap_ms()
-
-        if realizations is not None:
-            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(mask)
-        et_filter_ms = timer.lap_ms()
+        if (
+            resampling_frequency is not None
+            and self._resampled_vector_cache is not None
+        ):
+            # Both reading and resampling is done (if needed) in the cache lookup
+            table = self._get_or_create_resampled_table(
+                self._resampled_vector_cache,
+                vector_names,
+                resampling_frequency,
+                realizations,
+            )
+            et_read_ms = timer.lap_ms()
+            et_resample_ms = 0
+        else:
+            columns_to_get = ["DATE", "REAL"]
+            columns_to_get.extend(self._find_stored_vectors_to_read(vector_names))
+            table = self._get_or_read_table(columns_to_get, realizations)
+            et_read_ms = timer.lap_ms()
 
-        if resampling_frequency is not None:
-            table = resample_segmented_multi_real_table(table, resampling_frequency)
-        et_resample_ms = timer.lap_ms()
+            if resampling_frequency is not None:
+                table = resample_segmented_multi_real_table(table, resampling_frequency)
+            table = self._add_vectors_calculated_from_cumulatives(table, vector_names)
+            et_resample_ms = timer.lap_ms()
 
-        df = table.to_pandas(timestamp_as_object=True)
+        df = table.to_pandas(timestamp_as_object=not date_as_datetime64)
         et_to_pandas_ms = timer.lap_ms()
 
         LOGGER.debug(
             f"get_vectors_df({resampling_frequency}) took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
-            f"filter={et_filter_ms}ms, "
             f"resample={et_resample_ms}ms, "
             f"to_pandas={et_to_pandas_ms}ms), "
             f"#vecs={len(vector_names)}, "
@@ -358,6 +612,197 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         return df
 
+    def get_vectors_statistics_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        statistics: Mapping[str, StatisticSpec],
+        realizations: Optional[Sequence[int]] = None,
+        date_as_datetime64: bool = False,
+    ) -> pd.DataFrame:
+        if not vector_names:
+            raise ValueError("List of requested vector names is empty")
+
+        timer = PerfTimer()
+
+        unique_vector_names = list(dict.fromkeys(vector_names))
+        if (
+            resampling_frequency is not None
+            and self._resampled_vector_cache is not None
+        ):
+            # Reading, resampling and calculation is done (if needed) in the cache lookup
+            per_vector_tables = self._get_or_create_statistics_tables(
+                self._resampled_vector_cache,
+                unique_vector_names,
+                resampling_frequency,
+                statistics,
+                realizations,
+            )
+        else:
+            table = self._get_or_read_table(
+                ["DATE", "REAL"]
+                + self._find_stored_vectors_to_read(unique_vector_names),
+                realizations,
+            )
+            if resampling_frequency is not None:
+                table = resample_segmented_multi_real_table(table, resampling_frequency)
+            table = self._add_vectors_calculated_from_cumulatives(
+                table, unique_vector_names
+            )
+            per_vector_tables = create_per_vector_statistics_tables(
+                table, unique_vector_names, statistics
+            )
+        et_calc_ms = timer.lap_ms()
+
+        df = create_vectors_statistics_df(
+            per_vector_tables, unique_vector_names, statistics, date_as_datetime64
+        )
+        et_to_pandas_ms = timer.lap_ms()
+
+        LOGGER.debug(
+            f"get_vectors_statistics_df({resampling_frequency}) took: "
+            f"{timer.elapsed_ms()}ms ("
+            f"read_resample_and_calc={et_calc_ms}ms, "
+            f"to_pandas={et_to_pandas_ms}ms), "
+            f"#vecs={len(unique_vector_names)}, "
+            f"#real={len(realizations) if realizations is not None else 'all'}, "
+            f"df.shape={df.shape}, file={Path(self._arrow_file_name).name}"
+        )
+
+        return df
+
+    def _get_or_create_statistics_tables(
+        self,
+        cache: ResampledVectorCache,
+        vector_names: List[str],
+        resampling_frequency: Frequency,
+        statistics: Mapping[str, StatisticSpec],
+        realizations: Optional[Sequence[int]],
+    ) -> Dict[str, pa.Table]:
+        # pylint: disable=too-many-locals
+        """Get per vector tables with statistics for the specified vectors, utilizing
+        the cache. The statistics tables are cached separately for each set of requested
+        statistics. Statistics for vectors not present in the cache are calculated from
+        the resampled vector data, which is itself fetched from or added to the cache.
+        """
+        timer = PerfTimer()
+
+        statistics_provider_key = (
+            f"{self._cache_provider_key}__statistics__{make_statistics_key(statistics)}"
+        )
+
+        per_vector_tables: Dict[str, pa.Table] = {}
+        vectors_to_calc: List[str] = []
+        for vec_name in vector_names:
+            vec_table = cache.fetch(
+                statistics_provider_key, vec_name, resampling_frequency, realizations
+            )
+            if vec_table is not None:
+                per_vector_tables[vec_name] = vec_table
+            else:
+                vectors_to_calc.append(vec_name)
+        et_lookup_ms = timer.lap_ms()
+
+        if vectors_to_calc:
+            table = self._get_or_create_resampled_table(
+                cache, vectors_to_calc, resampling_frequency, realizations
+            )
+            calculated_tables = create_per_vector_statistics_tables(
+                table, vectors_to_calc, statistics
+            )
+            for vec_name, vec_table in calculated_tables.items():
+                cache.store(
+                    statistics_provider_key,
+                    vec_name,
+                    resampling_frequency,
+                    realizations,
+                    vec_table,
+                )
+                per_vector_tables[vec_name] = vec_table
+        et_calc_ms = timer.lap_ms()
+
+        LOGGER.debug(
+            f"_get_or_create_statistics_tables({resampling_frequency}) took: "
+            f"{timer.elapsed_ms()}ms ("
+            f"lookup={et_lookup_ms}ms, "
+            f"read_resample_and_calc={et_calc_ms}ms), "
+            f"#vecs={len(vector_names)}, "
+            f"#calculated_vecs={len(vectors_to_calc)}, "
+            f"cache_stats=({cache.stats_str()})"
+        )
+
+        return per_vector_tables
+
+    def _get_or_create_resampled_table(
+        self,
+        cache: ResampledVectorCache,
+        vector_names: Sequence[str],
+        resampling_frequency: Frequency,
+        realizations: Optional[Sequence[int]],
+    ) -> pa.Table:
+        """Get table with resampled data for the specified vectors, utilizing the
+        per-vector cache. Only the vectors not present in the cache will be read
+        and resampled, and the results will be added to the cache.
+        """
+        timer = PerfTimer()
+
+        per_vector_tables: Dict[str, pa.Table] = {}
+        vectors_to_resample: List[str] = []
+        for vec_name in vector_names:
+            if vec_name in per_vector_tables or vec_name in vectors_to_resample:
+                continue
+            vec_table = cache.fetch(
+                self._cache_provider_key, vec_name, resampling_frequency, realizations
+            )
+            if vec_table is not None:
+                per_vector_tables[vec_name] = vec_table
+            else:
+                vectors_to_resample.append(vec_name)
+        et_lookup_ms = timer.lap_ms()
+
+        if vectors_to_resample:
+            table = self._get_or_read_table(
+                ["DATE", "REAL"]
+                + self._find_stored_vectors_to_read(vectors_to_resample),
+                realizations,
+            )
+            table = resample_segmented_multi_real_table(table, resampling_frequency)
+            table = self._add_vectors_calculated_from_cumulatives(
+                table, vectors_to_resample
+            )
+            for vec_name in vectors_to_resample:
+                vec_table = table.select(["DATE", "REAL", vec_name])
+                cache.store(
+                    self._cache_provider_key,
+                    vec_name,
+                    resampling_frequency,
+                    realizations,
+                    vec_table,
+                )
+                per_vector_tables[vec_name] = vec_table
+        et_resample_ms = timer.lap_ms()
+
+        # The DATE and REAL columns are identical for all vectors resampled with
+        # the same frequency and set of realizations
+        ret_table = per_vector_tables[vector_names[0]].select(["DATE", "REAL"])
+        for vec_name in vector_names:
+            vec_table = per_vector_tables[vec_name]
+            ret_table = ret_table.append_column(
+                vec_table.field(vec_name), vec_table.column(vec_name)
+            )
+
+        LOGGER.debug(
+            f"_get_or_create_resampled_table({resampling_frequency}) took: "
+            f"{timer.elapsed_ms()}ms ("
+            f"lookup={et_lookup_ms}ms, "
+            f"read_and_resample={et_resample_ms}ms), "
+            f"#vecs={len(vector_names)}, "
+            f"#resampled_vecs={len(vectors_to_resample)}, "
+            f"cache_stats=({cache.stats_str()})"
+        )
+
+        return ret_table
+
     def get_vectors_for_date_df(
         self,
         date: datetime.datetime,
@@ -371,14 +816,11 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         columns_to_get = ["DATE", "REAL"]
         columns_to_get.extend(vector_names)
-        table = self._get_or_read_table(columns_to_get)
+        table = self._get_or_read_table(
+            columns_to_get, realizations if realizations else None
+        )
         et_read_ms = timer.lap_ms()
 
-        if realizations:
-            real_mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(real_mask)
-        et_filter_ms = timer.lap_ms()
-
         np_lookup_date = np.datetime64(date).astype("M8[ms]")
         table = sample_segmented_multi_real_table_at_date(table, np_lookup_date)
 
@@ -391,7 +833,6 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         LOGGER.debug(
             f"get_vectors_for_date_df() took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
-            f"filter={et_filter_ms}ms, "
             f"resample={et_resample_ms}ms, "
             f"to_pandas={et_to_pandas_ms}ms), "
             f"#vecs={len(vector_names)}, "
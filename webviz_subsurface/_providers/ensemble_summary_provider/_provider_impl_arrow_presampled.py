@@ -2,7 +2,7 @@ import datetime
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Mapping, Optional, Sequence
 
 import numpy as np
 import pandas as pd
@@ -10,6 +10,7 @@ import pyarrow as pa
 import pyarrow.compute as pc
 from pyarrow import feather
 
+from webviz_subsurface._utils.ensemble_statistics import StatisticSpec
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._dataframe_utils import make_date_column_datetime_object
@@ -20,6 +21,10 @@ from ._table_utils import (
     find_min_max_for_numeric_table_columns,
     get_per_vector_min_max_from_schema_metadata,
 )
+from ._vector_statistics import (
+    create_per_vector_statistics_tables,
+    create_vectors_statistics_df,
+)
 from .ensemble_summary_provider import (
     EnsembleSummaryProvider,
     Frequency,
@@ -383,6 +388,7 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         vector_names: Sequence[str],
         resampling_frequency: Optional[Frequency],
         realizations: Optional[Sequence[int]] = None,
+        date_as_datetime64: bool = False,
     ) -> pd.DataFrame:
         if resampling_frequency is not None:
             raise ValueError("Resampling is not supported by this provider")
@@ -399,7 +405,7 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
             table = table.filter(mask)
         et_filter_ms = timer.lap_ms()
 
-        df = table.to_pandas(timestamp_as_object=True)
+        df = table.to_pandas(timestamp_as_object=not date_as_datetime64)
         # df = table.to_pandas(split_blocks=True, self_destruct=True)
         # del table  # not necessary, but a good practice
         et_to_pandas_ms = timer.lap_ms()
@@ -416,6 +422,56 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
 
         return df
 
+    def get_vectors_statistics_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        statistics: Mapping[str, StatisticSpec],
+        realizations: Optional[Sequence[int]] = None,
+        date_as_datetime64: bool = False,
+    ) -> pd.DataFrame:
+        # pylint: disable=too-many-locals
+        if resampling_frequency is not None:
+            raise ValueError("Resampling is not supported by this provider")
+        if not vector_names:
+            raise ValueError("List of requested vector names is empty")
+
+        timer = PerfTimer()
+
+        unique_vector_names = list(dict.fromkeys(vector_names))
+        columns_to_get = ["DATE", "REAL"]
+        columns_to_get.extend(unique_vector_names)
+        table = self._get_or_read_table(columns_to_get)
+        et_read_ms = timer.lap_ms()
+
+        if realizations is not None:
+            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
+            table = table.filter(mask)
+        et_filter_ms = timer.lap_ms()
+
+        per_vector_tables = create_per_vector_statistics_tables(
+            table, unique_vector_names, statistics
+        )
+        et_calc_ms = timer.lap_ms()
+
+        df = create_vectors_statistics_df(
+            per_vector_tables, unique_vector_names, statistics, date_as_datetime64
+        )
+        et_to_pandas_ms = timer.lap_ms()
+
+        LOGGER.debug(
+            f"get_vectors_statistics_df() took: {timer.elapsed_ms()}ms ("
+            f"read={et_read_ms}ms, "
+            f"filter={et_filter_ms}ms, "
+            f"calc={et_calc_ms}ms, "
+            f"to_pandas={et_to_pandas_ms}ms), "
+            f"#vecs={len(unique_vector_names)}, "
+            f"#real={len(realizations) if realizations is not None else 'all'}, "
+            f"df.shape={df.shape}, file={Path(self._arrow_file_name).name}"
+        )
+
+        return df
+
     def get_vectors_for_date_df(
         self,
         date: datetime.datetime,
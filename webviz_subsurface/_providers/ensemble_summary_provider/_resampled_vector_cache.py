@@ -0,0 +1,321 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+
+from .ensemble_summary_provider import Frequency
+
+LOGGER = logging.getLogger(__name__)
+
+_SPILL_FILE_SUFFIX = ".arrow"
+_TMP_FILE_SUFFIX = ".tmp"
+
+# Temporary files older than this are left over from writes that never finished,
+# e.g. due to a crash, and are removed when the cache is set up
+_ORPHANED_TMP_FILE_MIN_AGE_S = 60 * 60
+
+
+@dataclass
+class CacheStats:
+    mem_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+
+    def hit_ratio(self) -> float:
+        num_requests = self.mem_hits + self.disk_hits + self.misses
+        if num_requests == 0:
+            return 0.0
+        return (self.mem_hits + self.disk_hits) / num_requests
+
+
+# Key is (provider key, vector name, frequency, realizations key)
+_CacheKey = Tuple[str, str, str, str]
+
+
+class ResampledVectorCache:
+    """Bounded LRU cache for resampled vector data.
+
+    Each entry holds a table with DATE, REAL and a single vector column, resampled
+    to a given frequency for a given set of realizations. Entries that get evicted
+    from memory will be spilled to disk as .arrow files if `spill_dir` is specified,
+    and will be loaded back from there on subsequent requests.
+
+    The spill directory is limited to `max_disk_bytes`, and the least recently used
+    spill files are removed when the limit is exceeded. Spill files from earlier
+    sessions are kept and accounted for, while orphaned temporary files are removed
+    when the cache is set up.
+
+    The cache is also used for statistics of resampled vectors, in which case the
+    table holds DATE and one column per statistic, and the provider key identifies
+    the set of statistics.
+    """
+
+    def __init__(
+        self,
+        max_mem_bytes: int,
+        spill_dir: Optional[Path],
+        max_disk_bytes: int = 2 * 1024 * 1024 * 1024,
+    ) -> None:
+        self._max_mem_bytes = max_mem_bytes
+        self._spill_dir = spill_dir
+        self._max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._mem_entries: "OrderedDict[_CacheKey, pa.Table]" = OrderedDict()
+        self._mem_bytes = 0
+        self._stats = CacheStats()
+
+        # Spill files in least recently used order, with file name as key and file
+        # size as value. Only approximate when several processes share the directory.
+        self._disk_entries: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+
+        if self._spill_dir is not None:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            self._scan_spill_dir()
+
+    def fetch(
+        self,
+        provider_key: str,
+        vector_name: str,
+        frequency: Frequency,
+        realizations: Optional[Sequence[int]],
+    ) -> Optional[pa.Table]:
+        key = _make_cache_key(provider_key, vector_name, frequency, realizations)
+
+        with self._lock:
+            table = self._mem_entries.get(key)
+            if table is not None:
+                self._mem_entries.move_to_end(key)
+                self._stats.mem_hits += 1
+                return table
+
+        table = self._read_from_disk(key)
+
+        with self._lock:
+            if table is None:
+                self._stats.misses += 1
+                return None
+
+            self._stats.disk_hits += 1
+            evicted_entries = self._add_to_mem(key, table)
+
+        for evicted_key, evicted_table in evicted_entries:
+            self._write_to_disk(evicted_key, evicted_table)
+
+        return table
+
+    def store(
+        self,
+        provider_key: str,
+        vector_name: str,
+        frequency: Frequency,
+        realizations: Optional[Sequence[int]],
+        table: pa.Table,
+    ) -> None:
+        key = _make_cache_key(provider_key, vector_name, frequency, realizations)
+
+        with self._lock:
+            evicted_entries = self._add_to_mem(key, table)
+
+        for evicted_key, evicted_table in evicted_entries:
+            self._write_to_disk(evicted_key, evicted_table)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def stats_str(self) -> str:
+        with self._lock:
+            stats = self._stats
+            return (
+                f"mem_hits={stats.mem_hits}, disk_hits={stats.disk_hits}, "
+                f"misses={stats.misses}, evictions={stats.evictions}, "
+                f"hit_ratio={stats.hit_ratio():.2f}, "
+                f"disk_evictions={stats.disk_evictions}, "
+                f"#mem_entries={len(self._mem_entries)}, "
+                f"mem_size={self._mem_bytes / (1024 * 1024):.1f}MB, "
+                f"#disk_entries={len(self._disk_entries)}, "
+                f"disk_size={self._disk_bytes / (1024 * 1024):.1f}MB"
+            )
+
+    def _add_to_mem(
+        self, key: _CacheKey, table: pa.Table
+    ) -> List[Tuple[_CacheKey, pa.Table]]:
+        """Add entry to the memory tier, evicting least recently used entries if the
+        size limit is exceeded. Must be called with the lock held.
+        Returns the evicted entries."""
+
+        old_table = self._mem_entries.pop(key, None)
+        if old_table is not None:
+            self._mem_bytes -= old_table.nbytes
+
+        self._mem_entries[key] = table
+        self._mem_bytes += table.nbytes
+
+        evicted_entries: List[Tuple[_CacheKey, pa.Table]] = []
+        while self._mem_bytes > self._max_mem_bytes and len(self._mem_entries) > 1:
+            evicted_key, evicted_table = self._mem_entries.popitem(last=False)
+            self._mem_bytes -= evicted_table.nbytes
+            self._stats.evictions += 1
+            evicted_entries.append((evicted_key, evicted_table))
+
+        return evicted_entries
+
+    def _write_to_disk(self, key: _CacheKey, table: pa.Table) -> None:
+        if self._spill_dir is None:
+            return
+
+        full_file_path = self._spill_dir / _compose_spill_file_name(key)
+        if full_file_path.is_file():
+            return
+
+        # Go via a temporary file which we don't rename until writing is finished
+        # to make the writing concurrency-friendly
+        tmp_file_path = self._spill_dir / (
+            full_file_path.name + f"__{uuid.uuid4().hex}{_TMP_FILE_SUFFIX}"
+        )
+        try:
+            with pa.OSFile(str(tmp_file_path), "wb") as sink:
+                with pa.RecordBatchFileWriter(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_file_path, full_file_path)
+            file_size = full_file_path.stat().st_size
+        except OSError as exc:
+            LOGGER.warning(f"Failed to spill resampled vector to disk: {exc}")
+            tmp_file_path.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self._add_to_disk_index(full_file_path.name, file_size)
+            evicted_file_names = self._evict_from_disk_index()
+
+        self._remove_spill_files(evicted_file_names)
+
+    def _read_from_disk(self, key: _CacheKey) -> Optional[pa.Table]:
+        if self._spill_dir is None:
+            return None
+
+        full_file_path = self._spill_dir / _compose_spill_file_name(key)
+        if not full_file_path.is_file():
+            return None
+
+        try:
+            source = pa.memory_map(str(full_file_path), "r")
+            table = pa.ipc.RecordBatchFileReader(source).read_all()
+        except (OSError, pa.ArrowInvalid) as exc:
+            LOGGER.warning(f"Failed to read spilled resampled vector: {exc}")
+            return None
+
+        try:
+            # Touch the file so it is considered recently used by other processes
+            os.utime(full_file_path)
+        except OSError:
+            pass
+
+        with self._lock:
+            if full_file_path.name in self._disk_entries:
+                self._disk_entries.move_to_end(full_file_path.name)
+            else:
+                # Spilled by another process sharing the directory
+                self._add_to_disk_index(full_file_path.name, source.size())
+
+        return table
+
+    def _add_to_disk_index(self, file_name: str, file_size: int) -> None:
+        """Must be called with the lock held"""
+        old_file_size = self._disk_entries.pop(file_name, None)
+        if old_file_size is not None:
+            self._disk_bytes -= old_file_size
+
+        self._disk_entries[file_name] = file_size
+        self._disk_bytes += file_size
+
+    def _evict_from_disk_index(self) -> List[str]:
+        """Remove the least recently used spill files from the index until the disk
+        size limit is satisfied. Must be called with the lock held.
+        Returns the file names of the evicted entries."""
+        evicted_file_names: List[str] = []
+        while self._disk_bytes > self._max_disk_bytes and self._disk_entries:
+            file_name, file_size = self._disk_entries.popitem(last=False)
+            self._disk_bytes -= file_size
+            self._stats.disk_evictions += 1
+            evicted_file_names.append(file_name)
+
+        return evicted_file_names
+
+    def _remove_spill_files(self, file_names: List[str]) -> None:
+        if self._spill_dir is None:
+            return
+
+        for file_name in file_names:
+            try:
+                (self._spill_dir / file_name).unlink(missing_ok=True)
+            except OSError as exc:
+                LOGGER.warning(f"Failed to remove spilled resampled vector: {exc}")
+
+    def _scan_spill_dir(self) -> None:
+        """Index the existing spill files in least recently used order, remove orphaned
+        temporary files and evict spill files exceeding the disk size limit"""
+        if self._spill_dir is None:
+            return
+
+        now = time.time()
+        spill_files: List[Tuple[float, str, int]] = []
+        with os.scandir(self._spill_dir) as it:
+            for dir_entry in it:
+                try:
+                    stat = dir_entry.stat()
+                    if dir_entry.name.endswith(_TMP_FILE_SUFFIX):
+                        if now - stat.st_mtime > _ORPHANED_TMP_FILE_MIN_AGE_S:
+                            os.remove(dir_entry.path)
+                    elif dir_entry.name.endswith(_SPILL_FILE_SUFFIX):
+                        spill_files.append(
+                            (stat.st_mtime, dir_entry.name, stat.st_size)
+                        )
+                except OSError:
+                    # Removed by another process sharing the directory
+                    continue
+
+        with self._lock:
+            for _mtime, file_name, file_size in sorted(spill_files):
+                self._add_to_disk_index(file_name, file_size)
+            evicted_file_names = self._evict_from_disk_index()
+
+        self._remove_spill_files(evicted_file_names)
+
+        LOGGER.debug(
+            f"Found {len(spill_files)} spilled resampled vectors in {self._spill_dir}, "
+            f"evicted {len(evicted_file_names)} to fit the disk size limit"
+        )
+
+
+def _make_cache_key(
+    provider_key: str,
+    vector_name: str,
+    frequency: Frequency,
+    realizations: Optional[Sequence[int]],
+) -> _CacheKey:
+    if realizations is None:
+        reals_key = "all"
+    else:
+        reals_str = ",".join(str(real) for real in sorted(set(realizations)))
+        # There is no security risk here and chances of collision should be very slim
+        reals_key = hashlib.md5(reals_str.encode()).hexdigest()  # nosec
+
+    return (provider_key, vector_name, frequency.value, reals_key)
+
+
+def _compose_spill_file_name(key: _CacheKey) -> str:
+    # Vector names may contain characters that are not allowed in file names
+    key_hash = hashlib.md5("--".join(key).encode()).hexdigest()  # nosec
+    return f"{key_hash}{_SPILL_FILE_SUFFIX}"
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pyarrow as pa
@@ -152,30 +152,107 @@ def resample_single_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
 
 
 @dataclass
-class RealInterpolationInfo:
-    raw_dates_np: np.ndarray
-    raw_dates_np_as_uint: np.ndarray
+class _ResampleIndices:
+    """Per output row indices and weights for resampling a table that is segmented
+    on REAL. All row indices refer to rows in the full input table.
+    """
+
+    # The sample dates and realization number of each output row
     sample_dates_np: np.ndarray
-    sample_dates_np_as_uint: np.ndarray
+    real_np: np.ndarray
+
+    # Linear interpolation between the rows interp_lo_idx and interp_hi_idx.
+    # The value is computed as: (y_hi - y_lo) / interp_dx * interp_dxs + y_lo
+    interp_lo_idx: np.ndarray
+    interp_hi_idx: np.ndarray
+    interp_dx: np.ndarray
+    interp_dxs: np.ndarray
 
+    # Backfill picks the value at row backfill_idx, or 0 where backfill_valid is False
+    backfill_idx: np.ndarray
+    backfill_valid: np.ndarray
 
-def _extract_real_interpolation_info(
-    table: pa.Table, start_row_idx: int, row_count: int, freq: Frequency
-) -> RealInterpolationInfo:
-    real_dates = table["DATE"].slice(start_row_idx, row_count).to_numpy()
 
-    min_raw_date = np.min(real_dates)
-    max_raw_date = np.max(real_dates)
-    sample_dates = generate_normalized_sample_dates(min_raw_date, max_raw_date, freq)
+def _compute_resample_indices(table: pa.Table, freq: Frequency) -> _ResampleIndices:
+    """Compute the interpolation indices and weights for all realizations in the
+    table once, so that they can be reused for all vectors
+    """
+    # pylint: disable=too-many-locals
+
+    unique_reals, first_occurrence_idx, real_counts = np.unique(
+        table.column("REAL").to_numpy(), return_index=True, return_counts=True
+    )
+    raw_dates_np = table.column("DATE").to_numpy()
+    raw_dates_np_as_int = raw_dates_np.astype(np.int64)
+
+    # Realizations typically share the same time range, so avoid generating the
+    # same sample dates over and over again
+    sample_dates_cache: Dict[Tuple[int, int], np.ndarray] = {}
+
+    sample_dates_list = []
+    real_list = []
+    lo_idx_list = []
+    hi_idx_list = []
+    dx_list = []
+    dxs_list = []
+    backfill_idx_list = []
+    backfill_valid_list = []
+
+    for real, start_row_idx, row_count in zip(
+        unique_reals, first_occurrence_idx, real_counts
+    ):
+        raw_x = raw_dates_np_as_int[start_row_idx : start_row_idx + row_count]
+
+        range_key = (raw_x[0], raw_x[-1])
+        sample_dates_np = sample_dates_cache.get(range_key)
+        if sample_dates_np is None:
+            sample_dates_np = generate_normalized_sample_dates(
+                raw_dates_np[start_row_idx],
+                raw_dates_np[start_row_idx + row_count - 1],
+                freq,
+            )
+            sample_dates_cache[range_key] = sample_dates_np
+        x = sample_dates_np.astype(np.int64)
+
+        # Linear interpolation, same semantics as np.interp(), clamping to the first
+        # and last value outside the range of the raw dates
+        left_idx = np.searchsorted(raw_x, x, side="right") - 1
+        is_inside = (left_idx >= 0) & (left_idx < row_count - 1)
+        lo_idx = np.clip(left_idx, 0, row_count - 1)
+        hi_idx = np.where(is_inside, lo_idx + 1, lo_idx)
+        lo_idx_list.append(start_row_idx + lo_idx)
+        hi_idx_list.append(start_row_idx + hi_idx)
+        dx_list.append(np.where(is_inside, raw_x[hi_idx] - raw_x[lo_idx], 1))
+        dxs_list.append(np.where(is_inside, x - raw_x[lo_idx], 0))
+
+        # Backfill, same semantics as interpolate_backfill() with 0 as fill value
+        backfill_idx = np.searchsorted(raw_x, x, side="left")
+        backfill_valid_list.append((backfill_idx < row_count) & (x >= raw_x[0]))
+        backfill_idx_list.append(
+            start_row_idx + np.minimum(backfill_idx, row_count - 1)
+        )
 
-    return RealInterpolationInfo(
-        raw_dates_np=real_dates,
-        raw_dates_np_as_uint=real_dates.astype(np.uint64),
-        sample_dates_np=sample_dates,
-        sample_dates_np_as_uint=sample_dates.astype(np.uint64),
+        sample_dates_list.append(sample_dates_np)
+        real_list.append(np.full(len(sample_dates_np), real))
+
+    return _ResampleIndices(
+        sample_dates_np=_concatenate_or_empty(sample_dates_list, "M8[ms]"),
+        real_np=_concatenate_or_empty(real_list, np.int64),
+        interp_lo_idx=_concatenate_or_empty(lo_idx_list, np.int64),
+        interp_hi_idx=_concatenate_or_empty(hi_idx_list, np.int64),
+        interp_dx=_concatenate_or_empty(dx_list, np.float64).astype(np.float64),
+        interp_dxs=_concatenate_or_empty(dxs_list, np.float64).astype(np.float64),
+        backfill_idx=_concatenate_or_empty(backfill_idx_list, np.int64),
+        backfill_valid=_concatenate_or_empty(backfill_valid_list, bool),
     )
 
 
+def _concatenate_or_empty(arr_list: List[np.ndarray], dtype: Any) -> np.ndarray:
+    if not arr_list:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(arr_list)
+
+
 def resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.Table:
     """Resample table containing multiple realizations.
     The table must contain both a REAL and a DATE column.
@@ -184,88 +261,46 @@ def resample_segmented_multi_real_table(table: pa.Table, freq: Frequency) -> pa.
     sorted on DATE.
     The segmentation is needed since interpolations must be done per realization
     and we utilize slicing on rows for speed.
-    """
-    # pylint: disable=too-many-locals
-
-    real_arr_np = table.column("REAL").to_numpy()
-    unique_reals, first_occurrence_idx, real_counts = np.unique(
-        real_arr_np, return_index=True, return_counts=True
-    )
-
-    output_columns_dict: Dict[str, pa.ChunkedArray] = {}
 
-    real_interpolation_info_dict: Dict[int, RealInterpolationInfo] = {}
-
-    for colname in table.schema.names:
-        if colname in ["DATE", "REAL"]:
-            continue
-
-        is_rate = is_rate_from_field_meta(table.field(colname))
-        raw_whole_numpy_arr = table.column(colname).to_numpy()
-
-        vec_arr_list = []
-        for i, real in enumerate(unique_reals):
-            start_row_idx = first_occurrence_idx[i]
-            row_count = real_counts[i]
-
-            rii = real_interpolation_info_dict.get(real)
-            if not rii:
-                rii = _extract_real_interpolation_info(
-                    table, start_row_idx, row_count, freq
-                )
-                real_interpolation_info_dict[real] = rii
-
-            raw_numpy_arr = raw_whole_numpy_arr[
-                start_row_idx : start_row_idx + row_count
-            ]
-
-            if is_rate:
-                inter = interpolate_backfill(
-                    rii.sample_dates_np_as_uint,
-                    rii.raw_dates_np_as_uint,
-                    raw_numpy_arr,
-                    0,
-                    0,
-                )
-            else:
-                inter = np.interp(
-                    rii.sample_dates_np_as_uint,
-                    rii.raw_dates_np_as_uint,
-                    raw_numpy_arr,
-                )
+    The interpolation indices are computed once per realization and then reused for
+    all the vectors, writing the results into a preallocated 2-D array.
+    """
 
-            arr_length = len(rii.sample_dates_np_as_uint)
-            assert arr_length == len(inter)
+    ri = _compute_resample_indices(table, freq)
 
-            vec_arr_list.append(inter)
+    vec_names = [name for name in table.schema.names if name not in ["DATE", "REAL"]]
 
-        output_columns_dict[colname] = pa.chunked_array(vec_arr_list)
+    values_2d = np.empty((len(vec_names), len(ri.sample_dates_np)))
+    lo_values = np.empty(len(ri.sample_dates_np))
 
-    date_arr_list = []
-    real_arr_list = []
-    for real in unique_reals:
-        rii = real_interpolation_info_dict[real]
-        arr_length = len(rii.sample_dates_np)
-        date_arr_list.append(rii.sample_dates_np)
-        real_arr_list.append(np.full(arr_length, real))
+    for row, vec_name in enumerate(vec_names):
+        raw_values = table.column(vec_name).to_numpy().astype(np.float64, copy=False)
+        out_values = values_2d[row]
 
-    output_columns_dict["DATE"] = pa.chunked_array(date_arr_list)
-    output_columns_dict["REAL"] = pa.chunked_array(real_arr_list)
+        if is_rate_from_field_meta(table.field(vec_name)):
+            np.take(raw_values, ri.backfill_idx, out=out_values)
+            out_values[~ri.backfill_valid] = 0
+        else:
+            # Same arithmetic as np.interp(), done in place to avoid temporaries
+            np.take(raw_values, ri.interp_hi_idx, out=out_values)
+            np.take(raw_values, ri.interp_lo_idx, out=lo_values)
+            out_values -= lo_values
+            out_values /= ri.interp_dx
+            out_values *= ri.interp_dxs
+            out_values += lo_values
+
+    output_columns_dict: Dict[str, np.ndarray] = {
+        "DATE": ri.sample_dates_np,
+        "REAL": ri.real_np,
+    }
+    for row, vec_name in enumerate(vec_names):
+        output_columns_dict[vec_name] = values_2d[row]
 
     ret_table = pa.table(output_columns_dict, schema=table.schema)
 
     return ret_table
 
 
-def _compute_interpolation_weight(
-    d: np.datetime64, d0: np.datetime64, d1: np.datetime64
-) -> float:
-    d_as_uint = d.astype(np.uint64)
-    d0_as_uint = d0.astype(np.uint64)
-    d1_as_uint = d1.astype(np.uint64)
-    return float(d_as_uint - d0_as_uint) / float(d1_as_uint - d0_as_uint)
-
-
 def sample_segmented_multi_real_table_at_date(
     table: pa.Table, np_datetime: np.datetime64
 ) -> pa.Table:
@@ -282,79 +317,47 @@ def sample_segmented_multi_real_table_at_date(
     )
 
     all_dates_arr_np = table.column("DATE").to_numpy()
+    query_date_as_int = np_datetime.astype("M8[ms]").astype(np.int64)
+    all_dates_as_int = all_dates_arr_np.astype("M8[ms]").astype(np.int64)
+
+    # For each realization, find the last legal insertion index of the query date
+    # amongst the realization's dates. Since each realization segment is sorted on
+    # DATE, this equals the number of dates that are <= the query date.
+    # The segments need not be ordered on REAL, while np.add.reduceat() requires the
+    # segment starts in row order, so sum in row order and scatter back to REAL order.
+    last_insertion_idx = np.zeros(len(unique_reals_arr_np), dtype=np.int64)
+    if table.num_rows > 0:
+        segment_order = np.argsort(first_occurrence_idx)
+        last_insertion_idx[segment_order] = np.add.reduceat(
+            (all_dates_as_int <= query_date_as_int).astype(np.int64),
+            first_occurrence_idx[segment_order],
+        )
+
+    is_before_first = last_insertion_idx == 0
+    last_row_idx = first_occurrence_idx + real_counts - 1
+    is_after_last = (last_insertion_idx == real_counts) & (
+        all_dates_as_int[last_row_idx] < query_date_as_int
+    )
 
-    # Will receive row indices into the full input table for the two values we should
-    # interpolate/blend between.
-    # To keep things simple we always add two indices for each realization even if
-    # we know that no interpolation will be needed (e.g. exact matches)
-    row_indices = []
+    # Row indices into the full input table for the two values we should
+    # interpolate/blend between. To keep things simple we always have two indices
+    # for each realization even if no interpolation will be needed (e.g. exact
+    # matches or query dates outside the realization's date range)
+    v0_row_idx = first_occurrence_idx + np.maximum(last_insertion_idx - 1, 0)
+    is_exact_match = all_dates_as_int[v0_row_idx] == query_date_as_int
+    needs_blending = ~(is_before_first | is_after_last | is_exact_match)
+    v1_row_idx = np.where(needs_blending, v0_row_idx + 1, v0_row_idx)
 
-    # Will receive the blending weights for doing interpolation
+    # The blending weights for doing interpolation
     interpolate_t_arr = np.zeros(len(unique_reals_arr_np))
+    d0_arr = all_dates_as_int[v0_row_idx[needs_blending]]
+    d1_arr = all_dates_as_int[v1_row_idx[needs_blending]]
+    interpolate_t_arr[needs_blending] = (query_date_as_int - d0_arr) / (d1_arr - d0_arr)
 
-    # Array with mask for selecting values when doing backfill. A value of 1 will select
-    # v1, while a value of 0 will yield a 0 value
-    backfill_mask_arr = np.ones(len(unique_reals_arr_np))
-
-    for i, _real in enumerate(unique_reals_arr_np):
-        # Starting row of this realization and number of rows belonging to realization
-        start_row_idx = first_occurrence_idx[i]
-        row_count = real_counts[i]
-
-        # Get slice of the dates for just this realization
-        dates_arr_np = all_dates_arr_np[start_row_idx : start_row_idx + row_count]
-        assert len(dates_arr_np) > 0
-
-        # OUTSIDE RANGE (query date is before our first date)
-        if np_datetime < dates_arr_np[0]:
-            row_indices.append(start_row_idx)
-            row_indices.append(start_row_idx)
-            # Extrapolate or just fill with 0 for rates
-            # interpolate_t_arr[i] = 0
-            backfill_mask_arr[i] = 0
-
-        # OUTSIDE RANGE (query date is beyond our last date)
-        elif np_datetime > dates_arr_np[-1]:
-            row_indices.append(start_row_idx + row_count - 1)
-            row_indices.append(start_row_idx + row_count - 1)
-            # Extrapolate or just fill with 0 for rates. For interpolation, t should
-            # really 1, but since the rows are duplicated it does not matter
-            # interpolate_t_arr[i] = 0
-            backfill_mask_arr[i] = 0
-
-        # EXACT MATCH on the LAST DATE
-        elif np_datetime == dates_arr_np[-1]:
-            row_indices.append(start_row_idx + row_count - 1)
-            row_indices.append(start_row_idx + row_count - 1)
-            # interpolate_t_arr[i] = 0
-            # backfill_mask_arr[i] = 1
-
-        else:
-            # Search for query date amongst the realization's dates.
-            # last_insertion_index is the last legal insertion index of the queried value
-            last_insertion_index: int = np.searchsorted(
-                dates_arr_np, np_datetime, side="right"
-            ).item()
-
-            assert 0 < last_insertion_index < len(dates_arr_np)
-            assert dates_arr_np[last_insertion_index - 1] <= np_datetime
-            assert dates_arr_np[last_insertion_index] > np_datetime
-
-            if dates_arr_np[last_insertion_index - 1] == np_datetime:
-                # Exact match
-                row_indices.append(start_row_idx + last_insertion_index - 1)
-                row_indices.append(start_row_idx + last_insertion_index - 1)
-                # interpolate_t_arr[i] = 0
-                # backfill_mask_arr[i] = 1
-            else:
-                row_indices.append(start_row_idx + last_insertion_index - 1)
-                row_indices.append(start_row_idx + last_insertion_index)
-                interpolate_t_arr[i] = _compute_interpolation_weight(
-                    np_datetime,
-                    dates_arr_np[last_insertion_index - 1],
-                    dates_arr_np[last_insertion_index],
-                )
-                # backfill_mask_arr[i] = 1
+    # Array with mask for selecting values when doing backfill. A value of 1 will
+    # select v1, while a value of 0 will yield a 0 value for query dates outside the
+    # realization's date range
+    backfill_mask_arr = np.where(is_before_first | is_after_last, 0.0, 1.0)
 
     column_arrays = []
 
@@ -364,13 +367,12 @@ def sample_segmented_multi_real_table_at_date(
         elif colname == "DATE":
             column_arrays.append(np.full(len(unique_reals_arr_np), np_datetime))
         else:
-            records_np = table.column(colname).take(row_indices).to_numpy()
+            column = table.column(colname)
+            v1_arr = column.take(v1_row_idx).to_numpy()
             if is_rate_from_field_meta(table.field(colname)):
-                v1_arr = records_np[1::2]
                 interpolated_vec_values = v1_arr * backfill_mask_arr
             else:
-                v0_arr = records_np[0::2]
-                v1_arr = records_np[1::2]
+                v0_arr = column.take(v0_row_idx).to_numpy()
                 delta_arr = v1_arr - v0_arr
                 interpolated_vec_values = v0_arr + (delta_arr * interpolate_t_arr)
 
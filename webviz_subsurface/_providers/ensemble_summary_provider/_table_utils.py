@@ -1,5 +1,5 @@
 import json
-from typing import Dict
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 import pyarrow as pa
@@ -7,6 +7,26 @@ import pyarrow.compute as pc
 
 _MAIN_WEBVIZ_METADATA_KEY = b"webviz"
 _PER_VECTOR_MIN_MAX_KEY = "per_vector_min_max"
+_PER_REAL_BATCH_INDEX_KEY = "per_real_batch_index"
+
+
+def _add_entry_to_webviz_schema_metadata(
+    table: pa.Table, key: str, value: Any
+) -> pa.Table:
+    """Add/replace a single entry in the webviz dict stored in the schema's metadata,
+    keeping any other entries that are already present"""
+
+    webviz_meta = {}
+    new_combined_meta = {}
+    if table.schema.metadata is not None:
+        new_combined_meta.update(table.schema.metadata)
+        if _MAIN_WEBVIZ_METADATA_KEY in table.schema.metadata:
+            webviz_meta = json.loads(table.schema.metadata[_MAIN_WEBVIZ_METADATA_KEY])
+
+    webviz_meta[key] = value
+    new_combined_meta.update({_MAIN_WEBVIZ_METADATA_KEY: json.dumps(webviz_meta)})
+    table = table.replace_schema_metadata(new_combined_meta)
+    return table
 
 
 def find_min_max_for_numeric_table_columns(
@@ -31,13 +51,9 @@ def add_per_vector_min_max_to_table_schema_metadata(
 ) -> pa.Table:
     """Store dict with per-vector min/max values schema's metadata"""
 
-    webviz_meta = {_PER_VECTOR_MIN_MAX_KEY: per_vector_min_max}
-    new_combined_meta = {}
-    if table.schema.metadata is not None:
-        new_combined_meta.update(table.schema.metadata)
-    new_combined_meta.update({_MAIN_WEBVIZ_METADATA_KEY: json.dumps(webviz_meta)})
-    table = table.replace_schema_metadata(new_combined_meta)
-    return table
+    return _add_entry_to_webviz_schema_metadata(
+        table, _PER_VECTOR_MIN_MAX_KEY, per_vector_min_max
+    )
 
 
 def get_per_vector_min_max_from_schema_metadata(schema: pa.Schema) -> Dict[str, dict]:
@@ -47,6 +63,42 @@ def get_per_vector_min_max_from_schema_metadata(schema: pa.Schema) -> Dict[str,
     return webviz_meta[_PER_VECTOR_MIN_MAX_KEY]
 
 
+def add_per_real_batch_index_to_table_schema_metadata(
+    table: pa.Table, per_real_batch_index: Dict[int, Tuple[int, int]]
+) -> pa.Table:
+    """Store dict with the range of record batches holding each realization in the
+    schema's metadata. Each range is given as (first batch index, number of batches)"""
+
+    json_friendly_index = {
+        str(real): [int(first_batch), int(batch_count)]
+        for real, (first_batch, batch_count) in per_real_batch_index.items()
+    }
+    return _add_entry_to_webviz_schema_metadata(
+        table, _PER_REAL_BATCH_INDEX_KEY, json_friendly_index
+    )
+
+
+def get_per_real_batch_index_from_schema_metadata(
+    schema: pa.Schema,
+) -> Optional[Dict[int, Tuple[int, int]]]:
+    """Extract dict containing the per-realization record batch ranges from the
+    schema-level metadata. Returns None if the schema has no such index, which will
+    be the case for backing stores written before the index was introduced"""
+
+    if schema.metadata is None or _MAIN_WEBVIZ_METADATA_KEY not in schema.metadata:
+        return None
+
+    webviz_meta = json.loads(schema.metadata[_MAIN_WEBVIZ_METADATA_KEY])
+    json_index = webviz_meta.get(_PER_REAL_BATCH_INDEX_KEY)
+    if json_index is None:
+        return None
+
+    return {
+        int(real): (first_batch, batch_count)
+        for real, (first_batch, batch_count) in json_index.items()
+    }
+
+
 def find_intersected_dates_between_realizations(table: pa.Table) -> np.ndarray:
     """Find the intersection of dates present in all the realizations
     The input table must contain both REAL and DATE columns, but this function makes
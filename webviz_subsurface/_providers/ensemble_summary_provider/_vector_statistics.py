@@ -0,0 +1,77 @@
+import datetime
+import hashlib
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from webviz_subsurface._utils.ensemble_statistics import (
+    StatisticSpec,
+    calc_statistics_for_dense_array,
+    create_dense_group_arrays,
+)
+
+
+def make_statistics_key(statistics: Mapping[str, StatisticSpec]) -> str:
+    """Key identifying the requested statistics, e.g. for use in cache keys"""
+    stats_str = ";".join(f"{label}={spec}" for label, spec in statistics.items())
+    # There is no security risk here and chances of collision should be very slim
+    return hashlib.md5(stats_str.encode()).hexdigest()  # nosec
+
+
+def create_per_vector_statistics_tables(
+    table: pa.Table,
+    vector_names: Sequence[str],
+    statistics: Mapping[str, StatisticSpec],
+) -> Dict[str, pa.Table]:
+    """Calculate statistics across realizations per date for the vectors in the table,
+    directly on the numpy views of the Arrow columns.
+
+    The table must contain DATE and REAL columns in addition to the vector columns.
+    Returns dict with vector name as key and a table with a DATE column followed by
+    one column per statistic label as value, sorted on DATE.
+    """
+    dates_np, dense_arrays = create_dense_group_arrays(
+        table.column("DATE").to_numpy(),
+        {vec_name: table.column(vec_name).to_numpy() for vec_name in vector_names},
+    )
+    date_arr = pa.array(dates_np, type=pa.timestamp("ms"))
+
+    per_vector_tables: Dict[str, pa.Table] = {}
+    for vec_name in vector_names:
+        vec_statistics = calc_statistics_for_dense_array(
+            dense_arrays[vec_name], statistics
+        )
+        per_vector_tables[vec_name] = pa.table(
+            [date_arr] + [pa.array(vec_statistics[label]) for label in statistics],
+            names=["DATE"] + list(statistics),
+        )
+
+    return per_vector_tables
+
+
+def create_vectors_statistics_df(
+    per_vector_tables: Mapping[str, pa.Table],
+    vector_names: Sequence[str],
+    statistics: Mapping[str, StatisticSpec],
+    date_as_datetime64: bool,
+) -> pd.DataFrame:
+    """Assemble the per vector statistics tables into a dataframe with double column
+    level, with the same layout as create_grouped_statistics_df().
+
+    All the tables must have identical DATE columns, i.e. be calculated from data with
+    the same resampling frequency and the same set of realizations.
+    """
+    dates_np = per_vector_tables[vector_names[0]].column("DATE").to_numpy()
+    if not date_as_datetime64:
+        dates_np = dates_np.astype(datetime.datetime)
+
+    columns: Dict[Tuple[str, str], np.ndarray] = {("DATE", ""): dates_np}
+    for vec_name in vector_names:
+        vec_table = per_vector_tables[vec_name]
+        for label in statistics:
+            columns[(vec_name, label)] = vec_table.column(label).to_numpy()
+
+    column_tuples: List[Tuple[str, str]] = list(columns.keys())
+    return pd.DataFrame(columns, columns=pd.MultiIndex.from_tuples(column_tuples))
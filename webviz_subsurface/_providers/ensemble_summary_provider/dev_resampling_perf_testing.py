@@ -0,0 +1,172 @@
+import time
+from typing import Callable, Dict
+
+import numpy as np
+import pyarrow as pa
+
+from ._field_metadata import is_rate_from_field_meta
+from ._resampling import (
+    generate_normalized_sample_dates,
+    interpolate_backfill,
+    resample_segmented_multi_real_table,
+)
+from .ensemble_summary_provider import Frequency
+
+
+def _reference_resample_segmented_multi_real_table(
+    table: pa.Table, freq: Frequency
+) -> pa.Table:
+    """The previous implementation of resample_segmented_multi_real_table(),
+    which calls np.interp()/interpolate_backfill() per vector per realization.
+    Kept here as a reference for the benchmark.
+    """
+    # pylint: disable=too-many-locals
+    real_arr_np = table.column("REAL").to_numpy()
+    unique_reals, first_occurrence_idx, real_counts = np.unique(
+        real_arr_np, return_index=True, return_counts=True
+    )
+    all_dates_np = table.column("DATE").to_numpy()
+
+    per_real_dates: Dict[int, tuple] = {}
+    for i, real in enumerate(unique_reals):
+        raw_dates = all_dates_np[
+            first_occurrence_idx[i] : first_occurrence_idx[i] + real_counts[i]
+        ]
+        sample_dates = generate_normalized_sample_dates(
+            np.min(raw_dates), np.max(raw_dates), freq
+        )
+        per_real_dates[real] = (
+            raw_dates.astype(np.uint64),
+            sample_dates,
+            sample_dates.astype(np.uint64),
+        )
+
+    output_columns_dict: Dict[str, pa.ChunkedArray] = {}
+    for colname in table.schema.names:
+        if colname in ["DATE", "REAL"]:
+            continue
+
+        is_rate = is_rate_from_field_meta(table.field(colname))
+        raw_whole_numpy_arr = table.column(colname).to_numpy()
+
+        vec_arr_list = []
+        for i, real in enumerate(unique_reals):
+            raw_x, _sample_dates, sample_x = per_real_dates[real]
+            raw_y = raw_whole_numpy_arr[
+                first_occurrence_idx[i] : first_occurrence_idx[i] + real_counts[i]
+            ]
+            if is_rate:
+                vec_arr_list.append(interpolate_backfill(sample_x, raw_x, raw_y, 0, 0))
+            else:
+                vec_arr_list.append(np.interp(sample_x, raw_x, raw_y))
+
+        output_columns_dict[colname] = pa.chunked_array(vec_arr_list)
+
+    output_columns_dict["DATE"] = pa.chunked_array(
+        [per_real_dates[real][1] for real in unique_reals]
+    )
+    output_columns_dict["REAL"] = pa.chunked_array(
+        [np.full(len(per_real_dates[real][1]), real) for real in unique_reals]
+    )
+
+    return pa.table(output_columns_dict, schema=table.schema)
+
+
+def _create_synthetic_table(
+    num_vectors: int, num_reals: int, num_dates: int
+) -> pa.Table:
+    rng = np.random.default_rng(seed=1234)
+
+    per_real_tables = []
+    for real in range(num_reals):
+        # Irregular report steps, with slightly different length per realization
+        day_steps = rng.integers(1, 60, size=num_dates + real % 7)
+        dates = np.datetime64("2020-01-01", "ms") + np.cumsum(day_steps).astype("m8[D]")
+
+        columns: Dict[str, np.ndarray] = {
+            "DATE": dates,
+            "REAL": np.full(len(dates), real, dtype=np.int32),
+        }
+        for vec_idx in range(num_vectors):
+            columns[f"VEC_{vec_idx}"] = np.cumsum(rng.random(len(dates)))
+
+        per_real_tables.append(pa.table(columns))
+
+    table = pa.concat_tables(per_real_tables)
+
+    # Make every other vector a rate vector
+    schema = table.schema
+    for vec_idx in range(0, num_vectors, 2):
+        field_idx = schema.get_field_index(f"VEC_{vec_idx}")
+        field = schema.field(field_idx).with_metadata({b"is_rate": b"True"})
+        schema = schema.set(field_idx, field)
+
+    return table.cast(schema)
+
+
+def _time_resampling(
+    resample_func: Callable[[pa.Table, Frequency], pa.Table],
+    table: pa.Table,
+    freq: Frequency,
+    num_runs: int,
+) -> float:
+    best_elapsed_ms = float("inf")
+    for _ in range(num_runs):
+        start_tim = time.perf_counter()
+        resample_func(table, freq)
+        best_elapsed_ms = min(best_elapsed_ms, 1000 * (time.perf_counter() - start_tim))
+
+    return best_elapsed_ms
+
+
+def main() -> None:
+    print()
+    print("## Running resampling benchmark")
+    print("## =============================")
+
+    num_runs = 3
+
+    for num_vectors, num_reals, num_dates in [
+        (10, 100, 200),
+        (100, 200, 200),
+        (100, 200, 500),
+    ]:
+        table = _create_synthetic_table(num_vectors, num_reals, num_dates)
+
+        for freq in [Frequency.WEEKLY, Frequency.MONTHLY, Frequency.YEARLY]:
+            reference = _reference_resample_segmented_multi_real_table(table, freq)
+            result = resample_segmented_multi_real_table(table, freq)
+            assert reference.column("DATE").equals(result.column("DATE"))
+            max_abs_diff = max(
+                np.max(
+                    np.abs(
+                        reference.column(name).to_numpy()
+                        - result.column(name).to_numpy()
+                    )
+                )
+                for name in table.schema.names
+                if name.startswith("VEC_")
+            )
+
+            ref_ms = _time_resampling(
+                _reference_resample_segmented_multi_real_table, table, freq, num_runs
+            )
+            new_ms = _time_resampling(
+                resample_segmented_multi_real_table, table, freq, num_runs
+            )
+
+            print(
+                f"## vectors={num_vectors}, reals={num_reals}, dates={num_dates}, "
+                f"freq={freq.value}, output_rows={result.num_rows}: "
+                f"reference={ref_ms:.1f}ms, batched={new_ms:.1f}ms, "
+                f"speedup={ref_ms / new_ms:.1f}x, max_abs_diff={max_abs_diff:.2e}"
+            )
+
+    print("## done")
+
+
+# Running:
+#   python -m webviz_subsurface._providers.ensemble_summary_provider.dev_resampling_perf_testing
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
 import abc
 import datetime
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from typing import List, Mapping, Optional, Sequence
 
 import pandas as pd
 
+from webviz_subsurface._utils.dataframe_utils import (
+    make_date_column_datetime_object_or_datetime64,
+)
+from webviz_subsurface._utils.ensemble_statistics import (
+    StatisticSpec,
+    create_grouped_statistics_df,
+)
 from webviz_subsurface._utils.enum_shim import StrEnum
 
 
@@ -67,6 +74,16 @@ class EnsembleSummaryProvider(abc.ABC):
         the resampling_frequency parameter in `dates()` and `get_vectors_df()`.
         """
 
+    def supports_vectors_calculated_from_cumulatives(self) -> bool:
+        """Returns True if this provider calculates vectors from cumulatives, otherwise
+        False. A provider that does will accept 'PER_INTVL_<vector>' and 'PER_DAY_<vector>'
+        for stored vectors in `get_vectors_df()` and `get_vectors_statistics_df()`, with
+        the interval delta or average per day values of the stored cumulative vector,
+        calculated with the requested sampling. These vectors are not among the vector
+        names returned by `vector_names()`.
+        """
+        return False
+
     @abc.abstractmethod
     def dates(
         self,
@@ -87,6 +104,7 @@ class EnsembleSummaryProvider(abc.ABC):
         vector_names: Sequence[str],
         resampling_frequency: Optional[Frequency],
         realizations: Optional[Sequence[int]] = None,
+        date_as_datetime64: bool = False,
     ) -> pd.DataFrame:
         """Returns a Pandas DataFrame with data for the vectors specified in `vector_names.`
 
@@ -98,7 +116,43 @@ class EnsembleSummaryProvider(abc.ABC):
 
         The returned DataFrame will always contain a 'DATE' and 'REAL' column in addition
         to columns for all the requested vectors.
+        By default the 'DATE' column holds datetime.datetime objects. If `date_as_datetime64`
+        is True, the 'DATE' column will instead be of numpy datetime64[ms] dtype.
+        """
+
+    def get_vectors_statistics_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        statistics: Mapping[str, StatisticSpec],
+        realizations: Optional[Sequence[int]] = None,
+        date_as_datetime64: bool = False,
+    ) -> pd.DataFrame:
+        """Returns a Pandas DataFrame with statistics across realizations per date for the
+        vectors specified in `vector_names`.
+
+        The `statistics` parameter maps each statistic label to either a StatisticFunction
+        or a quantile in the range [0, 1]. Note that the quantile for the P10 statistic
+        is 0.9 by the oil industry convention.
+        The `resampling_frequency`, `realizations` and `date_as_datetime64` parameters
+        have the same meaning as for `get_vectors_df()`.
+
+        The returned DataFrame has a double column level, with a ('DATE', '') column
+        followed by a (vector, label) column for each vector and statistic label.
+
+        The default implementation computes the statistics from `get_vectors_df()`,
+        providers should override it to avoid materializing the realization data.
         """
+        vectors_df = self.get_vectors_df(
+            vector_names, resampling_frequency, realizations, date_as_datetime64
+        )
+        statistics_df = create_grouped_statistics_df(
+            vectors_df, "DATE", list(dict.fromkeys(vector_names)), statistics
+        )
+        make_date_column_datetime_object_or_datetime64(
+            statistics_df, date_as_datetime64
+        )
+        return statistics_df
 
     @abc.abstractmethod
     def get_vectors_for_date_df(
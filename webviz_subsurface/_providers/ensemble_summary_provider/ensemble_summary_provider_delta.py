@@ -0,0 +1,155 @@
+import datetime
+import logging
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from webviz_subsurface._utils.dataframe_utils import (
+    make_date_column_datetime_object_or_datetime64,
+)
+from webviz_subsurface._utils.delta_vectors import create_delta_vectors_df
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+from .ensemble_summary_provider import (
+    EnsembleSummaryProvider,
+    Frequency,
+    VectorMetadata,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class EnsembleSummaryProviderDelta(EnsembleSummaryProvider):
+    """Provider for the delta ensemble A-B of two ensemble summary providers.
+
+    The vectors and realizations of the delta ensemble are the ones present in both
+    ensemble A and B. All data is fetched from the wrapped providers, thus any caching
+    in these is utilized, and the delta is calculated for the DATE-REAL combinations
+    present in both ensembles. Rows where any of the requested delta vectors is NaN are
+    excluded.
+
+    Statistics are calculated from the delta vectors by the default implementation of
+    `get_vectors_statistics_df()`, as statistics of a delta ensemble can not be obtained
+    from the statistics of ensemble A and B.
+    """
+
+    def __init__(
+        self, provider_a: EnsembleSummaryProvider, provider_b: EnsembleSummaryProvider
+    ) -> None:
+        if provider_a.supports_resampling() != provider_b.supports_resampling():
+            raise ValueError(
+                f"Ensemble A and B must have same resampling support! "
+                f"Ensemble A support resampling: {provider_a.supports_resampling()} "
+                f"and Ensemble B support resampling: {provider_b.supports_resampling()}"
+            )
+
+        self._provider_a = provider_a
+        self._provider_b = provider_b
+
+        vector_names_b = set(provider_b.vector_names())
+        self._vector_names: List[str] = [
+            vec_name
+            for vec_name in provider_a.vector_names()
+            if vec_name in vector_names_b
+        ]
+        realizations_b = set(provider_b.realizations())
+        self._realizations: List[int] = [
+            real for real in provider_a.realizations() if real in realizations_b
+        ]
+
+    def vector_names(self) -> List[str]:
+        return self._vector_names
+
+    def vector_names_filtered_by_value(
+        self,
+        exclude_all_values_zero: bool = False,
+        exclude_constant_values: bool = False,
+    ) -> List[str]:
+        # The values of a delta vector are not known without calculating the delta, thus
+        # only exclude vectors excluded in both ensembles, as the delta of these is
+        # constant as well
+        filtered_names = set(
+            self._provider_a.vector_names_filtered_by_value(
+                exclude_all_values_zero, exclude_constant_values
+            )
+        ) | set(
+            self._provider_b.vector_names_filtered_by_value(
+                exclude_all_values_zero, exclude_constant_values
+            )
+        )
+        return [
+            vec_name for vec_name in self._vector_names if vec_name in filtered_names
+        ]
+
+    def realizations(self) -> List[int]:
+        return self._realizations
+
+    def vector_metadata(self, vector_name: str) -> Optional[VectorMetadata]:
+        if vector_name not in self._vector_names:
+            return None
+        return self._provider_a.vector_metadata(vector_name)
+
+    def supports_resampling(self) -> bool:
+        return self._provider_a.supports_resampling()
+
+    def dates(
+        self,
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> List[datetime.datetime]:
+        dates_b = set(self._provider_b.dates(resampling_frequency, realizations))
+        return [
+            date
+            for date in self._provider_a.dates(resampling_frequency, realizations)
+            if date in dates_b
+        ]
+
+    def get_vectors_df(
+        self,
+        vector_names: Sequence[str],
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]] = None,
+        date_as_datetime64: bool = False,
+    ) -> pd.DataFrame:
+        if not vector_names:
+            raise ValueError("List of requested vector names is empty")
+
+        timer = PerfTimer()
+
+        # Get dates as datetime64, to join the ensembles on numeric dates
+        vectors_a_df = self._provider_a.get_vectors_df(
+            vector_names, resampling_frequency, realizations, date_as_datetime64=True
+        )
+        vectors_b_df = self._provider_b.get_vectors_df(
+            vector_names, resampling_frequency, realizations, date_as_datetime64=True
+        )
+        et_get_vectors_ms = timer.lap_ms()
+
+        delta_df = create_delta_vectors_df(vectors_a_df, vectors_b_df, vector_names)
+        make_date_column_datetime_object_or_datetime64(delta_df, date_as_datetime64)
+        et_calc_delta_ms = timer.lap_ms()
+
+        LOGGER.debug(
+            f"get_vectors_df() took: {timer.elapsed_ms()}ms ("
+            f"get_vectors={et_get_vectors_ms}ms, "
+            f"calc_delta={et_calc_delta_ms}ms), "
+            f"#vecs={len(vector_names)}, "
+            f"#real={len(realizations) if realizations is not None else 'all'}, "
+            f"df.shape={delta_df.shape}"
+        )
+
+        return delta_df
+
+    def get_vectors_for_date_df(
+        self,
+        date: datetime.datetime,
+        vector_names: Sequence[str],
+        realizations: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        vectors_a_df = self._provider_a.get_vectors_for_date_df(
+            date, vector_names, realizations
+        )
+        vectors_b_df = self._provider_b.get_vectors_for_date_df(
+            date, vector_names, realizations
+        )
+        return create_delta_vectors_df(vectors_a_df, vectors_b_df, vector_names)
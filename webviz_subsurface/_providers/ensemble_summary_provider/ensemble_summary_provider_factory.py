@@ -1,8 +1,12 @@
+import dataclasses
 import hashlib
+import heapq
+import json
 import logging
 import os
+import uuid
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from webviz_config.webviz_factory import WebvizFactory
 from webviz_config.webviz_factory_registry import WEBVIZ_FACTORY_REGISTRY
@@ -11,20 +15,37 @@ from webviz_config.webviz_instance_info import WebvizRunMode
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ..ensemble_table_provider._table_import import load_per_real_csv_file
-from ._arrow_unsmry_import import load_per_realization_arrow_unsmry_files
+from ._arrow_unsmry_import import (
+    FileEntry,
+    discover_per_realization_arrow_unsmry_files,
+    iterate_arrow_unsmry_files,
+    load_per_realization_arrow_unsmry_files,
+)
 from ._csv_import import load_ensemble_summary_csv_file
 from ._provider_impl_arrow_lazy import ProviderImplArrowLazy
 from ._provider_impl_arrow_presampled import ProviderImplArrowPresampled
+from ._resampled_vector_cache import ResampledVectorCache
 from ._resampling import Frequency, resample_single_real_table
 from .ensemble_summary_provider import EnsembleSummaryProvider
 
 LOGGER = logging.getLogger(__name__)
 
+# Memory budget for the resampled vector cache shared by all lazy providers
+_RESAMPLED_VECTOR_CACHE_MAX_MEM_BYTES = 512 * 1024 * 1024
+# Disk budget for the resampled vectors spilled from memory, shared across sessions
+_RESAMPLED_VECTOR_CACHE_MAX_DISK_BYTES = 2 * 1024 * 1024 * 1024
+
 
 class EnsembleSummaryProviderFactory(WebvizFactory):
-    def __init__(self, root_storage_folder: Path, allow_storage_writes: bool) -> None:
+    def __init__(
+        self,
+        root_storage_folder: Path,
+        allow_storage_writes: bool,
+        incremental_lazy_updates: bool = False,
+    ) -> None:
         self._storage_dir = Path(root_storage_folder) / __name__
         self._allow_storage_writes = allow_storage_writes
+        self._incremental_lazy_updates = incremental_lazy_updates
 
         LOGGER.info(
             f"EnsembleSummaryProviderFactory init: storage_dir={self._storage_dir}"
@@ -33,6 +54,17 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         if self._allow_storage_writes:
             os.makedirs(self._storage_dir, exist_ok=True)
 
+        # Resampled vectors evicted from memory are spilled to disk when possible
+        self._resampled_vector_cache = ResampledVectorCache(
+            max_mem_bytes=_RESAMPLED_VECTOR_CACHE_MAX_MEM_BYTES,
+            max_disk_bytes=_RESAMPLED_VECTOR_CACHE_MAX_DISK_BYTES,
+            spill_dir=(
+                self._storage_dir / "resampled_vector_cache"
+                if self._allow_storage_writes
+                else None
+            ),
+        )
+
     @staticmethod
     def instance() -> "EnsembleSummaryProviderFactory":
         """Static method to access the singleton instance of the factory."""
@@ -43,7 +75,12 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
             storage_folder = app_instance_info.storage_folder
             allow_writes = app_instance_info.run_mode != WebvizRunMode.PORTABLE
 
-            factory = EnsembleSummaryProviderFactory(storage_folder, allow_writes)
+            # In non-portable mode the data is read from the ensemble folders, which
+            # may have changed since the backing stores were written, e.g. by an
+            # ongoing ERT run. Keep the lazy backing stores in sync with the folders.
+            factory = EnsembleSummaryProviderFactory(
+                storage_folder, allow_writes, incremental_lazy_updates=allow_writes
+            )
 
             # Store the factory object in the global factory registry
             WEBVIZ_FACTORY_REGISTRY.set_factory(EnsembleSummaryProviderFactory, factory)
@@ -184,7 +221,10 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         return provider
 
     def create_from_arrow_unsmry_lazy(
-        self, ens_path: str, rel_file_pattern: str
+        self,
+        ens_path: str,
+        rel_file_pattern: str,
+        incremental: Optional[bool] = None,
     ) -> EnsembleSummaryProvider:
         """Create EnsembleSummaryProvider from per-realization unsmry data in .arrow format.
 
@@ -193,6 +233,15 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         pattern is relative to each realization's `runpath`.
         Typically the file pattern will be: "share/results/unsmry/*.arrow"
 
+        If `incremental` is True, an existing backing store will be checked against the
+        current per-realization files (modification time and size) and updated if any
+        realizations have been added, changed or removed. Only the new and changed
+        realizations will be loaded, while data for the unchanged ones is reused from the
+        existing backing store. This is intended for ensembles that grow realization by
+        realization, e.g. during an ERT run. If `incremental` is None, the
+        `incremental_lazy_updates` setting of the factory is used, which is enabled for
+        the factory instance in non-portable mode.
+
         The returned summary provider supports lazy resampling.
         """
 
@@ -201,8 +250,16 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         storage_key = (
             f"arrow_unsmry_lazy__{_make_hash_string(ens_path + rel_file_pattern)}"
         )
+
+        if incremental is None:
+            incremental = self._incremental_lazy_updates
+        if incremental and self._allow_storage_writes:
+            self._update_arrow_unsmry_lazy_backing_store(
+                ens_path, rel_file_pattern, storage_key
+            )
+
         provider = ProviderImplArrowLazy.from_backing_store(
-            self._storage_dir, storage_key
+            self._storage_dir, storage_key, self._resampled_vector_cache
         )
         if provider:
             LOGGER.info(
@@ -218,37 +275,120 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         LOGGER.info(f"Importing/saving arrow summary data for: {ens_path}")
 
         timer.lap_s()
-        per_real_tables = load_per_realization_arrow_unsmry_files(
+        file_entries = discover_per_realization_arrow_unsmry_files(
             ens_path, rel_file_pattern
         )
-        if not per_real_tables:
+        if not file_entries:
             raise ValueError(
                 f"Could not find any .arrow unsmry files for ens_path={ens_path}"
             )
-        et_import_smry_s = timer.lap_s()
 
+        # The files are loaded while streaming the tables to the backing store
         try:
             ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
-                self._storage_dir, storage_key, per_real_tables
+                self._storage_dir,
+                storage_key,
+                iterate_arrow_unsmry_files(file_entries),
             )
         except ValueError as exc:
             raise ValueError(f"Failed to write backing store for: {ens_path}") from exc
+        _write_file_manifest(self._storage_dir, storage_key, file_entries)
 
-        et_write_s = timer.lap_s()
+        et_import_and_write_s = timer.lap_s()
 
         provider = ProviderImplArrowLazy.from_backing_store(
-            self._storage_dir, storage_key
+            self._storage_dir, storage_key, self._resampled_vector_cache
         )
         if not provider:
             raise ValueError(f"Failed to load/create lazy provider for {ens_path}")
 
         LOGGER.info(
             f"Saved lazy summary provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_smry={et_import_smry_s:.2f}s, write={et_write_s:.2f}s, ens_path={ens_path})"
+            f"import_and_write={et_import_and_write_s:.2f}s, ens_path={ens_path})"
         )
 
         return provider
 
+    def _update_arrow_unsmry_lazy_backing_store(
+        self, ens_path: str, rel_file_pattern: str, storage_key: str
+    ) -> None:
+        """Bring the backing store up to date with the per-realization files, loading
+        only realizations that are new or have changed since the backing store was
+        written. Does nothing if no backing store exists yet, or if no files are found,
+        in which case the existing backing store is used as is.
+        """
+        timer = PerfTimer()
+
+        manifest_entries = _read_file_manifest(self._storage_dir, storage_key)
+        if manifest_entries is None:
+            if not (self._storage_dir / (storage_key + ".arrow")).is_file():
+                return
+            # Backing store was written without a manifest, reload all realizations
+            manifest_entries = []
+
+        file_entries = discover_per_realization_arrow_unsmry_files(
+            ens_path, rel_file_pattern
+        )
+        if not file_entries:
+            LOGGER.warning(
+                f"Could not find any .arrow unsmry files for ens_path={ens_path}, "
+                f"using the existing backing store"
+            )
+            return
+        if file_entries == manifest_entries:
+            LOGGER.debug(f"Backing store is up to date for: {ens_path}")
+            return
+
+        manifest_entries_dict = {entry.real: entry for entry in manifest_entries}
+        unchanged_reals = [
+            entry.real
+            for entry in file_entries
+            if manifest_entries_dict.get(entry.real) == entry
+        ]
+        # The stored tables are zero-copy views into the memory mapped backing store
+        stored_per_real_tables = (
+            ProviderImplArrowLazy.read_per_realization_tables_from_backing_store(
+                self._storage_dir, storage_key, unchanged_reals
+            )
+        )
+        if stored_per_real_tables is None:
+            # Backing store is of an older format, load all realizations
+            stored_per_real_tables = {}
+        et_read_stored_s = timer.lap_s()
+
+        entries_to_load = [
+            entry for entry in file_entries if entry.real not in stored_per_real_tables
+        ]
+
+        # Merge the stored and the loaded tables in realization order, the files are
+        # loaded while streaming the tables to the backing store
+        try:
+            ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
+                self._storage_dir,
+                storage_key,
+                heapq.merge(
+                    sorted(stored_per_real_tables.items(), key=lambda item: item[0]),
+                    iterate_arrow_unsmry_files(entries_to_load),
+                    key=lambda item: item[0],
+                ),
+            )
+        except ValueError as exc:
+            raise ValueError(f"Failed to write backing store for: {ens_path}") from exc
+        _write_file_manifest(self._storage_dir, storage_key, file_entries)
+        et_import_and_write_s = timer.lap_s()
+
+        num_removed_reals = len(
+            set(manifest_entries_dict) - {entry.real for entry in file_entries}
+        )
+        LOGGER.info(
+            f"Updated lazy summary provider backing store in {timer.elapsed_s():.2f}s ("
+            f"read_stored={et_read_stored_s:.2f}s, "
+            f"import_and_write={et_import_and_write_s:.2f}s, "
+            f"#reused_reals={len(stored_per_real_tables)}, "
+            f"#loaded_reals={len(entries_to_load)}, "
+            f"#removed_reals={num_removed_reals}, ens_path={ens_path})"
+        )
+
     def create_from_arrow_unsmry_presampled(
         self,
         ens_path: str,
@@ -332,6 +472,33 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         return provider
 
 
+def _compose_file_manifest_path(storage_dir: Path, storage_key: str) -> Path:
+    return storage_dir / (storage_key + ".manifest.json")
+
+
+def _write_file_manifest(
+    storage_dir: Path, storage_key: str, file_entries: Sequence[FileEntry]
+) -> None:
+    """Write manifest of the per-realization files that a backing store was built from"""
+    manifest_path = _compose_file_manifest_path(storage_dir, storage_key)
+    manifest = {"files": [dataclasses.asdict(entry) for entry in file_entries]}
+
+    tmp_manifest_path = storage_dir / (manifest_path.name + f"__{uuid.uuid4().hex}.tmp")
+    tmp_manifest_path.write_text(json.dumps(manifest))
+    os.replace(tmp_manifest_path, manifest_path)
+
+
+def _read_file_manifest(
+    storage_dir: Path, storage_key: str
+) -> Optional[List[FileEntry]]:
+    manifest_path = _compose_file_manifest_path(storage_dir, storage_key)
+    if not manifest_path.is_file():
+        return None
+
+    manifest = json.loads(manifest_path.read_text())
+    return [FileEntry(**entry_dict) for entry_dict in manifest["files"]]
+
+
 def _make_hash_string(string_to_hash: str) -> str:
     # There is no security risk here and chances of collision should be very slim
     return hashlib.md5(string_to_hash.encode()).hexdigest()  # nosec
@@ -1,3 +1,4 @@
+from ._surface_array_encoding import SurfaceArrayEncoding
 from ._types import QualifiedDiffSurfaceAddress, QualifiedSurfaceAddress
 from .ensemble_surface_provider import (
     EnsembleSurfaceProvider,
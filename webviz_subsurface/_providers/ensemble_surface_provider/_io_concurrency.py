@@ -0,0 +1,98 @@
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Mapping, Optional, TypeVar
+
+from webviz_subsurface._utils.enum_shim import StrEnum
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Environment variables for tuning the file I/O concurrency of a running app
+IO_EXECUTOR_TYPE_ENV_VAR = "WEBVIZ_SUBSURFACE_IO_EXECUTOR_TYPE"
+IO_MAX_WORKERS_ENV_VAR = "WEBVIZ_SUBSURFACE_IO_MAX_WORKERS"
+
+
+class IoExecutorType(StrEnum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass(frozen=True)
+class IoConcurrencyConfig:
+    """Controls how file operations on many surfaces are parallelized.
+
+    Threads are usually the best choice since the work is dominated by file I/O.
+    The number of workers is deliberately kept low by default, since network file
+    systems tend to degrade rather than speed up when hammered with many
+    concurrent requests. Setting max_workers to 1 disables parallelization.
+    """
+
+    executor_type: IoExecutorType = IoExecutorType.THREAD
+    max_workers: int = 8
+
+
+def io_concurrency_config_from_env(
+    environ: Optional[Mapping[str, str]] = None
+) -> IoConcurrencyConfig:
+    """Create config from the environment variables WEBVIZ_SUBSURFACE_IO_EXECUTOR_TYPE
+    ("thread" or "process") and WEBVIZ_SUBSURFACE_IO_MAX_WORKERS. Defaults are used for
+    variables that are not set, and invalid values are logged and ignored."""
+
+    if environ is None:
+        environ = os.environ
+    default_config = IoConcurrencyConfig()
+
+    executor_type = default_config.executor_type
+    executor_type_str = environ.get(IO_EXECUTOR_TYPE_ENV_VAR)
+    if executor_type_str:
+        try:
+            executor_type = IoExecutorType(executor_type_str.strip().lower())
+        except ValueError:
+            LOGGER.warning(
+                f"Ignoring invalid {IO_EXECUTOR_TYPE_ENV_VAR}={executor_type_str}, "
+                f"valid values are: {[str(item) for item in IoExecutorType]}"
+            )
+
+    max_workers = default_config.max_workers
+    max_workers_str = environ.get(IO_MAX_WORKERS_ENV_VAR)
+    if max_workers_str:
+        try:
+            max_workers = int(max_workers_str)
+            if max_workers < 1:
+                raise ValueError("max_workers must be at least 1")
+        except ValueError:
+            LOGGER.warning(
+                f"Ignoring invalid {IO_MAX_WORKERS_ENV_VAR}={max_workers_str}, "
+                f"must be a positive integer"
+            )
+            max_workers = default_config.max_workers
+
+    return IoConcurrencyConfig(executor_type=executor_type, max_workers=max_workers)
+
+
+def map_with_io_concurrency(
+    config: IoConcurrencyConfig, func: Callable[..., T], *iterables: Iterable[Any]
+) -> List[T]:
+    """Same as the builtin map(), but runs the calls in a pool of workers as given by
+    the config. The results are returned in the same order as the arguments.
+    Note that func must be picklable (ie. a module level function) when using
+    processes."""
+
+    arg_lists = [list(iterable) for iterable in iterables]
+    num_calls = min(len(arg_list) for arg_list in arg_lists) if arg_lists else 0
+    num_workers = min(config.max_workers, num_calls)
+
+    if num_workers <= 1:
+        return list(map(func, *arg_lists))
+
+    executor: Executor
+    if config.executor_type == IoExecutorType.PROCESS:
+        executor = ProcessPoolExecutor(max_workers=num_workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=num_workers)
+
+    with executor:
+        return list(executor.map(func, *arg_lists))
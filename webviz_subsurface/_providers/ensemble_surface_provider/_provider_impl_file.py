@@ -1,8 +1,9 @@
 import logging
 import shutil
 import warnings
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -11,7 +12,14 @@ import xtgeo
 from webviz_subsurface._utils.enum_shim import StrEnum
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ._io_concurrency import IoConcurrencyConfig, map_with_io_concurrency
+from ._stat_surf_cache import StatSurfCache, compose_input_fingerprint
 from ._surface_discovery import SurfaceFileInfo
+from ._surface_stack_file import (
+    SURFACE_STACK_FILE_EXTENSION,
+    SurfaceStackFile,
+    write_surface_stack_file,
+)
 from .ensemble_surface_provider import (
     EnsembleSurfaceProvider,
     ObservedSurfaceAddress,
@@ -36,6 +44,7 @@ class Col:
     DATESTR = "datestr"
     ORIGINAL_PATH = "original_path"
     REL_PATH = "rel_path"
+    STACK_INDEX = "stack_index"
 
 
 class SurfaceType(StrEnum):
@@ -43,27 +52,145 @@ class SurfaceType(StrEnum):
     SIMULATED = "simulated"
 
 
+class SurfaceStoreFormat(StrEnum):
+    # Each surface copied as a separate file
+    FILE_COPIES = "file_copies"
+    # All realizations of a simulated surface packed into one memory mapped file
+    STACKED = "stacked"
+
+
+@dataclass(frozen=True)
+class _InventoryEntry:
+    real: int
+    # Full path to the surface file, either within the backing store or the original
+    path: str
+    rel_path: str
+    stack_index: int
+
+
+# Key is (type, attribute, name, datestr)
+_InventoryKey = Tuple[SurfaceType, str, str, str]
+
+
+class _InventoryIndex:
+    """Lookup structures built once from the surface inventory, so that the
+    provider's queries don't need to scan the inventory DataFrame"""
+
+    # pylint: disable=too-many-locals
+    def __init__(self, inventory_df: pd.DataFrame, provider_dir: Path) -> None:
+        self._entries: Dict[_InventoryKey, Dict[int, List[_InventoryEntry]]] = {}
+        names_per_attr: Dict[str, Set[str]] = {}
+        dates_per_attr: Dict[str, Set[str]] = {}
+        reals: Set[int] = set()
+
+        for (
+            surf_type,
+            real,
+            attribute,
+            name,
+            datestr,
+            rel_path,
+            orig_path,
+            stack_idx,
+        ) in zip(
+            inventory_df[Col.TYPE],
+            inventory_df[Col.REAL],
+            inventory_df[Col.ATTRIBUTE],
+            inventory_df[Col.NAME],
+            inventory_df[Col.DATESTR],
+            inventory_df[Col.REL_PATH],
+            inventory_df[Col.ORIGINAL_PATH],
+            inventory_df[Col.STACK_INDEX],
+        ):
+            # Use file name within backing store if the surface was copied there,
+            # otherwise use the original source file name
+            path = str(provider_dir / rel_path) if rel_path else orig_path
+            entry = _InventoryEntry(
+                real=int(real), path=path, rel_path=rel_path, stack_index=int(stack_idx)
+            )
+            key = (SurfaceType(surf_type), attribute, name, datestr)
+            self._entries.setdefault(key, {}).setdefault(entry.real, []).append(entry)
+
+            names_per_attr.setdefault(attribute, set()).add(name)
+            dates_per_attr.setdefault(attribute, set()).add(datestr)
+            reals.add(entry.real)
+
+        self.attributes: List[str] = sorted(names_per_attr)
+        self.names_per_attribute: Dict[str, List[str]] = {
+            attr: sorted(names) for attr, names in names_per_attr.items()
+        }
+        self.dates_per_attribute: Dict[str, List[str]] = {
+            attr: sorted(dates) for attr, dates in dates_per_attr.items()
+        }
+        # Strip out any entries with real == -1
+        self.realizations: List[int] = sorted(real for real in reals if real >= 0)
+
+    def find_entries(
+        self,
+        key: _InventoryKey,
+        realizations: Optional[List[int]],
+    ) -> List[_InventoryEntry]:
+        """Returns the entries for the key, restricted to the given realizations if
+        specified. The entries are ordered by realization."""
+        entries_per_real = self._entries.get(key)
+        if not entries_per_real:
+            return []
+
+        if realizations is None:
+            reals = sorted(entries_per_real)
+        else:
+            reals = sorted(set(realizations).intersection(entries_per_real))
+
+        return [entry for real in reals for entry in entries_per_real[real]]
+
+
 class ProviderImplFile(EnsembleSurfaceProvider):
     def __init__(
-        self, provider_id: str, provider_dir: Path, surface_inventory_df: pd.DataFrame
+        self,
+        provider_id: str,
+        provider_dir: Path,
+        surface_inventory_df: pd.DataFrame,
+        stat_surf_cache: Optional[StatSurfCache] = None,
+        io_concurrency: IoConcurrencyConfig = IoConcurrencyConfig(),
     ) -> None:
         self._provider_id = provider_id
         self._provider_dir = provider_dir
         self._inventory_df = surface_inventory_df
+        self._stat_surf_cache = stat_surf_cache
+        self._io_concurrency = io_concurrency
+        self._stack_files: Dict[str, SurfaceStackFile] = {}
+
+        # Backing stores written before the introduction of stack files
+        if Col.STACK_INDEX not in self._inventory_df.columns:
+            self._inventory_df[Col.STACK_INDEX] = -1
+
+        timer = PerfTimer()
+        self._inventory_index = _InventoryIndex(self._inventory_df, self._provider_dir)
+        LOGGER.debug(
+            f"Built surface inventory index in: {timer.elapsed_ms()}ms "
+            f"(#rows={len(self._inventory_df)})"
+        )
 
     @staticmethod
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals, too-many-statements
     def write_backing_store(
         storage_dir: Path,
         storage_key: str,
         sim_surfaces: List[SurfaceFileInfo],
         obs_surfaces: List[SurfaceFileInfo],
         avoid_copying_surfaces: bool,
+        io_concurrency: IoConcurrencyConfig = IoConcurrencyConfig(),
+        store_format: SurfaceStoreFormat = SurfaceStoreFormat.STACKED,
     ) -> None:
         """If avoid_copying_surfaces if True, the specified surfaces will NOT be copied
         into the backing store, but will be referenced from their source locations.
         Note that this is only useful when running in non-portable mode and will fail
         in portable mode.
+        When copying with the STACKED store format, all realizations of a simulated
+        surface are packed into one surface stack file. Surfaces that cannot be
+        stacked, because their realizations differ in topology, and observed surfaces
+        are copied as separate files.
+        The copying of surfaces is parallelized according to io_concurrency.
         """
 
         timer = PerfTimer()
@@ -85,6 +212,15 @@ class ProviderImplFile(EnsembleSurfaceProvider):
         datestr_arr: List[str] = []
         rel_path_arr: List[str] = []
         original_path_arr: List[str] = []
+        stack_index_arr: List[int] = []
+
+        timer.lap_s()
+        stacked_surf_dict: Dict[str, Tuple[str, int]] = {}
+        if do_copy_surfs_into_store and store_format == SurfaceStoreFormat.STACKED:
+            stacked_surf_dict = _write_simulated_surfaces_into_stack_files(
+                sim_surfaces, provider_dir, io_concurrency
+            )
+        et_stack_s = timer.lap_s()
 
         for surfinfo in sim_surfaces:
             type_arr.append(SurfaceType.SIMULATED)
@@ -94,6 +230,13 @@ class ProviderImplFile(EnsembleSurfaceProvider):
             datestr_arr.append(surfinfo.datestr if surfinfo.datestr else "")
             original_path_arr.append(surfinfo.path)
 
+            stacked_entry = stacked_surf_dict.get(surfinfo.path)
+            if stacked_entry is not None:
+                rel_path_arr.append(stacked_entry[0])
+                stack_index_arr.append(stacked_entry[1])
+                continue
+
+            stack_index_arr.append(-1)
             rel_path_in_store = ""
             if do_copy_surfs_into_store:
                 rel_path_in_store = _compose_rel_sim_surf_pathstr(
@@ -117,6 +260,7 @@ class ProviderImplFile(EnsembleSurfaceProvider):
             name_arr.append(surfinfo.name)
             datestr_arr.append(surfinfo.datestr if surfinfo.datestr else "")
             original_path_arr.append(surfinfo.path)
+            stack_index_arr.append(-1)
 
             rel_path_in_store = ""
             if do_copy_surfs_into_store:
@@ -130,11 +274,19 @@ class ProviderImplFile(EnsembleSurfaceProvider):
 
         timer.lap_s()
         if do_copy_surfs_into_store:
+            copy_idx_arr = [
+                idx for idx, stack_idx in enumerate(stack_index_arr) if stack_idx < 0
+            ]
             LOGGER.debug(
-                f"Copying {len(original_path_arr)} surfaces into backing store..."
+                f"Copying {len(copy_idx_arr)} surfaces into backing store "
+                f"({io_concurrency.executor_type}, "
+                f"max_workers={io_concurrency.max_workers})..."
             )
             _copy_surfaces_into_provider_dir(
-                original_path_arr, rel_path_arr, provider_dir
+                [original_path_arr[idx] for idx in copy_idx_arr],
+                [rel_path_arr[idx] for idx in copy_idx_arr],
+                provider_dir,
+                io_concurrency,
             )
         et_copy_s = timer.lap_s()
 
@@ -147,6 +299,7 @@ class ProviderImplFile(EnsembleSurfaceProvider):
                 Col.DATESTR: datestr_arr,
                 Col.REL_PATH: rel_path_arr,
                 Col.ORIGINAL_PATH: original_path_arr,
+                Col.STACK_INDEX: stack_index_arr,
             }
         )
 
@@ -156,7 +309,8 @@ class ProviderImplFile(EnsembleSurfaceProvider):
         if do_copy_surfs_into_store:
             LOGGER.debug(
                 f"Wrote surface backing store in: {timer.elapsed_s():.2f}s ("
-                f"copy={et_copy_s:.2f}s)"
+                f"stack={et_stack_s:.2f}s, copy={et_copy_s:.2f}s, "
+                f"format={store_format})"
             )
         else:
             LOGGER.debug(
@@ -168,13 +322,21 @@ class ProviderImplFile(EnsembleSurfaceProvider):
     def from_backing_store(
         storage_dir: Path,
         storage_key: str,
+        stat_surf_cache: Optional[StatSurfCache] = None,
+        io_concurrency: IoConcurrencyConfig = IoConcurrencyConfig(),
     ) -> Optional["ProviderImplFile"]:
         provider_dir = storage_dir / storage_key
         parquet_file_name = provider_dir / "surface_inventory.parquet"
 
         try:
             surface_inventory_df = pd.read_parquet(path=parquet_file_name)
-            return ProviderImplFile(storage_key, provider_dir, surface_inventory_df)
+            return ProviderImplFile(
+                storage_key,
+                provider_dir,
+                surface_inventory_df,
+                stat_surf_cache,
+                io_concurrency,
+            )
         except FileNotFoundError:
             return None
 
@@ -182,37 +344,24 @@ class ProviderImplFile(EnsembleSurfaceProvider):
         return self._provider_id
 
     def attributes(self) -> List[str]:
-        return sorted(list(self._inventory_df[Col.ATTRIBUTE].unique()))
+        return list(self._inventory_index.attributes)
 
     def surface_names_for_attribute(self, surface_attribute: str) -> List[str]:
-        return sorted(
-            list(
-                self._inventory_df.loc[
-                    self._inventory_df[Col.ATTRIBUTE] == surface_attribute
-                ][Col.NAME].unique()
-            )
+        return list(
+            self._inventory_index.names_per_attribute.get(surface_attribute, [])
         )
 
     def surface_dates_for_attribute(
         self, surface_attribute: str
     ) -> Optional[List[str]]:
-        dates = sorted(
-            list(
-                self._inventory_df.loc[
-                    self._inventory_df[Col.ATTRIBUTE] == surface_attribute
-                ][Col.DATESTR].unique()
-            )
-        )
+        dates = self._inventory_index.dates_per_attribute.get(surface_attribute, [])
         if len(dates) == 1 and not bool(dates[0]):
             return None
 
-        return dates
+        return list(dates)
 
     def realizations(self) -> List[int]:
-        unique_reals = self._inventory_df[Col.REAL].unique()
-
-        # Sort and strip out any entries with real == -1
-        return sorted([r for r in unique_reals if r >= 0])
+        return list(self._inventory_index.realizations)
 
     def get_surface(
         self,
@@ -220,7 +369,6 @@ class ProviderImplFile(EnsembleSurfaceProvider):
     ) -> Optional[xtgeo.RegularSurface]:
         if isinstance(address, StatisticalSurfaceAddress):
             return self._get_or_create_statistical_surface(address)
-            # return self._create_statistical_surface(address)
         if isinstance(address, SimulatedSurfaceAddress):
             return self._get_simulated_surface(address)
         if isinstance(address, ObservedSurfaceAddress):
@@ -228,78 +376,161 @@ class ProviderImplFile(EnsembleSurfaceProvider):
 
         raise TypeError("Unknown type of surface address")
 
+    def get_statistical_surfaces(
+        self,
+        addresses: List[StatisticalSurfaceAddress],
+    ) -> List[Optional[xtgeo.RegularSurface]]:
+        # Group the addresses that share the same input surfaces so that the input
+        # surfaces only need to be loaded once per group
+        group_dict: Dict[Tuple[str, str, str, Tuple[int, ...]], List[int]] = {}
+        for idx, address in enumerate(addresses):
+            group_key = (
+                address.attribute,
+                address.name,
+                address.datestr if address.datestr is not None else "",
+                tuple(sorted(set(address.realizations))),
+            )
+            group_dict.setdefault(group_key, []).append(idx)
+
+        surf_arr: List[Optional[xtgeo.RegularSurface]] = [None] * len(addresses)
+        for idx_list in group_dict.values():
+            group_surfs = self._get_or_create_statistical_surfaces(
+                [addresses[idx] for idx in idx_list]
+            )
+            for idx, surf in zip(idx_list, group_surfs):
+                surf_arr[idx] = surf
+
+        return surf_arr
+
     def _get_or_create_statistical_surface(
         self, address: StatisticalSurfaceAddress
     ) -> Optional[xtgeo.RegularSurface]:
+        return self._get_or_create_statistical_surfaces([address])[0]
+
+    # pylint: disable=too-many-locals
+    def _get_or_create_statistical_surfaces(
+        self, addresses: List[StatisticalSurfaceAddress]
+    ) -> List[Optional[xtgeo.RegularSurface]]:
+        """All the addresses must refer to the same input surfaces, ie. they may only
+        differ in the requested statistic"""
         timer = PerfTimer()
 
-        surf = self._create_statistical_surface(address)
+        first_address = addresses[0]
+        surf_fns: List[str] = self._locate_simulated_surfaces(
+            attribute=first_address.attribute,
+            name=first_address.name,
+            datestr=first_address.datestr if first_address.datestr is not None else "",
+            realizations=first_address.realizations,
+        )
+
+        if len(surf_fns) == 0:
+            LOGGER.warning(
+                f"No input surfaces found for statistical surface {first_address}"
+            )
+            return [None] * len(addresses)
+
+        input_fingerprint: Optional[str] = None
+        if self._stat_surf_cache is not None:
+            try:
+                input_fingerprint = compose_input_fingerprint(
+                    first_address.realizations, surf_fns
+                )
+            except OSError as exc:
+                LOGGER.warning(
+                    f"Unable to fingerprint input surfaces for {first_address}: {exc}"
+                )
+
+        stat_surf_dict: Dict[SurfaceStatistic, Optional[xtgeo.RegularSurface]] = {}
+        if self._stat_surf_cache is not None and input_fingerprint is not None:
+            for address in addresses:
+                cached_surf = self._stat_surf_cache.fetch(address, input_fingerprint)
+                if cached_surf is not None:
+                    stat_surf_dict[address.statistic] = cached_surf
+        num_cached = len(stat_surf_dict)
+
+        missing_addresses = [
+            address for address in addresses if address.statistic not in stat_surf_dict
+        ]
+        if missing_addresses:
+            created_surf_dict = self._create_statistical_surfaces(
+                first_address,
+                list(dict.fromkeys(address.statistic for address in missing_addresses)),
+                surf_fns,
+            )
+            stat_surf_dict.update(created_surf_dict)
+
+            if self._stat_surf_cache is not None and input_fingerprint is not None:
+                for address in missing_addresses:
+                    created_surf = created_surf_dict.get(address.statistic)
+                    if created_surf is not None:
+                        self._stat_surf_cache.store(
+                            address, input_fingerprint, created_surf
+                        )
 
         LOGGER.debug(
-            f"Created statistical surface in: {timer.elapsed_s():.2f}s ("
-            f"[stat={address.statistic}, "
-            f"attr={address.attribute}, name={address.name}, date={address.datestr}]"
+            f"Got {len(addresses)} statistical surfaces in: {timer.elapsed_s():.2f}s ("
+            f"#from_cache={num_cached}, "
+            f"[stats={[address.statistic.value for address in addresses]}, "
+            f"attr={first_address.attribute}, name={first_address.name}, "
+            f"date={first_address.datestr}]"
         )
 
-        return surf
+        # Hand out copies if the same statistic was requested multiple times
+        surf_arr: List[Optional[xtgeo.RegularSurface]] = []
+        handed_out: Set[SurfaceStatistic] = set()
+        for address in addresses:
+            surf = stat_surf_dict.get(address.statistic)
+            if surf is not None and address.statistic in handed_out:
+                surf = surf.copy()
+            handed_out.add(address.statistic)
+            surf_arr.append(surf)
 
-    def _create_statistical_surface(
-        self, address: StatisticalSurfaceAddress
-    ) -> Optional[xtgeo.RegularSurface]:
-        surf_fns: List[str] = self._locate_simulated_surfaces(
+        return surf_arr
+
+    def _create_statistical_surfaces(
+        self,
+        address: StatisticalSurfaceAddress,
+        statistics: List[SurfaceStatistic],
+        surf_fns: List[str],
+    ) -> Dict[SurfaceStatistic, xtgeo.RegularSurface]:
+        timer = PerfTimer()
+
+        stacked = self._locate_stacked_simulated_surfaces(
             attribute=address.attribute,
             name=address.name,
             datestr=address.datestr if address.datestr is not None else "",
             realizations=address.realizations,
         )
-
-        if len(surf_fns) == 0:
-            LOGGER.warning(f"No input surfaces found for statistical surface {address}")
-            return None
-
-        timer = PerfTimer()
-
-        surfaces = xtgeo.Surfaces(surf_fns)
-        et_load_s = timer.lap_s()
-
-        surf_count = len(surfaces.surfaces)
-        if surf_count == 0:
-            LOGGER.warning(
-                f"Could not load input surfaces for statistical surface {address}"
+        if stacked is not None:
+            # Compute directly on the memory mapped values
+            stack_file, stacked_reals = stacked
+            values_stack = stack_file.values_for_realizations(stacked_reals)
+            template_surf = stack_file.create_surface(values_stack[0])
+        else:
+            template_surf, values_stack = _load_surfaces_into_stack(
+                surf_fns, self._io_concurrency
             )
-            return None
+        et_load_s = timer.lap_s()
 
-        # print("########################################################")
-        # first_surf = surfaces.surfaces[0]
-        # for surf in surfaces.surfaces:
-        #     print(
-        #         surf.dimensions,
-        #         surf.xinc,
-        #         surf.yinc,
-        #         surf.xori,
-        #         surf.yori,
-        #         surf.rotation,
-        #         surf.filesrc,
-        #     )
-        # print("########################################################")
-
-        # Suppress numpy warnings when surfaces have undefined z-values
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", "All-NaN slice encountered")
-            warnings.filterwarnings("ignore", "Mean of empty slice")
-            warnings.filterwarnings("ignore", "Degrees of freedom <= 0 for slice")
-
-            stat_surface = _calc_statistic_across_surfaces(address.statistic, surfaces)
+        stat_values_dict = _calc_statistics_from_stack(statistics, values_stack)
         et_calc_s = timer.lap_s()
 
+        stat_surf_dict: Dict[SurfaceStatistic, xtgeo.RegularSurface] = {}
+        for statistic, stat_values in stat_values_dict.items():
+            stat_surf = template_surf.copy()
+            stat_surf.values = stat_values
+            stat_surf_dict[statistic] = stat_surf
+
         LOGGER.debug(
-            f"Created statistical surface in: {timer.elapsed_s():.2f}s ("
+            f"Created statistical surfaces in: {timer.elapsed_s():.2f}s ("
             f"load={et_load_s:.2f}s, calc={et_calc_s:.2f}s), "
-            f"[#surfaces={surf_count}, stat={address.statistic}, "
+            f"[#surfaces={len(surf_fns)}, "
+            f"load_workers={self._io_concurrency.max_workers}, "
+            f"stats={[statistic.value for statistic in statistics]}, "
             f"attr={address.attribute}, name={address.name}, date={address.datestr}]"
         )
 
-        return stat_surface
+        return stat_surf_dict
 
     def _get_simulated_surface(
         self, address: SimulatedSurfaceAddress
@@ -308,6 +539,21 @@ class ProviderImplFile(EnsembleSurfaceProvider):
 
         timer = PerfTimer()
 
+        stacked = self._locate_stacked_simulated_surfaces(
+            attribute=address.attribute,
+            name=address.name,
+            datestr=address.datestr if address.datestr is not None else "",
+            realizations=[address.realization],
+        )
+        if stacked is not None:
+            stack_file, stacked_reals = stacked
+            real_idx = stack_file.index_of_realization(stacked_reals[0])
+            surf = stack_file.create_surface(stack_file.values[real_idx])
+            LOGGER.debug(
+                f"Loaded simulated surface from stack file in: {timer.elapsed_s():.2f}s"
+            )
+            return surf
+
         surf_fns: List[str] = self._locate_simulated_surfaces(
             attribute=address.attribute,
             name=address.name,
@@ -362,56 +608,45 @@ class ProviderImplFile(EnsembleSurfaceProvider):
         self, attribute: str, name: str, datestr: str, realizations: List[int]
     ) -> List[str]:
         """Returns list of file names matching the specified filter criteria"""
-        df = self._inventory_df.loc[
-            self._inventory_df[Col.TYPE] == SurfaceType.SIMULATED
-        ]
+        entries = self._inventory_index.find_entries(
+            (SurfaceType.SIMULATED, attribute, name, datestr), realizations
+        )
+        return [entry.path for entry in entries]
 
-        df = df.loc[
-            (df[Col.ATTRIBUTE] == attribute)
-            & (df[Col.NAME] == name)
-            & (df[Col.DATESTR] == datestr)
-            & (df[Col.REAL].isin(realizations))
-        ]
+    def _locate_stacked_simulated_surfaces(
+        self, attribute: str, name: str, datestr: str, realizations: List[int]
+    ) -> Optional[Tuple[SurfaceStackFile, List[int]]]:
+        """If all the simulated surfaces matching the filter criteria reside in the
+        same stack file, returns the stack file along with the sorted list of
+        matching realizations. Otherwise returns None."""
+        entries = self._inventory_index.find_entries(
+            (SurfaceType.SIMULATED, attribute, name, datestr), realizations
+        )
+        if not entries or any(entry.stack_index < 0 for entry in entries):
+            return None
 
-        df = df[[Col.REL_PATH, Col.ORIGINAL_PATH]]
+        rel_paths = {entry.rel_path for entry in entries}
+        if len(rel_paths) != 1:
+            return None
 
-        # Return file name within backing store if the surface was copied there,
-        # otherwise return the original source file name
-        fn_list: List[str] = []
-        for _index, row in df.iterrows():
-            if row[Col.REL_PATH]:
-                fn_list.append(self._provider_dir / row[Col.REL_PATH])
-            else:
-                fn_list.append(row[Col.ORIGINAL_PATH])
+        stack_file = self._get_stack_file(rel_paths.pop())
+        return stack_file, sorted({entry.real for entry in entries})
 
-        return fn_list
+    def _get_stack_file(self, rel_path: str) -> SurfaceStackFile:
+        stack_file = self._stack_files.get(rel_path)
+        if stack_file is None:
+            stack_file = SurfaceStackFile(self._provider_dir / rel_path)
+            self._stack_files[rel_path] = stack_file
+        return stack_file
 
     def _locate_observed_surfaces(
         self, attribute: str, name: str, datestr: str
     ) -> List[str]:
         """Returns file names of observed surfaces matching the criteria"""
-        df = self._inventory_df.loc[
-            self._inventory_df[Col.TYPE] == SurfaceType.OBSERVED
-        ]
-
-        df = df.loc[
-            (df[Col.ATTRIBUTE] == attribute)
-            & (df[Col.NAME] == name)
-            & (df[Col.DATESTR] == datestr)
-        ]
-
-        df = df[[Col.REL_PATH, Col.ORIGINAL_PATH]]
-
-        # Return file name within backing store if the surface was copied there,
-        # otherwise return the original source file name
-        fn_list: List[str] = []
-        for _index, row in df.iterrows():
-            if row[Col.REL_PATH]:
-                fn_list.append(self._provider_dir / row[Col.REL_PATH])
-            else:
-                fn_list.append(row[Col.ORIGINAL_PATH])
-
-        return fn_list
+        entries = self._inventory_index.find_entries(
+            (SurfaceType.OBSERVED, attribute, name, datestr), None
+        )
+        return [entry.path for entry in entries]
 
 
 def _find_observed_surfaces_corresponding_to_simulated(
@@ -441,14 +676,89 @@ def _copy_surfaces_into_provider_dir(
     original_path_arr: List[str],
     rel_path_arr: List[str],
     provider_dir: Path,
+    io_concurrency: IoConcurrencyConfig,
 ) -> None:
-    for src_path, dst_rel_path in zip(original_path_arr, rel_path_arr):
-        # LOGGER.debug(f"copying surface from: {src_path}")
-        shutil.copyfile(src_path, provider_dir / dst_rel_path)
+    timer = PerfTimer()
+
+    full_dst_path_arr = [provider_dir / dst_rel_path for dst_rel_path in rel_path_arr]
+    map_with_io_concurrency(
+        io_concurrency, shutil.copyfile, original_path_arr, full_dst_path_arr
+    )
 
-    # full_dst_path_arr = [storage_dir / dst_rel_path for dst_rel_path in store_path_arr]
-    # with ProcessPoolExecutor() as executor:
-    #     executor.map(shutil.copyfile, original_path_arr, full_dst_path_arr)
+    LOGGER.debug(
+        f"Copied {len(original_path_arr)} surfaces in: {timer.elapsed_s():.2f}s "
+        f"({io_concurrency.executor_type}, max_workers={io_concurrency.max_workers})"
+    )
+
+
+# pylint: disable=too-many-locals
+def _write_simulated_surfaces_into_stack_files(
+    sim_surfaces: List[SurfaceFileInfo],
+    provider_dir: Path,
+    io_concurrency: IoConcurrencyConfig,
+) -> Dict[str, Tuple[str, int]]:
+    """Packs all realizations of each simulated surface into a stack file.
+    Returns dict, keyed on original surface path, with the stack file path relative
+    to the provider directory and the index of the surface within the stack file.
+    Surfaces whose realizations differ in topology are skipped and will not be
+    present in the returned dict."""
+
+    timer = PerfTimer()
+
+    surfs_per_stack: Dict[Tuple[str, str, str], List[SurfaceFileInfo]] = {}
+    for surfinfo in sim_surfaces:
+        stack_key = (surfinfo.name, surfinfo.attribute, surfinfo.datestr or "")
+        surfs_per_stack.setdefault(stack_key, []).append(surfinfo)
+
+    stacked_surf_dict: Dict[str, Tuple[str, int]] = {}
+    for (name, attribute, datestr), surfinfos in surfs_per_stack.items():
+        surfinfos = sorted(surfinfos, key=lambda surfinfo: surfinfo.real)
+        realizations = [surfinfo.real for surfinfo in surfinfos]
+        if len(set(realizations)) != len(realizations):
+            LOGGER.warning(
+                f"Duplicate realizations for surface {name=}, {attribute=}, "
+                f"{datestr=}, will not be stacked"
+            )
+            continue
+
+        try:
+            template_surf, values_stack = _load_surfaces_into_stack(
+                [surfinfo.path for surfinfo in surfinfos], io_concurrency
+            )
+        except ValueError as exc:
+            LOGGER.warning(
+                f"Unable to stack surface {name=}, {attribute=}, {datestr=}: {exc}"
+            )
+            continue
+
+        rel_path_in_store = _compose_rel_sim_surf_stack_pathstr(
+            attribute=attribute, name=name, datestr=datestr
+        )
+        write_surface_stack_file(
+            provider_dir / rel_path_in_store, template_surf, realizations, values_stack
+        )
+        for stack_idx, surfinfo in enumerate(surfinfos):
+            stacked_surf_dict[surfinfo.path] = (rel_path_in_store, stack_idx)
+
+    LOGGER.debug(
+        f"Wrote {len(surfs_per_stack)} surface stack files with "
+        f"{len(stacked_surf_dict)} surfaces in: {timer.elapsed_s():.2f}s"
+    )
+
+    return stacked_surf_dict
+
+
+def _compose_rel_sim_surf_stack_pathstr(
+    attribute: str,
+    name: str,
+    datestr: Optional[str],
+) -> str:
+    """Compose path to surface stack file, relative to provider's directory"""
+    if datestr:
+        fname = f"{name}--{attribute}--{datestr}{SURFACE_STACK_FILE_EXTENSION}"
+    else:
+        fname = f"{name}--{attribute}{SURFACE_STACK_FILE_EXTENSION}"
+    return str(Path(REL_SIM_DIR) / fname)
 
 
 def _compose_rel_sim_surf_pathstr(
@@ -480,24 +790,126 @@ def _compose_rel_obs_surf_pathstr(
     return str(Path(REL_OBS_DIR) / fname)
 
 
-def _calc_statistic_across_surfaces(
-    statistic: SurfaceStatistic, surfaces: xtgeo.Surfaces
-) -> xtgeo.RegularSurface:
-    """Calculates a statistical surface from a list of Xtgeo surface instances"""
-
-    stat_surf: xtgeo.RegularSurface
+# Topology as checked by xtgeo.RegularSurface.compare_topology(strict=False)
+_SurfaceTopology = Tuple[int, int, float, float, float, float, float]
+
+
+def _load_surface_values_as_float32(
+    surf_fn: str,
+) -> Tuple[_SurfaceTopology, np.ndarray]:
+    """Worker function for loading a single surface.
+    Returns the surface topology along with its values, with undefined values set
+    to NaN. Returning plain arrays keeps the transfer cheap when using processes."""
+    surf = xtgeo.surface_from_file(surf_fn)
+    topology = (
+        surf.ncol,
+        surf.nrow,
+        surf.xori,
+        surf.yori,
+        surf.xinc,
+        surf.yinc,
+        surf.rotation,
+    )
+    values = np.ma.filled(surf.values, fill_value=np.nan).astype(np.float32)
+    return topology, values
+
+
+def _load_surfaces_into_stack(
+    surf_fns: List[str], io_concurrency: IoConcurrencyConfig
+) -> Tuple[xtgeo.RegularSurface, np.ndarray]:
+    """Loads the surfaces into a preallocated float32 array of shape
+    (nreal, ncol, nrow), with undefined values set to NaN. The surfaces are loaded
+    in parallel according to io_concurrency.
+    Returns the first surface, to be used as a template, along with the stack.
+    Raises ValueError if the surfaces differ in topology."""
+
+    timer = PerfTimer()
+
+    template_surf = xtgeo.surface_from_file(surf_fns[0])
+    template_topology = (
+        template_surf.ncol,
+        template_surf.nrow,
+        template_surf.xori,
+        template_surf.yori,
+        template_surf.xinc,
+        template_surf.yinc,
+        template_surf.rotation,
+    )
+    values_stack = np.empty(
+        (len(surf_fns), template_surf.ncol, template_surf.nrow), dtype=np.float32
+    )
+    values_stack[0] = np.ma.filled(template_surf.values, fill_value=np.nan)
+    et_load_template_ms = timer.lap_ms()
+
+    loaded_arr = map_with_io_concurrency(
+        io_concurrency, _load_surface_values_as_float32, surf_fns[1:]
+    )
+    et_load_rest_ms = timer.lap_ms()
+
+    for idx, (topology, values) in enumerate(loaded_arr, start=1):
+        if topology != template_topology:
+            raise ValueError("Cannot do statistics, surfaces differ in topology")
+        values_stack[idx] = values
+    et_stack_ms = timer.lap_ms()
+
+    LOGGER.debug(
+        f"Loaded {len(surf_fns)} surfaces into stack in: {timer.elapsed_ms()}ms ("
+        f"template={et_load_template_ms}ms, rest={et_load_rest_ms}ms, "
+        f"stack={et_stack_ms}ms, {io_concurrency.executor_type}, "
+        f"max_workers={io_concurrency.max_workers})"
+    )
+
+    return template_surf, values_stack
+
+
+_PERCENTILE_OF_STATISTIC = {
+    SurfaceStatistic.MINIMUM: 0,
+    SurfaceStatistic.P10: 10,
+    SurfaceStatistic.P90: 90,
+    SurfaceStatistic.MAXIMUM: 100,
+}
+
+
+def _calc_statistics_from_stack(
+    statistics: List[SurfaceStatistic], values_stack: np.ndarray
+) -> Dict[SurfaceStatistic, np.ma.MaskedArray]:
+    """Calculates the requested statistics across the realization axis of the
+    stacked surface values. Nodes that are undefined in any of the realizations
+    will be undefined in the resulting statistical values.
+    Minimum, maximum and the percentiles are all computed in one partitioning pass.
+    """
+
+    stat_values_dict: Dict[SurfaceStatistic, np.ndarray] = {}
+
+    # Suppress numpy warnings when surfaces have undefined z-values
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "All-NaN slice encountered")
+        warnings.filterwarnings("ignore", "Mean of empty slice")
+        warnings.filterwarnings("ignore", "Degrees of freedom <= 0 for slice")
+        warnings.filterwarnings("ignore", "invalid value encountered")
+
+        if SurfaceStatistic.MEAN in statistics:
+            stat_values_dict[SurfaceStatistic.MEAN] = np.asarray(
+                np.mean(values_stack, axis=0, dtype=np.float64)
+            )
+        if SurfaceStatistic.STDDEV in statistics:
+            stat_values_dict[SurfaceStatistic.STDDEV] = np.asarray(
+                np.std(values_stack, axis=0, dtype=np.float64)
+            )
 
-    if statistic == SurfaceStatistic.MEAN:
-        stat_surf = surfaces.apply(np.mean, axis=0)
-    elif statistic == SurfaceStatistic.STDDEV:
-        stat_surf = surfaces.apply(np.std, axis=0)
-    elif statistic == SurfaceStatistic.MINIMUM:
-        stat_surf = surfaces.apply(np.min, axis=0)
-    elif statistic == SurfaceStatistic.MAXIMUM:
-        stat_surf = surfaces.apply(np.max, axis=0)
-    elif statistic == SurfaceStatistic.P10:
-        stat_surf = surfaces.apply(np.percentile, 10, axis=0)
-    elif statistic == SurfaceStatistic.P90:
-        stat_surf = surfaces.apply(np.percentile, 90, axis=0)
+        percentile_stats = [
+            stat for stat in statistics if stat in _PERCENTILE_OF_STATISTIC
+        ]
+        if percentile_stats:
+            percentile_values = np.percentile(
+                values_stack,
+                [_PERCENTILE_OF_STATISTIC[stat] for stat in percentile_stats],
+                axis=0,
+            )
+            for stat, values in zip(percentile_stats, percentile_values):
+                stat_values_dict[stat] = values
 
-    return stat_surf
+    return {
+        stat: np.ma.masked_invalid(values.astype(np.float64, copy=False))
+        for stat, values in stat_values_dict.items()
+    }
@@ -1,11 +1,11 @@
-import datetime
 import hashlib
 import logging
 import os
-import pickle  # nosec
+import threading
 import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import xtgeo
 
@@ -25,66 +25,196 @@ FILE_EXTENSION = ".gri"
 
 
 class StatSurfCache:
-    def __init__(self, cache_dir: Path) -> None:
+    """Two tier cache for statistical surfaces.
+
+    Entries are content addressed, the key being composed from the statistical
+    surface address and a fingerprint of the input surfaces (see
+    `compose_input_fingerprint()`), so that a change in any of the input surfaces
+    will yield a new key. Recently used surfaces are kept in an in-memory LRU, in
+    front of an optional disk tier which is shared between processes. The disk tier
+    is capped in size and the least recently used files will be evicted first.
+    """
+
+    def __init__(
+        self, cache_dir: Optional[Path], max_mem_bytes: int, max_disk_bytes: int
+    ) -> None:
         self.cache_dir = cache_dir
+        self._max_mem_bytes = max_mem_bytes
+        self._max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._mem_entries: "OrderedDict[str, xtgeo.RegularSurface]" = OrderedDict()
+        self._mem_bytes = 0
 
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        placeholder_file = self.cache_dir / "placeholder.txt"
-        placeholder_file.write_text(
-            f"Placeholder -- {datetime.datetime.now()} -- {os.getpid()}"
-        )
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def fetch(
-        self, address: StatisticalSurfaceAddress
+        self, address: StatisticalSurfaceAddress, input_fingerprint: str
     ) -> Optional[xtgeo.RegularSurface]:
-        full_surf_path = self.cache_dir / _compose_stat_surf_file_name(
-            address, FILE_EXTENSION
+        surf_fn = _compose_stat_surf_file_name(
+            address, input_fingerprint, FILE_EXTENSION
+        )
+
+        with self._lock:
+            surf = self._mem_entries.get(surf_fn)
+            if surf is not None:
+                self._mem_entries.move_to_end(surf_fn)
+                return surf.copy()
+
+        surf = self._read_from_disk(surf_fn)
+        if surf is None:
+            return None
+
+        with self._lock:
+            self._add_to_mem(surf_fn, surf)
+
+        return surf.copy()
+
+    def store(
+        self,
+        address: StatisticalSurfaceAddress,
+        input_fingerprint: str,
+        surface: xtgeo.RegularSurface,
+    ) -> None:
+        surf_fn = _compose_stat_surf_file_name(
+            address, input_fingerprint, FILE_EXTENSION
         )
 
+        # Store a copy so that callers may freely modify the surface they got
+        surface = surface.copy()
+        with self._lock:
+            self._add_to_mem(surf_fn, surface)
+
+        self._write_to_disk(surf_fn, surface)
+
+    def _add_to_mem(self, surf_fn: str, surface: xtgeo.RegularSurface) -> None:
+        """Must be called with the lock held"""
+        old_surf = self._mem_entries.pop(surf_fn, None)
+        if old_surf is not None:
+            self._mem_bytes -= _surface_nbytes(old_surf)
+
+        self._mem_entries[surf_fn] = surface
+        self._mem_bytes += _surface_nbytes(surface)
+
+        while self._mem_bytes > self._max_mem_bytes and len(self._mem_entries) > 1:
+            _evicted_fn, evicted_surf = self._mem_entries.popitem(last=False)
+            self._mem_bytes -= _surface_nbytes(evicted_surf)
+
+    def _read_from_disk(self, surf_fn: str) -> Optional[xtgeo.RegularSurface]:
+        if self.cache_dir is None:
+            return None
+
+        full_surf_path = self.cache_dir / surf_fn
+        if not full_surf_path.is_file():
+            return None
+
         try:
             surf = xtgeo.surface_from_file(full_surf_path, fformat=FILE_FORMAT_READ)
+            # Touch the file so that eviction of the disk tier is done in LRU order
+            os.utime(full_surf_path)
             return surf
         # pylint: disable=bare-except
         except:
             return None
 
-    def store(
-        self, address: StatisticalSurfaceAddress, surface: xtgeo.RegularSurface
-    ) -> None:
-        surf_fn = _compose_stat_surf_file_name(address, FILE_EXTENSION)
+    def _write_to_disk(self, surf_fn: str, surface: xtgeo.RegularSurface) -> None:
+        if self.cache_dir is None:
+            return
+
         full_surf_path = self.cache_dir / surf_fn
 
-        # Try and go via a temporary file which we don't rename until writing is finished.
-        # to make the cache writing more concurrency-friendly.
+        # Go via a temporary file which we don't rename until writing is finished
+        # to make the cache writing concurrency-friendly. Since the file names are
+        # content addressed, it doesn't matter which process wins the rename.
         # One problem here is that we don't control the file handle (xtgeo does) so can't
         # enforce flush and sync of the file to disk before the rename :-(
-        # Still, we probably need a more robust way of shring the cached surfaces...
         tmp_surf_path = self.cache_dir / (surf_fn + f"__{uuid.uuid4().hex}.tmp")
         try:
             surface.to_file(tmp_surf_path, fformat=FILE_FORMAT_WRITE)
             os.replace(tmp_surf_path, full_surf_path)
         # pylint: disable=bare-except
         except:
-            os.remove(tmp_surf_path)
+            LOGGER.warning(f"Failed to write statistical surface to cache: {surf_fn}")
+            if tmp_surf_path.exists():
+                os.remove(tmp_surf_path)
+            return
+
+        self._evict_from_disk_if_needed()
+
+    def _evict_from_disk_if_needed(self) -> None:
+        """Delete the least recently used files until the disk tier is within its
+        size limit. Other processes may be doing the same, so tolerate files that
+        disappear underway."""
+        if self.cache_dir is None:
+            return
+
+        entries: List[os.DirEntry] = []
+        total_bytes = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(FILE_EXTENSION):
+                    continue
+                try:
+                    total_bytes += entry.stat().st_size
+                    entries.append(entry)
+                except FileNotFoundError:
+                    continue
+
+        if total_bytes <= self._max_disk_bytes:
+            return
+
+        num_evicted = 0
+        for entry in sorted(entries, key=_entry_mtime_or_zero):
+            if total_bytes <= self._max_disk_bytes:
+                break
+            try:
+                entry_bytes = entry.stat().st_size
+                os.remove(entry.path)
+                total_bytes -= entry_bytes
+                num_evicted += 1
+            except FileNotFoundError:
+                continue
+
+        LOGGER.debug(
+            f"Evicted {num_evicted} surfaces from statistical surface disk cache"
+        )
+
 
-        # surface.to_file(full_surf_path, fformat=FILE_FORMAT_WRITE)
+def compose_input_fingerprint(realizations: List[int], surf_fns: List[str]) -> str:
+    """Compose a fingerprint of the inputs to a statistical surface, consisting of
+    the sorted unique realizations and the path, size and modification time of each
+    input surface file.
+    """
+    reals_str = ",".join(str(real) for real in sorted(set(realizations)))
+    file_strs: List[str] = []
+    for surf_fn in sorted(str(fn) for fn in surf_fns):
+        stat_res = os.stat(surf_fn)
+        file_strs.append(f"{surf_fn}:{stat_res.st_size}:{stat_res.st_mtime_ns}")
+
+    # There is no security risk here and chances of collision should be very slim
+    return hashlib.md5("|".join([reals_str] + file_strs).encode()).hexdigest()  # nosec
 
 
 def _compose_stat_surf_file_name(
-    address: StatisticalSurfaceAddress, extension: str
+    address: StatisticalSurfaceAddress, input_fingerprint: str, extension: str
 ) -> str:
-    # Should probably sort the realization list
-    # Also, what about duplicates
-    # And further, handling of missing realizations...
-
-    pickled = pickle.dumps(address.realizations, pickle.HIGHEST_PROTOCOL)
-    real_hash = hashlib.md5(pickled).hexdigest()  # nosec
     return "--".join(
         [
             f"{address.statistic}",
             f"{address.name}",
             f"{address.attribute}",
             f"{address.datestr}",
-            f"{real_hash}{extension}",
+            f"{input_fingerprint}{extension}",
         ]
     )
+
+
+def _surface_nbytes(surface: xtgeo.RegularSurface) -> int:
+    return surface.values.nbytes + surface.values.mask.nbytes
+
+
+def _entry_mtime_or_zero(entry: os.DirEntry) -> int:
+    try:
+        return entry.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
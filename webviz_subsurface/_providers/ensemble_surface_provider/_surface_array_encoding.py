@@ -0,0 +1,51 @@
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._utils.enum_shim import StrEnum
+
+# Value used for undefined nodes in the UINT16 encoding
+UINT16_UNDEFINED_VALUE = 65535
+_UINT16_MAX_QUANTIZED_VALUE = UINT16_UNDEFINED_VALUE - 1
+
+
+class SurfaceArrayEncoding(StrEnum):
+    # 32 bit float per node, undefined nodes are NaN
+    FLOAT32 = "float32"
+    # 16 bit float per node, undefined nodes are NaN. Note the limited precision
+    # (about 3 significant digits) and range (abs values up to 65504)
+    FLOAT16 = "float16"
+    # Values quantized linearly to the range [0, 65534] between the surface's
+    # val_min and val_max, undefined nodes are 65535.
+    # Decode using: val_min + q * (val_max - val_min) / 65534
+    UINT16 = "uint16"
+
+
+def surface_to_encoded_array_bytes(
+    surface: xtgeo.RegularSurface,
+    encoding: SurfaceArrayEncoding,
+    val_min: float,
+    val_max: float,
+) -> bytes:
+    """Returns the surface values as raw bytes in the given encoding, rotated so
+    that rows run along the X axis starting from the bottom. The val_min and val_max
+    are only used by the UINT16 encoding and must be the min and max of the
+    surface's defined values.
+    """
+    masked_values = surface.values
+
+    if encoding == SurfaceArrayEncoding.UINT16:
+        value_range = val_max - val_min
+        scale = _UINT16_MAX_QUANTIZED_VALUE / value_range if value_range > 0 else 0.0
+        quantized = np.rint((np.ma.getdata(masked_values) - val_min) * scale)
+        quantized = np.clip(quantized, 0, _UINT16_MAX_QUANTIZED_VALUE)
+        values = np.where(
+            np.ma.getmaskarray(masked_values), UINT16_UNDEFINED_VALUE, quantized
+        ).astype(np.uint16)
+    else:
+        dtype = np.float16 if encoding == SurfaceArrayEncoding.FLOAT16 else np.float32
+        values = np.ma.filled(masked_values.astype(dtype), fill_value=np.nan)
+
+    # Rotate 90 deg left.
+    # This will cause the width of to run along the X axis
+    # and height of along Y axis (starting from bottom.)
+    return np.ascontiguousarray(np.rot90(values)).tobytes()
@@ -0,0 +1,153 @@
+import json
+import os
+import struct
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import xtgeo
+
+# Layout of a surface stack file:
+#   8 bytes       little endian uint64 with the byte length of the header
+#   header        UTF-8 encoded JSON, padded with spaces so that the data is aligned
+#   data          float32 array of shape (num_reals, ncol, nrow) in C order, with
+#                 undefined values stored as NaN
+SURFACE_STACK_FILE_EXTENSION = ".surfstack"
+
+_FORMAT_VERSION = 1
+_DATA_ALIGNMENT = 64
+_HEADER_LEN_STRUCT = struct.Struct("<Q")
+
+
+@dataclass(frozen=True)
+class SurfaceStackGeometry:
+    ncol: int
+    nrow: int
+    xori: float
+    yori: float
+    xinc: float
+    yinc: float
+    rotation: float
+    yflip: int
+
+
+class SurfaceStackFile:
+    """Read access to a file holding the surfaces of all realizations for a given
+    name, attribute and date, packed into one float32 array.
+
+    The array is memory mapped, so extracting the values of a single realization
+    is a zero-copy slice, and statistics can be computed directly on the array.
+    """
+
+    def __init__(self, file_name: Path) -> None:
+        with open(file_name, "rb") as file:
+            (header_len,) = _HEADER_LEN_STRUCT.unpack(
+                file.read(_HEADER_LEN_STRUCT.size)
+            )
+            header = json.loads(file.read(header_len).decode())
+
+        if header["version"] != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported surface stack file version {header['version']} in "
+                f"{file_name}"
+            )
+
+        self._geometry = SurfaceStackGeometry(**header["geometry"])
+        self._realizations: List[int] = header["realizations"]
+        self._real_to_index: Dict[int, int] = {
+            real: idx for idx, real in enumerate(self._realizations)
+        }
+        self._values: np.ndarray = np.memmap(
+            file_name,
+            dtype=np.float32,
+            mode="r",
+            offset=_HEADER_LEN_STRUCT.size + header_len,
+            shape=(len(self._realizations), self._geometry.ncol, self._geometry.nrow),
+        )
+
+    @property
+    def realizations(self) -> List[int]:
+        return self._realizations
+
+    @property
+    def values(self) -> np.ndarray:
+        """The memory mapped array of shape (num_reals, ncol, nrow)"""
+        return self._values
+
+    def index_of_realization(self, real: int) -> int:
+        return self._real_to_index[real]
+
+    def values_for_realizations(self, realizations: List[int]) -> np.ndarray:
+        """Returns the values for the specified realizations, stacked along the first
+        axis. This is a zero-copy view whenever the realizations make up a
+        contiguous, ascending run in the file."""
+        indices = [self._real_to_index[real] for real in realizations]
+        if indices and indices == list(range(indices[0], indices[0] + len(indices))):
+            return self._values[indices[0] : indices[0] + len(indices)]
+        return self._values[indices]
+
+    def create_surface(self, values: np.ndarray) -> xtgeo.RegularSurface:
+        """Create a surface with this file's geometry from an (ncol, nrow) array"""
+        geom = self._geometry
+        return xtgeo.RegularSurface(
+            ncol=geom.ncol,
+            nrow=geom.nrow,
+            xinc=geom.xinc,
+            yinc=geom.yinc,
+            xori=geom.xori,
+            yori=geom.yori,
+            yflip=geom.yflip,
+            rotation=geom.rotation,
+            values=np.ma.masked_invalid(values.astype(np.float64)),
+        )
+
+
+def write_surface_stack_file(
+    file_name: Path,
+    template_surf: xtgeo.RegularSurface,
+    realizations: List[int],
+    values_stack: np.ndarray,
+) -> None:
+    """Write a surface stack file, taking the geometry from template_surf.
+    The values_stack must have shape (len(realizations), ncol, nrow) and undefined
+    values must be NaN."""
+
+    geometry = SurfaceStackGeometry(
+        ncol=int(template_surf.ncol),
+        nrow=int(template_surf.nrow),
+        xori=float(template_surf.xori),
+        yori=float(template_surf.yori),
+        xinc=float(template_surf.xinc),
+        yinc=float(template_surf.yinc),
+        rotation=float(template_surf.rotation),
+        yflip=int(template_surf.yflip),
+    )
+    expected_shape = (len(realizations), geometry.ncol, geometry.nrow)
+    if values_stack.shape != expected_shape:
+        raise ValueError(
+            f"Shape of values {values_stack.shape} does not match {expected_shape}"
+        )
+
+    header_bytes = json.dumps(
+        {
+            "version": _FORMAT_VERSION,
+            "geometry": asdict(geometry),
+            "realizations": [int(real) for real in realizations],
+        }
+    ).encode()
+    unpadded_len = _HEADER_LEN_STRUCT.size + len(header_bytes)
+    header_bytes += b" " * (-unpadded_len % _DATA_ALIGNMENT)
+
+    # Go via a temporary file which we don't rename until writing is finished
+    tmp_file_name = file_name.with_name(file_name.name + f"__{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_file_name, "wb") as file:
+            file.write(_HEADER_LEN_STRUCT.pack(len(header_bytes)))
+            file.write(header_bytes)
+            np.ascontiguousarray(values_stack, dtype=np.float32).tofile(file)
+        os.replace(tmp_file_name, file_name)
+    finally:
+        if tmp_file_name.exists():
+            os.remove(tmp_file_name)
@@ -0,0 +1,88 @@
+import time
+from typing import Dict
+
+import numpy as np
+import xtgeo
+from dash import Dash, html
+
+from ._types import QualifiedSurfaceAddress
+from .ensemble_surface_provider import SimulatedSurfaceAddress
+from .surface_array_server import SurfaceArrayEncoding, SurfaceArrayServer
+
+
+def _create_synthetic_surface(ncol: int, nrow: int) -> xtgeo.RegularSurface:
+    rng = np.random.default_rng(seed=1234)
+    x_arr, y_arr = np.meshgrid(
+        np.linspace(0, 4 * np.pi, nrow), np.linspace(0, 3 * np.pi, ncol)
+    )
+    values = 1700 + 50 * np.sin(x_arr) * np.cos(y_arr) + rng.normal(0, 0.5, x_arr.shape)
+    # Undefined area in one corner, as is typical for real maps
+    mask = np.zeros(values.shape, dtype=bool)
+    mask[: ncol // 5, : nrow // 4] = True
+    masked_values = np.ma.masked_array(values, mask=mask)
+
+    return xtgeo.RegularSurface(
+        ncol=ncol, nrow=nrow, xinc=25.0, yinc=25.0, values=masked_values
+    )
+
+
+# pylint: disable=too-many-locals
+def main() -> None:
+    print()
+    print("## Running SurfaceArrayServer benchmark")
+    print("## =====================================")
+
+    app = Dash(__name__)
+    app.layout = html.Div()
+    server = SurfaceArrayServer(app)
+    client = app.server.test_client()
+
+    num_runs = 5
+    surface = _create_synthetic_surface(2000, 2000)
+    qualified_address = QualifiedSurfaceAddress(
+        provider_id="benchmark",
+        address=SimulatedSurfaceAddress(
+            attribute="depth", name="synthetic", datestr=None, realization=0
+        ),
+    )
+
+    for encoding in SurfaceArrayEncoding:
+        start_tim = time.perf_counter()
+        server.publish_surface(qualified_address, surface, encoding)
+        publish_ms = 1000 * (time.perf_counter() - start_tim)
+
+        url = SurfaceArrayServer.encode_partial_url(qualified_address, encoding)
+        for accept_encoding in ["identity", "gzip"]:
+            headers: Dict[str, str] = {"Accept-Encoding": accept_encoding}
+
+            best_ms = float("inf")
+            for _ in range(num_runs):
+                start_tim = time.perf_counter()
+                response = client.get(url, headers=headers)
+                best_ms = min(best_ms, 1000 * (time.perf_counter() - start_tim))
+            num_bytes = len(response.data)
+
+            headers["If-None-Match"] = response.headers["ETag"]
+            best_304_ms = float("inf")
+            for _ in range(num_runs):
+                start_tim = time.perf_counter()
+                response = client.get(url, headers=headers)
+                best_304_ms = min(best_304_ms, 1000 * (time.perf_counter() - start_tim))
+            assert response.status_code == 304
+
+            print(
+                f"## encoding={encoding.value:8s} accept={accept_encoding:8s} "
+                f"bytes={num_bytes / (1024 * 1024):6.2f}MB  "
+                f"request={best_ms:6.1f}ms  revalidate_304={best_304_ms:5.1f}ms  "
+                f"(publish={publish_ms:.0f}ms)"
+            )
+
+    print("## done")
+
+
+# pylint: disable=line-too-long
+# Running:
+#   python -m webviz_subsurface._providers.ensemble_surface_provider.dev_surface_array_server_perf_testing
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -83,6 +83,16 @@ class EnsembleSurfaceProvider(abc.ABC):
     ) -> Optional[xtgeo.RegularSurface]:
         """Returns a surface for a given surface address"""
 
+    def get_statistical_surfaces(
+        self,
+        addresses: List[StatisticalSurfaceAddress],
+    ) -> List[Optional[xtgeo.RegularSurface]]:
+        """Returns statistical surfaces for a list of addresses, in the same order as
+        the addresses. Implementations may compute all the statistics requested for
+        the same input surfaces in one go, which is typically much faster than
+        requesting the surfaces one by one."""
+        return [self.get_surface(address) for address in addresses]
+
     # @abc.abstractmethod
     # def get_surface_bounds(self, surface: EnsembleSurfaceContext) -> List[float]:
     #     """Returns the bounds for a surface [xmin,ymin, xmax,ymax]"""
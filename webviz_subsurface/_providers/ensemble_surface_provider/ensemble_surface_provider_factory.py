@@ -10,7 +10,9 @@ from webviz_config.webviz_instance_info import WebvizRunMode
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ._io_concurrency import IoConcurrencyConfig, io_concurrency_config_from_env
 from ._provider_impl_file import ProviderImplFile
+from ._stat_surf_cache import StatSurfCache
 from ._surface_discovery import (
     discover_observed_surface_files,
     discover_per_realization_surface_files,
@@ -19,6 +21,11 @@ from .ensemble_surface_provider import EnsembleSurfaceProvider
 
 LOGGER = logging.getLogger(__name__)
 
+# Size limits for the cache of statistical surfaces. The memory limit is per process,
+# while the disk limit applies to the cache directory shared by all processes.
+_STAT_SURF_CACHE_MAX_MEM_BYTES = 256 * 1024 * 1024
+_STAT_SURF_CACHE_MAX_DISK_BYTES = 2 * 1024 * 1024 * 1024
+
 
 class EnsembleSurfaceProviderFactory(WebvizFactory):
     def __init__(
@@ -26,18 +33,33 @@ class EnsembleSurfaceProviderFactory(WebvizFactory):
         root_storage_folder: Path,
         allow_storage_writes: bool,
         avoid_copying_surfaces: bool,
+        io_concurrency: IoConcurrencyConfig = IoConcurrencyConfig(),
     ) -> None:
         self._storage_dir = Path(root_storage_folder) / __name__
         self._allow_storage_writes = allow_storage_writes
         self._avoid_copying_surfaces = avoid_copying_surfaces
+        self._io_concurrency = io_concurrency
 
         LOGGER.info(
-            f"EnsembleSurfaceProviderFactory init: storage_dir={self._storage_dir}"
+            f"EnsembleSurfaceProviderFactory init: storage_dir={self._storage_dir}, "
+            f"io_concurrency={self._io_concurrency}"
         )
 
         if self._allow_storage_writes:
             os.makedirs(self._storage_dir, exist_ok=True)
 
+        # The statistical surface cache is content addressed, so it can safely be
+        # shared between all the providers created by this factory
+        self._stat_surf_cache = StatSurfCache(
+            cache_dir=(
+                self._storage_dir / "stat_surf_cache"
+                if self._allow_storage_writes
+                else None
+            ),
+            max_mem_bytes=_STAT_SURF_CACHE_MAX_MEM_BYTES,
+            max_disk_bytes=_STAT_SURF_CACHE_MAX_DISK_BYTES,
+        )
+
     @staticmethod
     def instance() -> "EnsembleSurfaceProviderFactory":
         """Static method to access the singleton instance of the factory."""
@@ -53,6 +75,7 @@ class EnsembleSurfaceProviderFactory(WebvizFactory):
                 root_storage_folder=storage_folder,
                 allow_storage_writes=allow_writes,
                 avoid_copying_surfaces=dont_copy_surfs,
+                io_concurrency=io_concurrency_config_from_env(),
             )
 
             # Store the factory object in the global factory registry
@@ -76,7 +99,12 @@ class EnsembleSurfaceProviderFactory(WebvizFactory):
             )
         )
         storage_key = f"ens__{_make_hash_string(string_to_hash)}"
-        provider = ProviderImplFile.from_backing_store(self._storage_dir, storage_key)
+        provider = ProviderImplFile.from_backing_store(
+            self._storage_dir,
+            storage_key,
+            self._stat_surf_cache,
+            self._io_concurrency,
+        )
         if provider:
             LOGGER.info(
                 f"Loaded surface provider from backing store in {timer.elapsed_s():.2f}s ("
@@ -105,10 +133,16 @@ class EnsembleSurfaceProviderFactory(WebvizFactory):
             sim_surfaces=sim_surface_files,
             obs_surfaces=obs_surface_files,
             avoid_copying_surfaces=self._avoid_copying_surfaces,
+            io_concurrency=self._io_concurrency,
         )
         et_write_s = timer.lap_s()
 
-        provider = ProviderImplFile.from_backing_store(self._storage_dir, storage_key)
+        provider = ProviderImplFile.from_backing_store(
+            self._storage_dir,
+            storage_key,
+            self._stat_surf_cache,
+            self._io_concurrency,
+        )
         if not provider:
             raise ValueError(f"Failed to load/create surface provider for {ens_path}")
 
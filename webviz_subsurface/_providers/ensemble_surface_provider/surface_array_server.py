@@ -1,21 +1,23 @@
+import gzip
 import hashlib
-import io
 import json
 import logging
 import math
-import tempfile
 from dataclasses import asdict, dataclass
 from typing import List, Optional, Tuple, Union
 from urllib.parse import quote
 
 import flask
-import flask_caching
 import xtgeo
 from dash import Dash
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
+from webviz_subsurface._utils.publish_store import get_publish_store
 
-from ._surface_to_float32_array import surface_to_float32_array
+from ._surface_array_encoding import (
+    SurfaceArrayEncoding,
+    surface_to_encoded_array_bytes,
+)
 from ._types import QualifiedDiffSurfaceAddress, QualifiedSurfaceAddress
 from .ensemble_surface_provider import (
     ObservedSurfaceAddress,
@@ -30,6 +32,15 @@ _ROOT_URL_PATH = "/SurfaceArrayServer"
 
 _SURFACE_SERVER_INSTANCE: Optional["SurfaceArrayServer"] = None
 
+# The arrays are compressed once when published, and both the compressed and the
+# uncompressed bytes are stored, so that requests are served without any compression
+# or decompression. Level 6 is the usual tradeoff between speed and size.
+_GZIP_COMPRESSLEVEL = 6
+
+# Content at a given URL never changes during the lifetime of the server, but the
+# URLs may be reused after a restart, so let clients revalidate using the ETag.
+_CACHE_CONTROL = "no-cache"
+
 
 @dataclass(frozen=True)
 class SurfaceArrayMeta:
@@ -48,18 +59,16 @@ class SurfaceArrayMeta:
     y_inc: float
 
 
+@dataclass(frozen=True)
+class _EncodedArray:
+    identity_bytes: bytes
+    gzipped_bytes: bytes
+    etag: str
+
+
 class SurfaceArrayServer:
     def __init__(self, app: Dash) -> None:
-        cache_dir = tempfile.mkdtemp()
-        LOGGER.debug(f"Setting up file cache in: {cache_dir}")
-        self._array_cache = flask_caching.Cache(
-            config={
-                "CACHE_TYPE": "FileSystemCache",
-                "CACHE_DIR": cache_dir,
-                "CACHE_DEFAULT_TIMEOUT": 0,
-            }
-        )
-        self._array_cache.init_app(app.server)
+        self._array_cache = get_publish_store("SurfaceArrayServer")
 
         self._setup_url_rule(app)
 
@@ -77,7 +86,10 @@ class SurfaceArrayServer:
         self,
         qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
         surface: xtgeo.RegularSurface,
+        encoding: SurfaceArrayEncoding = SurfaceArrayEncoding.FLOAT32,
     ) -> None:
+        """Publish surface so that it can be fetched through the URL returned by
+        encode_partial_url() using the same encoding."""
         timer = PerfTimer()
 
         if isinstance(qualified_address, QualifiedSurfaceAddress):
@@ -94,10 +106,10 @@ class SurfaceArrayServer:
 
         LOGGER.debug(
             f"Publishing surface (dim={surface.dimensions}, #cells={surface.ncol*surface.nrow}), "
-            f"[base_cache_key={base_cache_key}]"
+            f"[base_cache_key={base_cache_key}, encoding={encoding}]"
         )
 
-        self._create_and_store_array_in_cache(base_cache_key, surface)
+        self._create_and_store_array_in_cache(base_cache_key, surface, encoding)
 
         LOGGER.debug(f"Surface published in: {timer.elapsed_s():.2f}s")
 
@@ -131,6 +143,7 @@ class SurfaceArrayServer:
     @staticmethod
     def encode_partial_url(
         qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
+        encoding: SurfaceArrayEncoding = SurfaceArrayEncoding.FLOAT32,
     ) -> str:
         if isinstance(qualified_address, QualifiedSurfaceAddress):
             address_str = _address_to_str(
@@ -145,6 +158,8 @@ class SurfaceArrayServer:
             )
 
         url_path: str = f"{_ROOT_URL_PATH}/{quote(address_str)}"
+        if encoding != SurfaceArrayEncoding.FLOAT32:
+            url_path += f"?encoding={encoding}"
         return url_path
 
     def _setup_url_rule(self, app: Dash) -> None:
@@ -157,21 +172,54 @@ class SurfaceArrayServer:
 
             timer = PerfTimer()
 
-            array_cache_key = "ARRAY:" + full_surf_address_str
+            try:
+                encoding = SurfaceArrayEncoding(
+                    flask.request.args.get("encoding", SurfaceArrayEncoding.FLOAT32)
+                )
+            except ValueError:
+                flask.abort(400)
+
+            array_cache_key = _compose_array_cache_key(full_surf_address_str, encoding)
             LOGGER.debug(f"Looking for array in cache (key={array_cache_key}")
 
-            cached_array_bytes = self._array_cache.get(array_cache_key)
-            if not cached_array_bytes:
+            encoded_array = self._array_cache.get(array_cache_key)
+            if not isinstance(encoded_array, _EncodedArray):
                 LOGGER.error(
                     f"Error getting array for address: {full_surf_address_str}"
                 )
                 flask.abort(404)
 
-            response = flask.send_file(
-                cached_array_bytes, mimetype="application/octet-stream"
+            content_coding = flask.request.accept_encodings.best_match(
+                ["gzip"], default="identity"
             )
+
+            # Strong ETags must differ between content codings of the same resource
+            etag = encoded_array.etag
+            if content_coding != "identity":
+                etag += f"-{content_coding}"
+
+            if flask.request.if_none_match.contains(etag):
+                response = flask.Response(status=304)
+                _set_caching_headers(response, etag)
+                LOGGER.debug(
+                    f"Request handled as not modified in: {timer.elapsed_s():.2f}s"
+                )
+                return response
+
+            if content_coding == "gzip":
+                body = encoded_array.gzipped_bytes
+            else:
+                body = encoded_array.identity_bytes
+
+            response = flask.Response(body, mimetype="application/octet-stream")
+            if content_coding != "identity":
+                response.headers["Content-Encoding"] = content_coding
+            _set_caching_headers(response, etag)
+
             LOGGER.debug(
-                f"Request handled from array cache in: {timer.elapsed_s():.2f}s"
+                f"Request handled from array cache in: {timer.elapsed_s():.2f}s "
+                f"(encoding={encoding}, content_coding={content_coding}, "
+                f"#bytes={len(body)})"
             )
             return response
 
@@ -179,17 +227,9 @@ class SurfaceArrayServer:
         self,
         base_cache_key: str,
         surface: xtgeo.RegularSurface,
+        encoding: SurfaceArrayEncoding,
     ) -> None:
         timer = PerfTimer()
-        LOGGER.debug("Converting surface to float32 array...")
-        array_bytes: io.BytesIO = surface_to_float32_array(surface)
-
-        et_to_array_s = timer.lap_s()
-
-        array_cache_key = "ARRAY:" + base_cache_key
-        meta_cache_key = "META:" + base_cache_key
-
-        self._array_cache.add(array_cache_key, array_bytes)
 
         meta = SurfaceArrayMeta(
             x_min=surface.xmin,
@@ -206,16 +246,51 @@ class SurfaceArrayServer:
             x_inc=surface.xinc,
             y_inc=surface.yinc,
         )
-        self._array_cache.add(meta_cache_key, meta)
+        self._array_cache.put("META:" + base_cache_key, meta)
+
+        LOGGER.debug(f"Converting surface to {encoding} array...")
+        # Quantize using the published min/max so that the clients can decode
+        array_bytes = surface_to_encoded_array_bytes(
+            surface, encoding, meta.val_min, meta.val_max
+        )
+        et_to_array_s = timer.lap_s()
+
+        gzipped_bytes = gzip.compress(array_bytes, compresslevel=_GZIP_COMPRESSLEVEL)
+        et_compress_s = timer.lap_s()
+
+        array_cache_key = _compose_array_cache_key(base_cache_key, encoding)
+        # There is no security risk here and chances of collision should be very slim
+        etag = hashlib.md5(  # nosec
+            array_cache_key.encode() + hashlib.md5(array_bytes).digest()  # nosec
+        ).hexdigest()
+        self._array_cache.put(
+            array_cache_key, _EncodedArray(array_bytes, gzipped_bytes, etag)
+        )
         et_write_cache_s = timer.lap_s()
 
         LOGGER.debug(
             f"Created surface array and wrote to cache in in: {timer.elapsed_s():.2f}s ("
-            f"to_array={et_to_array_s:.2f}s, write_cache={et_write_cache_s:.2f}s), "
-            f"[base_cache_key={base_cache_key}]"
+            f"to_array={et_to_array_s:.2f}s, compress={et_compress_s:.2f}s, "
+            f"write_cache={et_write_cache_s:.2f}s), "
+            f"[base_cache_key={base_cache_key}, encoding={encoding}, "
+            f"#bytes={len(array_bytes)}, #gzipped_bytes={len(gzipped_bytes)}]"
         )
 
 
+def _compose_array_cache_key(
+    base_cache_key: str, encoding: SurfaceArrayEncoding
+) -> str:
+    if encoding == SurfaceArrayEncoding.FLOAT32:
+        return "ARRAY:" + base_cache_key
+    return f"ARRAY:{encoding}:" + base_cache_key
+
+
+def _set_caching_headers(response: flask.Response, etag: str) -> None:
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    response.vary.add("Accept-Encoding")
+
+
 def _address_to_str(
     provider_id: str,
     address: SurfaceAddress,
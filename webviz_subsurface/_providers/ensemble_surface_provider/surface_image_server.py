@@ -3,17 +3,16 @@ import io
 import json
 import logging
 import math
-import tempfile
 from dataclasses import asdict, dataclass
-from typing import Any, List, Optional, Tuple, Union
+from typing import List, Optional, Tuple, Union
 from urllib.parse import quote
 
 import flask
-import flask_caching
 import xtgeo
 from dash import Dash
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
+from webviz_subsurface._utils.publish_store import get_publish_store
 
 from ._surface_to_image import surface_to_png_bytes_optimized
 from ._types import QualifiedDiffSurfaceAddress, QualifiedSurfaceAddress
@@ -45,16 +44,7 @@ class SurfaceImageMeta:
 
 class SurfaceImageServer:
     def __init__(self, app: Dash) -> None:
-        cache_dir = tempfile.mkdtemp()
-        LOGGER.debug(f"Setting up file cache in: {cache_dir}")
-        self._image_cache = flask_caching.Cache(
-            config={
-                "CACHE_TYPE": "FileSystemCache",
-                "CACHE_DIR": cache_dir,
-                "CACHE_DEFAULT_TIMEOUT": 0,
-            }
-        )
-        self._image_cache.init_app(app.server)
+        self._image_cache = get_publish_store("SurfaceImageServer")
 
         self._setup_url_rule(app)
 
@@ -155,7 +145,7 @@ class SurfaceImageServer:
             img_cache_key = "IMG:" + full_surf_address_str
             LOGGER.debug(f"Looking for image in cache (key={img_cache_key}")
 
-            cached_img_bytes: Any = self._image_cache.get(img_cache_key)
+            cached_img_bytes = self._image_cache.get(img_cache_key)
             if not cached_img_bytes:
                 LOGGER.error(
                     f"Error getting image for address: {full_surf_address_str}"
@@ -184,7 +174,7 @@ class SurfaceImageServer:
         img_cache_key = "IMG:" + base_cache_key
         meta_cache_key = "META:" + base_cache_key
 
-        self._image_cache.add(img_cache_key, png_bytes)
+        self._image_cache.put(img_cache_key, png_bytes)
 
         # For debugging rotations
         # unrot_surf = surface.copy()
@@ -203,7 +193,7 @@ class SurfaceImageServer:
             deckgl_bounds=deckgl_bounds,
             deckgl_rot_deg=deckgl_rot,
         )
-        self._image_cache.add(meta_cache_key, meta)
+        self._image_cache.put(meta_cache_key, meta)
         et_write_cache_s = timer.lap_s()
 
         LOGGER.debug(
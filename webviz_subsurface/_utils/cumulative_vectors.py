@@ -0,0 +1,72 @@
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+PER_DAY_PREFIX = "PER_DAY_"
+PER_INTERVAL_PREFIX = "PER_INTVL_"
+
+
+def split_per_interval_or_per_day_vector_name(
+    vector_name: str,
+) -> Optional[Tuple[str, bool]]:
+    """Split name of vector calculated from cumulative, i.e. "PER_INTVL_<vector>" or
+    "PER_DAY_<vector>", into the name of the cumulative vector and a flag telling if it
+    is a per day vector.
+
+    Returns None if the vector name has neither of the prefixes.
+    """
+    if vector_name.startswith(PER_DAY_PREFIX):
+        return vector_name[len(PER_DAY_PREFIX) :], True
+    if vector_name.startswith(PER_INTERVAL_PREFIX):
+        return vector_name[len(PER_INTERVAL_PREFIX) :], False
+    return None
+
+
+def calc_from_cumulative_values(
+    dates: np.ndarray,
+    reals: np.ndarray,
+    cumulative_values: Mapping[str, np.ndarray],
+    as_per_day: bool,
+) -> Dict[str, np.ndarray]:
+    """Calculate interval delta or average per day values from cumulative values.
+
+    The arrays must be sorted on realization, then date, as the rows of the ensemble
+    summary providers. The value at a date is the change from that date to the next
+    date of the same realization. The value at the last date of each realization is 0,
+    and NaN deltas are set to 0.
+
+    For per day values the interval delta is divided by the number of whole days in
+    the interval. The realization boundaries are found once, and each vector is
+    calculated in a single vectorized pass.
+
+    `Input:`
+    * dates: np.ndarray - Dates of datetime64 dtype
+    * reals: np.ndarray - Realization number of each row
+    * cumulative_values: Mapping - Vector name as key and cumulative values as value
+
+    `Returns:`
+    * Dict with vector name as key and the calculated values as value
+    """
+    num_rows = len(reals)
+
+    # Intervals from a row to the next row within the same realization
+    is_interval_in_real = reals[1:] == reals[:-1]
+
+    interval_days: Optional[np.ndarray] = None
+    if as_per_day:
+        interval_days = (dates[1:] - dates[:-1]) // np.timedelta64(1, "D")
+
+    calculated_values: Dict[str, np.ndarray] = {}
+    for vector_name, values in cumulative_values.items():
+        values = np.asarray(values, dtype=np.float64)
+        interval_values = np.diff(values)
+        interval_values[np.isnan(interval_values)] = 0
+        if interval_days is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                interval_values = interval_values / interval_days
+
+        result = np.zeros(num_rows)
+        result[:-1] = np.where(is_interval_in_real, interval_values, 0)
+        calculated_values[vector_name] = result
+
+    return calculated_values
@@ -91,6 +91,72 @@ def make_date_column_datetime_object(df: pd.DataFrame) -> None:
     )
 
 
+def is_date_column_datetime64(df: pd.DataFrame) -> bool:
+    """Check if date column is of numpy datetime64[ms] dtype
+
+    Raise ValueError if date column is missing
+
+    `NOTE:`
+    - The check is performed on the column dtype, thus also for dataframe without rows
+    - Only millisecond resolution is accepted, i.e. datetime64[ns] columns as created by
+    default by pandas from pd.Timestamp elements give False
+    """
+    if "DATE" not in df.columns:
+        raise ValueError('df does not contain column "DATE"')
+
+    return df["DATE"].dtype == np.dtype("datetime64[ms]")
+
+
+def assert_date_column_is_datetime_object_or_datetime64(df: pd.DataFrame) -> None:
+    """Check if date column is on datetime.datetime format or of numpy datetime64[ms] dtype
+
+    Raise ValueError if date column is missing, or is on neither of the formats.
+    See assert_date_column_is_datetime_object() for details on the datetime.datetime check.
+    """
+    if is_date_column_datetime64(df):
+        return None
+
+    assert_date_column_is_datetime_object(df)
+    return None
+
+
+def make_date_column_datetime64(df: pd.DataFrame) -> None:
+    """Convert date column to numpy datetime64[ms] dtype
+
+    Handles "DATE" column with datetime.datetime or pd.Timestamp elements, and columns
+    of datetime64 dtype with any resolution. Millisecond resolution is used to be
+    aligned with the storage type in the arrow files, and as it covers dates beyond
+    year 2262, which is the limit for nanosecond resolution.
+
+    `NOTE:`
+    - Conversion is performed also when no rows, to obtain correct column dtype
+    """
+    if "DATE" not in df.columns:
+        raise ValueError('df does not contain column "DATE"')
+
+    if is_date_column_datetime64(df):
+        return None
+
+    df["DATE"] = pd.Series(
+        df["DATE"].to_numpy().astype("datetime64[ms]"), index=df.index
+    )
+    return None
+
+
+def make_date_column_datetime_object_or_datetime64(
+    df: pd.DataFrame, as_datetime64: bool
+) -> None:
+    """Convert date column to numpy datetime64[ms] dtype if as_datetime64 is True,
+    otherwise to datetime.datetime format.
+
+    Convenience for functions preserving the date format of their input dataframe.
+    """
+    if as_datetime64:
+        make_date_column_datetime64(df)
+    else:
+        make_date_column_datetime_object(df)
+
+
 def correlate_response_with_dataframe(
     df: pd.DataFrame, response: str, corrwith: Optional[list] = None
 ) -> pd.Series:
@@ -0,0 +1,136 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _make_sorted_keys(
+    key_codes: Sequence[np.ndarray], key_sizes: Sequence[int]
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Combine integer key codes into one int64 key per row, in lexicographical order of
+    the key codes, and sort the keys if needed.
+
+    Returns the sorted keys, and the row order used for sorting. The row order is None
+    when the rows already are in sorted order, as for the rows of the providers.
+    """
+    keys = np.zeros(len(key_codes[0]), dtype=np.int64)
+    for codes, size in zip(key_codes, key_sizes):
+        keys = keys * size + codes
+
+    if np.all(keys[1:] > keys[:-1]):
+        return keys, None
+
+    row_order = np.argsort(keys, kind="stable")
+    return keys[row_order], row_order
+
+
+def find_matching_rows(
+    keys_a: Sequence[np.ndarray], keys_b: Sequence[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the rows with equal key in a and b, i.e. an inner join on the key columns.
+
+    Each key is given as one or more columns, e.g. (REAL, DATE), and is assumed to be
+    unique among the rows. The unique values of each key column are found once for a and
+    b combined by hashing, and the rows are joined by a binary search among the sorted
+    keys of b.
+
+    `Returns:`
+    * Row indices into a and row indices into b for the matching keys, sorted on the key
+    columns in the given column order
+    """
+    # pylint: disable=too-many-locals
+    key_codes_a: List[np.ndarray] = []
+    key_codes_b: List[np.ndarray] = []
+    key_sizes: List[int] = []
+    for column_a, column_b in zip(keys_a, keys_b):
+        codes, uniques = pd.factorize(np.concatenate([column_a, column_b]), sort=True)
+        key_codes_a.append(codes[: len(column_a)])
+        key_codes_b.append(codes[len(column_a) :])
+        key_sizes.append(len(uniques))
+
+    sorted_keys_a, row_order_a = _make_sorted_keys(key_codes_a, key_sizes)
+    sorted_keys_b, row_order_b = _make_sorted_keys(key_codes_b, key_sizes)
+
+    pos_in_b = np.searchsorted(sorted_keys_b, sorted_keys_a)
+    pos_in_b[pos_in_b == len(sorted_keys_b)] = 0
+    is_match = (
+        sorted_keys_b[pos_in_b] == sorted_keys_a
+        if len(sorted_keys_b) > 0
+        else np.zeros(len(sorted_keys_a), dtype=bool)
+    )
+
+    rows_a = np.flatnonzero(is_match)
+    rows_b = pos_in_b[is_match]
+    if row_order_a is not None:
+        rows_a = row_order_a[rows_a]
+    if row_order_b is not None:
+        rows_b = row_order_b[rows_b]
+    return rows_a, rows_b
+
+
+def create_delta_vectors_df(
+    vectors_a_df: pd.DataFrame,
+    vectors_b_df: pd.DataFrame,
+    vector_names: Sequence[str],
+) -> pd.DataFrame:
+    """Create dataframe with delta vectors A-B, for the DATE-REAL combinations present in
+    both dataframes.
+
+    Replacement for subtracting the dataframes with a ["DATE", "REAL"] MultiIndex and
+    dropping NaN values. The rows are joined once on the key columns, and all vectors are
+    subtracted as contiguous numpy arrays. Rows where any of the delta vectors is NaN
+    are excluded.
+
+    The dataframes must contain a "REAL" column in addition to the vector columns, and
+    optionally a "DATE" column. The dates of the result are taken from A, thus the caller
+    should ensure the wanted format of the "DATE" column.
+
+    `Returns:`
+    * DataFrame with columns ["DATE", "REAL", vector1, ..., vectorN], or ["REAL",
+    vector1, ..., vectorN] without "DATE" column in input, sorted on "REAL" and
+    thereafter "DATE" as for the ensemble summary providers
+    """
+    # pylint: disable=too-many-locals
+    key_columns = ["REAL"]
+    if "DATE" in vectors_a_df.columns and "DATE" in vectors_b_df.columns:
+        key_columns.append("DATE")
+
+    keys_a = [vectors_a_df[column].to_numpy() for column in key_columns]
+    keys_b = [vectors_b_df[column].to_numpy() for column in key_columns]
+    if "DATE" in key_columns and keys_a[1].dtype != keys_b[1].dtype:
+        # Join on equal date format, e.g. datetime.datetime and datetime64
+        keys_a[1] = keys_a[1].astype("datetime64[ms]")
+        keys_b[1] = keys_b[1].astype("datetime64[ms]")
+
+    rows_a, rows_b = find_matching_rows(keys_a, keys_b)
+    is_rows_a_aligned = np.array_equal(rows_a, np.arange(vectors_a_df.shape[0]))
+    is_rows_b_aligned = np.array_equal(rows_b, np.arange(vectors_b_df.shape[0]))
+
+    def _matching_values(
+        df: pd.DataFrame, vector_name: str, rows: np.ndarray, is_aligned: bool
+    ) -> np.ndarray:
+        values = df[vector_name].to_numpy(dtype=np.float64, na_value=np.nan)
+        return values if is_aligned else values[rows]
+
+    # Subtract each vector as a contiguous array, and exclude rows with any NaN value
+    vector_columns = list(dict.fromkeys(vector_names))
+    delta_values: Dict[str, np.ndarray] = {}
+    is_valid_row = np.ones(len(rows_a), dtype=bool)
+    for vector_name in vector_columns:
+        delta_values[vector_name] = _matching_values(
+            vectors_a_df, vector_name, rows_a, is_rows_a_aligned
+        ) - _matching_values(vectors_b_df, vector_name, rows_b, is_rows_b_aligned)
+        is_valid_row &= ~np.isnan(delta_values[vector_name])
+
+    has_invalid_rows = not is_valid_row.all()
+    if has_invalid_rows:
+        rows_a = rows_a[is_valid_row]
+
+    columns: Dict[str, np.ndarray] = {}
+    if "DATE" in key_columns:
+        columns["DATE"] = vectors_a_df["DATE"].to_numpy()[rows_a]
+    columns["REAL"] = vectors_a_df["REAL"].to_numpy()[rows_a]
+    for vector_name, values in delta_values.items():
+        columns[vector_name] = values[is_valid_row] if has_invalid_rows else values
+
+    return pd.DataFrame(columns)
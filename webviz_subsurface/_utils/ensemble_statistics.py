@@ -0,0 +1,187 @@
+import warnings
+from typing import Dict, Hashable, Mapping, Sequence, Tuple, TypeVar, Union
+
+import numpy as np
+import pandas as pd
+
+from .enum_shim import StrEnum
+
+
+class StatisticFunction(StrEnum):
+    MEAN = "mean"
+    STD = "std"
+    MIN = "min"
+    MAX = "max"
+
+
+# A statistic is either one of the statistic functions, or a quantile given as a
+# float in the range [0, 1]
+StatisticSpec = Union[StatisticFunction, float]
+
+LabelT = TypeVar("LabelT", bound=Hashable)
+
+
+# pylint: disable=too-many-locals
+def create_dense_group_arrays(
+    group_values: Union[pd.Series, np.ndarray], value_arrays: Mapping[str, np.ndarray]
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Pivot value arrays to dense 2D arrays, with one row per unique group value,
+    e.g. one row per date with the values for all realizations in the columns.
+
+    Groups with fewer members than the largest group are padded with NaN. Elements with
+    missing group value are excluded, as for pandas groupby.
+
+    `Input:`
+    * group_values: pd.Series | np.ndarray - Group value for each element
+    * value_arrays: Mapping - Name as key and array of same length as group_values as
+    value
+
+    `Returns:`
+    * Sorted unique group values
+    * Dict with name as key and array of shape (num_groups, max_group_size) as value
+    """
+    codes, uniques = pd.factorize(group_values, sort=True)
+    num_groups = len(uniques)
+
+    valid_rows = np.flatnonzero(codes >= 0)
+    valid_codes = codes[valid_rows]
+    group_sizes = np.bincount(valid_codes, minlength=num_groups)
+    max_group_size = int(group_sizes.max()) if num_groups > 0 else 0
+
+    # Position of each element within its group, keeping the order of the elements
+    row_order = valid_rows[np.argsort(valid_codes, kind="stable")]
+    sorted_codes = codes[row_order]
+    group_starts = np.cumsum(group_sizes) - group_sizes
+    member_idx = np.arange(len(row_order)) - group_starts[sorted_codes]
+
+    dense_arrays: Dict[str, np.ndarray] = {}
+    for name, values in value_arrays.items():
+        dense_arr = np.full((num_groups, max_group_size), np.nan)
+        dense_arr[sorted_codes, member_idx] = np.asarray(values)[row_order]
+        dense_arrays[name] = dense_arr
+
+    return np.asarray(uniques), dense_arrays
+
+
+def nanquantile_rows(values: np.ndarray, quantiles: Sequence[float]) -> np.ndarray:
+    """Quantiles for each row of a 2D array, ignoring NaN values.
+
+    Equivalent to np.nanquantile(values, quantiles, axis=1) with the default "linear"
+    method, but vectorized over the rows. np.nanquantile() falls back to a Python loop
+    over the rows when the array contains NaN values. Rows without any valid values give
+    NaN.
+
+    `Returns:`
+    * Array of shape (len(quantiles), num_rows)
+    """
+    num_rows = values.shape[0]
+    quantiles_arr = np.asarray(quantiles, dtype=np.float64)
+    if values.shape[1] == 0:
+        return np.full((len(quantiles_arr), num_rows), np.nan)
+
+    # NaN values are sorted to the end of each row
+    sorted_values = np.sort(values, axis=1)
+    num_valid = np.count_nonzero(~np.isnan(values), axis=1)
+
+    virtual_idx = quantiles_arr[:, np.newaxis] * np.maximum(num_valid - 1, 0)
+    lower_idx = np.floor(virtual_idx).astype(np.int64)
+    upper_idx = np.minimum(lower_idx + 1, np.maximum(num_valid - 1, 0))
+    gamma = virtual_idx - lower_idx
+
+    row_idx = np.arange(num_rows)
+    lower = sorted_values[row_idx, lower_idx]
+    upper = sorted_values[row_idx, upper_idx]
+
+    # Same interpolation as numpy, which is exact at both ends of the interval
+    diff = upper - lower
+    result = np.where(gamma >= 0.5, upper - diff * (1 - gamma), lower + diff * gamma)
+    result[:, num_valid == 0] = np.nan
+    return result
+
+
+def calc_statistics_for_dense_array(
+    values: np.ndarray, statistics: Mapping[LabelT, StatisticSpec]
+) -> Dict[LabelT, np.ndarray]:
+    """Calculate statistics for each row of a 2D array, ignoring NaN values.
+    All quantiles are calculated in one vectorized pass.
+
+    Standard deviation is calculated with ddof=1, as for pandas. Rows without valid
+    values give NaN for all statistics.
+
+    `Input:`
+    * values: np.ndarray - 2D array, e.g. with shape (num_dates, num_realizations)
+    * statistics: Mapping - Statistic label as key and statistic spec as value
+
+    `Returns:`
+    * Dict with statistic label as key and 1D array with one value per row as value
+    """
+    quantiles = {
+        label: spec
+        for label, spec in statistics.items()
+        if not isinstance(spec, StatisticFunction)
+    }
+    quantile_values = (
+        nanquantile_rows(values, list(quantiles.values()))
+        if quantiles
+        else np.empty((0, values.shape[0]))
+    )
+
+    result: Dict[LabelT, np.ndarray] = dict(zip(quantiles.keys(), quantile_values))
+    with warnings.catch_warnings():
+        # Rows without valid values give NaN, ignore the warnings from numpy
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        for label, spec in statistics.items():
+            if spec is StatisticFunction.MEAN:
+                result[label] = np.nanmean(values, axis=1)
+            elif spec is StatisticFunction.STD:
+                result[label] = np.nanstd(values, axis=1, ddof=1)
+            elif spec is StatisticFunction.MIN:
+                result[label] = np.nanmin(values, axis=1)
+            elif spec is StatisticFunction.MAX:
+                result[label] = np.nanmax(values, axis=1)
+
+    return {label: result[label] for label in statistics}
+
+
+def create_grouped_statistics_df(
+    df: pd.DataFrame,
+    group_column: str,
+    value_columns: Sequence[str],
+    statistics: Mapping[LabelT, StatisticSpec],
+) -> pd.DataFrame:
+    """Calculate statistics of the value columns per unique value of the group column,
+    e.g. statistics across realizations per date, ignoring NaN values.
+
+    Replacement for df.groupby(group_column).agg([...]).reset_index(), where each value
+    column is pivoted to a dense array once, and all statistics are calculated with
+    vectorized numpy functions.
+
+    `Input:`
+    * df: pd.DataFrame - Dataframe with group column and value columns
+    * group_column: str - Name of column to group by
+    * value_columns: Sequence[str] - Names of columns to calculate statistics for
+    * statistics: Mapping - Statistic label as key and statistic spec as value, i.e.
+    either a StatisticFunction or a quantile in the range [0, 1]
+
+    `Returns:`
+    * Dataframe with double column level, sorted on the group column:\n
+      [ group_column,   value_column1,              ... value_columnN
+                        label1, ..., labelM         ... label1, ..., labelM ]
+    """
+    group_values, value_arrays = create_dense_group_arrays(
+        df[group_column],
+        {
+            column: df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            for column in value_columns
+        },
+    )
+
+    columns: Dict[Tuple[str, Hashable], np.ndarray] = {(group_column, ""): group_values}
+    for column in value_columns:
+        column_statistics = calc_statistics_for_dense_array(
+            value_arrays[column], statistics
+        )
+        for label, statistic_values in column_statistics.items():
+            columns[(column, label)] = statistic_values
+
+    return pd.DataFrame(columns, columns=pd.MultiIndex.from_tuples(columns.keys()))
@@ -0,0 +1,87 @@
+import hashlib
+import logging
+from typing import Optional
+
+import flask
+from dash import Dash
+
+from webviz_subsurface._utils.perf_timer import PerfTimer
+from webviz_subsurface._utils.publish_store import get_publish_store
+
+LOGGER = logging.getLogger(__name__)
+
+_ROOT_URL_PATH = "/PngImageServer"
+
+# The images are addressed by a hash of their content, so a given URL will always
+# return the same image and the browser never needs to revalidate
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_PNG_IMAGE_SERVER_INSTANCE: Optional["PngImageServer"] = None
+
+
+class PngImageServer:
+    """Serves PNG images from a URL route instead of inlining them as base64 data
+    URLs in the callback payloads. Used by e.g. SurfaceLeafletModel."""
+
+    def __init__(self, app: Dash) -> None:
+        self._image_store = get_publish_store("PngImageServer")
+
+        self._setup_url_rule(app)
+
+    @staticmethod
+    def instance(app: Dash) -> "PngImageServer":
+        """Returns the PngImageServer, creating it and its URL route on the first
+        call. Must be called during plugin initialization, before the app starts
+        serving requests."""
+        # pylint: disable=global-statement
+        global _PNG_IMAGE_SERVER_INSTANCE
+        if not _PNG_IMAGE_SERVER_INSTANCE:
+            LOGGER.debug("Initializing PngImageServer instance")
+            _PNG_IMAGE_SERVER_INSTANCE = PngImageServer(app)
+
+        return _PNG_IMAGE_SERVER_INSTANCE
+
+    @staticmethod
+    def initialized_instance() -> Optional["PngImageServer"]:
+        """Returns the PngImageServer if it has been created by instance(),
+        otherwise None"""
+        return _PNG_IMAGE_SERVER_INSTANCE
+
+    def publish_png(self, png_bytes: bytes) -> str:
+        """Publish the PNG image and return the (partial) URL it is served from"""
+        timer = PerfTimer()
+
+        # There is no security risk here and chances of collision should be very slim
+        image_key = hashlib.md5(png_bytes).hexdigest()  # nosec
+        self._image_store.put("PNG:" + image_key, png_bytes)
+
+        LOGGER.debug(
+            f"PNG image published in: {timer.elapsed_s():.2f}s "
+            f"[image_key={image_key}, #bytes={len(png_bytes)}]"
+        )
+
+        return f"{_ROOT_URL_PATH}/{image_key}.png"
+
+    def _setup_url_rule(self, app: Dash) -> None:
+        @app.server.route(_ROOT_URL_PATH + "/<image_key>.png")
+        def _handle_png_image_request(image_key: str) -> flask.Response:
+            timer = PerfTimer()
+
+            if flask.request.if_none_match.contains(image_key):
+                response = flask.Response(status=304)
+            else:
+                cached_png_bytes = self._image_store.get("PNG:" + image_key)
+                if not cached_png_bytes:
+                    LOGGER.error(f"Error getting PNG image with key: {image_key}")
+                    flask.abort(404)
+
+                response = flask.Response(cached_png_bytes, mimetype="image/png")
+
+            response.set_etag(image_key)
+            response.headers["Cache-Control"] = _CACHE_CONTROL
+
+            LOGGER.debug(
+                f"PNG image request handled in: {timer.elapsed_s():.2f}s "
+                f"(status={response.status_code})"
+            )
+            return response
@@ -0,0 +1,538 @@
+import abc
+import atexit
+import getpass
+import hashlib
+import logging
+import os
+import pickle  # nosec
+import shutil
+import stat
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# Shared memory backed file system, used for the shared store if it is large enough
+_SHM_DIR = Path("/dev/shm")
+_MIN_SHM_TOTAL_BYTES = 2 * 1024 * 1024 * 1024
+
+# All the publish stores share one size limit. For the shared store the limit is also
+# a fraction of the free space in its directory, since /dev/shm is used by others,
+# e.g. for transferring data between processes.
+_MAX_TOTAL_BYTES = 2 * 1024 * 1024 * 1024
+_MAX_FRACTION_OF_FREE_BYTES = 0.25
+
+_SESSION_DIR_PREFIX = "webviz_publish_store_"
+_ENTRY_SUFFIX = ".pkl"
+
+# The session directory created by the process group leader is passed on to its
+# worker processes through this environment variable
+_SESSION_DIR_ENV_VAR = "WEBVIZ_SUBSURFACE_PUBLISH_STORE_DIR"
+
+# The shared store's directory is rescanned to pick up the entries written by other
+# processes after this many puts, or after writing this fraction of the size limit
+_RESCAN_INTERVAL_PUTS = 64
+_RESCAN_INTERVAL_FRACTION_OF_MAX_BYTES = 1 / 16
+
+# Number of gets between each time the stats are logged
+_LOG_STATS_INTERVAL = 200
+
+_PUBLISH_STORES: Dict[str, "PublishStore"] = {}
+_PUBLISH_STORES_LOCK = threading.Lock()
+_IN_MEMORY_ENTRIES: Optional["_InMemoryEntries"] = None
+
+
+@dataclass(frozen=True)
+class PublishStoreStats:
+    """Statistics for a publish store. The counters are for the current process only,
+    while used_bytes covers all stores and processes sharing the size limit."""
+
+    num_hits: int
+    num_misses: int
+    num_puts: int
+    num_evictions: int
+    used_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        num_gets = self.num_hits + self.num_misses
+        return self.num_hits / num_gets if num_gets > 0 else 0.0
+
+
+class PublishStore(abc.ABC):
+    """Store for data published by the servers (surface images, arrays etc.) that is
+    later fetched by the clients through a URL. The stores are limited in size, and
+    the least recently used entries are evicted when the limit is exceeded. Several
+    stores, each with its own name, may share one size limit."""
+
+    def __init__(self, name: str, max_bytes: int) -> None:
+        self._name = name
+        self._max_bytes = max_bytes
+        self._stats_lock = threading.Lock()
+        self._num_hits = 0
+        self._num_misses = 0
+        self._num_puts = 0
+        self._num_evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._get_impl(key)
+
+        with self._stats_lock:
+            if value is not None:
+                self._num_hits += 1
+            else:
+                self._num_misses += 1
+            num_gets = self._num_hits + self._num_misses
+
+        if num_gets % _LOG_STATS_INTERVAL == 0:
+            stats = self.get_stats()
+            LOGGER.debug(
+                f"Publish store {self._name}: hit_ratio={stats.hit_ratio:.2f} "
+                f"(#hits={stats.num_hits}, #misses={stats.num_misses}, "
+                f"#puts={stats.num_puts}, #evictions={stats.num_evictions}, "
+                f"used={stats.used_bytes / (1024 * 1024):.1f}MB of "
+                f"{stats.max_bytes / (1024 * 1024):.0f}MB)"
+            )
+
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value under key, replacing any existing value"""
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        num_evicted = self._put_impl(key, data)
+
+        with self._stats_lock:
+            self._num_puts += 1
+            self._num_evictions += num_evicted
+
+    def clear(self) -> None:
+        """Remove all entries of this store, e.g. when the published data must be
+        recreated. Entries of other stores sharing the size limit are kept."""
+        self._clear_impl()
+        LOGGER.debug(f"Cleared publish store {self._name}")
+
+    def get_stats(self) -> PublishStoreStats:
+        with self._stats_lock:
+            return PublishStoreStats(
+                num_hits=self._num_hits,
+                num_misses=self._num_misses,
+                num_puts=self._num_puts,
+                num_evictions=self._num_evictions,
+                used_bytes=self._used_bytes(),
+                max_bytes=self._max_bytes,
+            )
+
+    @abc.abstractmethod
+    def _get_impl(self, key: str) -> Optional[Any]:
+        """Returns the unpickled value or None if the key is not in the store"""
+
+    @abc.abstractmethod
+    def _put_impl(self, key: str, data: bytes) -> int:
+        """Store the pickled data and return the number of evicted entries"""
+
+    @abc.abstractmethod
+    def _clear_impl(self) -> None:
+        ...
+
+    @abc.abstractmethod
+    def _used_bytes(self) -> int:
+        ...
+
+
+# pylint: disable=too-few-public-methods
+class _InMemoryEntries:
+    """The entries of in-memory publish stores in least recently used order, keyed by
+    store name and key. May be shared by several stores."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self.total_bytes = 0
+
+
+class InMemoryPublishStore(PublishStore):
+    """Publish store that only lives in the memory of the current process. All stores
+    created with the same shared_entries are limited by max_bytes in total."""
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        shared_entries: Optional[_InMemoryEntries] = None,
+    ) -> None:
+        super().__init__(name, max_bytes)
+        self._shared = shared_entries if shared_entries else _InMemoryEntries()
+
+    def _get_impl(self, key: str) -> Optional[Any]:
+        with self._shared.lock:
+            data = self._shared.entries.get((self._name, key))
+            if data is None:
+                return None
+            self._shared.entries.move_to_end((self._name, key))
+
+        return pickle.loads(data)  # nosec
+
+    def _put_impl(self, key: str, data: bytes) -> int:
+        num_evicted = 0
+        with self._shared.lock:
+            entries = self._shared.entries
+            old_data = entries.pop((self._name, key), None)
+            if old_data is not None:
+                self._shared.total_bytes -= len(old_data)
+
+            entries[(self._name, key)] = data
+            self._shared.total_bytes += len(data)
+
+            # Always keep the newest entry, even if it alone exceeds the limit
+            while self._shared.total_bytes > self._max_bytes and len(entries) > 1:
+                _evicted_key, evicted_data = entries.popitem(last=False)
+                self._shared.total_bytes -= len(evicted_data)
+                num_evicted += 1
+
+        return num_evicted
+
+    def _clear_impl(self) -> None:
+        with self._shared.lock:
+            entries = self._shared.entries
+            for entry_key in [k for k in entries if k[0] == self._name]:
+                self._shared.total_bytes -= len(entries.pop(entry_key))
+
+    def _used_bytes(self) -> int:
+        with self._shared.lock:
+            return self._shared.total_bytes
+
+
+class SharedDirPublishStore(PublishStore):
+    """Publish store that keeps its entries as files in a directory shared by all the
+    worker processes, so that data published by one worker can be fetched through
+    any of the others. The directory is preferably on a shared memory backed file
+    system, see get_publish_store().
+
+    Each store keeps its entries in a subdirectory named by the store, and all stores
+    in the same directory are limited by max_bytes in total. Writes are atomic, and
+    the file modification times are used to track recent use, so the least recently
+    used entries can be evicted by any of the processes."""
+
+    def __init__(self, name: str, max_bytes: int, store_dir: Path) -> None:
+        super().__init__(name, max_bytes)
+        self._store_dir = store_dir
+        self._entry_dir = store_dir / name
+        self._entry_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._puts_since_rescan = 0
+        self._bytes_since_rescan = 0
+        self._approx_total_bytes = self._scan_and_evict_if_needed()[0]
+
+    def _get_impl(self, key: str) -> Optional[Any]:
+        entry_path = self._make_entry_path(key)
+        try:
+            data = entry_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            # Touch the entry so it is considered recently used
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        return pickle.loads(data)  # nosec
+
+    def _put_impl(self, key: str, data: bytes) -> int:
+        entry_path = self._make_entry_path(key)
+        tmp_path = self._entry_dir / f"tmp-{uuid.uuid4().hex}"
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, entry_path)
+        except OSError as exc:
+            LOGGER.warning(
+                f"Failed to write entry to publish store {self._name}: {exc}"
+            )
+            tmp_path.unlink(missing_ok=True)
+
+        with self._lock:
+            self._approx_total_bytes += len(data)
+            self._puts_since_rescan += 1
+            self._bytes_since_rescan += len(data)
+            need_scan = (
+                self._approx_total_bytes > self._max_bytes
+                or self._puts_since_rescan >= _RESCAN_INTERVAL_PUTS
+                or self._bytes_since_rescan
+                >= self._max_bytes * _RESCAN_INTERVAL_FRACTION_OF_MAX_BYTES
+            )
+            if not need_scan:
+                return 0
+
+            self._approx_total_bytes, num_evicted = self._scan_and_evict_if_needed()
+            self._puts_since_rescan = 0
+            self._bytes_since_rescan = 0
+
+        return num_evicted
+
+    def _clear_impl(self) -> None:
+        with os.scandir(self._entry_dir) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith(_ENTRY_SUFFIX):
+                    try:
+                        os.remove(dir_entry.path)
+                    except FileNotFoundError:
+                        pass
+
+        with self._lock:
+            self._approx_total_bytes = self._scan_and_evict_if_needed()[0]
+
+    def _used_bytes(self) -> int:
+        with self._lock:
+            return self._approx_total_bytes
+
+    def _make_entry_path(self, key: str) -> Path:
+        # There is no security risk here and chances of collision should be very slim
+        key_hash = hashlib.md5(key.encode()).hexdigest()  # nosec
+        return self._entry_dir / (key_hash + _ENTRY_SUFFIX)
+
+    def _scan_and_evict_if_needed(self) -> Tuple[int, int]:
+        """Returns total size of the entries of all the stores in the directory after
+        eviction, and the number of evicted entries"""
+        entries = []
+        total_bytes = 0
+        for entry_dir in self._store_dir.iterdir():
+            if not entry_dir.is_dir():
+                continue
+            with os.scandir(entry_dir) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith(_ENTRY_SUFFIX):
+                        continue
+                    try:
+                        entry_stat = dir_entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append(
+                        (entry_stat.st_mtime_ns, entry_stat.st_size, dir_entry.path)
+                    )
+                    total_bytes += entry_stat.st_size
+
+        num_evicted = 0
+        if total_bytes > self._max_bytes:
+            # Oldest first, but never evict the most recently used entry
+            entries.sort()
+            for _mtime_ns, size, path in entries[:-1]:
+                if total_bytes <= self._max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    num_evicted += 1
+                except FileNotFoundError:
+                    # Already evicted by another process
+                    pass
+                total_bytes -= size
+
+            LOGGER.debug(
+                f"Evicted {num_evicted} entries from publish store {self._name}, "
+                f"size is now {total_bytes / (1024 * 1024):.1f}MB"
+            )
+
+        return total_bytes, num_evicted
+
+
+def get_publish_store(name: str) -> PublishStore:
+    """Returns the publish store with the given name, creating it if needed.
+
+    Where possible the store is shared between all the worker processes of the
+    application, i.e. all processes in the same process group. On platforms without
+    process groups the store is local to the process. All the stores share one size
+    limit."""
+    # pylint: disable=global-statement
+    global _IN_MEMORY_ENTRIES
+    with _PUBLISH_STORES_LOCK:
+        store = _PUBLISH_STORES.get(name)
+        if store is None:
+            session_dir = _get_session_dir()
+            if session_dir is not None:
+                max_bytes = _get_max_total_bytes(session_dir)
+                LOGGER.debug(
+                    f"Setting up shared publish store in: {session_dir / name} "
+                    f"(max_total={max_bytes / (1024 * 1024):.0f}MB)"
+                )
+                store = SharedDirPublishStore(name, max_bytes, session_dir)
+            else:
+                LOGGER.debug(f"Setting up in-memory publish store: {name}")
+                if _IN_MEMORY_ENTRIES is None:
+                    _IN_MEMORY_ENTRIES = _InMemoryEntries()
+                store = InMemoryPublishStore(name, _MAX_TOTAL_BYTES, _IN_MEMORY_ENTRIES)
+            _PUBLISH_STORES[name] = store
+
+        return store
+
+
+def get_all_publish_store_stats() -> Dict[str, PublishStoreStats]:
+    with _PUBLISH_STORES_LOCK:
+        return {name: store.get_stats() for name, store in _PUBLISH_STORES.items()}
+
+
+def _get_max_total_bytes(session_dir: Path) -> int:
+    """Size limit for the stores in the session directory, counting the space already
+    used by the stores as free"""
+    try:
+        free_bytes = shutil.disk_usage(session_dir).free
+    except OSError:
+        return _MAX_TOTAL_BYTES
+
+    used_bytes = 0
+    for entry_path in session_dir.glob(f"*/*{_ENTRY_SUFFIX}"):
+        try:
+            used_bytes += entry_path.stat().st_size
+        except FileNotFoundError:
+            pass
+
+    return min(
+        _MAX_TOTAL_BYTES,
+        int((free_bytes + used_bytes) * _MAX_FRACTION_OF_FREE_BYTES),
+    )
+
+
+def _get_session_dir() -> Optional[Path]:
+    """Returns the directory shared by the processes of the application, or None if
+    the stores must be local to the process"""
+    inherited_dir = os.environ.get(_SESSION_DIR_ENV_VAR)
+    if inherited_dir:
+        if _is_private_dir(Path(inherited_dir)):
+            return Path(inherited_dir)
+        LOGGER.warning(
+            f"Not using publish store directory {inherited_dir} from "
+            f"{_SESSION_DIR_ENV_VAR}, it must be a directory only accessible by the "
+            f"current user"
+        )
+        return None
+
+    if not hasattr(os, "getpgrp"):
+        return None
+
+    base_dir = Path(tempfile.gettempdir())
+    try:
+        if shutil.disk_usage(_SHM_DIR).total >= _MIN_SHM_TOTAL_BYTES:
+            base_dir = _SHM_DIR
+    except OSError:
+        pass
+
+    try:
+        user_dir_prefix = f"{_SESSION_DIR_PREFIX}{getpass.getuser()}_"
+    except (KeyError, OSError):
+        user_dir_prefix = f"{_SESSION_DIR_PREFIX}{os.getuid()}_"
+
+    # Gunicorn workers are forked from the master and stay in its process group,
+    # while each new launch of the application gets a new process group
+    process_group_id = os.getpgrp()
+    _remove_stale_session_dirs(base_dir, user_dir_prefix, process_group_id)
+
+    if os.getpid() == process_group_id:
+        # A new launch of the application, so create a new private directory and pass
+        # it on to the worker processes, which inherit the environment
+        session_dir = Path(
+            tempfile.mkdtemp(
+                prefix=f"{user_dir_prefix}{process_group_id}_", dir=base_dir
+            )
+        )
+        os.environ[_SESSION_DIR_ENV_VAR] = str(session_dir)
+        atexit.register(_remove_session_dir, session_dir, os.getpid())
+        return session_dir
+
+    return _get_worker_session_dir(base_dir, user_dir_prefix, process_group_id)
+
+
+def _get_worker_session_dir(
+    base_dir: Path, user_dir_prefix: str, process_group_id: int
+) -> Optional[Path]:
+    """Session directory for worker processes that did not inherit the directory, e.g.
+    gunicorn workers when the app is not preloaded by the master. The workers agree on
+    a directory named by the process group and the start time of its leader, so a
+    directory left behind by an earlier process group with the same id is never
+    reused."""
+    leader_start_time = _get_process_start_time(process_group_id)
+    session_dir = base_dir / (
+        f"{user_dir_prefix}{process_group_id}"
+        + (f"_{leader_start_time}" if leader_start_time else "")
+    )
+    try:
+        session_dir.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    except OSError as exc:
+        LOGGER.warning(f"Failed to create publish store directory: {exc}")
+        return None
+
+    if not _is_private_dir(session_dir):
+        LOGGER.warning(
+            f"Not using publish store directory {session_dir}, it is not a directory "
+            f"only accessible by the current user"
+        )
+        return None
+
+    return session_dir
+
+
+def _is_private_dir(path: Path) -> bool:
+    """Check that path is a directory, and not a symlink, that is owned by and only
+    accessible by the current user. The stores unpickle the entries in the directory,
+    thus no one else must be able to write there."""
+    try:
+        dir_stat = os.lstat(path)
+    except OSError:
+        return False
+
+    return (
+        stat.S_ISDIR(dir_stat.st_mode)
+        and dir_stat.st_uid == os.getuid()
+        and stat.S_IMODE(dir_stat.st_mode) == 0o700
+    )
+
+
+def _get_process_start_time(pid: int) -> Optional[str]:
+    """Returns the start time of the process in clock ticks after boot, or None if it
+    is not available (e.g. on platforms without /proc)"""
+    try:
+        proc_stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+
+    # The command name in the second field may contain spaces, so split after it.
+    # The start time is the 22nd field.
+    fields_after_command = proc_stat.rsplit(")", 1)[-1].split()
+    return fields_after_command[19] if len(fields_after_command) > 19 else None
+
+
+def _remove_session_dir(session_dir: Path, creator_pid: int) -> None:
+    # Forked worker processes inherit the exit handlers, but only the process that
+    # created the directory should remove it
+    if os.getpid() == creator_pid:
+        LOGGER.debug(f"Removing publish store: {session_dir}")
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+
+def _remove_stale_session_dirs(
+    base_dir: Path, user_dir_prefix: str, current_process_group_id: int
+) -> None:
+    """Remove the session directories of process groups that no longer exist"""
+    for session_dir in base_dir.glob(f"{user_dir_prefix}*"):
+        try:
+            process_group_id = int(
+                session_dir.name[len(user_dir_prefix) :].split("_", 1)[0]
+            )
+        except ValueError:
+            continue
+        if process_group_id == current_process_group_id:
+            continue
+
+        try:
+            os.killpg(process_group_id, 0)
+        except ProcessLookupError:
+            LOGGER.debug(f"Removing stale publish store: {session_dir}")
+            shutil.rmtree(session_dir, ignore_errors=True)
+        except OSError:
+            pass
@@ -279,11 +279,15 @@ def create_calculated_vector_df(
     provider: EnsembleSummaryProvider,
     realizations: Optional[Sequence[int]],
     resampling_frequency: Optional[Frequency],
+    date_as_datetime64: bool = False,
 ) -> pd.DataFrame:
     """Create dataframe with calculated vector from expression
 
     If expression is not successfully evaluated, empty dataframe is returned
 
+    The "DATE" column is of datetime64[ms] dtype if date_as_datetime64 is True, see
+    EnsembleSummaryProvider.get_vectors_df()
+
     `Return:`
     * Dataframe with calculated vector data made form expression - columns:\n
         ["DATE","REAL", calculated_vector]
@@ -299,7 +303,10 @@ def create_calculated_vector_df(
 
     # Retrieve data for vectors in expression
     vectors_df = provider.get_vectors_df(
-        vector_names, resampling_frequency, realizations
+        vector_names,
+        resampling_frequency,
+        realizations,
+        date_as_datetime64=date_as_datetime64,
     )
 
     values: Dict[str, np.ndarray] = {}
@@ -8,7 +8,6 @@ import numpy as np
 import plotly.graph_objects as go
 import webviz_subsurface_components as wsc
 from dash import dcc, no_update
-from flask_caching import Cache
 
 from webviz_subsurface._providers import (
     EnsembleSurfaceProvider,
@@ -21,6 +20,7 @@ from webviz_subsurface._providers import (
 from webviz_subsurface._providers.ensemble_surface_provider.ensemble_surface_provider import (
     SurfaceStatistic,
 )
+from webviz_subsurface._utils.publish_store import PublishStore
 from webviz_subsurface.plugins._co2_migration._types import LegendData
 from webviz_subsurface.plugins._co2_migration._utilities import plume_extent
 from webviz_subsurface.plugins._co2_migration._utilities.co2volume import (
@@ -477,10 +477,10 @@ def process_visualization_info(
     thresholds: dict,
     unit: str,
     stored_info: Dict[str, Any],
-    cache: Cache,
+    publish_store: PublishStore,
 ) -> Dict[str, Any]:
     """
-    Clear surface cache if the threshold for visualization or mass unit is changed
+    Clear published surfaces if the threshold for visualization or mass unit is changed
     """
     stored_info["attribute"] = attribute
     stored_info["change"] = False
@@ -496,7 +496,7 @@ def process_visualization_info(
                 stored_info["change"] = True
                 stored_info["thresholds"][att] = thresholds[att]
     if stored_info["change"]:
-        cache.clear()
+        publish_store.clear()
     return stored_info
 
 
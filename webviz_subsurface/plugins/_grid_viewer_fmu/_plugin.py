@@ -39,6 +39,11 @@ class EXPERIMENTALGridViewerFMU(WebvizPluginABC):
     * **`eclipse_init_parameters`:** Which Eclipse init parameters to load
     * **`eclipse_restart_parameters`:** Which Eclipse restart parameters to load
 
+    * **`preextract_grid_properties`:** Extract all grid properties into a
+        memory-mapped store when the plugin is first loaded. This makes switching
+        between properties and realizations much faster, at the expense of a slower
+        first time import and more disk usage.
+
     An optional initial cell filter can be set as:
     * **`grid_ijk_filter`:** with one or more of the following:
         ```yaml
@@ -79,10 +84,12 @@ class EXPERIMENTALGridViewerFMU(WebvizPluginABC):
         eclipse_init_parameters: List[str] = None,
         eclipse_restart_parameters: List[str] = None,
         initial_ijk_filter: Dict[str, int] = None,
+        preextract_grid_properties: bool = False,
     ):
         super().__init__(stretch=True)
 
         self.ensemble = webviz_settings.shared_settings["scratch_ensembles"][ensemble]
+        self._preextract_grid_properties = preextract_grid_properties
 
         if roff_grid_name:
             self.add_roff_grid_provider(
@@ -128,9 +135,13 @@ class EXPERIMENTALGridViewerFMU(WebvizPluginABC):
             ens_path=self.ensemble,
             grid_name=grid_name,
             attribute_filter=attribute_filter,
+            preextract_properties=self._preextract_grid_properties,
         )
         self.grid_viz_service = GridVizService.instance()
         self.grid_viz_service.register_provider(self.grid_provider)
+        esg_geometry_cache = factory.esg_geometry_cache()
+        if esg_geometry_cache:
+            self.grid_viz_service.set_esg_geometry_cache(esg_geometry_cache)
 
     def add_eclipse_grid_provider(
         self, grid_name: str, init_properties: List[str], restart_properties: List[str]
@@ -141,6 +152,10 @@ class EXPERIMENTALGridViewerFMU(WebvizPluginABC):
             grid_name=grid_name,
             init_properties=init_properties,
             restart_properties=restart_properties,
+            preextract_properties=self._preextract_grid_properties,
         )
         self.grid_viz_service = GridVizService.instance()
         self.grid_viz_service.register_provider(self.grid_provider)
+        esg_geometry_cache = factory.esg_geometry_cache()
+        if esg_geometry_cache:
+            self.grid_viz_service.set_esg_geometry_cache(esg_geometry_cache)
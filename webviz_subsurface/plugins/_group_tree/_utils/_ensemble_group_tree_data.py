@@ -7,6 +7,10 @@ from webviz_config.common_cache import CACHE
 
 from webviz_subsurface._models import GruptreeModel
 from webviz_subsurface._providers import EnsembleSummaryProvider
+from webviz_subsurface._utils.ensemble_statistics import (
+    StatisticFunction,
+    StatisticSpec,
+)
 
 from .._types import DataType, EdgeOrNode, NodeType, StatOptions, TreeModeOptions
 
@@ -98,23 +102,26 @@ class EnsembleGroupTreeData:
             for sumvec in self._sumvecs["SUMVEC"]
             if sumvec in self._provider.vector_names()
         ]
-        smry = self._provider.get_vectors_df(vectors, None)
 
         if tree_mode is TreeModeOptions.STATISTICS:
-            if stat_option is StatOptions.MEAN:
-                smry = smry.groupby("DATE").mean().reset_index()
-            elif stat_option in [StatOptions.P50, StatOptions.P10, StatOptions.P90]:
-                quantile = {"p50": 0.5, "p10": 0.9, "p90": 0.1}[stat_option.value]
-                smry = smry.groupby("DATE").quantile(quantile).reset_index()
-            elif stat_option is StatOptions.MAX:
-                smry = smry.groupby("DATE").max().reset_index()
-            elif stat_option is StatOptions.MIN:
-                smry = smry.groupby("DATE").min().reset_index()
-            else:
+            stat_option_statistics: Dict[StatOptions, StatisticSpec] = {
+                StatOptions.MEAN: StatisticFunction.MEAN,
+                StatOptions.P50: 0.5,
+                StatOptions.P10: 0.9,
+                StatOptions.P90: 0.1,
+                StatOptions.MAX: StatisticFunction.MAX,
+                StatOptions.MIN: StatisticFunction.MIN,
+            }
+            statistic = stat_option_statistics.get(stat_option)
+            if statistic is None:
                 raise ValueError(
                     f"Statistical option: {stat_option.value} not implemented"
                 )
+            smry = self._provider.get_vectors_statistics_df(
+                vectors, None, {stat_option.value: statistic}
+            ).droplevel(1, axis=1)
         else:
+            smry = self._provider.get_vectors_df(vectors, None)
             smry = smry[smry["REAL"] == real]
 
         gruptree_filtered = self._gruptree
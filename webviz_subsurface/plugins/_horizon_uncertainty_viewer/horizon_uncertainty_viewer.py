@@ -20,6 +20,7 @@ from webviz_config.webviz_store import webvizstore
 import webviz_subsurface
 from webviz_subsurface._datainput.well import get_well_layers
 from webviz_subsurface._models import SurfaceLeafletModel
+from webviz_subsurface._utils.png_image_server import PngImageServer
 
 from ._huv_table import FilterTable
 from ._huv_xsection import HuvXsection
@@ -50,6 +51,7 @@ class HorizonUncertaintyViewer(WebvizPluginABC):
         planned_wells_dir: Path = None,
     ):
         super().__init__()
+        PngImageServer.instance(app)
         self.plotly_theme = webviz_settings.theme.plotly_theme
         self.uid = uuid4()
         WEBVIZ_ASSETS.add(
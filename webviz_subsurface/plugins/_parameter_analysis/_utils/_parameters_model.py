@@ -1,12 +1,15 @@
 from typing import Any, List, Optional, Tuple
 
-import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from webviz_config import WebvizConfigTheme
 
 from webviz_subsurface._figures import create_figure
 from webviz_subsurface._models.parameter_model import ParametersModel as Pmodel
+from webviz_subsurface._utils.ensemble_statistics import (
+    StatisticFunction,
+    create_grouped_statistics_df,
+)
 
 from .._types import VisualizationType
 
@@ -73,19 +76,25 @@ class ParametersModel:
             if col in dframe.columns
         ]
 
+        parameters = [
+            col for col in dframe.columns if col not in drop_columns + ["ENSEMBLE"]
+        ]
+
         return (
-            dframe.drop(columns=drop_columns)
-            .groupby(["ENSEMBLE"])
-            .agg(
-                [
-                    ("Avg", "mean"),
-                    ("Stddev", "std"),
-                    ("P10", lambda x: np.percentile(x, 10)),
-                    ("P90", lambda x: np.percentile(x, 90)),
-                    ("Min", "min"),
-                    ("Max", "max"),
-                ]
+            create_grouped_statistics_df(
+                dframe,
+                group_column="ENSEMBLE",
+                value_columns=parameters,
+                statistics={
+                    "Avg": StatisticFunction.MEAN,
+                    "Stddev": StatisticFunction.STD,
+                    "P10": 0.1,
+                    "P90": 0.9,
+                    "Min": StatisticFunction.MIN,
+                    "Max": StatisticFunction.MAX,
+                },
             )
+            .set_index("ENSEMBLE")
             .stack(0, future_stack=True)
             .rename_axis(["ENSEMBLE", "PARAMETER"])
             .reset_index()
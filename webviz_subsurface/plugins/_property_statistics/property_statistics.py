@@ -21,6 +21,7 @@ from webviz_subsurface._utils.ensemble_table_provider_set import (
 from webviz_subsurface._utils.ensemble_table_provider_set_factory import (
     create_csvfile_providerset_from_paths,
 )
+from webviz_subsurface._utils.png_image_server import PngImageServer
 
 from .controllers.property_delta_controller import property_delta_controller
 from .controllers.property_qc_controller import property_qc_controller
@@ -105,6 +106,7 @@ differ between individual realizations of an ensemble.
         csvfile_smry: Path = None,
     ):
         super().__init__()
+        PngImageServer.instance(app)
         self.theme: WebvizConfigTheme = webviz_settings.theme
         self.ensembles = ensembles
         self._surface_folders: Union[dict, None] = None
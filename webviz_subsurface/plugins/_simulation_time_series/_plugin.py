@@ -87,6 +87,7 @@ class SimulationTimeSeries(WebvizPluginABC):
         predefined_expressions: str = None,
         user_defined_vector_definitions: str = None,
         line_shape_fallback: str = "linear",
+        date_as_datetime64: bool = False,
     ) -> None:
         super().__init__(stretch=True)
 
@@ -338,6 +339,7 @@ class SimulationTimeSeries(WebvizPluginABC):
                 user_defined_vector_definitions=self._user_defined_vector_definitions,
                 observations=self._observations,
                 line_shape_fallback=self._line_shape_fallback,
+                date_as_datetime64=date_as_datetime64,
             ),
             SimulationTimeSeries.Ids.SUBPLOT_VIEW,
         )
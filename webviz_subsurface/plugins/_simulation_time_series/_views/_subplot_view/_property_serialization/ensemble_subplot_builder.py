@@ -16,6 +16,7 @@ from .._utils.create_vector_traces_utils import (
     create_vector_statistics_traces,
     render_hovertemplate,
 )
+from .._utils.datetime_utils import to_datetime_object_array
 from .graph_figure_builder_base import GraphFigureBuilderBase
 
 
@@ -266,7 +267,7 @@ class EnsembleSubplotBuilder(GraphFigureBuilderBase):
                 "Must provide ensemble argument of type str for this implementation!"
             )
 
-        samples = vectors_df["DATE"].tolist()
+        samples = to_datetime_object_array(vectors_df["DATE"]).tolist()
         vector_trace_set: Dict[str, dict] = {}
 
         # Get vectors - sort after validation
@@ -16,6 +16,7 @@ from .._utils.create_vector_traces_utils import (
     create_vector_statistics_traces,
     render_hovertemplate,
 )
+from .._utils.datetime_utils import to_datetime_object_array
 from .graph_figure_builder_base import GraphFigureBuilderBase
 
 
@@ -292,7 +293,7 @@ class VectorSubplotBuilder(GraphFigureBuilderBase):
         vectors: Set[str] = set(vectors_df.columns) - set(["DATE", "REAL"])
         self._validate_vectors_are_selected(vectors)
 
-        samples = vectors_df["DATE"].tolist()
+        samples = to_datetime_object_array(vectors_df["DATE"]).tolist()
 
         vector_trace_set: Dict[str, dict] = {}
         for vector in vectors:
@@ -18,6 +18,7 @@ from webviz_subsurface._utils.statistics_plotting import (
 )
 
 from .._types import FanchartOptions, StatisticsOptions
+from .._utils.datetime_utils import to_datetime_object_array
 from .._utils.from_timeseries_cumulatives import is_per_interval_or_per_day_vector
 
 
@@ -100,19 +101,25 @@ def create_vector_realization_traces(
         )
 
     vector_name = vector_names[0]
+
+    # Convert dates for the whole dataframe at once, and slice per realization
+    dates = to_datetime_object_array(vector_df["DATE"])
+    values = vector_df[vector_name].to_numpy()
     return [
         {
             "line": {"width": 1, "shape": line_shape, "color": color},
             "mode": "lines",
-            "x": list(real_df["DATE"]),
-            "y": list(real_df[vector_name]),
+            "x": list(dates[real_indices]),
+            "y": list(values[real_indices]),
             "hovertemplate": f"{hovertemplate}Realization: {real}, Ensemble: {ensemble}",
             "name": legend_group,
             "legendgroup": legend_group,
             "legendrank": legendrank,
             "showlegend": real_no == 0 and show_legend,
         }
-        for real_no, (real, real_df) in enumerate(vector_df.groupby("REAL"))
+        for real_no, (real, real_indices) in enumerate(
+            vector_df.groupby("REAL").indices.items()
+        )
     ]
 
 
@@ -219,7 +226,7 @@ def create_vector_statistics_traces(
     )
 
     data = StatisticsData(
-        samples=vector_statistics_df["DATE"].values,
+        samples=to_datetime_object_array(vector_statistics_df["DATE"]).tolist(),
         free_line=mean_data,
         minimum=minimum,
         maximum=maximum,
@@ -295,7 +302,7 @@ def create_vector_fanchart_traces(
     )
 
     data = FanchartData(
-        samples=vector_statistics_df["DATE"].tolist(),
+        samples=to_datetime_object_array(vector_statistics_df["DATE"]).tolist(),
         low_high=low_high_data,
         minimum_maximum=minimum_maximum_data,
         free_line=mean_data,
@@ -3,8 +3,9 @@ import datetime
 import pandas as pd
 
 from webviz_subsurface._utils.dataframe_utils import (
-    assert_date_column_is_datetime_object,
-    make_date_column_datetime_object,
+    assert_date_column_is_datetime_object_or_datetime64,
+    is_date_column_datetime64,
+    make_date_column_datetime_object_or_datetime64,
 )
 
 
@@ -33,7 +34,8 @@ def create_relative_to_date_df(
     realization is not present in relative_date_df the realization is excluded output.
     """
 
-    assert_date_column_is_datetime_object(df)
+    assert_date_column_is_datetime_object_or_datetime64(df)
+    date_as_datetime64 = is_date_column_datetime64(df)
 
     if not set(["DATE", "REAL"]).issubset(set(df.columns)):
         raise ValueError('Expect column "DATE" and "REAL" in input dataframe!')
@@ -64,5 +66,5 @@ def create_relative_to_date_df(
         real_df[vectors] = real_df[vectors].sub(relative_date_data.iloc[0], axis=1)
         output_df = pd.concat([output_df, real_df], ignore_index=True)
 
-    make_date_column_datetime_object(output_df)
+    make_date_column_datetime_object_or_datetime64(output_df, date_as_datetime64)
     return output_df
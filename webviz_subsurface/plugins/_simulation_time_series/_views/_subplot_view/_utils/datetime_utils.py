@@ -1,5 +1,8 @@
 import datetime
 
+import numpy as np
+import pandas as pd
+
 # DOCS: https://docs.python.org/3/library/datetime.html#strftime-strptime-behavior
 
 
@@ -14,3 +17,16 @@ def to_str(date: datetime.datetime) -> str:
             f" or microsecond for {str(date)}"
         )
     return date.strftime("%Y-%m-%d")
+
+
+def to_datetime_object_array(dates: pd.Series) -> np.ndarray:
+    """Get array of datetime.datetime objects for plotting, from a date series on
+    datetime.datetime format or of datetime64 dtype.
+
+    Dates of datetime64 dtype are converted via millisecond resolution, as numpy only
+    converts datetime64 to datetime.datetime objects for resolutions of microseconds
+    and coarser.
+    """
+    if pd.api.types.is_datetime64_dtype(dates.dtype):
+        return dates.to_numpy().astype("datetime64[ms]").astype(object)
+    return dates.to_numpy()
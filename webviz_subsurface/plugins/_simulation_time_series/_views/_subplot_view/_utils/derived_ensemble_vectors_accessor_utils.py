@@ -29,6 +29,7 @@ def create_derived_vectors_accessor_dict(
     delta_ensembles: List[DeltaEnsemble],
     resampling_frequency: Optional[Frequency],
     relative_date: Optional[datetime.datetime],
+    date_as_datetime64: bool = False,
 ) -> Dict[str, DerivedVectorsAccessor]:
     """Create dictionary with ensemble name as key and derived vectors accessor
     as key.
@@ -49,6 +50,9 @@ def create_derived_vectors_accessor_dict(
     * delta_ensembles: List[DeltaEnsemble] - list of created delta ensembles
     * resampling_frequency: Optional[Frequency] - Resampling frequency setting for
     EnsembleSummaryProviders
+    * relative_date: Optional[datetime.datetime] - Date to make vector data relative to
+    * date_as_datetime64: bool - Provide "DATE" column of datetime64[ms] dtype instead of
+    datetime.datetime objects
 
     `Return:`
     * Dict[str, DerivedVectorsAccessor] - dictionary with ensemble name as key and
@@ -69,6 +73,7 @@ def create_derived_vectors_accessor_dict(
                 expressions=expressions,
                 resampling_frequency=resampling_frequency,
                 relative_date=relative_date,
+                date_as_datetime64=date_as_datetime64,
             )
         elif (
             ensemble in delta_ensemble_name_dict.keys()
@@ -88,6 +93,7 @@ def create_derived_vectors_accessor_dict(
                 expressions=expressions,
                 resampling_frequency=resampling_frequency,
                 relative_date=relative_date,
+                date_as_datetime64=date_as_datetime64,
             )
 
     return ensemble_data_accessor_dict
@@ -4,8 +4,15 @@ from typing import List, Optional, Sequence, Tuple
 import pandas as pd
 from webviz_subsurface_components import ExpressionInfo
 
-from webviz_subsurface._providers import EnsembleSummaryProvider, Frequency
-from webviz_subsurface._utils.dataframe_utils import make_date_column_datetime_object
+from webviz_subsurface._providers import (
+    EnsembleSummaryProvider,
+    EnsembleSummaryProviderDelta,
+    Frequency,
+)
+from webviz_subsurface._utils.dataframe_utils import (
+    make_date_column_datetime_object_or_datetime64,
+)
+from webviz_subsurface._utils.delta_vectors import create_delta_vectors_df
 from webviz_subsurface._utils.vector_calculator import (
     create_calculated_vector_df,
     get_selected_expressions,
@@ -13,7 +20,7 @@ from webviz_subsurface._utils.vector_calculator import (
 
 from .. import dataframe_utils
 from ..from_timeseries_cumulatives import (
-    calculate_from_resampled_cumulative_vectors_df,
+    calculate_per_interval_and_per_day_vectors_df,
     get_cumulative_vector_name,
     is_per_interval_or_per_day_vector,
 )
@@ -24,7 +31,8 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
     """
     Class to create derived vector data and access these for a delta ensemble.
 
-    The delta ensemble is represented a pair of two ensemble summary providers.
+    The delta ensemble is represented a pair of two ensemble summary providers, and the
+    delta vectors are fetched from a delta ensemble summary provider wrapping the pair.
 
     A list of vector names are provided, and data is fetched or created based on which
     type of vectors are present in the list.
@@ -34,6 +42,9 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
 
     Based on the vector type, the class provides an interface for retrieving dataframes
     for the set of such vectors for the provider.
+
+    The "DATE" column of the dataframes is on datetime.datetime format by default, and
+    of datetime64[ms] dtype if date_as_datetime64 is True.
     """
 
     def __init__(
@@ -44,6 +55,7 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
         expressions: Optional[List[ExpressionInfo]] = None,
         resampling_frequency: Optional[Frequency] = None,
         relative_date: Optional[datetime.datetime] = None,
+        date_as_datetime64: bool = False,
     ) -> None:
         if len(provider_pair) != 2:
             raise ValueError(
@@ -53,31 +65,18 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
         self._provider_a = provider_pair[0]
         self._provider_b = provider_pair[1]
 
+        # Delta ensemble provider for common vectors and realizations in the providers
+        self._delta_provider = EnsembleSummaryProviderDelta(
+            self._provider_a, self._provider_b
+        )
+
         # Initialize base class
-        _intersected_realizations = [
-            elm
-            for elm in self._provider_a.realizations()
-            if elm in self._provider_b.realizations()
-        ]
-        super().__init__(_intersected_realizations)
+        super().__init__(self._delta_provider.realizations())
 
         self._name = name
-        if (
-            self._provider_a.supports_resampling()
-            != self._provider_b.supports_resampling()
-        ):
-            raise ValueError(
-                f"Ensemble A and B must have same resampling support! "
-                f"Ensemble A support resampling: {self._provider_a.supports_resampling()} "
-                f"and Ensemble B support resampling: {self._provider_b.supports_resampling()}"
-            )
 
         # Intersection of vectors in providers
-        _accessor_vectors = [
-            elm
-            for elm in self._provider_a.vector_names()
-            if elm in self._provider_b.vector_names()
-        ]
+        _accessor_vectors = self._delta_provider.vector_names()
 
         # Categorize vector types among the vectors in argument
         self._provider_vectors = [
@@ -97,65 +96,11 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
 
         # Set resampling frequency
         self._resampling_frequency = (
-            resampling_frequency
-            if self._provider_a.supports_resampling()
-            and self._provider_b.supports_resampling()
-            else None
+            resampling_frequency if self._delta_provider.supports_resampling() else None
         )
 
         self._relative_date = relative_date
-
-    def __create_delta_ensemble_vectors_df(
-        self,
-        vector_names: List[str],
-        resampling_frequency: Optional[Frequency],
-        realizations: Optional[Sequence[int]] = None,
-    ) -> pd.DataFrame:
-        """
-        Get vectors dataframe with delta vectors for ensemble A and B, for common realizations
-
-        `Return:` Dataframe with delta ensemble data for common vectors and realizations in ensemble
-        A and B.
-
-        `Output:`
-        * DataFrame with columns ["DATE", "REAL", vector1, ..., vectorN]
-
-        `Input:`
-        * vector_names: List[str] - List of vector names to get data for
-        * resampling_frequency: Optional[Frequency] - Optional resampling frequency
-        * realizations: Optional[Sequence[int]] - Optional sequence of realization numbers for
-        vectors
-
-        NOTE:
-        - Performs "inner join". Only obtain matching index ["DATE", "REAL"] - i.e "DATE"-"REAL"
-        combination present in only one vector -> neglected
-        - Ensures equal dates samples and realizations by dropping nan-values
-        """
-
-        if not vector_names:
-            raise ValueError("List of requested vector names is empty")
-
-        # NOTE: index order ["DATE","REAL"] to obtain column order when
-        # performing reset_index() later
-        ensemble_a_vectors_df = self._provider_a.get_vectors_df(
-            vector_names, resampling_frequency, realizations
-        ).set_index(["DATE", "REAL"])
-        ensemble_b_vectors_df = self._provider_b.get_vectors_df(
-            vector_names, resampling_frequency, realizations
-        ).set_index(["DATE", "REAL"])
-
-        # Reset index, sort values by "REAL" and thereafter by "DATE" to
-        # group realizations and order by date
-        ensembles_delta_vectors_df = (
-            ensemble_a_vectors_df.sub(ensemble_b_vectors_df)
-            .dropna(axis=0, how="any")
-            .reset_index()
-            .sort_values(["REAL", "DATE"], ignore_index=True)
-        )
-
-        make_date_column_datetime_object(ensembles_delta_vectors_df)
-
-        return ensembles_delta_vectors_df
+        self._date_as_datetime64 = date_as_datetime64
 
     def has_provider_vectors(self) -> bool:
         return len(self._provider_vectors) > 0
@@ -184,16 +129,19 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
                 f'Vector data handler for provider "{self._name}" has no provider vectors'
             )
 
+        delta_ensemble_vectors_df = self._delta_provider.get_vectors_df(
+            self._provider_vectors,
+            self._resampling_frequency,
+            realizations,
+            date_as_datetime64=self._date_as_datetime64,
+        )
+
         if self._relative_date:
             return dataframe_utils.create_relative_to_date_df(
-                self.__create_delta_ensemble_vectors_df(
-                    self._provider_vectors, self._resampling_frequency, realizations
-                ),
+                delta_ensemble_vectors_df,
                 self._relative_date,
             )
-        return self.__create_delta_ensemble_vectors_df(
-            self._provider_vectors, self._resampling_frequency, realizations
-        )
+        return delta_ensemble_vectors_df
 
     def create_per_interval_and_per_day_vectors_df(
         self,
@@ -233,27 +181,18 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
         ]
         cumulative_vector_names = list(sorted(set(cumulative_vector_names)))
 
-        vectors_df = self.__create_delta_ensemble_vectors_df(
-            cumulative_vector_names, self._resampling_frequency, realizations
+        vectors_df = self._delta_provider.get_vectors_df(
+            cumulative_vector_names,
+            self._resampling_frequency,
+            realizations,
+            date_as_datetime64=self._date_as_datetime64,
         )
 
-        per_interval_and_per_day_vectors_df = pd.DataFrame()
-        for vector_name in self._per_interval_and_per_day_vectors:
-            cumulative_vector_name = get_cumulative_vector_name(vector_name)
-            per_interval_or_per_day_vector_df = (
-                calculate_from_resampled_cumulative_vectors_df(
-                    vectors_df[["DATE", "REAL", cumulative_vector_name]],
-                    as_per_day=vector_name.startswith("PER_DAY_"),
-                )
+        per_interval_and_per_day_vectors_df = (
+            calculate_per_interval_and_per_day_vectors_df(
+                vectors_df, self._per_interval_and_per_day_vectors
             )
-            if per_interval_and_per_day_vectors_df.empty:
-                per_interval_and_per_day_vectors_df = per_interval_or_per_day_vector_df
-            else:
-                per_interval_and_per_day_vectors_df = pd.merge(
-                    per_interval_and_per_day_vectors_df,
-                    per_interval_or_per_day_vector_df,
-                    how="inner",
-                )
+        )
 
         if self._relative_date:
             return dataframe_utils.create_relative_to_date_df(
@@ -296,10 +235,18 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
         provider_b_calculated_vectors_df = pd.DataFrame()
         for expression in self._vector_calculator_expressions:
             provider_a_calculated_vector_df = create_calculated_vector_df(
-                expression, self._provider_a, realizations, self._resampling_frequency
+                expression,
+                self._provider_a,
+                realizations,
+                self._resampling_frequency,
+                self._date_as_datetime64,
             )
             provider_b_calculated_vector_df = create_calculated_vector_df(
-                expression, self._provider_b, realizations, self._resampling_frequency
+                expression,
+                self._provider_b,
+                realizations,
+                self._resampling_frequency,
+                self._date_as_datetime64,
             )
 
             if (
@@ -324,21 +271,18 @@ class DerivedDeltaEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
                 provider_b_calculated_vectors_df, provider_b_calculated_vector_df
             )
 
-        # NOTE: index order ["DATE","REAL"] to obtain column order when
-        # performing reset_index() later
-        provider_a_calculated_vectors_df.set_index(["DATE", "REAL"], inplace=True)
-        provider_b_calculated_vectors_df.set_index(["DATE", "REAL"], inplace=True)
-
-        # Reset index, sort values by "REAL" and thereafter by "DATE" to
-        # group realizations and order by date
-        delta_ensemble_calculated_vectors_df = (
-            provider_a_calculated_vectors_df.sub(provider_b_calculated_vectors_df)
-            .dropna(axis=0, how="any")
-            .reset_index()
-            .sort_values(["REAL", "DATE"], ignore_index=True)
+        delta_ensemble_calculated_vectors_df = create_delta_vectors_df(
+            provider_a_calculated_vectors_df,
+            provider_b_calculated_vectors_df,
+            [
+                elm
+                for elm in provider_a_calculated_vectors_df.columns
+                if elm not in ["DATE", "REAL"]
+            ],
+        )
+        make_date_column_datetime_object_or_datetime64(
+            delta_ensemble_calculated_vectors_df, self._date_as_datetime64
         )
-
-        make_date_column_datetime_object(delta_ensemble_calculated_vectors_df)
 
         if self._relative_date:
             return dataframe_utils.create_relative_to_date_df(
@@ -12,7 +12,7 @@ from webviz_subsurface._utils.vector_calculator import (
 
 from .. import dataframe_utils
 from ..from_timeseries_cumulatives import (
-    calculate_from_resampled_cumulative_vectors_df,
+    calculate_per_interval_and_per_day_vectors_df,
     get_cumulative_vector_name,
     is_per_interval_or_per_day_vector,
 )
@@ -33,6 +33,9 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
 
     Based on the vector type, the class provides an interface for retrieving dataframes
     for the set of such vectors for the provider.
+
+    The "DATE" column of the dataframes is on datetime.datetime format by default, and
+    of datetime64[ms] dtype if date_as_datetime64 is True.
     """
 
     def __init__(
@@ -43,6 +46,7 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
         expressions: Optional[List[ExpressionInfo]] = None,
         resampling_frequency: Optional[Frequency] = None,
         relative_date: Optional[datetime.datetime] = None,
+        date_as_datetime64: bool = False,
     ) -> None:
         # Initialize base class
         super().__init__(provider.realizations())
@@ -67,6 +71,7 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
             resampling_frequency if self._provider.supports_resampling() else None
         )
         self._relative_date = relative_date
+        self._date_as_datetime64 = date_as_datetime64
 
     def has_provider_vectors(self) -> bool:
         return len(self._provider_vectors) > 0
@@ -86,16 +91,18 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
                 f'Vector data handler for provider "{self._name}" has no provider vectors'
             )
 
+        vectors_df = self._provider.get_vectors_df(
+            self._provider_vectors,
+            self._resampling_frequency,
+            realizations,
+            date_as_datetime64=self._date_as_datetime64,
+        )
         if self._relative_date:
             return dataframe_utils.create_relative_to_date_df(
-                self._provider.get_vectors_df(
-                    self._provider_vectors, self._resampling_frequency, realizations
-                ),
+                vectors_df,
                 self._relative_date,
             )
-        return self._provider.get_vectors_df(
-            self._provider_vectors, self._resampling_frequency, realizations
-        )
+        return vectors_df
 
     def create_per_interval_and_per_day_vectors_df(
         self,
@@ -128,34 +135,32 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
                 "or per day vector names"
             )
 
-        cumulative_vector_names = [
-            get_cumulative_vector_name(elm)
-            for elm in self._per_interval_and_per_day_vectors
-            if is_per_interval_or_per_day_vector(elm)
-        ]
-        cumulative_vector_names = list(sorted(set(cumulative_vector_names)))
-
-        vectors_df = self._provider.get_vectors_df(
-            cumulative_vector_names, self._resampling_frequency, realizations
-        )
-
-        per_interval_and_per_day_vectors_df = pd.DataFrame()
-        for vector_name in self._per_interval_and_per_day_vectors:
-            cumulative_vector_name = get_cumulative_vector_name(vector_name)
-            per_interval_or_per_day_vector_df = (
-                calculate_from_resampled_cumulative_vectors_df(
-                    vectors_df[["DATE", "REAL", cumulative_vector_name]],
-                    as_per_day=vector_name.startswith("PER_DAY_"),
-                )
+        if self._provider.supports_vectors_calculated_from_cumulatives():
+            per_interval_and_per_day_vectors_df = self._provider.get_vectors_df(
+                self._per_interval_and_per_day_vectors,
+                self._resampling_frequency,
+                realizations,
+                date_as_datetime64=self._date_as_datetime64,
             )
-            if per_interval_and_per_day_vectors_df.empty:
-                per_interval_and_per_day_vectors_df = per_interval_or_per_day_vector_df
-            else:
-                per_interval_and_per_day_vectors_df = pd.merge(
-                    per_interval_and_per_day_vectors_df,
-                    per_interval_or_per_day_vector_df,
-                    how="inner",
+        else:
+            cumulative_vector_names = [
+                get_cumulative_vector_name(elm)
+                for elm in self._per_interval_and_per_day_vectors
+                if is_per_interval_or_per_day_vector(elm)
+            ]
+            cumulative_vector_names = list(sorted(set(cumulative_vector_names)))
+
+            vectors_df = self._provider.get_vectors_df(
+                cumulative_vector_names,
+                self._resampling_frequency,
+                realizations,
+                date_as_datetime64=self._date_as_datetime64,
+            )
+            per_interval_and_per_day_vectors_df = (
+                calculate_per_interval_and_per_day_vectors_df(
+                    vectors_df, self._per_interval_and_per_day_vectors
                 )
+            )
 
         if self._relative_date:
             return dataframe_utils.create_relative_to_date_df(
@@ -191,7 +196,11 @@ class DerivedEnsembleVectorsAccessorImpl(DerivedVectorsAccessor):
         calculated_vectors_df = pd.DataFrame()
         for expression in self._vector_calculator_expressions:
             calculated_vector_df = create_calculated_vector_df(
-                expression, self._provider, realizations, self._resampling_frequency
+                expression,
+                self._provider,
+                realizations,
+                self._resampling_frequency,
+                self._date_as_datetime64,
             )
             if calculated_vectors_df.empty:
                 calculated_vectors_df = calculated_vector_df
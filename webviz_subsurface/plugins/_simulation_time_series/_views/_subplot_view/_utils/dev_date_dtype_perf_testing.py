@@ -0,0 +1,135 @@
+import datetime
+import time
+from functools import partial
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from webviz_subsurface._utils.delta_vectors import create_delta_vectors_df
+
+from .create_vector_traces_utils import create_vector_realization_traces
+from .dataframe_utils import create_relative_to_date_df
+from .from_timeseries_cumulatives import calculate_from_resampled_cumulative_vectors_df
+from .vector_statistics import create_vectors_statistics_df
+
+
+def _create_synthetic_table(
+    num_vectors: int, num_reals: int, num_dates: int
+) -> pa.Table:
+    """Table on the format returned from resampling in the ensemble summary providers,
+    with monthly dates and equal dates for all realizations"""
+    rng = np.random.default_rng(seed=1234)
+
+    dates = np.arange(
+        np.datetime64("2020-01", "M"), np.datetime64("2020-01", "M") + num_dates
+    ).astype("datetime64[ms]")
+
+    columns: Dict[str, np.ndarray] = {
+        "DATE": np.tile(dates, num_reals),
+        "REAL": np.repeat(np.arange(num_reals, dtype=np.int64), num_dates),
+    }
+    for vec_idx in range(num_vectors):
+        columns[f"VEC_{vec_idx}"] = np.cumsum(rng.random(num_dates * num_reals))
+
+    return pa.table(columns)
+
+
+def _time_func(func: Callable[[], object], num_runs: int) -> float:
+    best_elapsed_ms = float("inf")
+    for _ in range(num_runs):
+        start_tim = time.perf_counter()
+        func()
+        best_elapsed_ms = min(best_elapsed_ms, 1000 * (time.perf_counter() - start_tim))
+
+    return best_elapsed_ms
+
+
+def _create_delta_df(df_a: pd.DataFrame, df_b: pd.DataFrame) -> pd.DataFrame:
+    """Same operations as for delta ensembles in DerivedDeltaEnsembleVectorsAccessorImpl"""
+    return (
+        df_a.set_index(["DATE", "REAL"])
+        .sub(df_b.set_index(["DATE", "REAL"]))
+        .dropna(axis=0, how="any")
+        .reset_index()
+        .sort_values(["REAL", "DATE"], ignore_index=True)
+    )
+
+
+def _time_pipeline_steps(
+    table: pa.Table, relative_date: datetime.datetime, date_as_datetime64: bool
+) -> Dict[str, float]:
+    num_runs = 3
+
+    df = table.to_pandas(timestamp_as_object=not date_as_datetime64)
+    steps: Dict[str, Callable[[], object]] = {
+        "to_pandas": partial(
+            table.to_pandas, timestamp_as_object=not date_as_datetime64
+        ),
+        "statistics": partial(create_vectors_statistics_df, df),
+        "per_interval": partial(
+            calculate_from_resampled_cumulative_vectors_df, df, as_per_day=False
+        ),
+        "per_day": partial(
+            calculate_from_resampled_cumulative_vectors_df, df, as_per_day=True
+        ),
+        "relative_date": partial(create_relative_to_date_df, df, relative_date),
+        "delta_ensemble": partial(_create_delta_df, df, df),
+        "delta_aligned": partial(
+            create_delta_vectors_df, df, df, table.column_names[2:]
+        ),
+        "traces": partial(
+            create_vector_realization_traces,
+            df[["DATE", "REAL", "VEC_0"]],
+            ensemble="ens",
+            color="black",
+            legend_group="ens",
+            line_shape="linear",
+            hovertemplate="",
+        ),
+    }
+
+    return {
+        step_name: _time_func(step_func, num_runs)
+        for step_name, step_func in steps.items()
+    }
+
+
+def main() -> None:
+    print()
+    print("## Running DATE column dtype benchmark")
+    print("## ===================================")
+
+    for num_vectors, num_reals, num_dates in [
+        (1, 100, 120),
+        (5, 200, 240),
+        (10, 500, 360),
+    ]:
+        table = _create_synthetic_table(num_vectors, num_reals, num_dates)
+        relative_date = table["DATE"][num_dates // 2].as_py()
+
+        print(
+            f"## vectors={num_vectors}, reals={num_reals}, dates={num_dates}, "
+            f"rows={table.num_rows}"
+        )
+
+        object_timings = _time_pipeline_steps(table, relative_date, False)
+        datetime64_timings = _time_pipeline_steps(table, relative_date, True)
+        for step_name, object_ms in object_timings.items():
+            datetime64_ms = datetime64_timings[step_name]
+            print(
+                f"##   {step_name:<15} object={object_ms:9.1f}ms, "
+                f"datetime64={datetime64_ms:9.1f}ms, "
+                f"speedup={object_ms / datetime64_ms:.1f}x"
+            )
+
+    print("## done")
+
+
+# pylint: disable=line-too-long
+# Running:
+#   python -m webviz_subsurface.plugins._simulation_time_series._views._subplot_view._utils.dev_date_dtype_perf_testing
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
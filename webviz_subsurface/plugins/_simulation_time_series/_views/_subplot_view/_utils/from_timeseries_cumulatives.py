@@ -1,13 +1,16 @@
 import datetime
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 
 from webviz_subsurface._providers import Frequency
+from webviz_subsurface._utils.cumulative_vectors import (
+    calc_from_cumulative_values,
+    split_per_interval_or_per_day_vector_name,
+)
 from webviz_subsurface._utils.dataframe_utils import (
-    assert_date_column_is_datetime_object,
-    make_date_column_datetime_object,
+    assert_date_column_is_datetime_object_or_datetime64,
 )
 
 ###################################################################################
@@ -26,16 +29,13 @@ def is_per_interval_or_per_day_vector(vector: str) -> bool:
 
 
 def get_cumulative_vector_name(vector: str) -> str:
-    if not is_per_interval_or_per_day_vector(vector):
+    split_vector_name = split_per_interval_or_per_day_vector_name(vector)
+    if split_vector_name is None:
         raise ValueError(
             f'Expected "{vector}" to be a vector calculated from cumulative!'
         )
 
-    if vector.startswith("PER_DAY_"):
-        return vector.lstrip("PER_DAY_")
-    if vector.startswith("PER_INTVL_"):
-        return vector.lstrip("PER_INTVL_")
-    raise ValueError(f"Expected {vector} to be a cumulative vector!")
+    return split_vector_name[0]
 
 
 def create_per_day_vector_name(vector: str) -> str:
@@ -67,81 +67,85 @@ def calculate_from_resampled_cumulative_vectors_df(
     - Does not handle raw data format with varying sampling or sampling frequency higher than
     daily!
     - Dataframe has columns:\n
-    "DATE": Series with dates on datetime.datetime format
+    "DATE": Series with dates on datetime.datetime format or of datetime64[ms] dtype,
+    the format is preserved in the returned dataframe
     "REAL": Series of realization number identifier
     vector1, ..., vectorN: Series of vector data for vector of given column name
 
     `TODO:`
     * IMPROVE FUNCTION NAME?
     * Handle raw data format?
-    * Give e.g. a dict with info of "per_day and per_intvl" calculation for each vector column?
-    Can thereby calculate everything for provided vector columns and no iterate column per
-    column?
     """
-    assert_date_column_is_datetime_object(vectors_df)
-
-    vectors_df = vectors_df.copy()
-
     column_keys = [elm for elm in vectors_df.columns if elm not in ["DATE", "REAL"]]
+    return calculate_per_interval_and_per_day_vectors_df(
+        vectors_df,
+        [
+            create_per_day_vector_name(vector)
+            if as_per_day
+            else create_per_interval_vector_name(vector)
+            for vector in column_keys
+        ],
+    )
 
-    # Sort by realizations, thereafter dates
-    vectors_df.sort_values(by=["REAL", "DATE"], inplace=True)
-
-    # Create column of unique id for realizations. .diff() takes diff between an index
-    # and previous index in a column. Thereby if "realuid" is != 0, the .diff() is
-    # between two realizations.
-    # Could alternatively loop over ensembles and realizations, but this is quicker for
-    # larger datasets.
-    vectors_df["realuid"] = vectors_df["REAL"]
 
-    vectors_df.set_index(["DATE"], inplace=True)
+def calculate_per_interval_and_per_day_vectors_df(
+    vectors_df: pd.DataFrame, vector_names: Sequence[str]
+) -> pd.DataFrame:
+    """
+    Calculates the per interval and per day vectors in vector_names from the cumulative
+    vector columns in provided dataframe, in one pass over the data. See
+    calculate_from_resampled_cumulative_vectors_df() for assumptions on the data.
 
-    cumulative_name_map = {
-        vector: create_per_day_vector_name(vector)
-        if as_per_day
-        else create_per_interval_vector_name(vector)
-        for vector in column_keys
-    }
-    cumulative_vectors = list(cumulative_name_map.values())
+    `INPUT:`
+    * vectors_df: pd.Dataframe - Dataframe with columns:
+        ["DATE", "REAL", cumulative_vector1, ..., cumulative_vectorN]
+    * vector_names: Sequence[str] - Per interval and per day vector names, with the
+    cumulative vectors among the columns of vectors_df
 
-    # Take diff of given column_keys indexes - preserve REAL
-    cumulative_vectors_df = pd.concat(
-        [
-            vectors_df[["REAL"]],
-            vectors_df[["realuid"] + column_keys]
-            .diff()
-            .shift(-1)
-            .rename(
-                mapper=cumulative_name_map,
-                axis=1,
-            ),
-        ],
-        axis=1,
+    `RETURNS:`
+    * Dataframe sorted on "REAL" then "DATE", with columns:
+        ["DATE", "REAL", vector_name1, ..., vector_nameM]
+    """
+    assert_date_column_is_datetime_object_or_datetime64(vectors_df)
+
+    # Sort by realizations, thereafter dates. The DATE column keeps its format, while
+    # the calculations are done on datetime64 dates. Only the unique dates are converted,
+    # as conversion of datetime.datetime objects is done element by element.
+    date_values = vectors_df["DATE"].to_numpy()
+    date_codes, unique_dates = pd.factorize(date_values)
+    dates_np = np.asarray(unique_dates).astype("datetime64[ms]")[date_codes]
+    real_values = vectors_df["REAL"].to_numpy()
+    sort_order = np.lexsort((dates_np, real_values))
+    dates_np = dates_np[sort_order]
+    real_values = real_values[sort_order]
+
+    calculated_values: Dict[str, np.ndarray] = {}
+    for as_per_day in [False, True]:
+        vector_name_map = {
+            vector: get_cumulative_vector_name(vector)
+            for vector in vector_names
+            if vector.startswith("PER_DAY_") == as_per_day
+        }
+        cumulative_values = calc_from_cumulative_values(
+            dates_np,
+            real_values,
+            {
+                cumulative_vector: vectors_df[cumulative_vector].to_numpy()[sort_order]
+                for cumulative_vector in set(vector_name_map.values())
+            },
+            as_per_day,
+        )
+        for vector, cumulative_vector in vector_name_map.items():
+            calculated_values[vector] = cumulative_values[cumulative_vector]
+
+    cumulative_vectors_df = pd.DataFrame(
+        {
+            "DATE": pd.Series(date_values[sort_order], dtype=date_values.dtype),
+            "REAL": real_values,
+        }
     )
-    cumulative_vectors_df[cumulative_vectors] = cumulative_vectors_df[
-        cumulative_vectors
-    ].fillna(value=0)
-
-    # Reset index (DATE becomes regular column)
-    cumulative_vectors_df.reset_index(inplace=True)
-
-    # Convert interval cumulative to daily average rate if requested
-    if as_per_day:
-        days = cumulative_vectors_df["DATE"].diff().shift(-1).dt.days.fillna(value=0)
-        for vector in column_keys:
-            with np.errstate(invalid="ignore"):
-                cumulative_vector_name = cumulative_name_map[vector]
-                cumulative_vectors_df.loc[:, cumulative_vector_name] = (
-                    cumulative_vectors_df[cumulative_vector_name].values / days.values
-                )
-
-    # Find .diff() between two realizations and set value = 0
-    cumulative_vectors_df.loc[
-        cumulative_vectors_df["realuid"] != 0, cumulative_vectors
-    ] = 0
-    cumulative_vectors_df.drop("realuid", axis=1, inplace=True)
-
-    make_date_column_datetime_object(cumulative_vectors_df)
+    for vector in vector_names:
+        cumulative_vectors_df[vector] = calculated_values[vector]
 
     return cumulative_vectors_df
 
@@ -1,11 +1,13 @@
-from typing import List
-
-import numpy as np
 import pandas as pd
 
 from webviz_subsurface._utils.dataframe_utils import (
-    assert_date_column_is_datetime_object,
-    make_date_column_datetime_object,
+    assert_date_column_is_datetime_object_or_datetime64,
+    is_date_column_datetime64,
+    make_date_column_datetime_object_or_datetime64,
+)
+from webviz_subsurface._utils.ensemble_statistics import (
+    StatisticFunction,
+    create_grouped_statistics_df,
 )
 
 from .._types import StatisticsOptions
@@ -20,13 +22,16 @@ def create_vectors_statistics_df(vectors_df: pd.DataFrame) -> pd.DataFrame:
     `Input:`
     * vectors_df: pd.DataFrame - Dataframe with vectors dataframe and columns:
         ["DATE", "REAL", vector1, ... , vectorN]
+      The "DATE" column is either on datetime.datetime format or of datetime64[ms] dtype,
+      and the format is preserved in the returned dataframe.
 
     `Returns:`
     * Dataframe with double column level:\n
       [ "DATE",     vector1,                        ... vectorN
                     MEAN, MIN, MAX, P10, P90, P50   ... MEAN, MIN, MAX, P10, P90, P50]
     """
-    assert_date_column_is_datetime_object(vectors_df)
+    assert_date_column_is_datetime_object_or_datetime64(vectors_df)
+    date_as_datetime64 = is_date_column_datetime64(vectors_df)
 
     # Get vectors names, keep order
     columns_list = list(vectors_df.columns)
@@ -51,33 +56,20 @@ def create_vectors_statistics_df(vectors_df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame(columns=pd.MultiIndex.from_tuples(columns_tuples))
 
     # Invert p10 and p90 due to oil industry convention.
-    def p10(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=90)
-
-    def p90(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=10)
-
-    def p50(x: List[float]) -> np.floating:
-        return np.nanpercentile(x, q=50)
-
-    statistics_df: pd.DataFrame = (
-        vectors_df[["DATE"] + vector_names]
-        .groupby(["DATE"])
-        .agg(["mean", "min", "max", p10, p90, p50])
-        .reset_index(level=["DATE"], col_level=0)
+    statistics_df = create_grouped_statistics_df(
+        vectors_df,
+        group_column="DATE",
+        value_columns=vector_names,
+        statistics={
+            StatisticsOptions.MEAN: StatisticFunction.MEAN,
+            StatisticsOptions.MIN: StatisticFunction.MIN,
+            StatisticsOptions.MAX: StatisticFunction.MAX,
+            StatisticsOptions.P10: 0.9,
+            StatisticsOptions.P90: 0.1,
+            StatisticsOptions.P50: 0.5,
+        },
     )
 
-    # Rename columns to StatisticsOptions enum types for strongly typed format
-    col_stat_label_map = {
-        "mean": StatisticsOptions.MEAN,
-        "min": StatisticsOptions.MIN,
-        "max": StatisticsOptions.MAX,
-        "p10": StatisticsOptions.P10,
-        "p90": StatisticsOptions.P90,
-        "p50": StatisticsOptions.P50,
-    }
-    statistics_df.rename(columns=col_stat_label_map, level=1, inplace=True)
-
-    make_date_column_datetime_object(statistics_df)
+    make_date_column_datetime_object_or_datetime64(statistics_df, date_as_datetime64)
 
     return statistics_df
@@ -84,6 +84,7 @@ class SubplotView(ViewABC):
         user_defined_vector_definitions: Dict[str, VectorDefinition],
         observations: dict,  # TODO: Improve typehint?
         line_shape_fallback: str = "linear",
+        date_as_datetime64: bool = False,
     ) -> None:
         super().__init__("Subplot View")
 
@@ -135,6 +136,7 @@ class SubplotView(ViewABC):
         self._user_defined_vector_definitions = user_defined_vector_definitions
         self._observations = observations
         self._has_presampled_providers = has_presampled_providers
+        self._date_as_datetime64 = date_as_datetime64
 
     # pylint: disable=too-many-statements
     def set_callbacks(self) -> None:
@@ -346,6 +348,7 @@ class SubplotView(ViewABC):
                 delta_ensembles=delta_ensembles,
                 resampling_frequency=resampling_frequency,
                 relative_date=relative_date,
+                date_as_datetime64=self._date_as_datetime64,
             )
 
             # TODO: How to get metadata for calculated vector?
@@ -703,6 +706,7 @@ class SubplotView(ViewABC):
                 delta_ensembles=delta_ensembles,
                 resampling_frequency=resampling_frequency,
                 relative_date=relative_date,
+                date_as_datetime64=self._date_as_datetime64,
             )
 
             # Dict with vector name as key and dataframe data as value
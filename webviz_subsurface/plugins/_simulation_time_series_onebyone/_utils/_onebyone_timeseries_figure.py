@@ -11,6 +11,10 @@ from webviz_subsurface._utils.colors import (
     rgba_to_str,
     scale_rgb_lightness,
 )
+from webviz_subsurface._utils.ensemble_statistics import (
+    StatisticFunction,
+    create_grouped_statistics_df,
+)
 from webviz_subsurface._utils.enum_shim import StrEnum
 from webviz_subsurface._utils.simulation_timeseries import (
     get_simulation_line_shape,
@@ -169,17 +173,11 @@ class OneByOneTimeSeriesFigure:
         )
 
     def create_vectors_statistics_df(self) -> pd.DataFrame:
-        return (
-            self.dframe[["DATE", self.vector]]
-            .groupby(["DATE"])
-            .agg(
-                [
-                    ("Mean", np.nanmean),
-                    ("P10", lambda x: np.nanpercentile(x, q=90)),
-                    ("P90", lambda x: np.nanpercentile(x, q=10)),
-                ]
-            )
-            .reset_index()
+        return create_grouped_statistics_df(
+            self.dframe,
+            group_column="DATE",
+            value_columns=[self.vector],
+            statistics={"Mean": StatisticFunction.MEAN, "P10": 0.9, "P90": 0.1},
         )
 
     def create_vector_observation_traces(self) -> None:
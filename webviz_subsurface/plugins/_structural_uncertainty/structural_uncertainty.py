@@ -12,6 +12,7 @@ import webviz_subsurface
 from webviz_subsurface._components import ColorPicker
 from webviz_subsurface._datainput.fmu_input import find_surfaces, get_realizations
 from webviz_subsurface._models import SurfaceSetModel, WellSetModel
+from webviz_subsurface._utils.png_image_server import PngImageServer
 from webviz_subsurface._utils.webvizstore_functions import find_files, get_path
 
 from ._tour_steps import generate_tour_steps
@@ -143,6 +144,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
         initial_settings: Dict = None,
     ):
         super().__init__()
+        PngImageServer.instance(app)
         self._initial_settings = initial_settings if initial_settings else {}
 
         WEBVIZ_ASSETS.add(
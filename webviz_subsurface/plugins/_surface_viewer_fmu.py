@@ -17,6 +17,7 @@ from webviz_subsurface._datainput.fmu_input import find_surfaces, get_realizatio
 from webviz_subsurface._datainput.well import make_well_layers
 from webviz_subsurface._models import SurfaceLeafletModel, SurfaceSetModel
 from webviz_subsurface._private_plugins.surface_selector import SurfaceSelector
+from webviz_subsurface._utils.png_image_server import PngImageServer
 
 
 @deprecated_plugin("Relevant functionality is implemented in the MapViewerFMU plugin.")
@@ -95,6 +96,7 @@ attribute_settings:
         map_height: int = 600,
     ):
         super().__init__()
+        PngImageServer.instance(app)
         self.ens_paths = {
             ens: webviz_settings.shared_settings["scratch_ensembles"][ens]
             for ens in ensembles
@@ -14,6 +14,7 @@ from webviz_config.webviz_store import webvizstore
 from webviz_subsurface_components import LeafletMap
 
 from webviz_subsurface._models import SurfaceLeafletModel
+from webviz_subsurface._utils.png_image_server import PngImageServer
 
 from .._datainput.grid import load_grid, load_grid_parameter
 from .._datainput.surface import get_surface_fence
@@ -69,6 +70,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
         colors: list = None,
     ):
         super().__init__()
+        PngImageServer.instance(app)
         self.zunit = zunit
         self.gridfile = str(gridfile)
         self.gridparafiles = [str(gridfile) for gridfile in gridparameterfiles]
@@ -13,6 +13,7 @@ from webviz_config.webviz_store import webvizstore
 from webviz_subsurface_components import LeafletMap
 
 from webviz_subsurface._models import SurfaceLeafletModel
+from webviz_subsurface._utils.png_image_server import PngImageServer
 
 from .._datainput.seismic import load_cube_data
 from .._datainput.surface import get_surface_fence
@@ -65,6 +66,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
         colors: list = None,
     ):
         super().__init__()
+        PngImageServer.instance(app)
         self.zunit = zunit
         self.segyfiles = [str(segyfile) for segyfile in segyfiles]
         self.surfacefiles = [str(surffile) for surffile in surfacefiles]
@@ -11,6 +11,7 @@ from webviz_config.webviz_store import webvizstore
 from webviz_subsurface_components import LeafletMap
 
 from webviz_subsurface._models import SurfaceLeafletModel
+from webviz_subsurface._utils.png_image_server import PngImageServer
 
 from .._datainput.seismic import load_cube_data
 from .._datainput.surface import load_surface
@@ -81,6 +82,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
         sampling: int = 40,
     ):
         super().__init__()
+        PngImageServer.instance(app)
 
         self.zunit = zunit
         self.sampling = sampling
@@ -18,6 +18,7 @@ from webviz_config.webviz_store import webvizstore
 from webviz_subsurface_components import LeafletMap
 
 from webviz_subsurface._models import SurfaceLeafletModel
+from webviz_subsurface._utils.png_image_server import PngImageServer
 
 from .._datainput.fmu_input import get_realizations
 from .._datainput.seismic import load_cube_data
@@ -103,6 +104,7 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
         colors: list = None,
     ):
         super().__init__()
+        PngImageServer.instance(app)
 
         self.wellfolder = wellfolder
         self.wellsuffix = wellsuffix